@@ -16,11 +16,36 @@ class Settings(BaseSettings):
     MLFLOW_TRACKING_URI: str = "http://127.0.0.1:5000"
     MODEL_NAME: str = "card_approval_model"
     MODEL_STAGE: str = "Production"
+    REGISTRY_CACHE_TTL_SECONDS: float = 30.0  # how long a resolved model version is reused; 0 = always ask
 
     # Model Loading - if MODEL_PATH is set, load from local path (embedded in image)
     # Otherwise, fall back to loading from MLflow at runtime
     MODEL_PATH: str = ""  # e.g., "/app/models" when embedded in Docker image
 
+    # Single-instance mode - wrap the native model with the pyfunc interface instead of loading it twice
+    MODEL_SINGLE_INSTANCE: bool = False
+
+    # float32 serving - preprocess and score in float32 instead of float64
+    INFERENCE_FLOAT32: bool = False
+
+    # Thread budget - size to the CPU limit so request, model and BLAS threads do not oversubscribe it
+    INFERENCE_THREADS: int = 0  # OpenMP/BLAS pools and the model's nthread/n_jobs; 0 = library defaults
+    REQUEST_THREADPOOL_SIZE: int = 0  # synchronous requests handled at once; 0 = Starlette default (40)
+
+    # Warmup - score synthetic applicants at startup before reporting ready
+    WARMUP_ROUNDS: int = 2  # passes over the batch sizes; 0 = no warmup
+    WARMUP_BATCH_SIZES: str = "1,8,64"  # comma-separated
+
+    # Explanations - per-prediction feature attributions computed in a bounded background pool
+    EXPLAIN_MAX_WORKERS: int = 2
+    EXPLAIN_MAX_PENDING: int = 8  # queued + running requests before new ones are rejected
+    EXPLAIN_TIMEOUT_SECONDS: float = 2.0  # latency budget of one explanation request
+    EXPLAIN_CACHE_SIZE: int = 1024  # explanations kept per input hash; 0 = no caching
+
+    # Artifact Cache - if set, MLflow artifacts are cached on disk and reused across restarts
+    ARTIFACT_CACHE_DIR: str = ""  # e.g., "/var/cache/card-approval" on a shared volume
+    ARTIFACT_CACHE_MAX_BYTES: int = 2 * 1024**3  # 0 = no eviction
+
     # Google Cloud
     GOOGLE_APPLICATION_CREDENTIALS: str = ""
 
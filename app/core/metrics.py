@@ -25,6 +25,18 @@ REQUEST_DURATION = Histogram(
 
 ACTIVE_REQUESTS = Gauge("active_requests", "Number of active requests", registry=REGISTRY)
 
+MODEL_MEMORY_BYTES = Gauge(
+    "model_resident_memory_bytes",
+    "Resident memory taken by the loaded model objects in this worker",
+    registry=REGISTRY,
+)
+
+WARMUP_DURATION_SECONDS = Gauge(
+    "model_warmup_duration_seconds",
+    "Time spent warming up the prediction path at startup",
+    registry=REGISTRY,
+)
+
 
 def track_request_metrics(method: str, endpoint: str, status_code: int):
     """Track request metrics"""
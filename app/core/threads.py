@@ -0,0 +1,100 @@
+"""Thread budget of model inference.
+
+A request runs on a Starlette worker thread, and the model library and BLAS
+(used by the PCA projection) each start their own pool on top of it. Under
+concurrent load that oversubscribes a fractional CPU limit, so the budget
+caps every layer: OpenMP/BLAS pools, the model's own thread count and the
+number of requests scored at once.
+
+OpenMP reads OMP_NUM_THREADS only when it is loaded, and its pool size set at
+runtime applies to the calling thread only, so the environment is exported
+before any model library is imported and the cap is applied again in every
+thread that runs inference.
+"""
+
+import os
+import threading
+from typing import Any, Dict
+
+import anyio.to_thread
+from threadpoolctl import ThreadpoolController
+
+# Environment variables read by OpenMP/BLAS runtimes that are loaded later
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+# Per-call predict argument of libraries whose thread count cannot be set on the fitted model
+PREDICT_THREAD_PARAMS = {
+    "catboost": "thread_count",
+}
+
+
+def export_thread_env(n_threads: int) -> None:
+    """
+    Export the OpenMP/BLAS pool size for runtimes that are not loaded yet.
+
+    Must run before numpy or a model library is imported; already loaded
+    runtimes ignore the variables.
+
+    Args:
+        n_threads: Threads per pool.
+    """
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(n_threads)
+
+
+class NativeThreadBudget:
+    """Cap of the OpenMP/BLAS pools, applied once in each thread that runs inference."""
+
+    def __init__(self, n_threads: int):
+        """
+        Initialize the budget.
+
+        Args:
+            n_threads: Threads per pool.
+        """
+        self.n_threads = n_threads
+        self._controller = ThreadpoolController()
+        self._bound = threading.local()
+
+    def bind(self) -> None:
+        """Apply the cap to the calling thread (a no-op after the first call in that thread)."""
+        if getattr(self._bound, "n_threads", None) == self.n_threads:
+            return
+        self._controller.limit(limits=self.n_threads)
+        self._bound.n_threads = self.n_threads
+
+
+def configure_model_threads(model: Any, n_threads: int) -> Dict[str, int]:
+    """
+    Set the thread count a fitted model uses for prediction.
+
+    Args:
+        model: Native XGBoost, LightGBM, CatBoost or scikit-learn model (sklearn wrapper or booster).
+        n_threads: Threads per prediction call.
+
+    Returns:
+        Keyword arguments to pass to every predict/predict_proba call (empty if the model keeps the setting).
+    """
+    library = type(model).__module__.split(".")[0]
+
+    if library in PREDICT_THREAD_PARAMS:
+        return {PREDICT_THREAD_PARAMS[library]: n_threads}
+    if library == "xgboost" and not hasattr(model, "get_params"):
+        model.set_param({"nthread": n_threads})
+    elif library == "lightgbm" and not hasattr(model, "get_params"):
+        return {"num_threads": n_threads}
+    elif hasattr(model, "get_params") and "n_jobs" in model.get_params():
+        model.set_params(n_jobs=n_threads)
+    return {}
+
+
+def set_request_threadpool_size(size: int) -> None:
+    """
+    Limit how many synchronous endpoints run at once.
+
+    Must be called from the event loop (e.g. the lifespan handler).
+
+    Args:
+        size: Worker threads of the request threadpool.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = size
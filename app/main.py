@@ -7,14 +7,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
 from app.core.config import get_settings
-from app.core.logging import setup_logging
-from app.core.metrics import ACTIVE_REQUESTS, REQUEST_DURATION, metrics_endpoint, track_request_metrics
-from app.core.tracing import setup_tracing
-from app.routers import health, predict
+from app.core.threads import export_thread_env, set_request_threadpool_size
+
+# OpenMP/BLAS read their pool size when loaded, so export it before the routers import numpy and the models
+settings = get_settings()
+if settings.INFERENCE_THREADS > 0:
+    export_thread_env(settings.INFERENCE_THREADS)
+
+from app.core.logging import setup_logging  # noqa: E402
+from app.core.metrics import ACTIVE_REQUESTS, REQUEST_DURATION, metrics_endpoint, track_request_metrics  # noqa: E402
+from app.core.tracing import setup_tracing  # noqa: E402
+from app.routers import health, predict  # noqa: E402
+from app.services.warmup_service import mark_not_ready, mark_ready, parse_batch_sizes, run_warmup  # noqa: E402
 
 # Setup
 setup_logging()
-settings = get_settings()
 
 
 @asynccontextmanager
@@ -33,9 +40,21 @@ async def lifespan(_app: FastAPI):
     logger.info(f"Model loaded: v{model_service.version} (run_id: {model_service.run_id})")
     logger.info(f"Source: {model_service.get_model_info()['source']}")
 
+    # Concurrent synchronous requests (OpenMP/BLAS pools are capped per inference thread by the model service)
+    if settings.REQUEST_THREADPOOL_SIZE > 0:
+        set_request_threadpool_size(settings.REQUEST_THREADPOOL_SIZE)
+        logger.info(f"Request threadpool size: {settings.REQUEST_THREADPOOL_SIZE}")
+
+    # Warm up the prediction path; /health/ready reports ready only afterwards
+    mark_not_ready()
+    if settings.WARMUP_ROUNDS > 0:
+        run_warmup(model_service, parse_batch_sizes(settings.WARMUP_BATCH_SIZES), settings.WARMUP_ROUNDS)
+    mark_ready()
+
     yield
 
     # Shutdown
+    mark_not_ready()
     logger.info("Shutting down application")
 
 
@@ -4,11 +4,12 @@
 from datetime import datetime
 from typing import Dict
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from loguru import logger
 
 from app.core.config import get_settings
 from app.schemas.health import HealthResponse
+from app.services.warmup_service import is_ready
 from app.utils.mlflow_helpers import check_mlflow_connection
 
 router = APIRouter(prefix="/health", tags=["Health"])
@@ -47,8 +48,10 @@ def readiness_check() -> Dict[str, str]:
     """
     Readiness check for Kubernetes.
 
-    Returns 200 if service is ready to accept traffic.
+    Returns 200 once the model is loaded and warmed up, 503 before that.
     """
+    if not is_ready():
+        raise HTTPException(status_code=503, detail="warming up")
     return {"status": "ready"}
 
 
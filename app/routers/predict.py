@@ -7,7 +7,8 @@ import pandas as pd
 from fastapi import APIRouter, Depends, HTTPException
 from loguru import logger
 
-from app.schemas.prediction import PredictionInput, PredictionOutput
+from app.schemas.prediction import ExplanationOutput, PredictionInput, PredictionOutput
+from app.services.explanation_service import ExplanationQueueFull, ExplanationService, get_explanation_service
 from app.services.model_service import ModelService, get_model_service
 from app.services.preprocessing_service import get_preprocessing_service
 
@@ -23,6 +24,9 @@ def predict(
     try:
         logger.info(f"Prediction request received for customer ID: {input_data.ID}")
 
+        # Cap OpenMP/BLAS pools of this worker thread before the PCA projection runs in it
+        model_service.bind_thread_budget()
+
         # Preprocess input data
         df_processed = _preprocess_input(input_data, model_service.run_id)
 
@@ -92,6 +96,29 @@ def _get_probabilities(
     return prob_approved, confidence
 
 
+@router.post("/explain", response_model=ExplanationOutput)
+def explain(
+    input_data: PredictionInput,
+    explanation_service: ExplanationService = Depends(get_explanation_service),
+) -> ExplanationOutput:
+    """Explain a prediction with per-field contributions to the approval log-odds."""
+    try:
+        result = explanation_service.explain(input_data.model_dump())
+    except NotImplementedError as e:
+        raise HTTPException(status_code=501, detail=str(e)) from e
+    except ExplanationQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+    except TimeoutError as e:
+        # The computation keeps running and is cached, so a retry is usually served instantly
+        raise HTTPException(status_code=504, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Explanation failed for customer ID {input_data.ID}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Explanation failed: {str(e)}") from e
+
+    logger.info(f"Explanation completed: customer_id={input_data.ID}, cached={result['cached']}")
+    return ExplanationOutput(**result)
+
+
 @router.get("/model-info")
 def get_model_info(
     model_service: ModelService = Depends(get_model_service),
@@ -1,6 +1,6 @@
 """Prediction request and response schemas."""
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
 
@@ -86,3 +86,28 @@ class PredictionOutput(BaseModel):
                 "timestamp": "2025-12-13T11:30:00",
             }
         }
+
+
+class ExplanationOutput(BaseModel):
+    """Feature attributions of one prediction"""
+
+    probability: float = Field(..., ge=0, le=1, description="Approval probability")
+    base_value: float = Field(..., description="Expected model output (log-odds) before any feature is known")
+    contributions: Dict[str, float] = Field(
+        ..., description="Contribution of each input field to the approval log-odds, largest magnitude first"
+    )
+    version: Optional[str] = Field(None, description="Model version used")
+    cached: bool = Field(False, description="Served from the explanation cache")
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "probability": 0.85,
+                "base_value": 0.42,
+                "contributions": {"AMT_INCOME_TOTAL": 0.91, "DAYS_EMPLOYED": 0.37, "CNT_CHILDREN": -0.03},
+                "version": "1",
+                "cached": False,
+                "timestamp": "2025-12-13T11:30:00",
+            }
+        }
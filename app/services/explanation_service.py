@@ -0,0 +1,229 @@
+"""Explanation service for per-prediction feature attributions."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from app.core.config import get_settings
+from app.core.tracing import get_tracer
+from app.schemas.prediction import PredictionInput
+from app.services.model_service import ModelService, get_model_service
+from app.services.preprocessing_service import PreprocessingService, get_preprocessing_service
+
+
+class ExplanationQueueFull(RuntimeError):
+    """Raised when the explanation pool already holds its maximum number of requests."""
+
+
+def native_contributions(model, features: pd.DataFrame, **predict_kwargs) -> np.ndarray:
+    """
+    Exact tree attributions (TreeSHAP) from the model library's built-in implementation.
+
+    Args:
+        model: Native XGBoost, LightGBM or CatBoost model (sklearn wrapper or booster).
+        features: Model input features.
+        **predict_kwargs: Per-call arguments of LightGBM and CatBoost (thread budget).
+
+    Returns:
+        Array of shape (n_rows, n_features + 1) in log-odds; the last column is the base value.
+
+    Raises:
+        NotImplementedError: If the model has no native attribution path.
+    """
+    library = type(model).__module__.split(".")[0]
+
+    if library == "xgboost":
+        import xgboost
+
+        booster = model.get_booster() if hasattr(model, "get_booster") else model
+        return booster.predict(xgboost.DMatrix(features), pred_contribs=True)
+    if library == "lightgbm":
+        return np.asarray(model.predict(features, pred_contrib=True, **predict_kwargs))
+    if library == "catboost":
+        import catboost
+
+        return model.get_feature_importance(catboost.Pool(features), type="ShapValues", **predict_kwargs)
+
+    raise NotImplementedError(f"Feature attributions are not supported for {type(model).__name__} models")
+
+
+def input_field_groups(feature_names: List[str], fields: List[str]) -> Dict[str, List[int]]:
+    """
+    Group encoded feature columns by the input field they were derived from.
+
+    One-hot columns are named "<field>_<category>", so each column belongs to the
+    longest field it equals or starts with; unmatched columns keep their own name.
+
+    Args:
+        feature_names: Encoded feature column names.
+        fields: Raw input field names.
+
+    Returns:
+        Dictionary mapping input field to column indices.
+    """
+    by_length = sorted(fields, key=len, reverse=True)
+    groups: Dict[str, List[int]] = {}
+    for index, name in enumerate(feature_names):
+        field = next((f for f in by_length if name == f or name.startswith(f"{f}_")), name)
+        groups.setdefault(field, []).append(index)
+    return groups
+
+
+class ExplanationService:
+    """Compute, bound and cache per-prediction feature attributions."""
+
+    def __init__(
+        self,
+        model_service: ModelService,
+        preprocessing_service: PreprocessingService,
+        max_workers: int = 2,
+        max_pending: int = 8,
+        timeout_seconds: float = 2.0,
+        cache_size: int = 1024,
+    ):
+        """
+        Initialize the explanation service.
+
+        Args:
+            model_service: Loaded model service.
+            preprocessing_service: Preprocessing service of the model's run.
+            max_workers: Threads computing attributions.
+            max_pending: Requests queued or running before new ones are rejected.
+            timeout_seconds: Latency budget of one request.
+            cache_size: Explanations kept per input hash (0 disables caching).
+        """
+        self.model_service = model_service
+        self.preprocessing_service = preprocessing_service
+        self.timeout_seconds = timeout_seconds
+        self.cache_size = cache_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="explain")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        fields = [name for name in PredictionInput.model_fields if name != "ID"]
+        self._groups = input_field_groups(preprocessing_service.feature_names, fields)
+
+    def cache_key(self, input_data: dict) -> str:
+        """Hash of the model version and the input fields (the customer ID does not affect the output)."""
+        fields = {name: value for name, value in input_data.items() if name != "ID"}
+        payload = json.dumps([self.model_service.version, self.model_service.run_id, fields], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def explain(self, input_data: dict) -> dict:
+        """
+        Feature attributions of one prediction, within the latency budget.
+
+        Args:
+            input_data: Raw prediction input.
+
+        Returns:
+            Dictionary with probability, base_value, contributions, version and cached.
+
+        Raises:
+            ExplanationQueueFull: If the pool is saturated.
+            TimeoutError: If the attributions are not ready within the latency budget
+                (the computation finishes in the background and is cached).
+            NotImplementedError: If the model has no native attribution path.
+        """
+        key = self.cache_key(input_data)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        if not self._slots.acquire(blocking=False):
+            raise ExplanationQueueFull("Too many explanation requests in progress")
+        try:
+            future = self._executor.submit(self._compute, input_data)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda done: self._on_done(key, done))
+
+        try:
+            result = future.result(timeout=self.timeout_seconds)
+        except FutureTimeoutError as e:
+            raise TimeoutError(f"Explanation not ready within {self.timeout_seconds}s") from e
+        return {**result, "cached": False}
+
+    def _on_done(self, key: str, future: Future) -> None:
+        """Free the pool slot and cache the result of a finished computation."""
+        self._slots.release()
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.warning(f"Explanation failed: {future.exception()}")
+            return
+        self._cache_put(key, future.result())
+
+    def _compute(self, input_data: dict) -> dict:
+        """Attribute the model output to the raw input fields."""
+        self.model_service.bind_thread_budget()
+        tracer = get_tracer()
+        with tracer.start_as_current_span("explanation") as span:
+            df = pd.DataFrame([input_data])
+            features = self.preprocessing_service.preprocess(df)
+            contributions = native_contributions(
+                self.model_service.sklearn_model, features, **self.model_service.predict_kwargs
+            )
+
+            pc_attributions, base_value = contributions[:, :-1], contributions[:, -1]
+            encoded = self.preprocessing_service.encode(df).to_numpy()
+            feature_attributions = self.preprocessing_service.attribute_to_features(encoded, pc_attributions)[0]
+
+            per_field = {field: float(feature_attributions[indices].sum()) for field, indices in self._groups.items()}
+            margin = float(contributions[0].sum())
+            span.set_attribute("n_fields", len(per_field))
+
+        return {
+            "probability": float(1.0 / (1.0 + np.exp(-margin))),
+            "base_value": float(base_value[0]),
+            "contributions": dict(sorted(per_field.items(), key=lambda item: abs(item[1]), reverse=True)),
+            "version": self.model_service.version,
+        }
+
+    def _cache_get(self, key: str) -> Optional[dict]:
+        """Cached explanation, marked most recently used."""
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, key: str, result: dict) -> None:
+        """Store an explanation, evicting the least recently used ones."""
+        if self.cache_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def close(self) -> None:
+        """Stop accepting work and wait for running computations."""
+        self._executor.shutdown(wait=True)
+
+
+@lru_cache(maxsize=1)
+def get_explanation_service() -> ExplanationService:
+    """Get or create explanation service instance (cached singleton)"""
+    settings = get_settings()
+    model_service = get_model_service()
+    return ExplanationService(
+        model_service,
+        get_preprocessing_service(run_id=model_service.run_id),
+        max_workers=settings.EXPLAIN_MAX_WORKERS,
+        max_pending=settings.EXPLAIN_MAX_PENDING,
+        timeout_seconds=settings.EXPLAIN_TIMEOUT_SECONDS,
+        cache_size=settings.EXPLAIN_CACHE_SIZE,
+    )
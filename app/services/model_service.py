@@ -1,16 +1,33 @@
 """Model service for loading and managing ML models."""
 
 import json
+from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, Iterator
 
 import mlflow
+import psutil
 from loguru import logger
 
 from app.core.config import get_settings
+from app.core.metrics import MODEL_MEMORY_BYTES
+from app.core.threads import NativeThreadBudget, configure_model_threads
 from app.core.tracing import get_tracer
+from app.utils.artifact_cache import ArtifactCache, get_artifact_cache
 from app.utils.gcs import setup_gcs_credentials
-from app.utils.mlflow_helpers import get_latest_model_version, load_model_with_flavor, setup_mlflow_tracking
+from app.utils.mlflow_helpers import (
+    load_model_with_flavor,
+    setup_mlflow_tracking,
+    unwrap_native_model,
+    wrap_native_model,
+)
+from app.utils.registry_resolver import get_registry_resolver
+
+
+def _process_rss() -> int:
+    """Resident set size of the current process in bytes."""
+    return psutil.Process().memory_info().rss
 
 
 class ModelService:
@@ -22,6 +39,9 @@ class ModelService:
         self.sklearn_model = None  # For predict_proba support
         self.version = None
         self.run_id = None
+        self.memory_bytes = 0  # Resident memory taken by the loaded model objects
+        self.predict_kwargs = {}  # Per-call arguments of the native model (thread budget)
+        self.native_threads = None  # OpenMP/BLAS cap applied in each inference thread
         self._load_model()
 
     def _load_model(self) -> None:
@@ -56,11 +76,7 @@ class ModelService:
         # Find the model directory (MLflow downloads create a subdirectory)
         model_dir = self._find_model_directory(model_path)
 
-        # Load pyfunc model
-        self.model = mlflow.pyfunc.load_model(str(model_dir))
-
-        # Try loading native model for predict_proba support
-        self.sklearn_model = self._load_native_model(model_dir)
+        self._load_model_objects(str(model_dir), lambda uri: self._load_native_model(Path(uri)))
 
         self._log_model_load_status()
 
@@ -113,13 +129,13 @@ class ModelService:
 
     def _fetch_model_version(self) -> None:
         """Fetch the latest model version from MLflow registry."""
-        client = setup_mlflow_tracking(self.settings.MLFLOW_TRACKING_URI)
+        setup_mlflow_tracking(self.settings.MLFLOW_TRACKING_URI)
 
-        self.version, self.run_id = get_latest_model_version(
-            client=client,
-            model_name=self.settings.MODEL_NAME,
-            stage=self.settings.MODEL_STAGE,
+        resolver = get_registry_resolver(
+            self.settings.MLFLOW_TRACKING_URI, ttl_seconds=self.settings.REGISTRY_CACHE_TTL_SECONDS
         )
+        latest = resolver.resolve(self.settings.MODEL_NAME, self.settings.MODEL_STAGE)
+        self.version, self.run_id = latest["version"], latest["run_id"]
 
     def _load_model_artifacts_from_mlflow(self) -> None:
         """Load model artifacts from MLflow (pyfunc and native model)."""
@@ -127,14 +143,74 @@ class ModelService:
         logger.info(f"Loading model from MLflow: {model_uri} (stage: {self.settings.MODEL_STAGE})")
         logger.info(f"Model run ID: {self.run_id}")
 
-        # Load pyfunc model
-        self.model = mlflow.pyfunc.load_model(model_uri)
-
-        # Try loading native model for predict_proba support
-        self.sklearn_model = load_model_with_flavor(model_uri)
+        # Resolve through the local artifact cache when one is configured
+        with self._resolve_cached_uri(model_uri) as model_uri:
+            self._load_model_objects(model_uri, load_model_with_flavor)
 
         self._log_model_load_status()
 
+    def _load_model_objects(self, model_uri: str, native_loader: Callable[[str], Any]) -> None:
+        """
+        Load the pyfunc model and the native model used for predict_proba.
+
+        In single-instance mode the native model is loaded once and the pyfunc
+        interface wraps it; otherwise both are deserialized independently.
+        """
+        rss_before = _process_rss()
+
+        if self.settings.MODEL_SINGLE_INSTANCE:
+            self.sklearn_model = native_loader(model_uri)
+            if self.sklearn_model is not None:
+                self.model = wrap_native_model(model_uri, self.sklearn_model)
+            else:
+                self.model = mlflow.pyfunc.load_model(model_uri)
+        else:
+            # Load pyfunc model
+            self.model = mlflow.pyfunc.load_model(model_uri)
+
+            # Try loading native model for predict_proba support
+            self.sklearn_model = native_loader(model_uri)
+
+        self.memory_bytes = max(_process_rss() - rss_before, 0)
+        MODEL_MEMORY_BYTES.set(self.memory_bytes)
+        logger.info(f"Model resident memory: {self.memory_bytes / 1024**2:.1f} MiB")
+
+        if self.settings.INFERENCE_THREADS > 0:
+            self._apply_thread_budget(self.settings.INFERENCE_THREADS)
+
+    def _apply_thread_budget(self, n_threads: int) -> None:
+        """
+        Limit the threads each prediction call may use.
+
+        The native model keeps the setting or receives it per call (predict_kwargs);
+        the pyfunc model is configured too when it holds a separate native instance.
+        Models without a thread setting (e.g. the CatBoost pyfunc path) are capped by
+        the OpenMP/BLAS limits that bind_thread_budget applies in the calling thread.
+        """
+        self.native_threads = NativeThreadBudget(n_threads)
+        if self.sklearn_model is not None:
+            self.predict_kwargs = configure_model_threads(self.sklearn_model, n_threads)
+
+        pyfunc_native = unwrap_native_model(self.model)
+        if pyfunc_native is not None and pyfunc_native is not self.sklearn_model:
+            configure_model_threads(pyfunc_native, n_threads)
+        logger.info(f"Inference thread budget: {n_threads} per call")
+
+    @contextmanager
+    def _resolve_cached_uri(self, model_uri: str) -> Iterator[str]:
+        """Lease a local cached copy of the model artifacts, or yield the original URI if caching is disabled."""
+        cache = get_artifact_cache(self.settings.ARTIFACT_CACHE_DIR, self.settings.ARTIFACT_CACHE_MAX_BYTES)
+        if cache is None:
+            yield model_uri
+            return
+
+        key = ArtifactCache.make_key(self.run_id, "model", version=self.version)
+        with cache.lease(
+            key,
+            lambda dst: mlflow.artifacts.download_artifacts(artifact_uri=model_uri, dst_path=dst),
+        ) as local_path:
+            yield str(self._find_model_directory(local_path))
+
     def _log_model_load_status(self) -> None:
         """Log the model load status."""
         model_info = f"{self.settings.MODEL_NAME} v{self.version}"
@@ -143,10 +219,16 @@ class ModelService:
         else:
             logger.info(f"✓ Model loaded (pyfunc only): {model_info}")
 
+    def bind_thread_budget(self) -> None:
+        """Apply the OpenMP/BLAS cap to the calling thread (OpenMP pool sizes are per thread)."""
+        if self.native_threads is not None:
+            self.native_threads.bind()
+
     def predict(self, features):
         """Make prediction with loaded model"""
         if self.model is None:
             raise RuntimeError("Model not loaded")
+        self.bind_thread_budget()
 
         tracer = get_tracer()
         with tracer.start_as_current_span("model_inference.predict") as span:
@@ -166,13 +248,14 @@ class ModelService:
 
     def predict_proba(self, features):
         """Get prediction probabilities from loaded model"""
+        self.bind_thread_budget()
         tracer = get_tracer()
         with tracer.start_as_current_span("model_inference.predict_proba") as span:
             span.set_attribute("has_proba", self.sklearn_model is not None)
 
             if self.sklearn_model is not None and hasattr(self.sklearn_model, "predict_proba"):
                 try:
-                    proba = self.sklearn_model.predict_proba(features)
+                    proba = self.sklearn_model.predict_proba(features, **self.predict_kwargs)
                     span.set_attribute("prediction.success", True)
                     return proba
                 except Exception as e:
@@ -193,6 +276,8 @@ class ModelService:
             "run_id": self.run_id,
             "loaded": self.model is not None,
             "source": "local" if self.settings.MODEL_PATH else "mlflow",
+            "single_instance": bool(self.settings.MODEL_SINGLE_INSTANCE),
+            "memory_bytes": self.memory_bytes,
         }
 
 
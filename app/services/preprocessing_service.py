@@ -1,17 +1,24 @@
 """Preprocessing service for encoding categorical features before prediction"""
 
 import json
+from contextlib import nullcontext
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import joblib
 import mlflow
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 from app.core.config import get_settings
 from app.core.tracing import get_tracer
+from app.utils.artifact_cache import ArtifactCache, get_artifact_cache
+
+# A component whose value is below this fraction of its summed |terms| has cancelling terms;
+# proportional shares would amplify its attribution by up to 1 / ATTRIBUTION_RTOL
+ATTRIBUTION_RTOL = 1e-2
 
 
 class PreprocessingService:
@@ -28,8 +35,80 @@ class PreprocessingService:
         else:
             self.scaler, self.pca, self.feature_names = self._load_from_mlflow(run_id)
 
+        self.float32 = False
+        if self.settings.INFERENCE_FLOAT32:
+            self.enable_float32()
+
         logger.info(f"Preprocessing service ready ({len(self.feature_names)} features)")
 
+    def enable_float32(self) -> None:
+        """Switch preprocessing to the float32 path (fused scale + PCA projection)."""
+        self._projection, self._offset = self._build_float32_projection()
+        self.float32 = True
+        logger.info(f"float32 inference enabled ({self._projection.shape[0]} -> {self._projection.shape[1]})")
+
+    def _build_float32_projection(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fold the StandardScaler and PCA parameters into one float32 affine map.
+
+        PCA(scale(x)) = ((x - mean) / scale - pca_mean) @ components.T, which is
+        x @ W + b with W = (components / scale).T and b = -(mean / scale + pca_mean) @ components.T.
+        A scaler fitted without centering (sparse training) contributes mean = 0.
+        The parameters are combined in float64 and only the result is stored as float32.
+        """
+        mean, scale, components = self._affine_parameters()
+        weights = (components / scale).T
+        offset = -(mean / scale + np.asarray(self.pca.mean_, dtype=np.float64)) @ components.T
+        return np.ascontiguousarray(weights, dtype=np.float32), offset.astype(np.float32)
+
+    def _affine_parameters(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Scaler mean and scale, and PCA components (whitening applied), as float64 arrays."""
+        n_features = len(self.feature_names)
+        mean = getattr(self.scaler, "mean_", None) if getattr(self.scaler, "with_mean", True) else None
+        scale = getattr(self.scaler, "scale_", None)
+        mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+        scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+
+        components = np.asarray(self.pca.components_, dtype=np.float64)
+        if getattr(self.pca, "whiten", False):
+            components = components / np.sqrt(self.pca.explained_variance_)[:, np.newaxis]
+        return mean, scale, components
+
+    def encode(self, df: pd.DataFrame) -> pd.DataFrame:
+        """One-hot encode and align raw input to the training feature columns (before scaling)"""
+        if "ID" in df.columns:
+            df = df.drop("ID", axis=1)
+        df_encoded = pd.get_dummies(df.copy(), drop_first=True, dtype=np.float64)
+        return self.align_features(df_encoded, self.feature_names).astype(np.float64)
+
+    def attribute_to_features(self, encoded: np.ndarray, pc_attributions: np.ndarray) -> np.ndarray:
+        """
+        Map attributions of the principal components back to the encoded input features.
+
+        Each component value is a sum of per-feature terms, PC_k = sum_j components[k, j] * z_j
+        with z the standardized, PCA-centered features, so the attribution of PC_k is split
+        across features in proportion to their term. When the terms of a component (nearly)
+        cancel, |PC_k| < ATTRIBUTION_RTOL * sum_j |term_j|, proportional shares would blow up,
+        so that component is split by squared loadings instead. Per-feature attributions are
+        thus at most 1 / ATTRIBUTION_RTOL times the component's, and row sums are preserved.
+
+        Args:
+            encoded: Encoded features of shape (n_rows, n_features), as returned by encode().
+            pc_attributions: Attributions of shape (n_rows, n_components).
+
+        Returns:
+            Attributions of shape (n_rows, n_features).
+        """
+        mean, scale, components = self._affine_parameters()
+        standardized = (np.asarray(encoded, dtype=np.float64) - mean) / scale - np.asarray(self.pca.mean_)
+        terms = standardized[:, np.newaxis, :] * components[np.newaxis, :, :]
+        totals = terms.sum(axis=2, keepdims=True)
+
+        proportional = np.abs(totals) > ATTRIBUTION_RTOL * np.abs(terms).sum(axis=2, keepdims=True)
+        loadings = components**2 / (components**2).sum(axis=1, keepdims=True)
+        shares = np.where(proportional, terms / np.where(proportional, totals, 1.0), loadings[np.newaxis, :, :])
+        return np.einsum("nk,nkf->nf", np.asarray(pc_attributions, dtype=np.float64), shares)
+
     def _load_from_local_path(self):
         """Load preprocessing artifacts from embedded model path"""
         model_path = Path(self.settings.MODEL_PATH)
@@ -56,14 +135,24 @@ class PreprocessingService:
         logger.info(f"Loading preprocessing from MLflow (run_id: {run_id})")
         mlflow.set_tracking_uri(self.settings.MLFLOW_TRACKING_URI)
         artifact_uri = f"runs:/{run_id}/preprocessors"
-        local_path = Path(mlflow.artifacts.download_artifacts(artifact_uri))
+
+        cache = get_artifact_cache(self.settings.ARTIFACT_CACHE_DIR, self.settings.ARTIFACT_CACHE_MAX_BYTES)
+        if cache is not None:
+            # Lease the cache entry so another process cannot evict it while it is loaded
+            artifacts = cache.lease(
+                ArtifactCache.make_key(run_id, "preprocessors"),
+                lambda dst: mlflow.artifacts.download_artifacts(artifact_uri, dst_path=dst),
+            )
+        else:
+            artifacts = nullcontext(Path(mlflow.artifacts.download_artifacts(artifact_uri)))
 
         # Load artifacts
-        scaler = joblib.load(local_path / "scaler.pkl")
-        pca = joblib.load(local_path / "pca.pkl")
+        with artifacts as local_path:
+            scaler = joblib.load(local_path / "scaler.pkl")
+            pca = joblib.load(local_path / "pca.pkl")
 
-        with open(local_path / "feature_names.json", "r", encoding="utf-8") as f:
-            feature_names = json.load(f)["feature_names"]
+            with open(local_path / "feature_names.json", "r", encoding="utf-8") as f:
+                feature_names = json.load(f)["feature_names"]
 
         return scaler, pca, feature_names
 
@@ -88,7 +177,8 @@ class PreprocessingService:
 
             # One-hot encode
             with tracer.start_as_current_span("preprocessing.encode") as span:
-                df_encoded = pd.get_dummies(df.copy(), drop_first=True)
+                dummy_dtype = np.float32 if self.float32 else bool
+                df_encoded = pd.get_dummies(df.copy(), drop_first=True, dtype=dummy_dtype)
                 span.set_attribute("encoded_features", len(df_encoded.columns))
 
             # Align features
@@ -96,15 +186,23 @@ class PreprocessingService:
                 df_aligned = self.align_features(df_encoded, self.feature_names)
                 span.set_attribute("aligned_features", len(df_aligned.columns))
 
-            # Scale
-            with tracer.start_as_current_span("preprocessing.scale") as span:
-                df_scaled = self.scaler.transform(df_aligned)
-                span.set_attribute("scaler_type", "StandardScaler")
-
-            # PCA
-            with tracer.start_as_current_span("preprocessing.pca") as span:
-                df_pca = self.pca.transform(df_scaled)
-                span.set_attribute("n_components", df_pca.shape[1])
+            if self.float32:
+                # Scale + PCA as a single float32 matrix product
+                with tracer.start_as_current_span("preprocessing.scale_pca") as span:
+                    features = df_aligned.to_numpy(dtype=np.float32)
+                    df_pca = features @ self._projection + self._offset
+                    span.set_attribute("dtype", "float32")
+                    span.set_attribute("n_components", df_pca.shape[1])
+            else:
+                # Scale
+                with tracer.start_as_current_span("preprocessing.scale") as span:
+                    df_scaled = self.scaler.transform(df_aligned)
+                    span.set_attribute("scaler_type", "StandardScaler")
+
+                # PCA
+                with tracer.start_as_current_span("preprocessing.pca") as span:
+                    df_pca = self.pca.transform(df_scaled)
+                    span.set_attribute("n_components", df_pca.shape[1])
 
             # Return as DataFrame with PC column names
             pc_columns = [f"PC{i+1}" for i in range(df_pca.shape[1])]
@@ -0,0 +1,98 @@
+"""Startup warmup and readiness state of the prediction path."""
+
+import threading
+import time
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from app.core.metrics import WARMUP_DURATION_SECONDS
+from app.schemas.prediction import PredictionInput
+from app.services.model_service import ModelService
+from app.services.preprocessing_service import get_preprocessing_service
+
+_ready = threading.Event()
+
+
+def is_ready() -> bool:
+    """Whether warmup has finished and the service may receive traffic."""
+    return _ready.is_set()
+
+
+def mark_ready() -> None:
+    """Report the service as ready."""
+    _ready.set()
+
+
+def mark_not_ready() -> None:
+    """Report the service as not ready (e.g. before warmup)."""
+    _ready.clear()
+
+
+def parse_batch_sizes(value: str) -> List[int]:
+    """Parse a comma-separated list of batch sizes, ignoring blanks and non-positive values."""
+    return [int(size) for size in value.split(",") if size.strip() and int(size) > 0]
+
+
+def warmup_batch(size: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Synthetic applicants built from the PredictionInput example.
+
+    Binary flags alternate and amounts are jittered so multi-row batches
+    produce one-hot columns and realistic numeric ranges.
+
+    Args:
+        size: Number of applicants.
+        seed: Random seed of the jitter.
+
+    Returns:
+        DataFrame with one row per applicant, in request format.
+    """
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(size):
+        row = dict(example, ID=example["ID"] + i)
+        if i % 2:
+            row.update(CODE_GENDER="F", FLAG_OWN_CAR="N", FLAG_OWN_REALTY="N", FLAG_WORK_PHONE=1)
+        row["AMT_INCOME_TOTAL"] = float(example["AMT_INCOME_TOTAL"] * rng.uniform(0.5, 2.0))
+        row["DAYS_BIRTH"] = int(example["DAYS_BIRTH"] + rng.integers(-3000, 3000))
+        row["DAYS_EMPLOYED"] = int(example["DAYS_EMPLOYED"] + rng.integers(-1000, 1000))
+        rows.append(PredictionInput(**row).model_dump())
+    return pd.DataFrame(rows)
+
+
+def run_warmup(model_service: ModelService, batch_sizes: Iterable[int], rounds: int = 2) -> float:
+    """
+    Run synthetic applicants through preprocessing, predict and predict_proba.
+
+    The first calls pay for lazy allocations, library thread-pool start-up
+    and first-use code paths; running them here keeps that off live traffic.
+    Failures are logged and do not stop the service from becoming ready.
+
+    Args:
+        model_service: Loaded model service.
+        batch_sizes: Batch sizes to score, each once per round.
+        rounds: Passes over the batch sizes (0 skips warmup).
+
+    Returns:
+        Warmup duration in seconds.
+    """
+    start = time.perf_counter()
+    batch_sizes = list(batch_sizes)
+    try:
+        preprocessing_service = get_preprocessing_service(run_id=model_service.run_id)
+        for round_index in range(rounds):
+            for size in batch_sizes:
+                features = preprocessing_service.preprocess(warmup_batch(size, seed=round_index))
+                model_service.predict(features)
+                model_service.predict_proba(features)
+    except Exception as e:
+        logger.warning(f"Warmup failed, serving without it: {e}")
+
+    duration = time.perf_counter() - start
+    WARMUP_DURATION_SECONDS.set(duration)
+    logger.info(f"Warmup finished in {duration:.2f}s ({rounds} rounds, batch sizes {batch_sizes})")
+    return duration
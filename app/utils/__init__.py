@@ -1,11 +1,25 @@
 """Utility modules for the Card Approval API."""
 
+from app.utils.artifact_cache import ArtifactCache, get_artifact_cache
 from app.utils.gcs import setup_gcs_credentials
-from app.utils.mlflow_helpers import get_latest_model_version, load_model_with_flavor, setup_mlflow_tracking
+from app.utils.mlflow_helpers import (
+    get_latest_model_version,
+    load_model_with_flavor,
+    setup_mlflow_tracking,
+    unwrap_native_model,
+    wrap_native_model,
+)
+from app.utils.registry_resolver import RegistryResolver, get_registry_resolver
 
 __all__ = [
+    "ArtifactCache",
+    "get_artifact_cache",
     "setup_gcs_credentials",
     "setup_mlflow_tracking",
     "get_latest_model_version",
     "load_model_with_flavor",
+    "wrap_native_model",
+    "unwrap_native_model",
+    "RegistryResolver",
+    "get_registry_resolver",
 ]
@@ -0,0 +1,276 @@
+"""On-disk cache for MLflow artifacts shared by the API and CI scripts.
+
+Entries are keyed by model version and run_id. Each entry stores the
+downloaded files under ``data/`` next to a ``manifest.json`` holding their
+sizes and SHA-256 checksums, so a cache hit can be verified before use.
+Entries are populated in a temporary directory and renamed into place, and
+per-entry file locks make concurrent use from several processes on a shared
+volume safe: populating takes the entry lock exclusively, while readers hold
+it shared for as long as they lease the entry, so eviction (which needs the
+exclusive lock) never removes files that are being loaded.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to rename atomicity only
+    fcntl = None
+
+MANIFEST_NAME = "manifest.json"
+DATA_DIR_NAME = "data"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 checksum of a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hex digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_file_manifest(root: Path) -> Dict[str, Dict[str, object]]:
+    """
+    Describe every file below a directory by size and checksum.
+
+    Args:
+        root: Directory to scan.
+
+    Returns:
+        Mapping of POSIX relative path to ``{"size": int, "sha256": str}``.
+    """
+    files = {}
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            files[path.relative_to(root).as_posix()] = {
+                "size": path.stat().st_size,
+                "sha256": file_sha256(path),
+            }
+    return files
+
+
+class ArtifactCache:
+    """Content-verified, size-bounded local cache of MLflow artifacts."""
+
+    def __init__(self, root: str, max_bytes: int = 0, verify_checksums: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Cache directory (created if missing).
+            max_bytes: Upper bound on total cached bytes; 0 disables eviction.
+            verify_checksums: Whether to re-hash files on every cache hit.
+        """
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.verify_checksums = verify_checksums
+
+    @staticmethod
+    def make_key(run_id: str, artifact_path: str, version: Optional[str] = None) -> str:
+        """
+        Build the cache key for an artifact.
+
+        Args:
+            run_id: MLflow run ID that produced the artifact.
+            artifact_path: Artifact path within the run (e.g., 'model', 'preprocessors').
+            version: Registered model version, if the artifact is a registered model.
+
+        Returns:
+            Filesystem-safe cache key.
+        """
+        parts = [f"v{version}" if version else "", run_id, artifact_path.strip("/").replace("/", "_")]
+        return "-".join(part for part in parts if part)
+
+    @contextmanager
+    def lease(self, key: str, download_fn: Callable[[str], str]) -> Iterator[Path]:
+        """
+        Hold a cached artifact for use, downloading it on a miss.
+
+        The entry cannot be evicted by any process until the context exits, so
+        the artifact should be loaded inside it.
+
+        Args:
+            key: Cache key (see ``make_key``).
+            download_fn: Callable that downloads the artifact into the given
+                directory and returns the local path of the artifact.
+
+        Yields:
+            Local path of the artifact inside the cache.
+        """
+        entry = self.root / key
+
+        while True:
+            with self._lock(key, shared=True):
+                manifest = self._load_valid_manifest(entry)
+                if manifest is not None:
+                    os.utime(entry / MANIFEST_NAME)
+                    logger.info(f"Artifact cache hit: {key}")
+                    yield entry / DATA_DIR_NAME / manifest["root"]
+                    return
+
+            with self._lock(key):
+                # Another process may have populated the entry while we waited
+                if self._load_valid_manifest(entry) is None:
+                    logger.info(f"Artifact cache miss: {key}, downloading...")
+                    if entry.exists():
+                        shutil.rmtree(entry, ignore_errors=True)
+                    self._populate(key, entry, download_fn)
+
+            self._evict(keep=key)
+
+    def fetch(self, key: str, download_fn: Callable[[str], str]) -> Path:
+        """
+        Return the local path of a cached artifact, downloading it on a miss.
+
+        The entry is only protected from eviction while it is fetched; use
+        ``lease`` when the files are read after the call returns.
+
+        Args:
+            key: Cache key (see ``make_key``).
+            download_fn: Callable that downloads the artifact into the given
+                directory and returns the local path of the artifact.
+
+        Returns:
+            Local path of the artifact inside the cache.
+        """
+        with self.lease(key, download_fn) as path:
+            return path
+
+    def _populate(self, key: str, entry: Path, download_fn: Callable[[str], str]) -> dict:
+        """Download into a temporary directory, then rename it into place."""
+        tmp_entry = Path(tempfile.mkdtemp(prefix=f".tmp-{key}-", dir=self.root))
+        try:
+            data_dir = tmp_entry / DATA_DIR_NAME
+            data_dir.mkdir()
+            start = time.perf_counter()
+            local_path = Path(download_fn(str(data_dir))).resolve()
+            elapsed = time.perf_counter() - start
+
+            files = build_file_manifest(data_dir)
+            manifest = {
+                "key": key,
+                "root": local_path.relative_to(data_dir.resolve()).as_posix(),
+                "files": files,
+                "total_bytes": sum(meta["size"] for meta in files.values()),
+                "created_at": time.time(),
+            }
+            with open(tmp_entry / MANIFEST_NAME, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+
+            os.rename(tmp_entry, entry)
+            logger.info(f"Cached {key}: {len(files)} files, {manifest['total_bytes']:,} bytes in {elapsed:.2f}s")
+            return manifest
+        except Exception:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            raise
+
+    def _load_valid_manifest(self, entry: Path) -> Optional[dict]:
+        """Return the entry manifest if every file matches it, else None."""
+        manifest_path = entry / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            data_dir = entry / DATA_DIR_NAME
+            for rel_path, meta in manifest["files"].items():
+                path = data_dir / rel_path
+                if not path.is_file() or path.stat().st_size != meta["size"]:
+                    raise ValueError(f"size mismatch for {rel_path}")
+                if self.verify_checksums and file_sha256(path) != meta["sha256"]:
+                    raise ValueError(f"checksum mismatch for {rel_path}")
+            return manifest
+        except Exception as e:
+            logger.warning(f"Discarding invalid cache entry {entry.name}: {e}")
+            return None
+
+    def _evict(self, keep: str) -> None:
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        if self.max_bytes <= 0:
+            return
+
+        with self._lock(".evict"):
+            entries = []
+            for entry in self.root.iterdir():
+                manifest_path = entry / MANIFEST_NAME
+                if entry.name.startswith(".") or not manifest_path.exists():
+                    continue
+                try:
+                    with open(manifest_path, "r", encoding="utf-8") as f:
+                        size = json.load(f).get("total_bytes", 0)
+                    entries.append((manifest_path.stat().st_mtime, entry, size))
+                except (OSError, ValueError):
+                    continue
+
+            total = sum(size for _, _, size in entries)
+            for _, entry, size in sorted(entries, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                if entry.name == keep:
+                    continue
+                # Skip entries another process is populating or has leased
+                with self._lock(entry.name, blocking=False) as acquired:
+                    if not acquired:
+                        continue
+                    shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+                logger.info(f"Evicted cache entry {entry.name} ({size:,} bytes)")
+
+    @contextmanager
+    def _lock(self, name: str, blocking: bool = True, shared: bool = False) -> Iterator[bool]:
+        """Hold an inter-process lock for ``name``, exclusive unless ``shared``."""
+        if fcntl is None:
+            yield True
+            return
+
+        with open(self.root / f".{name.lstrip('.')}.lock", "a", encoding="utf-8") as lock_file:
+            flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            if not blocking:
+                flags |= fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_file.fileno(), flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def get_artifact_cache(cache_dir: str, max_bytes: int = 0) -> Optional[ArtifactCache]:
+    """
+    Create an artifact cache if a cache directory is configured.
+
+    Args:
+        cache_dir: Cache directory; empty disables caching.
+        max_bytes: Upper bound on total cached bytes; 0 disables eviction.
+
+    Returns:
+        ArtifactCache instance, or None if caching is disabled.
+    """
+    if not cache_dir:
+        return None
+    return ArtifactCache(cache_dir, max_bytes=max_bytes)
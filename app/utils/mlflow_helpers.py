@@ -4,6 +4,9 @@ from typing import Any, Optional, Tuple
 
 import mlflow
 from loguru import logger
+from mlflow.models import Model
+
+from app.utils.registry_resolver import resolve_latest_version
 
 
 def setup_mlflow_tracking(tracking_uri: str) -> mlflow.tracking.MlflowClient:
@@ -28,6 +31,8 @@ def get_latest_model_version(
     """
     Get the latest model version for a given model name and stage.
 
+    The stage is filtered on the tracking server; see registry_resolver.
+
     Args:
         client: MLflow client instance.
         model_name: Name of the registered model.
@@ -39,18 +44,7 @@ def get_latest_model_version(
     Raises:
         ValueError: If no model version is found for the given stage.
     """
-    filter_string = f"name='{model_name}'"
-    model_versions = client.search_model_versions(filter_string=filter_string)
-
-    # Filter by stage
-    stage_versions = [v for v in model_versions if v.current_stage == stage]
-
-    if not stage_versions:
-        raise ValueError(f"No model version found for {model_name} in {stage} stage")
-
-    # Sort by version number (descending) and get the latest
-    latest_version = sorted(stage_versions, key=lambda v: int(v.version), reverse=True)[0]
-
+    latest_version = resolve_latest_version(client, model_name, stage)
     return latest_version.version, latest_version.run_id
 
 
@@ -86,6 +80,40 @@ def load_model_with_flavor(model_uri: str) -> Optional[Any]:
     return None
 
 
+def wrap_native_model(model_uri: str, native_model: Any) -> mlflow.pyfunc.PyFuncModel:
+    """
+    Expose an already-loaded native model through the pyfunc interface.
+
+    The returned PyFuncModel keeps MLflow's input schema enforcement but calls
+    the native model's predict directly, so the artifacts are deserialized once.
+
+    Args:
+        model_uri: MLflow model URI or local model directory (for MLmodel metadata).
+        native_model: Model loaded with its native flavor.
+
+    Returns:
+        PyFuncModel backed by native_model.
+    """
+    return mlflow.pyfunc.PyFuncModel(model_meta=Model.load(model_uri), model_impl=native_model)
+
+
+def unwrap_native_model(pyfunc_model: mlflow.pyfunc.PyFuncModel) -> Any:
+    """
+    Get the native model behind a pyfunc model.
+
+    Args:
+        pyfunc_model: Model loaded with mlflow.pyfunc or built by wrap_native_model.
+
+    Returns:
+        The model held by the flavor's pyfunc wrapper, or the implementation itself.
+    """
+    model_impl = getattr(pyfunc_model, "_model_impl", None)
+    for attr in ("xgb_model", "lgb_model", "cb_model"):
+        if hasattr(model_impl, attr):
+            return getattr(model_impl, attr)
+    return model_impl
+
+
 def check_mlflow_connection(tracking_uri: str) -> bool:
     """
     Check if MLflow server is accessible.
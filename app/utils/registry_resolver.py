@@ -0,0 +1,215 @@
+"""Shared resolver for "latest model version in a stage" registry lookups.
+
+The API, ``download_model.py`` and ``evaluate_model.py`` all need the newest
+version of a registered model in a stage. The resolver asks the tracking
+server for exactly that (``get_latest_versions`` filters by stage on the
+server) instead of listing every version, and falls back to a
+version-descending paged search that stops at the first match. Results are
+cached for a short TTL and carry an ``etag`` derived from the version's
+identity and last update time, so pollers can cheaply tell whether anything
+changed.
+
+MLflow's REST client keeps one pooled keep-alive ``requests.Session`` per
+process, so resolvers share connections by sharing an ``MlflowClient``; use
+``get_registry_resolver`` to get the per-process resolver of a tracking URI.
+"""
+
+import hashlib
+import threading
+import time
+import warnings
+from typing import Callable, Dict, Optional, Tuple
+
+from loguru import logger
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, ErrorCode
+from mlflow.tracking import MlflowClient
+
+DEFAULT_TTL_SECONDS = 30.0
+SEARCH_PAGE_SIZE = 100
+
+_resolvers: Dict[Tuple[str, float], "RegistryResolver"] = {}
+_resolvers_lock = threading.Lock()
+
+
+def _search_latest_version(client: MlflowClient, model_name: str, stage: str, page_size: int = SEARCH_PAGE_SIZE):
+    """Page through versions newest first and return the first one in the stage."""
+    escaped_name = model_name.replace("'", "\\'")
+    page_token = None
+    while True:
+        page = client.search_model_versions(
+            filter_string=f"name='{escaped_name}'",
+            max_results=page_size,
+            order_by=["version_number DESC"],
+            page_token=page_token,
+        )
+        # Servers that ignore order_by still return complete pages, so pick the highest match per page
+        matches = [version for version in page if version.current_stage == stage]
+        if matches:
+            return max(matches, key=lambda version: int(version.version))
+        page_token = getattr(page, "token", None)
+        if not page_token:
+            return None
+
+
+def resolve_latest_version(client: MlflowClient, model_name: str, stage: str):
+    """
+    Find the latest version of a registered model in a stage.
+
+    Args:
+        client: MLflow client instance.
+        model_name: Name of the registered model.
+        stage: Model stage (e.g., 'Production', 'Staging').
+
+    Returns:
+        The matching ModelVersion entity.
+
+    Raises:
+        ValueError: If no model version is found for the given stage.
+    """
+    try:
+        with warnings.catch_warnings():
+            # Stages are deprecated in newer MLflow releases but are what this registry uses
+            warnings.simplefilter("ignore", FutureWarning)
+            versions = client.get_latest_versions(model_name, stages=[stage])
+        latest = max(versions, key=lambda version: int(version.version)) if versions else None
+    except MlflowException as e:
+        if e.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+            raise ValueError(f"No model version found for {model_name} in {stage} stage") from e
+        logger.debug(f"get_latest_versions unavailable ({e}); searching versions instead")
+        latest = _search_latest_version(client, model_name, stage)
+
+    if latest is None:
+        raise ValueError(f"No model version found for {model_name} in {stage} stage")
+    return latest
+
+
+def version_etag(model_version) -> str:
+    """
+    Change-detection tag of a model version.
+
+    Args:
+        model_version: ModelVersion entity.
+
+    Returns:
+        Short hex digest that changes whenever the version, its run, stage or last update changes.
+    """
+    identity = ":".join(
+        str(value)
+        for value in (
+            model_version.name,
+            model_version.version,
+            model_version.run_id,
+            model_version.current_stage,
+            model_version.last_updated_timestamp,
+        )
+    )
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+class RegistryResolver:
+    """Resolve and cache the latest model version per (model name, stage)."""
+
+    def __init__(
+        self,
+        client: MlflowClient,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            client: MLflow client instance (its HTTP session is reused for every lookup).
+            ttl_seconds: How long a resolved version is served from cache; 0 disables caching.
+            clock: Monotonic time source.
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._cache: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, model_name: str, stage: str, refresh: bool = False) -> dict:
+        """
+        Latest version of a model in a stage.
+
+        Args:
+            model_name: Name of the registered model.
+            stage: Model stage (e.g., 'Production', 'Staging').
+            refresh: Bypass the cache and query the registry.
+
+        Returns:
+            Dictionary with name, version, run_id, stage, source, last_updated_timestamp and etag.
+
+        Raises:
+            ValueError: If no model version is found for the given stage.
+        """
+        key = (model_name, stage)
+        now = self._clock()
+        if not refresh:
+            with self._lock:
+                cached = self._cache.get(key)
+            if cached is not None and now < cached[0]:
+                return dict(cached[1])
+
+        latest = resolve_latest_version(self.client, model_name, stage)
+        info = {
+            "name": model_name,
+            "version": str(latest.version),
+            "run_id": latest.run_id,
+            "stage": stage,
+            "source": latest.source,
+            "last_updated_timestamp": latest.last_updated_timestamp,
+            "etag": version_etag(latest),
+        }
+        if self.ttl_seconds > 0:
+            with self._lock:
+                self._cache[key] = (now + self.ttl_seconds, info)
+        return dict(info)
+
+    def resolve_if_changed(self, model_name: str, stage: str, etag: Optional[str]) -> Optional[dict]:
+        """
+        Resolve only to report a change, like an HTTP conditional request.
+
+        Args:
+            model_name: Name of the registered model.
+            stage: Model stage.
+            etag: Tag of the version the caller already has (None always returns the version).
+
+        Returns:
+            The version info if its etag differs from the given one, else None.
+        """
+        info = self.resolve(model_name, stage)
+        return None if info["etag"] == etag else info
+
+    def invalidate(self, model_name: Optional[str] = None, stage: Optional[str] = None) -> None:
+        """
+        Drop cached lookups.
+
+        Args:
+            model_name: Only drop this model (default: all models).
+            stage: Only drop this stage (default: all stages).
+        """
+        with self._lock:
+            for key in list(self._cache):
+                if (model_name is None or key[0] == model_name) and (stage is None or key[1] == stage):
+                    del self._cache[key]
+
+
+def get_registry_resolver(tracking_uri: str, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> RegistryResolver:
+    """
+    Get the shared resolver of a tracking server for this process.
+
+    Args:
+        tracking_uri: MLflow tracking server URI.
+        ttl_seconds: Cache TTL of the resolver (resolvers are shared per URI and TTL).
+
+    Returns:
+        RegistryResolver instance.
+    """
+    key = (tracking_uri, ttl_seconds)
+    with _resolvers_lock:
+        if key not in _resolvers:
+            _resolvers[key] = RegistryResolver(MlflowClient(tracking_uri=tracking_uri), ttl_seconds=ttl_seconds)
+        return _resolvers[key]
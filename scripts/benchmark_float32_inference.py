@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+float32 Inference Benchmark
+
+Runs synthetic applicants through the serving preprocessing path and the
+model in float64 and float32 mode, checks that prediction outputs agree and
+reports latency and the size of the intermediate matrices per batch size.
+
+By default a synthetic scaler/PCA/XGBoost model is fitted; pass --model-path
+to benchmark artifacts produced by scripts/download_model.py instead.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.schemas.prediction import PredictionInput  # noqa: E402
+
+CATEGORY_VALUES = {
+    "CODE_GENDER": ["M", "F"],
+    "FLAG_OWN_CAR": ["Y", "N"],
+    "FLAG_OWN_REALTY": ["Y", "N"],
+    "NAME_INCOME_TYPE": ["Working", "Commercial associate", "Pensioner", "State servant", "Student"],
+    "NAME_EDUCATION_TYPE": [
+        "Higher education",
+        "Secondary / secondary special",
+        "Incomplete higher",
+        "Lower secondary",
+        "Academic degree",
+    ],
+    "NAME_FAMILY_STATUS": ["Married", "Single / not married", "Civil marriage", "Separated", "Widow"],
+    "NAME_HOUSING_TYPE": ["House / apartment", "With parents", "Municipal apartment", "Rented apartment"],
+    "OCCUPATION_TYPE": ["Managers", "Laborers", "Core staff", "Sales staff", "Drivers", "Unknown"],
+}
+
+
+def make_applicants(n: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Build n synthetic applicants around the PredictionInput example."""
+    example = PredictionInput.model_config["json_schema_extra"]["example"]
+    df = pd.DataFrame([example] * n)
+
+    for column, values in CATEGORY_VALUES.items():
+        df[column] = rng.choice(values, size=n)
+    df["ID"] = np.arange(n) + 5000000
+    df["CNT_CHILDREN"] = rng.integers(0, 4, size=n)
+    df["AMT_INCOME_TOTAL"] = rng.lognormal(12, 0.5, size=n)
+    df["DAYS_BIRTH"] = rng.integers(-25000, -7000, size=n)
+    df["DAYS_EMPLOYED"] = rng.integers(-15000, 0, size=n)
+    for flag in ["FLAG_WORK_PHONE", "FLAG_PHONE", "FLAG_EMAIL"]:
+        df[flag] = rng.integers(0, 2, size=n)
+    df["CNT_FAM_MEMBERS"] = df["CNT_CHILDREN"] + rng.integers(1, 3, size=n)
+    return df
+
+
+def build_synthetic_artifacts(output_dir: Path, rng: np.random.Generator, n_train: int = 20000):
+    """Fit scaler, PCA and an XGBoost model on synthetic applicants and save the preprocessors."""
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+    from xgboost import XGBClassifier
+
+    train = make_applicants(n_train, rng).drop("ID", axis=1)
+    encoded = pd.get_dummies(train, drop_first=True)
+    scaler = StandardScaler().fit(encoded)
+    pca = PCA(n_components=5, random_state=42).fit(scaler.transform(encoded))
+    components = pd.DataFrame(pca.transform(scaler.transform(encoded)), columns=[f"PC{i+1}" for i in range(5)])
+
+    # Label loosely tied to income and employment so the model has signal
+    logits = (np.log(train["AMT_INCOME_TOTAL"]) - 12) * 2 - train["DAYS_EMPLOYED"] / 5000 + rng.normal(0, 1, n_train)
+    labels = (logits > 0).astype(int)
+    model = XGBClassifier(n_estimators=200, max_depth=5, learning_rate=0.1, random_state=42)
+    model.fit(components, labels)
+
+    preprocessing_path = output_dir / "preprocessors"
+    preprocessing_path.mkdir(parents=True, exist_ok=True)
+    joblib.dump(scaler, preprocessing_path / "scaler.pkl")
+    joblib.dump(pca, preprocessing_path / "pca.pkl")
+    with open(preprocessing_path / "feature_names.json", "w") as f:
+        json.dump({"feature_names": encoded.columns.tolist()}, f)
+
+    return model
+
+
+def load_native_model(model_path: Path):
+    """Load the native model from artifacts downloaded by download_model.py."""
+    from app.services.model_service import ModelService
+    from app.utils.mlflow_helpers import load_model_with_flavor
+
+    model_dir = ModelService._find_model_directory(None, model_path)
+    model = load_model_with_flavor(str(model_dir))
+    if model is None or not hasattr(model, "predict_proba"):
+        raise ValueError(f"No native model with predict_proba found in {model_path}")
+    return model
+
+
+def time_call(fn, repeats: int):
+    """Return (median seconds, last result) over several calls."""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark float32 vs float64 inference")
+    parser.add_argument(
+        "--model-path",
+        type=str,
+        default=None,
+        help="Directory produced by download_model.py (default: fit a synthetic model)",
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[1, 100, 10000, 100000],
+        help="Batch sizes to benchmark (default: 1 100 10000 100000)",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repetitions per batch size (default: 5)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1e-3,
+        help="Maximum allowed 99.9th percentile of the probability difference (default: 1e-3)",
+    )
+    parser.add_argument(
+        "--max-flip-rate",
+        type=float,
+        default=1e-4,
+        help="Maximum allowed fraction of flipped approve/reject decisions (default: 1e-4)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.model_path:
+            model_path = Path(args.model_path)
+            model = load_native_model(model_path)
+        else:
+            model_path = Path(tmp_dir)
+            print("Fitting synthetic preprocessors and XGBoost model...")
+            model = build_synthetic_artifacts(model_path, rng)
+
+        # Settings are read once, so point MODEL_PATH at the artifacts before importing the service
+        os.environ["MODEL_PATH"] = str(model_path)
+        os.environ["INFERENCE_FLOAT32"] = "false"
+        from app.core.config import get_settings
+        from app.services.preprocessing_service import PreprocessingService
+
+        get_settings.cache_clear()
+        service = PreprocessingService(run_id="benchmark")
+        service.enable_float32()
+        n_features = len(service.feature_names)
+
+        print("=" * 113)
+        print("FLOAT32 INFERENCE BENCHMARK")
+        print("=" * 113)
+        print(
+            f"{'batch':>8} | {'dtype':>7} | {'preprocess ms':>13} | {'model ms':>9} | "
+            f"{'total ms':>9} | {'matrix MB':>9} | {'max |dp|':>9} | {'p99.9 |dp|':>10} | {'flips':>8}"
+        )
+        print("-" * 113)
+
+        parity_ok = True
+        for batch_size in args.batch_sizes:
+            applicants = make_applicants(batch_size, rng)
+            outputs = {}
+
+            for dtype in ["float64", "float32"]:
+                service.float32 = dtype == "float32"
+                prep_time, features = time_call(lambda: service.preprocess(applicants.copy()), args.repeats)
+                model_time, proba = time_call(lambda: model.predict_proba(features)[:, 1], args.repeats)
+                outputs[dtype] = proba
+
+                # Encoded matrix fed to the scaler plus the PCA output, at the path's precision
+                itemsize = np.dtype(dtype).itemsize
+                matrix_mb = batch_size * (n_features + features.shape[1]) * itemsize / 1024**2
+
+                if dtype == "float64":
+                    parity = ""
+                else:
+                    # Isolated rows can land on the other side of a tree split threshold after
+                    # float32 rounding, so the gate uses a high percentile rather than the max
+                    diff = np.abs(outputs["float32"] - outputs["float64"])
+                    p999 = np.quantile(diff, 0.999)
+                    flips = np.mean((outputs["float32"] >= 0.5) != (outputs["float64"] >= 0.5))
+                    parity = f"{diff.max():>9.2e} | {p999:>10.2e} | {flips:>8.4%}"
+                    parity_ok = parity_ok and p999 <= args.tolerance and flips <= args.max_flip_rate
+
+                print(
+                    f"{batch_size:>8} | {dtype:>7} | {prep_time * 1000:>13.2f} | {model_time * 1000:>9.2f} | "
+                    f"{(prep_time + model_time) * 1000:>9.2f} | {matrix_mb:>9.2f} | {parity}"
+                )
+
+        print("=" * 113)
+        if not parity_ok:
+            print(" FAILED: float32 predictions diverge from float64 beyond the configured tolerance")
+            sys.exit(1)
+        print(" PASSED: float32 predictions match float64 within tolerance")
+
+
+if __name__ == "__main__":
+    main()
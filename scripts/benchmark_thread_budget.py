@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Inference Thread Budget Benchmark
+
+Scores single applicants through the serving preprocessing path and the
+model from a pool of request threads, the way synchronous endpoints run in
+Starlette's threadpool, for every combination of inference threads
+(OpenMP/BLAS and the model's nthread/n_jobs), request threadpool size and
+number of concurrent clients. Reports throughput and p50/p99 latency per
+cell, and the best setting per concurrency level.
+
+Run it under the same CPU limit as the pods (e.g. `taskset -c 0` or a
+container with --cpus=0.5) and copy the chosen values to INFERENCE_THREADS
+and REQUEST_THREADPOOL_SIZE.
+
+By default a synthetic scaler/PCA/XGBoost model is fitted; pass --model-path
+to benchmark artifacts produced by scripts/download_model.py instead.
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.threads import NativeThreadBudget, configure_model_threads  # noqa: E402
+from scripts.benchmark_float32_inference import (  # noqa: E402
+    build_synthetic_artifacts,
+    load_native_model,
+    make_applicants,
+)
+
+
+def run_cell(score, applicants, pool_size: int, concurrency: int, requests_per_client: int) -> dict:
+    """
+    Drive `concurrency` clients, each sending requests one after another, through a request threadpool.
+
+    Args:
+        score: Function scoring one applicant row
+        applicants: Applicants to draw requests from
+        pool_size: Request threadpool size
+        concurrency: Concurrent clients
+        requests_per_client: Sequential requests per client
+
+    Returns:
+        Dictionary with throughput (requests/s) and p50/p99 latency (ms), queueing included
+    """
+    rows = [applicants.iloc[[i]] for i in range(len(applicants))]
+
+    with ThreadPoolExecutor(max_workers=pool_size) as request_pool:
+
+        def client(client_index: int):
+            latencies = []
+            for i in range(requests_per_client):
+                row = rows[(client_index * requests_per_client + i) % len(rows)]
+                start = time.perf_counter()
+                request_pool.submit(score, row).result()
+                latencies.append(time.perf_counter() - start)
+            return latencies
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as clients:
+            latencies = np.concatenate(list(clients.map(client, range(concurrency))))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p99_ms": float(np.percentile(latencies, 99) * 1000),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inference thread budgets across concurrency levels")
+    parser.add_argument(
+        "--model-path",
+        type=str,
+        default=None,
+        help="Directory produced by download_model.py (default: fit a synthetic model)",
+    )
+    parser.add_argument(
+        "--inference-threads",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="OpenMP/BLAS and model threads per call to try (default: 1 2 4)",
+    )
+    parser.add_argument(
+        "--pool-sizes",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 40],
+        help="Request threadpool sizes to try; 40 is Starlette's default (default: 1 2 4 40)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16, 64],
+        help="Concurrent clients (default: 1 4 16 64)",
+    )
+    parser.add_argument("--requests", type=int, default=50, help="Sequential requests per client (default: 50)")
+    parser.add_argument("--output-csv", type=str, default=None, help="Also write the matrix to this CSV file")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.model_path:
+            model_path = Path(args.model_path)
+            model = load_native_model(model_path)
+        else:
+            model_path = Path(tmp_dir)
+            print("Fitting synthetic preprocessors and XGBoost model...")
+            model = build_synthetic_artifacts(model_path, rng)
+
+        # Settings are read once, so point MODEL_PATH at the artifacts before importing the service
+        os.environ["MODEL_PATH"] = str(model_path)
+        from app.core.config import get_settings
+        from app.services.preprocessing_service import PreprocessingService
+
+        get_settings.cache_clear()
+        service = PreprocessingService(run_id="benchmark")
+        applicants = make_applicants(1000, rng)
+
+        print("=" * 78)
+        print(f"THREAD BUDGET BENCHMARK ({os.cpu_count()} CPUs visible)")
+        print("=" * 78)
+        print(f"{'threads':>7} | {'pool':>4} | {'clients':>7} | {'req/s':>9} | {'p50 ms':>9} | {'p99 ms':>9}")
+        print("-" * 78)
+
+        results = []
+        for n_threads in args.inference_threads:
+            budget = NativeThreadBudget(n_threads)
+            predict_kwargs = configure_model_threads(model, n_threads)
+
+            def score(row):
+                # OpenMP pool sizes are per thread, so cap every request thread like the API does
+                budget.bind()
+                return model.predict_proba(service.preprocess(row.copy()), **predict_kwargs)
+
+            # Warm up so the first cell does not pay for thread-pool start-up
+            run_cell(score, applicants, pool_size=1, concurrency=1, requests_per_client=20)
+
+            for pool_size in args.pool_sizes:
+                for concurrency in args.concurrency:
+                    cell = run_cell(score, applicants, pool_size, concurrency, args.requests)
+                    cell.update(threads=n_threads, pool=pool_size, concurrency=concurrency)
+                    results.append(cell)
+                    print(
+                        f"{n_threads:>7} | {pool_size:>4} | {concurrency:>7} | {cell['throughput']:>9.1f} | "
+                        f"{cell['p50_ms']:>9.2f} | {cell['p99_ms']:>9.2f}"
+                    )
+
+        print("=" * 78)
+        print("Lowest p99 per concurrency level:")
+        for concurrency in args.concurrency:
+            best = min((r for r in results if r["concurrency"] == concurrency), key=lambda r: r["p99_ms"])
+            print(
+                f"   {concurrency:>4} clients: INFERENCE_THREADS={best['threads']} "
+                f"REQUEST_THREADPOOL_SIZE={best['pool']} (p99 {best['p99_ms']:.2f} ms, {best['throughput']:.1f} req/s)"
+            )
+
+    if args.output_csv:
+        with open(args.output_csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["threads", "pool", "concurrency", "throughput", "p50_ms", "p99_ms"])
+            writer.writeheader()
+            writer.writerows(results)
+        print(f" Matrix written to: {args.output_csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,131 @@ import json
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import mlflow
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.artifact_cache import ArtifactCache, file_sha256, get_artifact_cache  # noqa: E402
+from app.utils.registry_resolver import get_registry_resolver  # noqa: E402
+
+MANIFEST_FILE = "artifact_manifest.json"
+PARTIAL_DIR = ".partial"
+
+
+def _list_remote_files(repo, path: str = "") -> List:
+    """Recursively list the files of an artifact repository."""
+    files = []
+    for info in repo.list_artifacts(path):
+        if info.is_dir:
+            files.extend(_list_remote_files(repo, info.path))
+        else:
+            files.append(info)
+    return files
+
+
+def _is_unchanged(local_path: Path, expected_size: Optional[int], previous: Optional[dict]) -> bool:
+    """Check a local file against the previous manifest entry and the remote size."""
+    if previous is None or not local_path.is_file():
+        return False
+    if expected_size is not None and previous["size"] != expected_size:
+        return False
+    return local_path.stat().st_size == previous["size"] and file_sha256(local_path) == previous["sha256"]
+
+
+def _fetch_file(repo, remote_path: str, expected_size: Optional[int], target: Path, staging: Path) -> dict:
+    """
+    Download one artifact file into the staging area, verify it and move it into place.
+
+    A staged file left over from an interrupted run is reused when its size
+    already matches the remote size, so only incomplete files are transferred again.
+    """
+    staged = staging / remote_path
+    if not (staged.is_file() and expected_size is not None and staged.stat().st_size == expected_size):
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        repo.download_artifacts(remote_path, dst_path=str(staging))
+
+    size = staged.stat().st_size
+    if expected_size is not None and size != expected_size:
+        staged.unlink()
+        raise IOError(f"Size mismatch for {remote_path}: expected {expected_size}, got {size}")
+
+    entry = {"size": size, "sha256": file_sha256(staged)}
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(staged, target)
+    return entry
+
+
+def _sync_artifacts(
+    artifact_uri: str,
+    dest: Path,
+    staging: Path,
+    executor: ThreadPoolExecutor,
+    previous: Dict[str, dict],
+) -> Dict[str, dict]:
+    """
+    Mirror an artifact tree into dest, transferring only new or changed files.
+
+    Args:
+        artifact_uri: MLflow artifact URI (models:/, runs:/ or a storage URI)
+        dest: Local destination directory
+        staging: Directory for in-flight downloads, kept across runs for resuming
+        executor: Shared bounded pool used for the file transfers
+        previous: Manifest entries from the previous run, keyed by path relative to dest
+
+    Returns:
+        Manifest entries ({"size", "sha256"}) keyed by path relative to dest
+    """
+    repo = get_artifact_repository(artifact_uri)
+    remote_files = _list_remote_files(repo)
+
+    entries = {}
+    futures = {}
+    for info in remote_files:
+        target = dest / info.path
+        if _is_unchanged(target, info.file_size, previous.get(info.path)):
+            entries[info.path] = previous[info.path]
+            continue
+        futures[executor.submit(_fetch_file, repo, info.path, info.file_size, target, staging)] = info.path
+
+    for future in as_completed(futures):
+        entries[futures[future]] = future.result()
+
+    print(
+        f"   {artifact_uri}: {len(futures)} transferred, {len(remote_files) - len(futures)} unchanged",
+        file=sys.stderr,
+    )
+    return entries
+
+
+def _copy_changed(src: Path, dest: Path, previous: Dict[str, dict]) -> Dict[str, dict]:
+    """Copy a cached artifact tree into dest, skipping files that are already up to date."""
+    entries = {}
+    for path in sorted(src.rglob("*")):
+        if not path.is_file():
+            continue
+        rel_path = path.relative_to(src).as_posix()
+        entry = {"size": path.stat().st_size, "sha256": file_sha256(path)}
+        target = dest / rel_path
+        if previous.get(rel_path) != entry or not _is_unchanged(target, entry["size"], entry):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, target)
+        entries[rel_path] = entry
+    return entries
+
+
+def _load_manifest(output_path: Path) -> dict:
+    """Load the manifest (version, run_id, sources and files) written by a previous download, if any."""
+    manifest_path = output_path / MANIFEST_FILE
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path) as f:
+        return json.load(f)
 
 
 def download_model(
@@ -21,88 +143,146 @@ def download_model(
     model_name: str,
     stage: str,
     output_dir: str,
+    cache_dir: str = "",
+    cache_max_bytes: int = 0,
+    max_workers: int = 8,
 ) -> dict:
     """
     Download model artifacts from MLflow registry.
 
+    Model and preprocessing artifacts are transferred concurrently with a
+    bounded pool. Files already present in output_dir with the size and
+    checksum recorded in its manifest are kept, so repeat runs of the same
+    model version only transfer what changed. A different version or run
+    transfers every file: same-size artifacts (MLmodel, scaler.pkl, pca.pkl)
+    would otherwise look unchanged.
+
     Args:
         tracking_uri: MLflow tracking server URL
         model_name: Name of the registered model
         stage: Model stage (Production, Staging, etc.)
         output_dir: Local directory to save model artifacts
+        cache_dir: Local artifact cache directory (empty disables caching)
+        cache_max_bytes: Upper bound on cached bytes (0 disables eviction)
+        max_workers: Maximum number of concurrent file transfers
 
     Returns:
         Dictionary with model metadata (version, run_id, etc.)
     """
     mlflow.set_tracking_uri(tracking_uri)
-    client = mlflow.tracking.MlflowClient()
-
-    # Get model versions
-    filter_string = f"name='{model_name}'"
-    model_versions = client.search_model_versions(filter_string=filter_string)
 
-    # Filter by stage
-    stage_versions = [v for v in model_versions if v.current_stage == stage]
-
-    if not stage_versions:
-        raise ValueError(f"No model found for '{model_name}' in '{stage}' stage")
-
-    # Get latest version
-    latest = sorted(stage_versions, key=lambda v: int(v.version), reverse=True)[0]
-    version = latest.version
-    run_id = latest.run_id
-    source = latest.source
+    # Latest version in the stage, filtered by the registry server
+    latest = get_registry_resolver(tracking_uri).resolve(model_name, stage)
+    version = latest["version"]
+    run_id = latest["run_id"]
+    source = latest["source"]
 
     print(f" Found model: {model_name} v{version} ({stage})", file=sys.stderr)
     print(f"   Run ID: {run_id}", file=sys.stderr)
     print(f"   Source: {source}", file=sys.stderr)
 
-    # Prepare output directory
+    cache = get_artifact_cache(cache_dir, cache_max_bytes)
+
+    # Prepare output directory (kept across runs so unchanged files are not transferred again)
     output_path = Path(output_dir)
-    if output_path.exists():
-        shutil.rmtree(output_path)
     output_path.mkdir(parents=True, exist_ok=True)
-
-    # Download model artifacts
-    model_uri = f"models:/{model_name}/{version}"
-    print(f"\n   Downloading model artifacts to: {output_path}", file=sys.stderr)
-
-    # Download the model using mlflow
-    local_path = mlflow.artifacts.download_artifacts(
-        artifact_uri=model_uri,
-        dst_path=str(output_path),
-    )
-
-    print(f"   Model downloaded to: {local_path}", file=sys.stderr)
-
-    # Also download preprocessing artifacts from the same run
-    print(f"\n   Downloading preprocessing artifacts from run: {run_id}", file=sys.stderr)
-    try:
-        # Download preprocessing artifacts
-        preprocessing_artifacts = mlflow.artifacts.download_artifacts(
-            run_id=run_id,
-            artifact_path="preprocessors",
-            dst_path=str(output_path),
-        )
-        print(f"   Preprocessing artifacts downloaded to: {preprocessing_artifacts}", file=sys.stderr)
-
-        # Verify files exist
-        preprocessing_path = Path(preprocessing_artifacts)
-        required_files = ["scaler.pkl", "pca.pkl", "feature_names.json"]
-        for file in required_files:
-            file_path = preprocessing_path / file
-            if file_path.exists():
-                print(f"   ✓ {file}", file=sys.stderr)
+    staging = output_path / PARTIAL_DIR
+    previous_manifest = _load_manifest(output_path)
+    previous = previous_manifest.get("files", {})
+    same_run = previous_manifest.get("run_id") == run_id
+    previous_sources = previous_manifest.get("sources", {}) if same_run else {}
+
+    # (label, artifact URI, destination prefix within output_dir, cache key)
+    artifacts = [
+        ("model", f"models:/{model_name}/{version}", "", ArtifactCache.make_key(run_id, "model", version=version)),
+        (
+            "preprocessors",
+            f"runs:/{run_id}/preprocessors",
+            "preprocessors",
+            ArtifactCache.make_key(run_id, "preprocessors"),
+        ),
+    ]
+
+    def sync(label: str, artifact_uri: str, prefix: str, key: str) -> Dict[str, dict]:
+        dest = output_path / prefix
+        # Size and checksum only identify unchanged files within the same source
+        prefix_previous = {}
+        if previous_sources.get(label) == artifact_uri:
+            prefix_previous = {
+                path[len(prefix) + 1 :] if prefix else path: entry
+                for path, entry in previous.items()
+                if not prefix or path.startswith(f"{prefix}/")
+            }
+        if cache is None:
+            entries = _sync_artifacts(artifact_uri, dest, staging / (prefix or "model"), file_pool, prefix_previous)
+        else:
+
+            def download_to_cache(dst: str) -> str:
+                # Stage next to the cache entry so the final move stays on one filesystem
+                cache_staging = Path(dst).parent / PARTIAL_DIR
+                _sync_artifacts(artifact_uri, Path(dst), cache_staging, file_pool, {})
+                shutil.rmtree(cache_staging, ignore_errors=True)
+                return dst
+
+            # Lease the cache entry so another process cannot evict it while it is copied
+            with cache.lease(key, download_to_cache) as cached:
+                entries = _copy_changed(cached, dest, prefix_previous)
+        return {f"{prefix}/{path}" if prefix else path: entry for path, entry in entries.items()}
+
+    print(f"\n   Downloading model and preprocessing artifacts to: {output_path}", file=sys.stderr)
+    files = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as file_pool, ThreadPoolExecutor(
+        max_workers=len(artifacts)
+    ) as artifact_pool:
+        futures = {label: artifact_pool.submit(sync, label, uri, prefix, key) for label, uri, prefix, key in artifacts}
+
+        # Model artifacts are required
+        files.update(futures["model"].result())
+        print(f"   Model downloaded to: {output_path}", file=sys.stderr)
+
+        # Preprocessing artifacts are optional (the API falls back to MLflow at runtime)
+        try:
+            files.update(futures["preprocessors"].result())
+            preprocessing_path = output_path / "preprocessors"
+            print(f"   Preprocessing artifacts downloaded to: {preprocessing_path}", file=sys.stderr)
+
+            # Verify files exist
+            required_files = ["scaler.pkl", "pca.pkl", "feature_names.json"]
+            for file in required_files:
+                file_path = preprocessing_path / file
+                if file_path.exists():
+                    print(f"   ✓ {file}", file=sys.stderr)
+                else:
+                    print(f"   ✗ {file} NOT FOUND", file=sys.stderr)
+
+        except Exception as e:
+            print(f"    Could not download preprocessing artifacts: {e}", file=sys.stderr)
+            print(f"   Error type: {type(e).__name__}", file=sys.stderr)
+            import traceback
+
+            traceback.print_exc(file=sys.stderr)
+            print("   Preprocessing will use MLflow at runtime if needed", file=sys.stderr)
+            if previous_sources.get("preprocessors") == f"runs:/{run_id}/preprocessors":
+                # Keep what a previous download of the same run left in place
+                files.update({path: entry for path, entry in previous.items() if path.startswith("preprocessors/")})
             else:
-                print(f"   ✗ {file} NOT FOUND", file=sys.stderr)
-
-    except Exception as e:
-        print(f"    Could not download preprocessing artifacts: {e}", file=sys.stderr)
-        print(f"   Error type: {type(e).__name__}", file=sys.stderr)
-        import traceback
-
-        traceback.print_exc(file=sys.stderr)
-        print("   Preprocessing will use MLflow at runtime if needed", file=sys.stderr)
+                # Another run's scaler/PCA must not be served with this model; without the
+                # directory the API loads the preprocessors of this run from MLflow instead
+                shutil.rmtree(output_path / "preprocessors", ignore_errors=True)
+
+    # Remove files that are no longer part of the model
+    for stale_path in set(previous) - set(files):
+        (output_path / stale_path).unlink(missing_ok=True)
+    shutil.rmtree(staging, ignore_errors=True)
+
+    # Save file manifest for the next incremental download
+    with open(output_path / MANIFEST_FILE, "w") as f:
+        sources = {label: uri for label, uri, _, _ in artifacts}
+        if not any(path.startswith("preprocessors/") for path in files):
+            del sources["preprocessors"]
+        json.dump(
+            {"version": version, "run_id": run_id, "sources": sources, "files": files}, f, indent=2, sort_keys=True
+        )
 
     # Save model metadata
     metadata = {
@@ -153,6 +333,24 @@ def main():
         default=None,
         help="Output file for environment variables (for CI/CD)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=os.environ.get("ARTIFACT_CACHE_DIR", ""),
+        help="Local artifact cache directory (default: from ARTIFACT_CACHE_DIR env, empty disables caching)",
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=int(os.environ.get("ARTIFACT_CACHE_MAX_BYTES", "0")),
+        help="Upper bound on cached bytes, 0 disables eviction (default: from ARTIFACT_CACHE_MAX_BYTES env)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent file downloads (default: 8)",
+    )
 
     args = parser.parse_args()
 
@@ -174,6 +372,9 @@ def main():
             model_name=args.model_name,
             stage=args.model_stage,
             output_dir=args.output_dir,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_bytes,
+            max_workers=args.max_workers,
         )
 
         # Output for CI/CD
@@ -12,14 +12,24 @@ from pathlib import Path
 import mlflow
 import pandas as pd
 
+from app.utils.artifact_cache import ArtifactCache, get_artifact_cache
+from app.utils.registry_resolver import get_registry_resolver
+
 # Reuse existing evaluation utilities from training module
-from training.src.utils.metrics import calculate_metrics
+from training.src.data.processed_store import has_processed_manifest, iter_processed_chunks, load_processed_split
+from training.src.utils.metrics import StreamingMetrics, bootstrap_metrics, calculate_metrics
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-def load_mlflow_model(tracking_uri: str, model_name: str, stage: str):
+def load_mlflow_model(
+    tracking_uri: str,
+    model_name: str,
+    stage: str,
+    cache_dir: str = "",
+    cache_max_bytes: int = 0,
+):
     """
     Load the latest model from MLflow registry.
 
@@ -27,27 +37,18 @@ def load_mlflow_model(tracking_uri: str, model_name: str, stage: str):
         tracking_uri: MLflow tracking server URL
         model_name: Name of the registered model
         stage: Model stage (Production, Staging, etc.)
+        cache_dir: Local artifact cache directory (empty disables caching)
+        cache_max_bytes: Upper bound on cached bytes (0 disables eviction)
 
     Returns:
         Tuple of (model, version, run_id)
     """
     mlflow.set_tracking_uri(tracking_uri)
-    client = mlflow.tracking.MlflowClient()
-
-    # Get model versions
-    filter_string = f"name='{model_name}'"
-    model_versions = client.search_model_versions(filter_string=filter_string)
-
-    # Filter by stage
-    stage_versions = [v for v in model_versions if v.current_stage == stage]
 
-    if not stage_versions:
-        raise ValueError(f"No model found for '{model_name}' in '{stage}' stage")
-
-    # Get latest version
-    latest = sorted(stage_versions, key=lambda v: int(v.version), reverse=True)[0]
-    version = latest.version
-    run_id = latest.run_id
+    # Latest version in the stage, filtered by the registry server
+    latest = get_registry_resolver(tracking_uri).resolve(model_name, stage)
+    version = latest["version"]
+    run_id = latest["run_id"]
 
     print(f" Loading model: {model_name} v{version} ({stage})")
     print(f"   Run ID: {run_id}")
@@ -55,6 +56,22 @@ def load_mlflow_model(tracking_uri: str, model_name: str, stage: str):
     # Load model using native flavor for predict_proba support
     model_uri = f"models:/{model_name}/{version}"
 
+    # Resolve through the local artifact cache shared with the API and download_model.py
+    cache = get_artifact_cache(cache_dir, cache_max_bytes)
+    if cache is None:
+        return _load_with_flavors(model_uri), version, run_id
+
+    # Lease the cache entry so another process cannot evict it while the model is loaded
+    with cache.lease(
+        ArtifactCache.make_key(run_id, "model", version=version),
+        lambda dst: mlflow.artifacts.download_artifacts(artifact_uri=model_uri, dst_path=dst),
+    ) as local_path:
+        print(f"   Using cached artifacts: {local_path}")
+        return _load_with_flavors(str(local_path)), version, run_id
+
+
+def _load_with_flavors(model_uri: str):
+    """Load a model with the first native flavor that succeeds, falling back to pyfunc."""
     # Try native flavors first (for predict_proba support)
     flavor_loaders = [
         ("xgboost", mlflow.xgboost.load_model),
@@ -67,45 +84,44 @@ def load_mlflow_model(tracking_uri: str, model_name: str, stage: str):
         try:
             model = loader_func(model_uri)
             print(f"   Loaded with {flavor_name} flavor")
-            return model, version, run_id
+            return model
         except Exception:
             continue
 
     # Fallback to pyfunc
     model = mlflow.pyfunc.load_model(model_uri)
     print("   Loaded with pyfunc flavor")
-    return model, version, run_id
+    return model
 
 
 def load_test_data(data_dir: str):
     """
     Load test data from processed directory.
 
+    Reads the memory-mapped binary splits when present, else X_test.csv/y_test.csv.
+
     Args:
         data_dir: Path to processed data directory
 
     Returns:
         Tuple of (X_test, y_test)
     """
-    data_path = Path(data_dir)
-
-    X_test_path = data_path / "X_test.csv"
-    y_test_path = data_path / "y_test.csv"
-
-    if not X_test_path.exists():
-        raise FileNotFoundError(f"Test features not found: {X_test_path}")
-    if not y_test_path.exists():
-        raise FileNotFoundError(f"Test labels not found: {y_test_path}")
+    X_test = load_processed_split(data_dir, "X_test")
+    y_test = load_processed_split(data_dir, "y_test")
+    source = "binary" if has_processed_manifest(data_dir) else "CSV"
 
-    X_test = pd.read_csv(X_test_path)
-    y_test = pd.read_csv(y_test_path).squeeze()
-
-    print(f" Loaded test data: {len(X_test)} samples")
+    print(f" Loaded test data: {len(X_test)} samples ({source})")
 
     return X_test, y_test
 
 
-def evaluate_model(model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
+def evaluate_model(
+    model,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    n_resamples: int = 0,
+    confidence: float = 0.95,
+) -> dict:
     """
     Evaluate model using shared metrics from training module.
 
@@ -113,9 +129,11 @@ def evaluate_model(model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
         model: Trained model
         X_test: Test features
         y_test: Test labels
+        n_resamples: Bootstrap resamples for confidence intervals (0 disables)
+        confidence: Two-sided confidence level of the intervals
 
     Returns:
-        Dictionary of metrics
+        Dictionary of metrics, plus <metric>_lower/<metric>_upper bounds when bootstrapping
     """
     y_pred = model.predict(X_test)
     y_pred_proba = None
@@ -126,8 +144,60 @@ def evaluate_model(model, X_test: pd.DataFrame, y_test: pd.Series) -> dict:
         except Exception:
             pass
 
-    # Reuse the same metrics calculation from training
-    return calculate_metrics(y_test, y_pred, y_pred_proba)
+    if not n_resamples:
+        # Reuse the same metrics calculation from training
+        return calculate_metrics(y_test, y_pred, y_pred_proba)
+
+    intervals = bootstrap_metrics(
+        y_test, y_pred, y_pred_proba, n_resamples=n_resamples, confidence=confidence, n_jobs=os.cpu_count() or 1
+    )
+    metrics = {}
+    for name, interval in intervals.items():
+        metrics[name] = interval["estimate"]
+        metrics[f"{name}_lower"] = interval["lower"]
+        metrics[f"{name}_upper"] = interval["upper"]
+    return metrics
+
+
+def evaluate_model_streaming(model, chunks, n_bins: int = 1000) -> dict:
+    """
+    Evaluate model batch by batch with constant-memory accumulators.
+
+    Args:
+        model: Trained model
+        chunks: Iterable of (X, y) batches
+        n_bins: Score histogram bins for AUC and threshold analysis
+
+    Returns:
+        Dictionary of metrics, plus roc_auc and the F1-optimal threshold when every
+        sample was scored with probabilities
+    """
+    accumulator = StreamingMetrics(n_bins=n_bins)
+    use_proba = hasattr(model, "predict_proba")
+
+    for X_chunk, y_chunk in chunks:
+        y_pred = model.predict(X_chunk)
+        y_pred_proba = None
+        if use_proba:
+            try:
+                y_pred_proba = model.predict_proba(X_chunk)[:, 1]
+            except Exception as e:
+                print(f"   predict_proba failed after {accumulator.n_samples} samples: {e}")
+                use_proba = False
+        accumulator.update(y_chunk, y_pred, y_pred_proba)
+
+    print(f" Streamed {accumulator.n_samples} samples")
+    metrics = accumulator.compute()
+    if accumulator.n_scored and accumulator.n_scored == accumulator.n_samples:
+        metrics["optimal_threshold"] = accumulator.optimal_threshold("f1")
+    elif accumulator.n_scored:
+        # Scores of a subset of the holdout set would misreport AUC and the threshold
+        metrics.pop("roc_auc", None)
+        print(
+            f"   Only {accumulator.n_scored} of {accumulator.n_samples} samples scored; "
+            "reporting label-based metrics only"
+        )
+    return metrics
 
 
 def main():
@@ -168,10 +238,48 @@ def main():
         default=None,
         help="Output file to write model version info for CI/CD pipeline",
     )
+    parser.add_argument(
+        "--bootstrap-resamples",
+        type=int,
+        default=int(os.environ.get("EVAL_BOOTSTRAP_RESAMPLES", "0")),
+        help="Bootstrap resamples; when set, the gate uses the F1 lower confidence bound (default: 0, point estimate)",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Two-sided confidence level of the bootstrap intervals (default: 0.95)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=int(os.environ.get("EVAL_CHUNK_SIZE", "0")),
+        help="Stream the holdout data in batches of this many rows (default: 0, load it at once)",
+    )
+    parser.add_argument(
+        "--score-bins",
+        type=int,
+        default=1000,
+        help="Score histogram bins used for AUC and thresholds in streaming mode (default: 1000)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=os.environ.get("ARTIFACT_CACHE_DIR", ""),
+        help="Local artifact cache directory (default: from ARTIFACT_CACHE_DIR env, empty disables caching)",
+    )
+    parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=int(os.environ.get("ARTIFACT_CACHE_MAX_BYTES", "0")),
+        help="Upper bound on cached bytes, 0 disables eviction (default: from ARTIFACT_CACHE_MAX_BYTES env)",
+    )
 
     args = parser.parse_args()
 
     # Validate
+    if args.chunk_size and args.bootstrap_resamples:
+        parser.error("--bootstrap-resamples needs the whole holdout set and cannot be combined with --chunk-size")
     if not args.tracking_uri:
         print(" ERROR: MLFLOW_TRACKING_URI not set")
         sys.exit(1)
@@ -181,7 +289,8 @@ def main():
     print("=" * 60)
     print(f"   MLflow URI: {args.tracking_uri}")
     print(f"   Model: {args.model_name} ({args.model_stage})")
-    print(f"   Threshold: F1 >= {args.threshold}")
+    gate = f"F1 {args.confidence:.0%} lower bound" if args.bootstrap_resamples else "F1"
+    print(f"   Threshold: {gate} >= {args.threshold}")
     print("=" * 60)
 
     try:
@@ -190,29 +299,41 @@ def main():
             args.tracking_uri,
             args.model_name,
             args.model_stage,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_bytes,
         )
 
-        # Load test data
-        X_test, y_test = load_test_data(args.data_dir)
+        if args.chunk_size:
+            # Stream the test data through constant-memory accumulators
+            print(f"\n  Evaluating model in batches of {args.chunk_size} rows...")
+            chunks = iter_processed_chunks(args.data_dir, ("X_test", "y_test"), args.chunk_size)
+            metrics = evaluate_model_streaming(model, chunks, n_bins=args.score_bins)
+        else:
+            # Load test data
+            X_test, y_test = load_test_data(args.data_dir)
 
-        # Evaluate using shared metrics
-        print("\n  Evaluating model...")
-        metrics = evaluate_model(model, X_test, y_test)
+            # Evaluate using shared metrics
+            print("\n  Evaluating model...")
+            metrics = evaluate_model(
+                model, X_test, y_test, n_resamples=args.bootstrap_resamples, confidence=args.confidence
+            )
 
         # Print results
         print("\n" + "=" * 60)
         print(" EVALUATION RESULTS")
         print("=" * 60)
+        gate_metric = "f1_score_lower" if args.bootstrap_resamples else "f1_score"
         for metric_name, value in metrics.items():
-            status = " " if metric_name == "f1_score" and value >= args.threshold else "  "
+            status = " " if metric_name == gate_metric and value >= args.threshold else "  "
             print(f"   {status} {metric_name}: {value:.4f}")
 
         # Quality gate check
         f1 = metrics["f1_score"]
+        gate_value = metrics[gate_metric]
         print("\n" + "=" * 60)
 
-        if f1 >= args.threshold:
-            print(f"  PASSED: F1 score ({f1:.4f}) >= threshold ({args.threshold})")
+        if gate_value >= args.threshold:
+            print(f"  PASSED: {gate} ({gate_value:.4f}) >= threshold ({args.threshold})")
             print("   Model is ready for deployment!")
             print("=" * 60)
 
@@ -224,11 +345,13 @@ def main():
                     f.write(f"MODEL_VERSION={version}\n")
                     f.write(f"MODEL_RUN_ID={run_id}\n")
                     f.write(f"MODEL_F1_SCORE={f1:.4f}\n")
+                    if args.bootstrap_resamples:
+                        f.write(f"MODEL_F1_LOWER={gate_value:.4f}\n")
                 print(f" Model info written to: {output_file}")
 
             sys.exit(0)
         else:
-            print(f" FAILED: F1 score ({f1:.4f}) < threshold ({args.threshold})")
+            print(f" FAILED: {gate} ({gate_value:.4f}) < threshold ({args.threshold})")
             print("   Model does not meet quality requirements!")
             print("=" * 60)
             sys.exit(1)
@@ -65,25 +65,19 @@ def client(mock_model, mock_preprocessing_service):
         return original_open(*args, **kwargs)
 
     # Patch all external dependencies
-    with patch("app.services.model_service.mlflow") as mock_mlflow, patch(
-        "app.utils.mlflow_helpers.mlflow"
-    ) as mock_utils_mlflow, patch("app.services.preprocessing_service.mlflow") as mock_preproc_mlflow, patch(
-        "app.services.preprocessing_service.joblib"
-    ) as mock_joblib, patch(
+    with patch("app.services.model_service.mlflow") as mock_mlflow, patch("app.utils.mlflow_helpers.mlflow"), patch(
+        "app.services.preprocessing_service.mlflow"
+    ) as mock_preproc_mlflow, patch("app.services.preprocessing_service.joblib") as mock_joblib, patch(
         "app.utils.mlflow_helpers.check_mlflow_connection"
     ) as mock_check_mlflow, patch(
         "app.services.preprocessing_service.open", custom_open
     ), patch(
         "app.services.model_service.load_model_with_flavor"
-    ) as mock_load_flavor:
-        # Mock MLflow client for model service
-        mock_client = MagicMock()
-        mock_version = MagicMock()
-        mock_version.version = "1"
-        mock_version.run_id = "test-run-id"
-        mock_version.current_stage = "Production"
-        mock_client.search_model_versions.return_value = [mock_version]
-        mock_utils_mlflow.tracking.MlflowClient.return_value = mock_client
+    ) as mock_load_flavor, patch(
+        "app.services.model_service.get_registry_resolver"
+    ) as mock_resolver:
+        # Mock registry lookups for model service
+        mock_resolver.return_value.resolve.return_value = {"version": "1", "run_id": "test-run-id"}
         mock_mlflow.pyfunc.load_model.return_value = mock_model
 
         # Mock load_model_with_flavor to return the mock_model with predict_proba
@@ -0,0 +1,116 @@
+"""
+Unit tests for app/core/threads.py module.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import numpy as np
+import pytest
+from threadpoolctl import threadpool_info, threadpool_limits
+
+from app.core.threads import (
+    THREAD_ENV_VARS,
+    NativeThreadBudget,
+    configure_model_threads,
+    export_thread_env,
+    set_request_threadpool_size,
+)
+
+
+@pytest.fixture
+def training_data():
+    """Small binary classification problem."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    return X, (X[:, 0] > 0).astype(int)
+
+
+class TestConfigureModelThreads:
+    """Tests for configure_model_threads function."""
+
+    def test_xgboost_keeps_setting(self, training_data):
+        """Test XGBoost models take the thread count as a parameter."""
+        from xgboost import XGBClassifier
+
+        model = XGBClassifier(n_estimators=5, n_jobs=4).fit(*training_data)
+
+        assert configure_model_threads(model, 1) == {}
+        assert model.get_params()["n_jobs"] == 1
+        assert configure_model_threads(model.get_booster(), 1) == {}
+
+    def test_lightgbm(self, training_data):
+        """Test LightGBM sklearn models keep n_jobs and boosters get num_threads per call."""
+        from lightgbm import LGBMClassifier
+
+        model = LGBMClassifier(n_estimators=5, n_jobs=4, verbose=-1).fit(*training_data)
+
+        assert configure_model_threads(model, 1) == {}
+        assert model.get_params()["n_jobs"] == 1
+        assert configure_model_threads(model.booster_, 1) == {"num_threads": 1}
+
+    def test_catboost_per_call(self, training_data):
+        """Test CatBoost gets thread_count per call, and the argument is accepted by predict_proba."""
+        from catboost import CatBoostClassifier
+
+        model = CatBoostClassifier(iterations=5, verbose=False, allow_writing_files=False).fit(*training_data)
+
+        kwargs = configure_model_threads(model, 1)
+
+        assert kwargs == {"thread_count": 1}
+        assert model.predict_proba(training_data[0], **kwargs).shape == (200, 2)
+
+    def test_sklearn_n_jobs(self):
+        """Test scikit-learn estimators with n_jobs are configured and others are left alone."""
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.tree import DecisionTreeClassifier
+
+        forest = RandomForestClassifier(n_jobs=-1)
+
+        assert configure_model_threads(forest, 2) == {}
+        assert forest.n_jobs == 2
+        assert configure_model_threads(DecisionTreeClassifier(), 2) == {}
+
+
+class TestNativeThreadLimits:
+    """Tests for OpenMP/BLAS thread limits."""
+
+    def test_export_thread_env(self, monkeypatch):
+        """Test the OpenMP/BLAS environment variables are set for runtimes loaded later."""
+        for name in THREAD_ENV_VARS:
+            monkeypatch.setenv(name, "8")
+
+        export_thread_env(1)
+
+        assert all(os.environ[name] == "1" for name in THREAD_ENV_VARS)
+
+    def test_budget_binds_each_thread(self):
+        """Test the OpenMP/BLAS cap reaches pools used from other threads, where OpenMP keeps its own size."""
+        import lightgbm  # noqa: F401 - loads the OpenMP runtime
+
+        def pool_sizes(budget):
+            if budget is not None:
+                budget.bind()
+                budget.bind()
+            return {pool["user_api"]: pool["num_threads"] for pool in threadpool_info()}
+
+        n_threads = max(pool["num_threads"] for pool in threadpool_info()) + 1
+        # Restores the process-wide BLAS limit afterwards
+        with threadpool_limits(limits=None):
+            budget = NativeThreadBudget(n_threads)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                unbound = executor.submit(pool_sizes, None).result()
+                bound = executor.submit(pool_sizes, budget).result()
+
+        assert unbound["openmp"] != n_threads
+        assert set(bound.values()) == {n_threads}
+
+    def test_request_threadpool_size(self):
+        """Test the request threadpool limiter of the running event loop is resized."""
+
+        async def resize():
+            set_request_threadpool_size(3)
+            return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+        assert anyio.run(resize) == 3
@@ -5,6 +5,9 @@ Unit tests for app/routers/health.py module.
 from datetime import datetime
 from unittest.mock import patch
 
+import pytest
+from fastapi import HTTPException
+
 from app.routers.health import health_check, liveness_check, readiness_check
 from app.schemas.health import HealthResponse
 
@@ -66,19 +69,29 @@ class TestHealthCheck:
 class TestReadinessCheck:
     """Tests for readiness_check endpoint function."""
 
-    def test_returns_ready_status(self):
+    @patch("app.routers.health.is_ready", return_value=True)
+    def test_returns_ready_status(self, mock_ready):
         """Test readiness_check returns ready status."""
         result = readiness_check()
 
         assert result == {"status": "ready"}
 
-    def test_returns_dict(self):
+    @patch("app.routers.health.is_ready", return_value=True)
+    def test_returns_dict(self, mock_ready):
         """Test readiness_check returns dictionary."""
         result = readiness_check()
 
         assert isinstance(result, dict)
         assert "status" in result
 
+    @patch("app.routers.health.is_ready", return_value=False)
+    def test_not_ready_before_warmup(self, mock_ready):
+        """Test readiness_check returns 503 until warmup has finished."""
+        with pytest.raises(HTTPException) as exc_info:
+            readiness_check()
+
+        assert exc_info.value.status_code == 503
+
 
 class TestLivenessCheck:
     """Tests for liveness_check endpoint function."""
@@ -9,8 +9,16 @@ import pandas as pd
 import pytest
 from fastapi import HTTPException
 
-from app.routers.predict import _get_prediction, _get_probabilities, _preprocess_input, get_model_info, predict
-from app.schemas.prediction import PredictionInput, PredictionOutput
+from app.routers.predict import (
+    _get_prediction,
+    _get_probabilities,
+    _preprocess_input,
+    explain,
+    get_model_info,
+    predict,
+)
+from app.schemas.prediction import ExplanationOutput, PredictionInput, PredictionOutput
+from app.services.explanation_service import ExplanationQueueFull
 
 
 class TestPreprocessInput:
@@ -215,6 +223,69 @@ class TestPredictEndpoint:
         assert exc_info.value.status_code == 500
 
 
+class TestExplainEndpoint:
+    """Tests for explain endpoint function."""
+
+    @pytest.fixture
+    def sample_input(self):
+        """Sample prediction input."""
+        return PredictionInput(
+            ID=123,
+            CODE_GENDER="M",
+            FLAG_OWN_CAR="Y",
+            FLAG_OWN_REALTY="Y",
+            CNT_CHILDREN=0,
+            AMT_INCOME_TOTAL=100000.0,
+            NAME_INCOME_TYPE="Working",
+            NAME_EDUCATION_TYPE="Higher education",
+            NAME_FAMILY_STATUS="Married",
+            NAME_HOUSING_TYPE="House / apartment",
+            DAYS_BIRTH=-10000,
+            DAYS_EMPLOYED=-2000,
+            FLAG_MOBIL=1,
+            FLAG_WORK_PHONE=0,
+            FLAG_PHONE=1,
+            FLAG_EMAIL=0,
+            OCCUPATION_TYPE="Managers",
+            CNT_FAM_MEMBERS=2.0,
+        )
+
+    def test_returns_explanation_output(self, sample_input):
+        """Test explain returns ExplanationOutput."""
+        mock_service = MagicMock()
+        mock_service.explain.return_value = {
+            "probability": 0.85,
+            "base_value": 0.4,
+            "contributions": {"AMT_INCOME_TOTAL": 1.2},
+            "version": "1",
+            "cached": False,
+        }
+
+        result = explain(sample_input, mock_service)
+
+        assert isinstance(result, ExplanationOutput)
+        assert result.contributions == {"AMT_INCOME_TOTAL": 1.2}
+
+    @pytest.mark.parametrize(
+        "error, status_code",
+        [
+            (NotImplementedError("unsupported model"), 501),
+            (ExplanationQueueFull("busy"), 503),
+            (TimeoutError("too slow"), 504),
+            (Exception("boom"), 500),
+        ],
+    )
+    def test_maps_errors_to_status_codes(self, sample_input, error, status_code):
+        """Test unsupported models, saturation and the latency budget map to distinct status codes."""
+        mock_service = MagicMock()
+        mock_service.explain.side_effect = error
+
+        with pytest.raises(HTTPException) as exc_info:
+            explain(sample_input, mock_service)
+
+        assert exc_info.value.status_code == status_code
+
+
 class TestGetModelInfoEndpoint:
     """Tests for get_model_info endpoint function."""
 
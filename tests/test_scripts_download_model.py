@@ -0,0 +1,191 @@
+"""
+Unit tests for scripts/download_model.py module.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from mlflow.entities import FileInfo
+
+from scripts.download_model import MANIFEST_FILE, PARTIAL_DIR, download_model
+
+MODEL_URI = "models:/test_model/1"
+PREPROCESSORS_URI = "runs:/run-1/preprocessors"
+
+
+class FakeArtifactRepository:
+    """In-memory artifact repository recording which files were downloaded."""
+
+    def __init__(self, files):
+        self.files = dict(files)
+        self.downloads = []
+
+    def list_artifacts(self, path=""):
+        prefix = f"{path}/" if path else ""
+        children = {}
+        for file_path, content in self.files.items():
+            if not file_path.startswith(prefix):
+                continue
+            name, _, rest = file_path[len(prefix) :].partition("/")
+            child = prefix + name
+            children[child] = FileInfo(child, True, None) if rest else FileInfo(child, False, len(content))
+        return sorted(children.values(), key=lambda info: info.path)
+
+    def download_artifacts(self, artifact_path, dst_path=None):
+        self.downloads.append(artifact_path)
+        target = Path(dst_path) / artifact_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(self.files[artifact_path])
+        return str(target)
+
+
+@pytest.fixture
+def resolved():
+    """Registry version the resolver returns; tests change it to publish a new version."""
+    return {"version": "1", "run_id": "run-1", "source": "gs://bucket/model"}
+
+
+@pytest.fixture
+def registry(resolved):
+    """Fake model and preprocessing repositories behind a patched registry resolver."""
+    repos = {
+        MODEL_URI: FakeArtifactRepository(
+            {"MLmodel": b"flavors: {}", "model.xgb": b"x" * 1000, "nested/conda.yaml": b"name: env"}
+        ),
+        PREPROCESSORS_URI: FakeArtifactRepository(
+            {"scaler.pkl": b"s" * 200, "pca.pkl": b"p" * 300, "feature_names.json": b'{"feature_names": []}'}
+        ),
+    }
+    with patch("scripts.download_model.mlflow"), patch(
+        "scripts.download_model.get_artifact_repository", side_effect=repos.__getitem__
+    ), patch("scripts.download_model.get_registry_resolver") as mock_resolver:
+        mock_resolver.return_value.resolve.side_effect = lambda *args: dict(resolved)
+        yield repos
+
+
+def run_download(output_dir):
+    """Download the test model into output_dir."""
+    return download_model("http://mlflow:5000", "test_model", "Production", str(output_dir), max_workers=4)
+
+
+class TestDownloadModel:
+    """Tests for incremental, resumable artifact downloads."""
+
+    def test_first_download(self, registry, tmp_path):
+        """Test every file is transferred, recorded in the manifest and the staging area is removed."""
+        metadata = run_download(tmp_path)
+
+        assert metadata["version"] == "1"
+        assert (tmp_path / "model.xgb").read_bytes() == b"x" * 1000
+        assert (tmp_path / "nested" / "conda.yaml").exists()
+        assert (tmp_path / "preprocessors" / "scaler.pkl").read_bytes() == b"s" * 200
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())["files"]
+        assert set(manifest) == {
+            "MLmodel",
+            "model.xgb",
+            "nested/conda.yaml",
+            "preprocessors/scaler.pkl",
+            "preprocessors/pca.pkl",
+            "preprocessors/feature_names.json",
+        }
+        assert manifest["model.xgb"]["size"] == 1000
+        assert not (tmp_path / PARTIAL_DIR).exists()
+
+    def test_rerun_skips_unchanged_files(self, registry, tmp_path):
+        """Test a repeat run transfers only files whose size or content changed."""
+        run_download(tmp_path)
+        for repo in registry.values():
+            repo.downloads.clear()
+        registry[MODEL_URI].files["model.xgb"] = b"y" * 1200
+
+        run_download(tmp_path)
+
+        assert registry[MODEL_URI].downloads == ["model.xgb"]
+        assert registry[PREPROCESSORS_URI].downloads == []
+        assert (tmp_path / "model.xgb").read_bytes() == b"y" * 1200
+
+    def test_local_corruption_is_refetched(self, registry, tmp_path):
+        """Test a local file whose checksum no longer matches the manifest is transferred again."""
+        run_download(tmp_path)
+        registry[PREPROCESSORS_URI].downloads.clear()
+        (tmp_path / "preprocessors" / "pca.pkl").write_bytes(b"q" * 300)
+
+        run_download(tmp_path)
+
+        assert registry[PREPROCESSORS_URI].downloads == ["pca.pkl"]
+        assert (tmp_path / "preprocessors" / "pca.pkl").read_bytes() == b"p" * 300
+
+    def test_resume_reuses_complete_staged_files(self, registry, tmp_path):
+        """Test an interrupted run's complete staged file is reused and a truncated one is refetched."""
+        staging = tmp_path / PARTIAL_DIR / "model"
+        staging.mkdir(parents=True)
+        (staging / "model.xgb").write_bytes(b"x" * 1000)
+        (staging / "MLmodel").write_bytes(b"flav")
+
+        run_download(tmp_path)
+
+        assert "model.xgb" not in registry[MODEL_URI].downloads
+        assert "MLmodel" in registry[MODEL_URI].downloads
+        assert (tmp_path / "model.xgb").read_bytes() == b"x" * 1000
+        assert (tmp_path / "MLmodel").read_bytes() == b"flavors: {}"
+
+    def test_remotely_deleted_files_are_removed(self, registry, tmp_path):
+        """Test files no longer in the model are deleted locally and dropped from the manifest."""
+        run_download(tmp_path)
+        del registry[MODEL_URI].files["nested/conda.yaml"]
+        del registry[PREPROCESSORS_URI].files["pca.pkl"]
+
+        run_download(tmp_path)
+
+        assert not (tmp_path / "nested" / "conda.yaml").exists()
+        assert not (tmp_path / "preprocessors" / "pca.pkl").exists()
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())["files"]
+        assert "nested/conda.yaml" not in manifest
+        assert "preprocessors/pca.pkl" not in manifest
+
+    def test_new_version_refetches_same_size_files(self, registry, resolved, tmp_path):
+        """Test unchanged sizes and local checksums are not trusted across model versions."""
+        run_download(tmp_path)
+        resolved.update(version="2", run_id="run-2")
+        registry["models:/test_model/2"] = FakeArtifactRepository(
+            {"MLmodel": b"flavors: {2}", "model.xgb": b"z" * 1000, "nested/conda.yaml": b"name: env"}
+        )
+        registry["runs:/run-2/preprocessors"] = FakeArtifactRepository(
+            {"scaler.pkl": b"t" * 200, "pca.pkl": b"q" * 300, "feature_names.json": b'{"feature_names": []}'}
+        )
+
+        run_download(tmp_path)
+
+        assert sorted(registry["models:/test_model/2"].downloads) == ["MLmodel", "model.xgb", "nested/conda.yaml"]
+        assert len(registry["runs:/run-2/preprocessors"].downloads) == 3
+        assert (tmp_path / "MLmodel").read_bytes() == b"flavors: {2}"
+        assert (tmp_path / "model.xgb").read_bytes() == b"z" * 1000
+        assert (tmp_path / "preprocessors" / "scaler.pkl").read_bytes() == b"t" * 200
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        assert (manifest["version"], manifest["run_id"]) == ("2", "run-2")
+
+    def test_failed_preprocessors_of_another_run_are_removed(self, registry, resolved, tmp_path):
+        """Test a new model is not left with the previous run's preprocessors when their download fails."""
+        run_download(tmp_path)
+        resolved.update(version="2", run_id="run-2")
+        registry["models:/test_model/2"] = registry[MODEL_URI]
+
+        run_download(tmp_path)
+
+        assert not (tmp_path / "preprocessors").exists()
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())
+        assert not [path for path in manifest["files"] if path.startswith("preprocessors/")]
+        assert "preprocessors" not in manifest["sources"]
+
+    def test_failed_preprocessors_of_same_run_are_kept(self, registry, tmp_path):
+        """Test a failed preprocessing download keeps the files of an earlier download of the same run."""
+        run_download(tmp_path)
+        del registry[PREPROCESSORS_URI]
+
+        run_download(tmp_path)
+
+        assert (tmp_path / "preprocessors" / "scaler.pkl").read_bytes() == b"s" * 200
+        manifest = json.loads((tmp_path / MANIFEST_FILE).read_text())["files"]
+        assert "preprocessors/scaler.pkl" in manifest
@@ -0,0 +1,57 @@
+"""
+Unit tests for scripts/evaluate_model.py module.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scripts.evaluate_model import evaluate_model_streaming
+
+
+class ThresholdModel:
+    """Model predicting PC1 > 0, whose predict_proba fails from the given call on."""
+
+    def __init__(self, fail_from_call=None):
+        self.fail_from_call = fail_from_call
+        self.calls = 0
+
+    def predict(self, X):
+        return (X["PC1"] > 0).astype(int).to_numpy()
+
+    def predict_proba(self, X):
+        self.calls += 1
+        if self.fail_from_call is not None and self.calls >= self.fail_from_call:
+            raise RuntimeError("scoring failed")
+        score = 1 / (1 + np.exp(-X["PC1"].to_numpy()))
+        return np.column_stack([1 - score, score])
+
+
+def make_chunks(n_chunks=3, size=100):
+    """Batches of a noisy binary problem."""
+    rng = np.random.default_rng(0)
+    chunks = []
+    for _ in range(n_chunks):
+        X = pd.DataFrame({"PC1": rng.normal(size=size)})
+        y = pd.Series((X["PC1"] + rng.normal(scale=0.5, size=size) > 0).astype(int))
+        chunks.append((X, y))
+    return chunks
+
+
+class TestEvaluateModelStreaming:
+    """Tests for evaluate_model_streaming function."""
+
+    def test_scored_metrics_when_every_sample_is_scored(self):
+        """Test ROC AUC and the optimal threshold are reported when all batches have probabilities."""
+        metrics = evaluate_model_streaming(ThresholdModel(), make_chunks())
+
+        assert 0.5 < metrics["roc_auc"] <= 1.0
+        assert "optimal_threshold" in metrics
+
+    def test_partial_scoring_drops_score_metrics(self, capsys):
+        """Test a predict_proba failure on a later batch does not report AUC from the scored subset."""
+        metrics = evaluate_model_streaming(ThresholdModel(fail_from_call=2), make_chunks())
+
+        assert "roc_auc" not in metrics
+        assert "optimal_threshold" not in metrics
+        assert 0 < metrics["f1_score"] <= 1.0
+        assert "Only 100 of 300 samples scored" in capsys.readouterr().out
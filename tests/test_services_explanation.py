@@ -0,0 +1,172 @@
+"""
+Unit tests for app/services/explanation_service.py module.
+"""
+
+import threading
+from unittest.mock import MagicMock, mock_open, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.explanation_service import (
+    ExplanationQueueFull,
+    ExplanationService,
+    input_field_groups,
+    native_contributions,
+)
+
+FEATURE_NAMES = ["AMT_INCOME_TOTAL", "DAYS_BIRTH", "CODE_GENDER_M", "FLAG_OWN_CAR_Y"]
+
+
+@pytest.fixture
+def preprocessing_service():
+    """PreprocessingService backed by a real fitted scaler and PCA."""
+    from sklearn.decomposition import PCA
+    from sklearn.preprocessing import StandardScaler
+
+    from app.services.preprocessing_service import PreprocessingService
+
+    with patch("app.services.preprocessing_service.get_settings") as mock_settings, patch(
+        "app.services.preprocessing_service.mlflow"
+    ), patch("app.services.preprocessing_service.joblib"), patch(
+        "builtins.open", mock_open(read_data='{"feature_names": []}')
+    ):
+        mock_settings.return_value = MagicMock(ARTIFACT_CACHE_DIR="", INFERENCE_FLOAT32=False)
+        service = PreprocessingService(run_id="test-run-id")
+
+    rng = np.random.default_rng(0)
+    train = pd.DataFrame(
+        {
+            "AMT_INCOME_TOTAL": rng.normal(150000, 50000, 400),
+            "DAYS_BIRTH": rng.integers(-25000, -7000, 400).astype(float),
+            "CODE_GENDER_M": rng.integers(0, 2, 400).astype(float),
+            "FLAG_OWN_CAR_Y": rng.integers(0, 2, 400).astype(float),
+        }
+    )
+    service.feature_names = FEATURE_NAMES
+    service.scaler = StandardScaler().fit(train)
+    service.pca = PCA(n_components=3, random_state=42).fit(service.scaler.transform(train))
+    labels = (train["AMT_INCOME_TOTAL"] > 150000).astype(int).to_numpy()
+    return service, service.preprocess(train), labels
+
+
+@pytest.fixture
+def sample_input():
+    """Raw input covering the fitted features."""
+    return {"ID": 1, "AMT_INCOME_TOTAL": 210000.0, "DAYS_BIRTH": -12000, "CODE_GENDER": "M", "FLAG_OWN_CAR": "Y"}
+
+
+def make_service(model, preprocessing, **kwargs):
+    """ExplanationService over a mocked model service holding the given native model."""
+    model_service = MagicMock(version="1", run_id="test-run-id", sklearn_model=model, predict_kwargs={})
+    return ExplanationService(model_service, preprocessing, **kwargs)
+
+
+class TestNativeContributions:
+    """Tests for native_contributions function."""
+
+    @pytest.mark.parametrize("library", ["xgboost", "lightgbm"])
+    def test_contributions_sum_to_margin(self, preprocessing_service, library):
+        """Test attributions plus the base value reproduce the model's log-odds."""
+        _, features, labels = preprocessing_service
+        if library == "xgboost":
+            from xgboost import XGBClassifier
+
+            model = XGBClassifier(n_estimators=20, max_depth=3, n_jobs=1).fit(features, labels)
+        else:
+            from lightgbm import LGBMClassifier
+
+            model = LGBMClassifier(n_estimators=20, num_leaves=7, n_jobs=1, verbose=-1).fit(features, labels)
+
+        contributions = native_contributions(model, features.head(10))
+        proba = model.predict_proba(features.head(10))[:, 1]
+
+        assert contributions.shape == (10, features.shape[1] + 1)
+        np.testing.assert_allclose(contributions.sum(axis=1), np.log(proba / (1 - proba)), rtol=1e-4, atol=1e-4)
+
+    def test_unsupported_model_raises(self):
+        """Test models without a native attribution path are rejected."""
+        from sklearn.linear_model import LogisticRegression
+
+        with pytest.raises(NotImplementedError):
+            native_contributions(LogisticRegression(), pd.DataFrame({"PC1": [0.1]}))
+
+
+class TestInputFieldGroups:
+    """Tests for input_field_groups function."""
+
+    def test_groups_one_hot_columns_by_longest_field(self):
+        """Test dummy columns map to their source field, preferring the longest matching name."""
+        groups = input_field_groups(
+            ["FLAG_OWN_CAR_Y", "FLAG_OWN_REALTY_Y", "NAME_INCOME_TYPE_Working", "CNT_CHILDREN", "EXTRA"],
+            ["FLAG_OWN_CAR", "FLAG_OWN_REALTY", "NAME_INCOME_TYPE", "CNT_CHILDREN"],
+        )
+
+        assert groups == {
+            "FLAG_OWN_CAR": [0],
+            "FLAG_OWN_REALTY": [1],
+            "NAME_INCOME_TYPE": [2],
+            "CNT_CHILDREN": [3],
+            "EXTRA": [4],
+        }
+
+
+class TestExplanationService:
+    """Tests for ExplanationService class."""
+
+    @pytest.fixture
+    def model(self, preprocessing_service):
+        """Small XGBoost model on the principal components."""
+        from xgboost import XGBClassifier
+
+        _, features, labels = preprocessing_service
+        return XGBClassifier(n_estimators=20, max_depth=3, n_jobs=1).fit(features, labels)
+
+    def test_explains_in_input_fields(self, preprocessing_service, model, sample_input):
+        """Test contributions are reported per input field and add up to the predicted probability."""
+        preprocessing, _, _ = preprocessing_service
+        service = make_service(model, preprocessing)
+
+        result = service.explain(sample_input)
+
+        expected = model.predict_proba(preprocessing.preprocess(pd.DataFrame([sample_input])))[0, 1]
+        margin = result["base_value"] + sum(result["contributions"].values())
+        assert set(result["contributions"]) == {"AMT_INCOME_TOTAL", "DAYS_BIRTH", "CODE_GENDER", "FLAG_OWN_CAR"}
+        assert result["probability"] == pytest.approx(expected, abs=1e-4)
+        assert 1 / (1 + np.exp(-margin)) == pytest.approx(expected, abs=1e-4)
+        magnitudes = [abs(value) for value in result["contributions"].values()]
+        assert magnitudes == sorted(magnitudes, reverse=True)
+        service.close()
+
+    def test_cached_per_input_hash(self, preprocessing_service, model, sample_input):
+        """Test repeated inputs are served from cache regardless of the customer ID."""
+        preprocessing, _, _ = preprocessing_service
+        service = make_service(model, preprocessing)
+
+        first = service.explain(sample_input)
+        second = service.explain({**sample_input, "ID": 2})
+        other = service.explain({**sample_input, "AMT_INCOME_TOTAL": 90000.0})
+
+        assert not first["cached"]
+        assert second["cached"]
+        assert second["contributions"] == first["contributions"]
+        assert not other["cached"]
+        service.close()
+
+    def test_latency_budget_and_queue_bound(self, preprocessing_service, model, sample_input):
+        """Test slow requests time out, extra requests are rejected and late results are still cached."""
+        preprocessing, _, _ = preprocessing_service
+        release = threading.Event()
+        original = preprocessing.preprocess
+        preprocessing.preprocess = lambda df: release.wait(5) and original(df)
+        service = make_service(model, preprocessing, max_workers=1, max_pending=1, timeout_seconds=0.05)
+
+        with pytest.raises(TimeoutError):
+            service.explain(sample_input)
+        with pytest.raises(ExplanationQueueFull):
+            service.explain({**sample_input, "AMT_INCOME_TOTAL": 90000.0})
+
+        release.set()
+        service.close()
+        assert service.explain(sample_input)["cached"]
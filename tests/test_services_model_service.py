@@ -2,6 +2,7 @@
 Unit tests for app/services/model_service.py module.
 """
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -18,8 +19,8 @@ class TestModelService:
         with patch("app.services.model_service.get_settings") as mock_settings, patch(
             "app.services.model_service.setup_gcs_credentials"
         ) as mock_gcs, patch("app.services.model_service.setup_mlflow_tracking") as mock_mlflow_setup, patch(
-            "app.services.model_service.get_latest_model_version"
-        ) as mock_version, patch(
+            "app.services.model_service.get_registry_resolver"
+        ) as mock_resolver, patch(
             "app.services.model_service.mlflow"
         ) as mock_mlflow, patch(
             "app.services.model_service.load_model_with_flavor"
@@ -30,13 +31,16 @@ class TestModelService:
             settings.MODEL_STAGE = "Production"
             settings.MODEL_PATH = None  # Force MLflow loading path
             settings.GOOGLE_APPLICATION_CREDENTIALS = ""
+            settings.ARTIFACT_CACHE_DIR = ""  # Disable local artifact cache
+            settings.MODEL_SINGLE_INSTANCE = False
+            settings.INFERENCE_THREADS = 0  # Keep library thread defaults
             mock_settings.return_value = settings
 
             # Mock MLflow client
             mock_client = MagicMock()
             mock_mlflow_setup.return_value = mock_client
 
-            mock_version.return_value = ("1", "test-run-id")
+            mock_resolver.return_value.resolve.return_value = {"version": "1", "run_id": "test-run-id"}
 
             mock_pyfunc_model = MagicMock()
             mock_pyfunc_model.predict.return_value = np.array([1])
@@ -50,7 +54,7 @@ class TestModelService:
                 "settings": mock_settings,
                 "gcs": mock_gcs,
                 "mlflow_setup": mock_mlflow_setup,
-                "version": mock_version,
+                "resolver": mock_resolver,
                 "mlflow": mock_mlflow,
                 "load_flavor": mock_load_flavor,
                 "pyfunc_model": mock_pyfunc_model,
@@ -133,6 +137,84 @@ class TestModelService:
 
         assert result is None
 
+    def test_load_resolves_through_artifact_cache(self, mock_dependencies, tmp_path):
+        """Test model artifacts are loaded from the local cache when configured."""
+        from app.services.model_service import ModelService
+
+        settings = mock_dependencies["settings"].return_value
+        settings.ARTIFACT_CACHE_DIR = str(tmp_path)
+        settings.ARTIFACT_CACHE_MAX_BYTES = 0
+
+        def fake_download(artifact_uri, dst_path):
+            (Path(dst_path) / "MLmodel").write_text("flavors: {}")
+            return dst_path
+
+        mock_dependencies["mlflow"].artifacts.download_artifacts.side_effect = fake_download
+
+        ModelService()
+        ModelService()
+
+        # Second service start is served from the cache
+        assert mock_dependencies["mlflow"].artifacts.download_artifacts.call_count == 1
+        loaded_uri = mock_dependencies["mlflow"].pyfunc.load_model.call_args[0][0]
+        assert loaded_uri.startswith(str(tmp_path))
+
+    def test_single_instance_wraps_native_model(self, mock_dependencies):
+        """Test single-instance mode builds the pyfunc wrapper from the native model."""
+        from app.services.model_service import ModelService
+
+        mock_dependencies["settings"].return_value.MODEL_SINGLE_INSTANCE = True
+
+        with patch("app.services.model_service.wrap_native_model") as mock_wrap:
+            service = ModelService()
+
+        mock_dependencies["mlflow"].pyfunc.load_model.assert_not_called()
+        mock_wrap.assert_called_once_with("models:/test_model/1", mock_dependencies["sklearn_model"])
+        assert service.model is mock_wrap.return_value
+        assert service.sklearn_model is mock_dependencies["sklearn_model"]
+
+    def test_single_instance_falls_back_to_pyfunc(self, mock_dependencies):
+        """Test single-instance mode loads pyfunc when no native flavor is available."""
+        from app.services.model_service import ModelService
+
+        mock_dependencies["settings"].return_value.MODEL_SINGLE_INSTANCE = True
+        mock_dependencies["load_flavor"].return_value = None
+
+        service = ModelService()
+
+        assert service.model is mock_dependencies["pyfunc_model"]
+        assert service.sklearn_model is None
+
+    def test_thread_budget_configures_models(self, mock_dependencies):
+        """Test the inference thread budget reaches the native model and the pyfunc model's own instance."""
+        from app.services.model_service import ModelService
+
+        mock_dependencies["settings"].return_value.INFERENCE_THREADS = 1
+
+        with patch("app.services.model_service.configure_model_threads") as mock_configure, patch(
+            "app.services.model_service.unwrap_native_model"
+        ) as mock_unwrap:
+            mock_configure.return_value = {"thread_count": 1}
+            service = ModelService()
+            service.predict_proba([[0.5]])
+
+        mock_configure.assert_any_call(mock_dependencies["sklearn_model"], 1)
+        mock_configure.assert_any_call(mock_unwrap.return_value, 1)
+        mock_dependencies["sklearn_model"].predict_proba.assert_called_once_with([[0.5]], thread_count=1)
+        assert service.native_threads.n_threads == 1
+
+    def test_records_model_memory(self, mock_dependencies):
+        """Test resident model memory is measured and exported as a gauge."""
+        from app.core.metrics import MODEL_MEMORY_BYTES
+        from app.services.model_service import ModelService
+
+        with patch("app.services.model_service._process_rss", side_effect=[1000, 5000]):
+            service = ModelService()
+
+        assert service.memory_bytes == 4000
+        assert service.get_model_info()["memory_bytes"] == 4000
+        assert MODEL_MEMORY_BYTES._value.get() == 4000
+
     def test_get_model_info(self, mock_dependencies):
         """Test get_model_info returns correct information."""
         from app.services.model_service import ModelService
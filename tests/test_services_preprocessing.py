@@ -22,6 +22,8 @@ class TestPreprocessingService:
         ):
             settings = MagicMock()
             settings.MLFLOW_TRACKING_URI = "http://mlflow:5000"
+            settings.ARTIFACT_CACHE_DIR = ""  # Disable local artifact cache
+            settings.INFERENCE_FLOAT32 = False
             mock_settings.return_value = settings
 
             mock_mlflow.artifacts.download_artifacts.return_value = "/tmp/mock_artifacts"
@@ -129,6 +131,120 @@ class TestPreprocessingService:
         # Should have PC columns
         assert all(col.startswith("PC") for col in result.columns)
 
+    @pytest.fixture
+    def fitted_service(self, mock_dependencies):
+        """Create a PreprocessingService backed by a real fitted scaler and PCA."""
+        from sklearn.decomposition import PCA
+        from sklearn.preprocessing import StandardScaler
+
+        from app.services.preprocessing_service import PreprocessingService
+
+        rng = np.random.default_rng(0)
+        train = pd.DataFrame(
+            {
+                "income": rng.normal(150000, 50000, 500),
+                "days_birth": rng.integers(-25000, -7000, 500),
+                "gender_M": rng.integers(0, 2, 500),
+                "car_Y": rng.integers(0, 2, 500),
+            }
+        )
+
+        service = PreprocessingService(run_id="test-run-id")
+        service.feature_names = list(train.columns)
+        service.scaler = StandardScaler().fit(train)
+        service.pca = PCA(n_components=3, random_state=42).fit(service.scaler.transform(train))
+        return service, train
+
+    def test_float32_matches_float64(self, fitted_service):
+        """Test fused float32 projection matches the sklearn float64 path."""
+        service, train = fitted_service
+
+        expected = service.preprocess(train.copy())
+        service.enable_float32()
+        result = service.preprocess(train.copy())
+
+        assert result.dtypes.unique().tolist() == [np.float32]
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-4, atol=1e-4)
+
+    def test_incremental_pca_artifact(self, fitted_service):
+        """Test an IncrementalPCA artifact from chunked training is served like PCA."""
+        from sklearn.decomposition import IncrementalPCA
+
+        service, train = fitted_service
+        service.pca = IncrementalPCA(n_components=3, batch_size=100).fit(service.scaler.transform(train))
+
+        expected = service.preprocess(train.copy())
+        service.enable_float32()
+        result = service.preprocess(train.copy())
+
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-4, atol=1e-4)
+
+    def test_float32_uncentered_scaler(self, fitted_service):
+        """Test a scaler fitted without centering (sparse training) folds in no mean."""
+        from sklearn.decomposition import PCA
+        from sklearn.preprocessing import StandardScaler
+
+        service, train = fitted_service
+        service.scaler = StandardScaler(with_mean=False).fit(train)
+        service.pca = PCA(n_components=3, random_state=42).fit(service.scaler.transform(train))
+
+        expected = service.preprocess(train.copy())
+        service.enable_float32()
+        result = service.preprocess(train.copy())
+
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-4, atol=1e-4)
+
+    def test_float32_supports_whitening(self, fitted_service):
+        """Test whitened PCA is folded into the float32 projection."""
+        from sklearn.decomposition import PCA
+
+        service, train = fitted_service
+        service.pca = PCA(n_components=3, whiten=True, random_state=42).fit(service.scaler.transform(train))
+
+        expected = service.preprocess(train.copy())
+        service.enable_float32()
+        result = service.preprocess(train.copy())
+
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-4, atol=1e-4)
+
+    def test_attribute_to_features_preserves_totals(self, fitted_service):
+        """Test component attributions are split across features without changing their row sums."""
+        service, train = fitted_service
+        encoded = service.encode(train.head(5)).to_numpy()
+        pc_attributions = np.random.default_rng(1).normal(size=(5, 3))
+
+        result = service.attribute_to_features(encoded, pc_attributions)
+
+        assert result.shape == (5, 4)
+        np.testing.assert_allclose(result.sum(axis=1), pc_attributions.sum(axis=1))
+
+    def test_attribute_to_features_follows_component_terms(self, fitted_service):
+        """Test a component's attribution goes to the features that make up its value."""
+        service, train = fitted_service
+        row = train.head(1).copy()
+        row[["days_birth", "gender_M", "car_Y"]] = service.scaler.mean_[1:]
+        encoded = service.encode(row).to_numpy()
+
+        result = service.attribute_to_features(encoded, np.array([[1.0, 0.0, 0.0]]))
+
+        # Features at their training mean contribute nothing to any component
+        np.testing.assert_allclose(result[0], [1.0, 0.0, 0.0, 0.0], atol=1e-9)
+
+    def test_attribute_to_features_cancelling_component(self, fitted_service):
+        """Test a component whose large terms cancel to ~0 does not blow up the attributions."""
+        service, _ = fitted_service
+        components = service.pca.components_
+        # Standardized row along component 2 (orthogonal to component 1) plus a tiny component 1 value
+        standardized = 5.0 * components[1] + 1e-7 * components[0]
+        encoded = (standardized + service.pca.mean_) * service.scaler.scale_ + service.scaler.mean_
+        terms = components[0] * standardized
+        assert np.abs(terms).max() > 0.1 and abs(terms.sum()) < 1e-6
+
+        result = service.attribute_to_features(encoded[np.newaxis, :], np.array([[0.2, 0.0, 0.0]]))
+
+        assert np.abs(result).max() <= 0.2
+        np.testing.assert_allclose(result.sum(axis=1), [0.2])
+
 
 class TestGetPreprocessingService:
     """Tests for get_preprocessing_service function."""
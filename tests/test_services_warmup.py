@@ -0,0 +1,80 @@
+"""
+Unit tests for app/services/warmup_service.py module.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from app.schemas.prediction import PredictionInput
+from app.services.warmup_service import (
+    is_ready,
+    mark_not_ready,
+    mark_ready,
+    parse_batch_sizes,
+    run_warmup,
+    warmup_batch,
+)
+
+
+class TestWarmupBatch:
+    """Tests for warmup_batch function."""
+
+    def test_rows_are_valid_varied_applicants(self):
+        """Test synthetic rows validate as PredictionInput and vary categorical and numeric fields."""
+        batch = warmup_batch(8)
+
+        assert len(batch) == 8
+        assert list(batch.columns) == list(PredictionInput.model_fields)
+        for row in batch.to_dict(orient="records"):
+            PredictionInput(**row)
+        assert set(batch["CODE_GENDER"]) == {"M", "F"}
+        assert batch["AMT_INCOME_TOTAL"].nunique() == 8
+
+    def test_parse_batch_sizes(self):
+        """Test comma-separated sizes are parsed, skipping blanks and non-positive values."""
+        assert parse_batch_sizes("1, 8,,64,0") == [1, 8, 64]
+
+
+class TestRunWarmup:
+    """Tests for run_warmup function."""
+
+    @pytest.fixture
+    def mock_preprocessing(self):
+        """Patched preprocessing service that passes batches through."""
+        with patch("app.services.warmup_service.get_preprocessing_service") as mock_get_service:
+            mock_get_service.return_value.preprocess.side_effect = lambda df: pd.DataFrame({"PC1": range(len(df))})
+            yield mock_get_service.return_value
+
+    def test_scores_every_batch_size_per_round(self, mock_preprocessing):
+        """Test each batch size goes through preprocess, predict and predict_proba once per round."""
+        model_service = MagicMock()
+
+        duration = run_warmup(model_service, [1, 8, 64], rounds=2)
+
+        sizes = [len(call.args[0]) for call in model_service.predict.call_args_list]
+        assert sizes == [1, 8, 64, 1, 8, 64]
+        assert model_service.predict_proba.call_count == 6
+        assert duration >= 0
+
+    def test_failures_do_not_raise(self, mock_preprocessing):
+        """Test a failing warmup is logged instead of stopping startup."""
+        model_service = MagicMock()
+        model_service.predict.side_effect = RuntimeError("cold model")
+
+        run_warmup(model_service, [1], rounds=1)
+
+        model_service.predict.assert_called_once()
+
+
+class TestReadiness:
+    """Tests for readiness state."""
+
+    def test_mark_ready_and_not_ready(self):
+        """Test readiness follows mark_ready and mark_not_ready."""
+        mark_not_ready()
+        assert not is_ready()
+
+        mark_ready()
+        assert is_ready()
@@ -6,10 +6,11 @@ import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from training.src.data.data_loader import DataLoader  # noqa: E402
+from training.src.data.data_loader import DataLoader, LabelCountAccumulator  # noqa: E402
 
 # Add training/src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
@@ -103,6 +104,83 @@ class TestDataLoader:
 
         assert result[result["ID"] == 1]["Label"].values[0] == 0
 
+    def test_create_target_tie_resolves_to_bad(self, data_loader):
+        """Test IDs with equal good and bad counts are labeled as 0."""
+        credit_data = pd.DataFrame(
+            {
+                "ID": [7, 7, 7, 7],
+                "MONTHS_BALANCE": [-1, -2, -3, -4],
+                "STATUS": ["0", "2", "X", "5"],
+            }
+        )
+
+        result = data_loader.create_target_variable(credit_data)
+
+        assert result["Label"].tolist() == [0]
+
+    @pytest.mark.parametrize("categorical", [False, True])
+    @pytest.mark.parametrize("id_scale", [1, 10**9])
+    def test_create_target_matches_groupby_reference(self, data_loader, categorical, id_scale):
+        """Test labels match the row-wise groupby/idxmax construction exactly."""
+        rng = np.random.default_rng(0)
+        n = 5000
+        credit_data = pd.DataFrame(
+            {
+                "ID": rng.integers(5000000, 5000400, size=n) * id_scale,
+                "MONTHS_BALANCE": rng.integers(-60, 1, size=n),
+                "STATUS": rng.choice(np.array(["0", "1", "2", "3", "4", "5", "X", "C", None], dtype=object), size=n),
+            }
+        )
+
+        # Reference: per-row Good/Bad, then the most frequent label per ID (first on ties)
+        reference = credit_data.copy()
+        reference["Good or Bad"] = reference["STATUS"].apply(lambda x: "Good" if x in ["0", "X", "C"] else "Bad")
+        counts = reference.groupby(["ID", "Good or Bad"]).size().to_frame("size").reset_index()
+        expected = counts.loc[counts.groupby("ID")["size"].idxmax()]
+        expected["Label"] = (expected["Good or Bad"] == "Good").astype(np.int64)
+        expected = expected[["ID", "Label"]].reset_index(drop=True)
+
+        # Categorical STATUS (e.g., from a typed cache) must label the same as the CSV object column
+        if categorical:
+            credit_data["STATUS"] = credit_data["STATUS"].astype("category")
+        result = data_loader.create_target_variable(credit_data)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_stream_target_matches_in_memory(self, tmp_path):
+        """Test streaming target creation gives the same labels as the in-memory path."""
+        rng = np.random.default_rng(1)
+        n = 3000
+        credit_data = pd.DataFrame(
+            {
+                "ID": rng.integers(5000000, 5000300, size=n),
+                "MONTHS_BALANCE": rng.integers(-60, 1, size=n),
+                "STATUS": rng.choice(["0", "1", "2", "5", "X", "C"], size=n),
+            }
+        )
+        # Leading rows without 'X'/'C' would parse as integers if STATUS dtype were inferred per chunk
+        credit_data.loc[:199, "STATUS"] = "0"
+        credit_data.to_csv(tmp_path / "credit_record.csv", index=False)
+        loader = DataLoader(raw_data_dir=str(tmp_path), chunk_size=200)
+
+        expected = loader.create_target_variable(pd.read_csv(tmp_path / "credit_record.csv"))
+        result = loader.stream_target_variable()
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_load_and_prepare_streams_when_chunked(self, tmp_path, sample_app_data):
+        """Test load_and_prepare_data uses streaming when chunk_size is set."""
+        loader = DataLoader(raw_data_dir=str(tmp_path), chunk_size=100)
+        with patch.object(DataLoader, "load_application_data", return_value=sample_app_data), patch.object(
+            DataLoader, "stream_target_variable", return_value=pd.DataFrame({"ID": [1, 2, 3], "Label": [1, 0, 1]})
+        ) as mock_stream, patch.object(DataLoader, "load_raw_data") as mock_load:
+            X, y = loader.load_and_prepare_data()
+
+        mock_stream.assert_called_once()
+        mock_load.assert_not_called()
+        assert len(X) == 3
+        assert y.tolist() == [1, 0, 1]
+
     def test_merge_data(self, data_loader, sample_app_data):
         """Test merge_data merges correctly."""
         target_data = pd.DataFrame(
@@ -192,3 +270,26 @@ class TestDataLoader:
             X, y = data_loader.load_and_prepare_data()
 
             assert "ID" not in X.columns
+
+
+class TestLabelCountAccumulator:
+    """Tests for LabelCountAccumulator class."""
+
+    def test_update_merges_counts_across_chunks(self):
+        """Test counts for IDs seen in several chunks are summed in sorted ID order."""
+        accumulator = LabelCountAccumulator()
+
+        accumulator.update(pd.Index([3, 5]), np.array([2, 1]), np.array([1, 1]))
+        accumulator.update(pd.Index([1, 5, 9]), np.array([4, 2, 1]), np.array([0, 2, 1]))
+
+        assert accumulator.ids.tolist() == [1, 3, 5, 9]
+        assert accumulator.total_counts.tolist() == [4, 2, 3, 1]
+        assert accumulator.good_counts.tolist() == [0, 1, 3, 1]
+        assert len(accumulator) == 4
+
+    def test_nbytes_scales_with_ids(self):
+        """Test memory held depends on the number of IDs, not records."""
+        accumulator = LabelCountAccumulator()
+        accumulator.update(pd.Index([1, 2]), np.array([10**6, 10**6]), np.array([0, 0]))
+
+        assert accumulator.nbytes == 2 * 8 + 2 * 4 + 2 * 4
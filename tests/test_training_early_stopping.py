@@ -0,0 +1,170 @@
+"""
+Unit tests for training/src/models/early_stopping.py module.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+from catboost import CatBoostClassifier
+from lightgbm import LGBMClassifier
+from xgboost import XGBClassifier
+
+# Add training/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
+
+from src.models.early_stopping import (  # noqa: E402
+    fit_with_early_stopping,
+    load_early_stopping_config,
+    split_validation,
+)
+from src.models.train import ModelTrainer, _fit_and_evaluate  # noqa: E402
+
+
+@pytest.fixture
+def data():
+    """Noisy data on which boosting overfits long before 200 rounds."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(1000, 4)), columns=["PC1", "PC2", "PC3", "PC4"])
+    y = pd.Series((X["PC1"] + rng.normal(scale=1.5, size=1000) > 0).astype(int), name="Label")
+    return split_validation(X, y, validation_size=0.2)
+
+
+class TestLoadEarlyStoppingConfig:
+    """Tests for load_early_stopping_config function."""
+
+    def test_reads_training_and_data_sections(self, tmp_path):
+        """Test patience, metric and validation size come from the config."""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            yaml.dump(
+                {
+                    "data": {"validation_size": 0.15},
+                    "training": {"early_stopping": {"enabled": True, "patience": 5, "metric": "auc"}},
+                }
+            )
+        )
+
+        config = load_early_stopping_config(str(path))
+
+        assert config == {"enabled": True, "patience": 5, "metric": "auc", "validation_size": 0.15}
+
+    def test_disabled_without_section(self, tmp_path):
+        """Test early stopping is off when the config does not mention it."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"model": {}}))
+
+        assert load_early_stopping_config(str(path))["enabled"] is False
+
+    def test_unknown_metric_raises(self, tmp_path):
+        """Test an unsupported metric raises ValueError."""
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump({"training": {"early_stopping": {"metric": "bogus"}}}))
+
+        with pytest.raises(ValueError):
+            load_early_stopping_config(str(path))
+
+
+class TestFitWithEarlyStopping:
+    """Tests for fit_with_early_stopping function."""
+
+    def test_xgboost_truncated_to_best_iteration(self, data):
+        """Test the XGBoost model keeps only its best rounds and predicts like the best iteration."""
+        X_fit, X_val, y_fit, y_val = data
+        reference = XGBClassifier(n_estimators=200, early_stopping_rounds=5, eval_metric="auc", random_state=0)
+        reference.fit(X_fit, y_fit, eval_set=[(X_val, y_val)], verbose=False)
+
+        model, n_iterations = fit_with_early_stopping(
+            "XGBoost", XGBClassifier(n_estimators=200, random_state=0), X_fit, y_fit, X_val, y_val, patience=5
+        )
+
+        assert n_iterations == reference.best_iteration + 1 < 200
+        assert model.get_booster().num_boosted_rounds() == n_iterations
+        np.testing.assert_allclose(model.predict_proba(X_val), reference.predict_proba(X_val))
+
+    def test_lightgbm_truncated(self, data):
+        """Test the LightGBM booster stops at the best iteration."""
+        X_fit, X_val, y_fit, y_val = data
+
+        model, n_iterations = fit_with_early_stopping(
+            "LightGBM", LGBMClassifier(n_estimators=200, verbose=-1), X_fit, y_fit, X_val, y_val, patience=5
+        )
+
+        assert n_iterations == model.best_iteration_ < 200
+        assert model.booster_.num_trees() == n_iterations
+
+    def test_catboost_truncated(self, data):
+        """Test the CatBoost model is shrunk to the best iteration."""
+        X_fit, X_val, y_fit, y_val = data
+
+        model, n_iterations = fit_with_early_stopping(
+            "CatBoost",
+            CatBoostClassifier(iterations=200, verbose=0, random_state=0, allow_writing_files=False),
+            X_fit,
+            y_fit,
+            X_val,
+            y_val,
+            patience=5,
+        )
+
+        assert n_iterations == model.get_best_iteration() + 1 < 200
+        assert model.tree_count_ == n_iterations
+
+    def test_unsupported_model_raises(self, data):
+        """Test models without early stopping raise ValueError."""
+        X_fit, X_val, y_fit, y_val = data
+
+        with pytest.raises(ValueError):
+            fit_with_early_stopping("Naive Bayes", MagicMock(), X_fit, y_fit, X_val, y_val)
+
+
+class TestModelTrainerEarlyStopping:
+    """Tests for early stopping inside ModelTrainer."""
+
+    @patch("src.models.train.mlflow")
+    def test_best_iteration_logged(self, mock_mlflow, tmp_path, data):
+        """Test boosting models are early-stopped and their best iteration is logged."""
+        mock_mlflow.MlflowClient.return_value.create_run.return_value = MagicMock(info=MagicMock(run_id="run-1"))
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            yaml.dump(
+                {
+                    "model": {"hyperparameters": {"XGBoost": {"n_estimators": 200}, "Naive Bayes": {}}},
+                    "training": {"early_stopping": {"enabled": True, "patience": 5, "metric": "auc"}},
+                }
+            )
+        )
+        X_fit, X_val, y_fit, y_val = data
+        trainer = ModelTrainer(max_workers=1, config_path=str(path))
+
+        trainer.train_all_models(X_fit, y_fit, X_val, y_val)
+
+        assert trainer.trained_models["XGBoost"].get_booster().num_boosted_rounds() < 200
+        client = mock_mlflow.MlflowClient.return_value
+        logged = [{metric.key for metric in call.kwargs["metrics"]} for call in client.log_batch.call_args_list]
+        assert sum("best_iteration" in keys for keys in logged) == 1
+
+    def test_held_out_validation_split_used(self, data):
+        """Test a given pre-SMOTE validation split is monitored instead of a split of the training rows."""
+        X_fit, X_val, y_fit, y_val = data
+        job = {
+            "model_name": "XGBoost",
+            "model_class": XGBClassifier,
+            "params": {"n_estimators": 200},
+            "n_threads": 1,
+            "early_stopping": {"patience": 5, "metric": "auc", "validation_size": 0.1},
+        }
+        splits = {"X_train": X_fit, "y_train": y_fit, "X_test": X_val, "y_test": y_val, "X_val": X_val, "y_val": y_val}
+
+        with patch("src.models.train.split_validation") as mock_split, patch(
+            "src.models.train.fit_with_early_stopping", wraps=fit_with_early_stopping
+        ) as mock_fit:
+            _fit_and_evaluate(job, splits)
+
+        mock_split.assert_not_called()
+        args = mock_fit.call_args[0]
+        assert args[2] is X_fit and args[4] is X_val
@@ -169,6 +169,43 @@ class TestFeatureEngineer:
         assert (tmp_path / "pca.pkl").exists()
         assert (tmp_path / "feature_names.json").exists()
 
+    def test_full_pipeline_chunked(self, sample_data, tmp_path):
+        """Test chunked fitting saves a StandardScaler identical to the one-shot fit."""
+        import joblib
+
+        X, y = sample_data
+        kwargs = dict(apply_smote=False, n_components=3, save_preprocessors=True)
+
+        FeatureEngineer(random_state=42).full_pipeline(X, y, output_dir=str(tmp_path / "full"), **kwargs)
+        result = FeatureEngineer(random_state=42, chunk_size=16).full_pipeline(
+            X, y, output_dir=str(tmp_path / "chunked"), **kwargs
+        )
+
+        full = joblib.load(tmp_path / "full" / "scaler.pkl")
+        chunked = joblib.load(tmp_path / "chunked" / "scaler.pkl")
+        np.testing.assert_allclose(chunked.mean_, full.mean_)
+        np.testing.assert_allclose(chunked.scale_, full.scale_)
+        assert joblib.load(tmp_path / "chunked" / "pca.pkl").components_.shape == (3, len(result["feature_names"]))
+        assert result["X_train"].shape == (80, 3)
+
+    def test_full_pipeline_sparse(self, sample_data, tmp_path):
+        """Test the sparse path saves artifacts that reproduce its outputs on dense input."""
+        import joblib
+
+        X, y = sample_data
+        engineer = FeatureEngineer(random_state=42, sparse=True)
+
+        result = engineer.full_pipeline(
+            X, y, apply_smote=False, n_components=3, save_preprocessors=True, output_dir=str(tmp_path)
+        )
+
+        scaler = joblib.load(tmp_path / "scaler.pkl")
+        pca = joblib.load(tmp_path / "pca.pkl")
+        X_test = engineer.encoder.one_hot_encode(X.loc[result["y_test"].index])
+        np.testing.assert_allclose(pca.transform(scaler.transform(X_test)), result["X_test"].to_numpy(), atol=1e-10)
+        assert result["feature_names"] == list(FeatureEngineer().encode_features(X).columns)
+        assert engineer.transform_new_data(X.head(4)).shape == (4, 3)
+
     def test_full_pipeline_without_pca(self, engineer, sample_data, tmp_path):
         """Test full_pipeline can skip PCA."""
         X, y = sample_data
@@ -209,6 +246,28 @@ class TestFeatureEngineer:
         class_ratio = y_combined.value_counts().min() / y_combined.value_counts().max()
         assert class_ratio > 0.5
 
+    def test_full_pipeline_validation_split_before_smote(self, engineer, tmp_path):
+        """Test the early stopping split holds out real rows with the original class balance."""
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame({"feat1": rng.normal(size=200), "feat2": rng.normal(size=200)})
+        y = pd.Series([1] * 180 + [0] * 20)
+
+        result = engineer.full_pipeline(
+            X,
+            y,
+            apply_smote=True,
+            n_components=2,
+            save_preprocessors=False,
+            validation_size=0.25,
+        )
+
+        assert len(result["y_val"]) == 40
+        assert (result["y_val"] == 0).mean() < 0.2
+        assert list(result["X_val"].columns) == list(result["X_train"].columns)
+        # SMOTE balanced the remaining training rows only
+        assert (result["y_train"] == 0).mean() > 0.3
+        assert "X_val" not in engineer.full_pipeline(X, y, n_components=2, save_preprocessors=False)
+
     def test_save_preprocessors(self, engineer, sample_data, tmp_path):
         """Test save_preprocessors saves scaler and PCA."""
         X, y = sample_data
@@ -0,0 +1,108 @@
+"""
+Unit tests for training/src/utils/mlflow_async.py module.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add training/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
+
+from src.utils.mlflow_async import AsyncMLflowLogger  # noqa: E402
+from src.utils.mlflow_batch import MAX_BATCH_METRICS  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Mock MLflow client."""
+    return MagicMock()
+
+
+class TestAsyncMLflowLogger:
+    """Tests for AsyncMLflowLogger class."""
+
+    def test_queued_calls_are_batched_per_run(self, client):
+        """Test params, metrics and tags of a run are sent in one batch request."""
+        with AsyncMLflowLogger(client, flush_interval=60) as mlflow_logger:
+            mlflow_logger.log_params("run-1", {"depth": 3, "model_type": "XGBoost"})
+            mlflow_logger.log_metrics("run-1", {"f1_score": 0.9, "wall_time": 1.5})
+            mlflow_logger.set_tags("run-1", {"stage": "train"})
+            mlflow_logger.log_metrics("run-2", {"f1_score": 0.8})
+
+            assert mlflow_logger.flush()
+
+        assert client.log_batch.call_count == 2
+        batches = {call.args[0]: call.kwargs for call in client.log_batch.call_args_list}
+        assert {metric.key for metric in batches["run-1"]["metrics"]} == {"f1_score", "wall_time"}
+        assert {(param.key, param.value) for param in batches["run-1"]["params"]} == {
+            ("depth", "3"),
+            ("model_type", "XGBoost"),
+        }
+        assert [tag.key for tag in batches["run-1"]["tags"]] == ["stage"]
+
+    def test_background_flush_on_size_threshold(self, client):
+        """Test a full batch of metrics is sent without waiting for the interval or flush()."""
+        sent = threading.Event()
+        client.log_batch.side_effect = lambda *args, **kwargs: sent.set()
+
+        with AsyncMLflowLogger(client, flush_interval=60) as mlflow_logger:
+            mlflow_logger.log_metrics("run-1", {f"m{i}": i for i in range(MAX_BATCH_METRICS)})
+
+            assert sent.wait(5)
+
+    def test_artifacts_upload_concurrently(self, client, tmp_path):
+        """Test artifact uploads overlap instead of running one after another."""
+        barrier = threading.Barrier(3, timeout=5)
+        client.log_artifact.side_effect = lambda *args: barrier.wait()
+        paths = []
+        for name in ("scaler.pkl", "pca.pkl", "feature_names.json"):
+            paths.append(tmp_path / name)
+            paths[-1].write_text(name)
+
+        with AsyncMLflowLogger(client, max_workers=3) as mlflow_logger:
+            for path in paths:
+                mlflow_logger.log_artifact("run-1", str(path), "preprocessors")
+
+            assert mlflow_logger.flush()
+
+        assert client.log_artifact.call_count == 3
+
+    def test_end_run_waits_for_data(self, client):
+        """Test a run is terminated only after its data is sent."""
+        calls = []
+        client.log_batch.side_effect = lambda *args, **kwargs: calls.append("log_batch")
+        client.set_terminated.side_effect = lambda *args, **kwargs: calls.append("set_terminated")
+
+        with AsyncMLflowLogger(client, flush_interval=60) as mlflow_logger:
+            mlflow_logger.log_metrics("run-1", {"f1_score": 0.9})
+            mlflow_logger.end_run("run-1")
+
+        assert calls == ["log_batch", "set_terminated"]
+        client.set_terminated.assert_called_once_with("run-1", status="FINISHED")
+
+    def test_failures_are_reported_not_raised(self, client):
+        """Test failed requests are recorded and make flush() return False."""
+        client.log_batch.side_effect = ConnectionError("tracking server down")
+
+        mlflow_logger = AsyncMLflowLogger(client, flush_interval=60)
+        mlflow_logger.log_metrics("run-1", {"f1_score": 0.9})
+
+        assert not mlflow_logger.flush()
+        assert "tracking server down" in mlflow_logger.errors[0]
+        mlflow_logger.close()
+
+    def test_close_flushes_and_rejects_new_calls(self, client):
+        """Test close() sends what is queued and later calls raise."""
+        mlflow_logger = AsyncMLflowLogger(client, flush_interval=60)
+        mlflow_logger.log_params("run-1", {"depth": 3})
+
+        mlflow_logger.close()
+        mlflow_logger.close()
+
+        client.log_batch.assert_called_once()
+        with pytest.raises(RuntimeError):
+            mlflow_logger.log_params("run-1", {"depth": 4})
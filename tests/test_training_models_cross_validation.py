@@ -0,0 +1,164 @@
+"""
+Unit tests for training/src/models/cross_validation.py module.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+# Add training/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
+
+from src.models.cross_validation import (  # noqa: E402
+    CrossValidator,
+    aggregate_fold_metrics,
+    load_cv_config,
+    make_fold_assignment,
+    prepare_fold,
+)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Config with three folds and two fast models."""
+    path = tmp_path / "config.yaml"
+    config = {
+        "model": {
+            "hyperparameters": {
+                "AdaBoost": {"n_estimators": 5, "random_state": 42},
+                "Naive Bayes": {},
+            }
+        },
+        "training": {"cross_validation": {"enabled": True, "n_folds": 3, "stratified": True}},
+    }
+    path.write_text(yaml.dump(config))
+    return str(path)
+
+
+@pytest.fixture
+def encoded_data():
+    """Imbalanced encoded features with a learnable label."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(300, 6)), columns=[f"f{i}" for i in range(6)])
+    y = pd.Series((X["f0"] + rng.normal(scale=0.5, size=300) > 1.0).astype(int), name="Label")
+    return X, y
+
+
+class TestFoldAssignment:
+    """Tests for make_fold_assignment function."""
+
+    def test_every_row_in_one_fold(self, encoded_data):
+        """Test folds cover all rows with balanced sizes."""
+        _, y = encoded_data
+
+        folds = make_fold_assignment(y, n_folds=5)
+
+        assert set(np.unique(folds)) == set(range(5))
+        assert np.bincount(folds).min() >= len(y) // 5
+
+    def test_stratified_preserves_class_ratio(self, encoded_data):
+        """Test each fold holds about the same share of positives."""
+        _, y = encoded_data
+
+        folds = make_fold_assignment(y, n_folds=3, stratified=True)
+
+        positives = [int(y[folds == fold].sum()) for fold in range(3)]
+        assert max(positives) - min(positives) <= 1
+
+    def test_deterministic(self, encoded_data):
+        """Test the same seed gives the same folds."""
+        _, y = encoded_data
+
+        np.testing.assert_array_equal(make_fold_assignment(y, 3), make_fold_assignment(y, 3))
+
+
+class TestPrepareFold:
+    """Tests for per-fold preprocessing."""
+
+    def test_validation_rows_untouched_by_fit(self, encoded_data):
+        """Test the scaler and PCA are fit on training rows only."""
+        X, y = encoded_data
+        folds = make_fold_assignment(y, 3)
+
+        fold = prepare_fold(X, y, folds, 0, apply_smote=False, n_components=None)
+
+        train = X[folds != 0]
+        expected_val = (X[folds == 0] - train.mean()) / train.std(ddof=0)
+        np.testing.assert_allclose(fold["X_test"].to_numpy(), expected_val.to_numpy(), rtol=1e-10)
+        assert len(fold["y_test"]) == (folds == 0).sum()
+
+    def test_smote_only_on_training_rows(self, encoded_data):
+        """Test resampling grows the training rows and leaves validation rows as they are."""
+        X, y = encoded_data
+        folds = make_fold_assignment(y, 3)
+
+        fold = prepare_fold(X, y, folds, 1, apply_smote=True, n_components=3)
+
+        assert len(fold["X_train"]) > (folds != 1).sum()
+        assert fold["y_train"].mean() == pytest.approx(0.5, abs=0.05)
+        np.testing.assert_array_equal(fold["y_test"].to_numpy(), y[folds == 1].to_numpy())
+        assert list(fold["X_test"].columns) == ["PC1", "PC2", "PC3"]
+
+
+class TestAggregation:
+    """Tests for aggregate_fold_metrics function."""
+
+    def test_mean_and_std(self):
+        """Test metrics are aggregated per model and sorted by mean F1."""
+        fold_results = pd.DataFrame(
+            {
+                "Model": ["A", "A", "B", "B"],
+                "Fold": [0, 1, 0, 1],
+                "f1_score": [0.2, 0.4, 0.8, 0.8],
+                "accuracy": [0.5, 0.7, 0.9, 0.9],
+            }
+        )
+
+        summary = aggregate_fold_metrics(fold_results)
+
+        assert list(summary["Model"]) == ["B", "A"]
+        a = summary.set_index("Model").loc["A"]
+        assert a["f1_score_mean"] == pytest.approx(0.3)
+        assert a["f1_score_std"] == pytest.approx(np.std([0.2, 0.4], ddof=1))
+        assert a["n_folds"] == 2
+
+
+class TestCrossValidator:
+    """Tests for CrossValidator class."""
+
+    def test_reads_config(self, config_path):
+        """Test folds default to training.cross_validation in the config."""
+        assert load_cv_config(config_path)["n_folds"] == 3
+
+    @patch("src.models.cross_validation.mlflow")
+    def test_run_in_process(self, mock_mlflow, config_path, encoded_data, tmp_path):
+        """Test the folds x models grid runs and every model is logged in one batch."""
+        mock_mlflow.start_run.return_value.__enter__.return_value = MagicMock(info=MagicMock(run_id="run-1"))
+        client = mock_mlflow.MlflowClient.return_value
+        validator = CrossValidator(max_workers=1, config_path=config_path)
+
+        summary = validator.run(*encoded_data)
+
+        assert set(summary["Model"]) == {"AdaBoost", "Naive Bayes"}
+        assert (summary["n_folds"] == 3).all()
+        assert len(validator.fold_results) == 6
+        assert validator.run_ids == {"AdaBoost": "run-1", "Naive Bayes": "run-1"}
+        assert client.log_batch.call_count == 2
+        metrics = client.log_batch.call_args_list[0].kwargs["metrics"]
+        assert {metric.step for metric in metrics if metric.key == "cv_f1_score"} == {0, 1, 2}
+        assert any(metric.key == "cv_f1_score_std" for metric in metrics)
+
+        validator.save_results(str(tmp_path))
+        assert (tmp_path / "cv_summary.csv").exists()
+        assert (tmp_path / "cv_fold_results.csv").exists()
+
+    @patch("src.models.cross_validation.mlflow")
+    def test_too_few_folds(self, mock_mlflow, config_path):
+        """Test fewer than two folds raises ValueError."""
+        with pytest.raises(ValueError):
+            CrossValidator(n_folds=1, config_path=config_path)
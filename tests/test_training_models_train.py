@@ -0,0 +1,189 @@
+"""
+Unit tests for training/src/models/train.py module.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+# Add training/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
+
+from src.models.train import ModelTrainer, allocate_threads  # noqa: E402
+from src.utils.shared_memory import SharedDataset, attach_shared, detach_shared, spawn_pool  # noqa: E402
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Config with two fast models."""
+    path = tmp_path / "config.yaml"
+    config = {
+        "model": {
+            "hyperparameters": {
+                "AdaBoost": {"n_estimators": 5, "random_state": 42},
+                "Naive Bayes": {},
+            }
+        }
+    }
+    path.write_text(yaml.dump(config))
+    return str(path)
+
+
+@pytest.fixture
+def splits():
+    """Small separable train/test splits."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(200, 3)), columns=["PC1", "PC2", "PC3"])
+    y = pd.Series((X["PC1"] + rng.normal(scale=0.3, size=200) > 0).astype(int), name="Label")
+    return X[:150], y[:150], X[150:].reset_index(drop=True), y[150:].reset_index(drop=True)
+
+
+class TestAllocateThreads:
+    """Tests for allocate_threads function."""
+
+    def test_spare_cores_go_to_threaded_libraries(self):
+        """Test single-threaded models get one core and boosters share the rest."""
+        budget = allocate_threads(["AdaBoost", "XGBoost", "LightGBM", "CatBoost", "Naive Bayes"], 16)
+
+        assert budget["AdaBoost"] == 1
+        assert budget["Naive Bayes"] == 1
+        assert sorted([budget["XGBoost"], budget["LightGBM"], budget["CatBoost"]]) == [4, 5, 5]
+        assert sum(budget.values()) == 16
+
+    def test_fewer_cores_than_models(self):
+        """Test every model gets one thread when cores are scarce."""
+        budget = allocate_threads(["XGBoost", "LightGBM", "Naive Bayes"], 2)
+
+        assert budget == {"XGBoost": 1, "LightGBM": 1, "Naive Bayes": 1}
+
+    def test_fewer_slots_than_models(self):
+        """Test every threaded library gets a slot's share when models run in fewer slots."""
+        budget = allocate_threads(["AdaBoost", "XGBoost", "LightGBM", "CatBoost"], 8, max_concurrent=2)
+
+        assert budget == {"AdaBoost": 1, "XGBoost": 4, "LightGBM": 4, "CatBoost": 4}
+
+
+def _shared_columns(specs):
+    """Worker: column names of the shared X_train"""
+    handles, data = attach_shared(specs)
+    columns = list(data["X_train"].columns)
+    del data
+    detach_shared(handles)
+    return columns
+
+
+class TestSharedDataset:
+    """Tests for shared-memory transport of training data."""
+
+    def test_attach_returns_equal_frames(self, splits):
+        """Test attached frames equal the originals, with columns and names."""
+        X_train, y_train, _, _ = splits
+
+        with SharedDataset(X_train=X_train, y_train=y_train) as shared:
+            handles, data = attach_shared(shared.specs)
+            pd.testing.assert_frame_equal(data["X_train"], X_train.reset_index(drop=True))
+            pd.testing.assert_series_equal(data["y_train"], y_train.reset_index(drop=True))
+            del data
+            detach_shared(handles)
+
+    def test_object_dtype_rejected(self):
+        """Test non-numeric frames are rejected."""
+        with pytest.raises(ValueError):
+            SharedDataset(X=pd.DataFrame({"a": ["x"]}))
+
+    def test_spawn_pool_spawns_workers(self, splits):
+        """Test worker processes are spawned and read the data from shared memory."""
+        X_train, _, _, _ = splits
+
+        with SharedDataset(X_train=X_train) as shared, spawn_pool(1) as executor:
+            columns = executor.submit(_shared_columns, shared.specs).result()
+            assert executor._mp_context.get_start_method() == "spawn"
+
+        assert columns == list(X_train.columns)
+
+
+class TestModelTrainer:
+    """Tests for ModelTrainer class."""
+
+    @patch("src.models.train.mlflow")
+    def test_train_all_models_in_process(self, mock_mlflow, config_path, splits):
+        """Test models are trained, compared and logged to MLflow with timings."""
+        client = mock_mlflow.MlflowClient.return_value
+        client.create_run.side_effect = lambda experiment_id, run_name: MagicMock(
+            info=MagicMock(run_id=f"run-{run_name}")
+        )
+        trainer = ModelTrainer(max_workers=1, config_path=config_path)
+
+        results = trainer.train_all_models(*splits)
+
+        assert set(results["Model"]) == {"AdaBoost", "Naive Bayes"}
+        assert results["F1-Score"].is_monotonic_decreasing
+        assert set(trainer.trained_models) == {"AdaBoost", "Naive Bayes"}
+        assert trainer.run_ids == {"AdaBoost": "run-AdaBoost", "Naive Bayes": "run-Naive Bayes"}
+        logged = [{metric.key for metric in call.kwargs["metrics"]} for call in client.log_batch.call_args_list]
+        assert len(logged) == 2
+        assert all({"wall_time", "training_time", "f1_score"} <= keys for keys in logged)
+        assert client.log_artifacts.call_count == 2
+        assert {call.args[0] for call in client.set_terminated.call_args_list} == set(trainer.run_ids.values())
+
+    @patch("src.models.train.mlflow")
+    def test_threads_budgeted_for_every_model(self, mock_mlflow, tmp_path, splits):
+        """Test models queued behind the first slots still get a threaded budget."""
+        path = tmp_path / "config.yaml"
+        hyperparameters = {"AdaBoost": {"n_estimators": 5}, "XGBoost": {}, "LightGBM": {}, "CatBoost": {}}
+        path.write_text(yaml.dump({"model": {"hyperparameters": hyperparameters}}))
+        trainer = ModelTrainer(n_cores=8, max_workers=2, config_path=str(path))
+
+        with patch.object(ModelTrainer, "_train_in_pool", return_value=[]) as mock_pool:
+            trainer.train_all_models(*splits)
+
+        jobs, _, n_workers = mock_pool.call_args.args
+        threads = {job["model_name"]: job["n_threads"] for job in jobs}
+        assert n_workers == 2
+        assert threads == {"AdaBoost": 1, "XGBoost": 4, "LightGBM": 4, "CatBoost": 4}
+        assert {job["model_name"]: job["params"].get("thread_count", job["params"].get("n_jobs")) for job in jobs} == {
+            "AdaBoost": None,
+            "XGBoost": 4,
+            "LightGBM": 4,
+            "CatBoost": 4,
+        }
+
+    @patch("src.models.train.mlflow")
+    def test_unknown_models_raise(self, mock_mlflow, config_path, splits):
+        """Test requesting models missing from the config raises ValueError."""
+        trainer = ModelTrainer(max_workers=1, config_path=config_path)
+
+        with pytest.raises(ValueError):
+            trainer.train_all_models(*splits, models=["XGBoost"])
+
+    @patch("src.models.train.mlflow")
+    def test_save_outputs(self, mock_mlflow, config_path, splits, tmp_path):
+        """Test best model, comparison table and summary are written."""
+        mock_mlflow.MlflowClient.return_value.create_run.return_value = MagicMock(info=MagicMock(run_id="run-1"))
+        trainer = ModelTrainer(max_workers=1, config_path=config_path)
+        trainer.train_all_models(*splits)
+
+        model_path, metadata_path = trainer.save_best_model(str(tmp_path), metric="F1-Score")
+        trainer.save_comparison_results(str(tmp_path))
+        trainer.create_training_summary(splits[0], splits[2], str(tmp_path))
+
+        assert model_path.exists()
+        assert metadata_path.exists()
+        assert trainer.best_model_name == trainer.results_df.iloc[0]["Model"]
+        assert trainer.best_model_run_id == "run-1"
+        assert (tmp_path / "model_comparison.csv").exists()
+        assert trainer.best_model_name in (tmp_path / "training_summary.txt").read_text()
+
+    @patch("src.models.train.mlflow")
+    def test_save_best_model_unknown_metric(self, mock_mlflow, config_path, splits, tmp_path):
+        """Test an unknown selection metric raises ValueError."""
+        trainer = ModelTrainer(max_workers=1, config_path=config_path)
+        trainer.train_all_models(*splits)
+
+        with pytest.raises(ValueError):
+            trainer.save_best_model(str(tmp_path), metric="Bogus")
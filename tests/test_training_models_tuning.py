@@ -0,0 +1,166 @@
+"""
+Unit tests for training/src/models/tuning.py module.
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+# Add training/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
+
+from src.models.tuning import HyperparameterSearch, halving_budgets, sample_params  # noqa: E402
+from src.utils.mlflow_batch import MAX_BATCH_METRICS, log_batch  # noqa: E402
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Config with a small AdaBoost search space."""
+    path = tmp_path / "config.yaml"
+    config = {
+        "model": {"hyperparameters": {"AdaBoost": {"random_state": 42}, "Naive Bayes": {}}},
+        "tuning": {
+            "metric": "roc_auc",
+            "n_trials": 9,
+            "eta": 3,
+            "min_budget": 0.11,
+            "search_spaces": {
+                "AdaBoost": {
+                    "n_estimators": {"type": "int", "low": 2, "high": 10},
+                    "learning_rate": {"type": "float", "low": 0.05, "high": 1.0, "log": True},
+                }
+            },
+        },
+    }
+    path.write_text(yaml.dump(config))
+    return str(path)
+
+
+@pytest.fixture
+def train_data():
+    """Training split with a learnable label."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(400, 3)), columns=["PC1", "PC2", "PC3"])
+    y = pd.Series((X["PC1"] + rng.normal(scale=0.5, size=400) > 0).astype(int), name="Label")
+    return X, y
+
+
+class TestSampleParams:
+    """Tests for sample_params function."""
+
+    def test_values_within_space(self):
+        """Test sampled values respect type, bounds and step."""
+        space = {
+            "depth": {"type": "int", "low": 3, "high": 9},
+            "rate": {"type": "float", "low": 0.01, "high": 0.3, "log": True},
+            "trees": {"type": "int", "low": 100, "high": 500, "step": 50},
+            "booster": {"type": "choice", "values": ["gbtree", "dart"]},
+        }
+        rng = np.random.default_rng(0)
+
+        for _ in range(50):
+            params = sample_params(space, rng)
+            assert isinstance(params["depth"], int) and 3 <= params["depth"] <= 9
+            assert 0.01 <= params["rate"] <= 0.3
+            assert params["trees"] % 50 == 0
+            assert params["booster"] in ("gbtree", "dart")
+
+    def test_unknown_type_raises(self):
+        """Test an unknown distribution type raises ValueError."""
+        with pytest.raises(ValueError):
+            sample_params({"x": {"type": "normal"}}, np.random.default_rng(0))
+
+
+class TestHalvingBudgets:
+    """Tests for halving_budgets function."""
+
+    def test_budgets_grow_by_eta_to_full_data(self):
+        """Test rungs grow geometrically and end at the full data."""
+        assert halving_budgets(1 / 9, 3) == pytest.approx([1 / 9, 1 / 3, 1.0])
+        assert halving_budgets(0.1, 3) == pytest.approx([0.1, 0.3, 1.0])
+        assert halving_budgets(1.0, 3) == [1.0]
+
+    def test_invalid_arguments(self):
+        """Test invalid budget or eta raises ValueError."""
+        with pytest.raises(ValueError):
+            halving_budgets(0, 3)
+        with pytest.raises(ValueError):
+            halving_budgets(0.5, 1)
+
+
+class TestLogBatch:
+    """Tests for batched MLflow logging."""
+
+    def test_chunks_large_batches(self):
+        """Test metrics beyond the server limit are split across requests."""
+        client = MagicMock()
+
+        requests = log_batch(client, "run-1", metrics=list(range(MAX_BATCH_METRICS + 1)), params=["p"])
+
+        assert requests == 2
+        assert len(client.log_batch.call_args_list[0].kwargs["metrics"]) == MAX_BATCH_METRICS
+        assert client.log_batch.call_args_list[1].kwargs["params"] == []
+
+
+class TestHyperparameterSearch:
+    """Tests for HyperparameterSearch class."""
+
+    @patch("src.models.tuning.mlflow")
+    def test_successive_halving(self, mock_mlflow, config_path, train_data, tmp_path):
+        """Test trials are halved per rung and the best survivor is reported."""
+        mock_mlflow.start_run.return_value.__enter__.return_value = MagicMock(info=MagicMock(run_id="run-1"))
+        search = HyperparameterSearch(trial_log=str(tmp_path / "trials.jsonl"), max_workers=1, config_path=config_path)
+
+        results = search.run(*train_data)
+
+        assert list(results["Model"]) == ["AdaBoost"]
+        assert search.trials.groupby("rung").size().tolist() == [9, 3, 1]
+        assert search.trials.groupby("rung")["n_rows"].first().is_monotonic_increasing
+        assert 2 <= search.best_params["AdaBoost"]["n_estimators"] <= 10
+        assert search.best_params["AdaBoost"]["random_state"] == 42
+        assert search.run_ids == {"AdaBoost": "run-1"}
+        assert mock_mlflow.MlflowClient.return_value.log_batch.call_count == 1
+
+    @patch("src.models.tuning.mlflow")
+    def test_resume_skips_finished_trials(self, mock_mlflow, config_path, train_data, tmp_path):
+        """Test a rerun with the same trial log reuses every finished trial."""
+        trial_log = tmp_path / "trials.jsonl"
+        first = HyperparameterSearch(trial_log=str(trial_log), max_workers=1, config_path=config_path)
+        first.run(*train_data)
+        n_logged = len(trial_log.read_text().splitlines())
+
+        with patch("src.models.tuning._evaluate_trial") as evaluate:
+            second = HyperparameterSearch(trial_log=str(trial_log), max_workers=1, config_path=config_path)
+            second.run(*train_data)
+
+        evaluate.assert_not_called()
+        assert second.best_params == first.best_params
+        assert len(trial_log.read_text().splitlines()) == n_logged
+
+    @patch("src.models.tuning.mlflow")
+    def test_resume_with_other_search_raises(self, mock_mlflow, config_path, train_data, tmp_path):
+        """Test a trial log from a different search is rejected."""
+        trial_log = tmp_path / "trials.jsonl"
+        HyperparameterSearch(trial_log=str(trial_log), max_workers=1, config_path=config_path).run(*train_data)
+
+        search = HyperparameterSearch(trial_log=str(trial_log), max_workers=1, random_state=7, config_path=config_path)
+        with pytest.raises(ValueError):
+            search.run(*train_data)
+
+    @patch("src.models.tuning.mlflow")
+    def test_save_best_params(self, mock_mlflow, config_path, train_data, tmp_path):
+        """Test best parameters are written in the config layout."""
+        search = HyperparameterSearch(trial_log=str(tmp_path / "trials.jsonl"), max_workers=1, config_path=config_path)
+        search.run(*train_data)
+
+        path = search.save_best_params(str(tmp_path / "best.yaml"))
+
+        saved = yaml.safe_load(path.read_text())
+        assert saved["model"]["hyperparameters"]["AdaBoost"] == search.best_params["AdaBoost"]
+        assert json.loads((tmp_path / "trials.jsonl").read_text().splitlines()[0])["rung"] == 0
@@ -0,0 +1,184 @@
+"""
+Unit tests for training/src/pipeline modules.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add training/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
+
+from src.pipeline.runner import REPORT_FILE, STATE_DIR, PipelineRunner, Stage  # noqa: E402
+from src.pipeline.stages import build_stages  # noqa: E402
+
+# Copies its input to its output and appends a line to a run log
+COPY = (
+    "import sys, pathlib; src, dst, log = map(pathlib.Path, sys.argv[1:4]);"
+    "dst.parent.mkdir(parents=True, exist_ok=True); dst.write_text(src.read_text().upper());"
+    "log.open('a').write(sys.argv[4] + '\\n')"
+)
+
+# Marks itself started, then waits until the other stage has started too
+RENDEZVOUS = (
+    "import sys, time, pathlib; me, other, out = map(pathlib.Path, sys.argv[1:4]); me.touch();"
+    "deadline = time.time() + 10\n"
+    "while not other.exists():\n"
+    "    time.sleep(0.01)\n"
+    "    if time.time() > deadline: sys.exit(1)\n"
+    "out.write_text('done')"
+)
+
+
+def copy_stage(name, src, dst, **kwargs):
+    """Stage copying src to dst and recording that it ran."""
+    return Stage(
+        name,
+        [sys.executable, "-c", COPY, src, dst, "runs.log", name],
+        inputs=[src],
+        outputs=[dst],
+        **kwargs,
+    )
+
+
+def runs(root):
+    """Stage names in the order they ran."""
+    path = root / "runs.log"
+    return path.read_text().split() if path.exists() else []
+
+
+@pytest.fixture
+def root(tmp_path):
+    """Pipeline root with one raw input file."""
+    (tmp_path / "raw.txt").write_text("data")
+    return tmp_path
+
+
+class TestPipelineRunner:
+    """Tests for PipelineRunner class."""
+
+    def test_unchanged_stages_are_skipped(self, root):
+        """Test a second run skips every stage and the report records timings."""
+        stages = [copy_stage("prepare", "raw.txt", "prepared.txt"), copy_stage("train", "prepared.txt", "model.txt")]
+
+        first = PipelineRunner(stages, root=str(root)).run()
+        second = PipelineRunner(stages, root=str(root)).run()
+
+        assert [entry["status"] for entry in first["stages"]] == ["ran", "ran"]
+        assert [entry["status"] for entry in second["stages"]] == ["skipped", "skipped"]
+        assert runs(root) == ["prepare", "train"]
+        assert (root / "model.txt").read_text() == "DATA"
+        report = json.loads((root / STATE_DIR / REPORT_FILE).read_text())
+        assert report["status"] == "success"
+        assert all(entry["seconds"] >= 0 for entry in report["stages"])
+        assert report["stages"][1]["depends_on"] == ["prepare"]
+
+    def test_changed_params_rerun_only_that_stage(self, root):
+        """Test a parameter change reruns its stage; unchanged upstream stages stay skipped."""
+        PipelineRunner(
+            [copy_stage("prepare", "raw.txt", "prepared.txt"), copy_stage("train", "prepared.txt", "model.txt")],
+            root=str(root),
+        ).run()
+
+        report = PipelineRunner(
+            [
+                copy_stage("prepare", "raw.txt", "prepared.txt"),
+                copy_stage("train", "prepared.txt", "model.txt", params={"learning_rate": 0.1}),
+            ],
+            root=str(root),
+        ).run()
+
+        assert [entry["status"] for entry in report["stages"]] == ["skipped", "ran"]
+
+    def test_identical_upstream_output_skips_downstream(self, root):
+        """Test downstream stages are keyed on upstream content, not on upstream reruns."""
+        stages = [copy_stage("prepare", "raw.txt", "prepared.txt"), copy_stage("train", "prepared.txt", "model.txt")]
+        PipelineRunner(stages, root=str(root)).run()
+
+        (root / "raw.txt").write_text("DATA")  # upper-cases to the same prepared.txt
+        report = PipelineRunner(stages, root=str(root)).run()
+
+        assert [entry["status"] for entry in report["stages"]] == ["ran", "skipped"]
+
+    def test_missing_output_or_force_reruns(self, root):
+        """Test a deleted output or a forced stage runs again."""
+        stages = [copy_stage("prepare", "raw.txt", "prepared.txt")]
+        PipelineRunner(stages, root=str(root)).run()
+
+        (root / "prepared.txt").unlink()
+        PipelineRunner(stages, root=str(root)).run()
+        PipelineRunner(stages, root=str(root), force=["prepare"]).run()
+
+        assert runs(root) == ["prepare"] * 3
+
+    def test_independent_stages_run_in_parallel(self, root):
+        """Test stages without a dependency between them overlap in time."""
+        stages = [
+            Stage(
+                name,
+                [sys.executable, "-c", RENDEZVOUS, f"{name}.started", f"{other}.started", f"{name}.out"],
+                inputs=["raw.txt"],
+                outputs=[f"{name}.out"],
+            )
+            for name, other in (("eda", "prepare"), ("prepare", "eda"))
+        ]
+
+        report = PipelineRunner(stages, root=str(root), max_workers=2).run()
+
+        assert report["status"] == "success"
+
+    def test_failure_blocks_downstream_only(self, root):
+        """Test a failed stage blocks its dependents while independent stages still run."""
+        stages = [
+            Stage("prepare", [sys.executable, "-c", "raise SystemExit(3)"], inputs=["raw.txt"], outputs=["p.txt"]),
+            copy_stage("train", "p.txt", "model.txt"),
+            copy_stage("eda", "raw.txt", "eda.txt"),
+        ]
+
+        report = PipelineRunner(stages, root=str(root)).run()
+
+        statuses = {entry["stage"]: entry for entry in report["stages"]}
+        assert report["status"] == "failed"
+        assert statuses["prepare"]["status"] == "failed"
+        assert statuses["prepare"]["returncode"] == 3
+        assert statuses["train"]["status"] == "blocked"
+        assert statuses["eda"]["status"] == "ran"
+
+    def test_invalid_graphs_raise(self, root):
+        """Test overlapping outputs and cycles are rejected."""
+        with pytest.raises(ValueError):
+            PipelineRunner([copy_stage("a", "raw.txt", "out/a.txt"), Stage("b", ["true"], outputs=["out"])])
+        with pytest.raises(ValueError):
+            PipelineRunner([copy_stage("a", "b.txt", "a.txt"), copy_stage("b", "a.txt", "b.txt")])
+
+
+class TestBuildStages:
+    """Tests for the default stage definitions."""
+
+    def test_dependencies(self, tmp_path):
+        """Test default stages chain and optional stages depend only on what they read."""
+        stages = build_stages(include=["download", "preprocess", "cross_validation", "train", "tuning", "evaluate"])
+
+        runner = PipelineRunner(stages, root=str(tmp_path))
+
+        assert runner.dependencies == {
+            "download": [],
+            "preprocess": ["download"],
+            "cross_validation": ["download"],
+            "train": ["preprocess"],
+            "tuning": ["preprocess"],
+            "evaluate": ["preprocess", "train"],
+        }
+
+    def test_evaluate_inputs_cover_imported_code(self):
+        """Test the evaluation stage reruns when the metrics, processed store or artifact code changes."""
+        (evaluate,) = build_stages(include=["evaluate"])
+
+        assert {"training/src/data", "training/src/utils", "app/utils"} <= set(evaluate.inputs)
+
+    def test_unknown_stage_raises(self):
+        """Test an unknown stage name raises ValueError."""
+        with pytest.raises(ValueError):
+            build_stages(include=["deploy"])
@@ -0,0 +1,144 @@
+"""
+Unit tests for training/src/data/processed_store.py module.
+"""
+
+import json
+import mmap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from training.src.data.processed_store import (  # noqa: E402
+    MANIFEST_NAME,
+    has_processed_manifest,
+    has_processed_split,
+    iter_processed_chunks,
+    load_processed_split,
+    load_processed_splits,
+    save_processed_splits,
+)
+
+
+@pytest.fixture
+def splits():
+    """Small processed splits with full-precision floats."""
+    rng = np.random.default_rng(0)
+    return {
+        "X_train": pd.DataFrame(rng.normal(size=(20, 3)) / 3, columns=["PC1", "PC2", "PC3"]),
+        "X_test": pd.DataFrame(rng.normal(size=(5, 3)) / 3, columns=["PC1", "PC2", "PC3"]),
+        "y_train": pd.Series(rng.integers(0, 2, size=20), name="Label"),
+        "y_test": pd.Series(rng.integers(0, 2, size=5), name="Label"),
+    }
+
+
+class TestProcessedStore:
+    """Tests for binary processed split storage."""
+
+    def test_round_trip_is_exact(self, tmp_path, splits):
+        """Test splits load back bit-identical with names and columns."""
+        save_processed_splits(str(tmp_path), splits)
+
+        loaded = load_processed_splits(str(tmp_path))
+
+        for name, expected in splits.items():
+            if isinstance(expected, pd.DataFrame):
+                pd.testing.assert_frame_equal(loaded[name], expected)
+            else:
+                pd.testing.assert_series_equal(loaded[name], expected)
+
+    def test_manifest_records_shapes_and_dtypes(self, tmp_path, splits):
+        """Test the manifest describes every split."""
+        save_processed_splits(str(tmp_path), splits)
+
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+
+        assert manifest["splits"]["X_train"]["shape"] == [20, 3]
+        assert manifest["splits"]["X_train"]["columns"] == ["PC1", "PC2", "PC3"]
+        assert manifest["splits"]["y_test"]["name"] == "Label"
+        assert not (tmp_path / "X_train.csv").exists()
+
+    def test_load_is_memory_mapped(self, tmp_path, splits):
+        """Test loaded data shares memory with the mapped file."""
+        save_processed_splits(str(tmp_path), splits)
+
+        X_train = load_processed_split(str(tmp_path), "X_train")
+
+        base = X_train.to_numpy()
+        while not isinstance(base, (np.memmap, mmap.mmap)) and getattr(base, "base", None) is not None:
+            base = base.base
+        assert isinstance(base, (np.memmap, mmap.mmap))
+
+    def test_writes_do_not_touch_file(self, tmp_path, splits):
+        """Test in-place edits of a loaded split do not modify the stored file."""
+        save_processed_splits(str(tmp_path), splits)
+
+        X_train = load_processed_split(str(tmp_path), "X_train")
+        X_train.iloc[0, 0] = 99.0
+
+        assert load_processed_split(str(tmp_path), "X_train").iloc[0, 0] == splits["X_train"].iloc[0, 0]
+
+    def test_export_csv(self, tmp_path, splits):
+        """Test CSV export is written when requested."""
+        save_processed_splits(str(tmp_path), splits, export_csv=True)
+
+        assert (tmp_path / "X_test.csv").exists()
+        assert (tmp_path / "y_test.csv").exists()
+
+    def test_falls_back_to_csv(self, tmp_path, splits):
+        """Test directories without a manifest are read from CSV."""
+        splits["X_test"].to_csv(tmp_path / "X_test.csv", index=False)
+        splits["y_test"].to_csv(tmp_path / "y_test.csv", index=False)
+
+        X_test = load_processed_split(str(tmp_path), "X_test")
+        y_test = load_processed_split(str(tmp_path), "y_test")
+
+        assert not has_processed_manifest(str(tmp_path))
+        assert X_test.shape == (5, 3)
+        assert isinstance(y_test, pd.Series)
+
+    def test_missing_split_raises(self, tmp_path, splits):
+        """Test requesting an unknown split raises FileNotFoundError."""
+        save_processed_splits(str(tmp_path), {"X_test": splits["X_test"]})
+
+        with pytest.raises(FileNotFoundError):
+            load_processed_split(str(tmp_path), "X_train")
+
+    def test_has_processed_split(self, tmp_path, splits):
+        """Test optional splits are detected in binary and CSV directories."""
+        save_processed_splits(str(tmp_path / "binary"), splits)
+        (tmp_path / "csv").mkdir()
+        splits["X_train"].to_csv(tmp_path / "csv" / "X_val.csv", index=False)
+
+        assert has_processed_split(str(tmp_path / "binary"), "X_train")
+        assert not has_processed_split(str(tmp_path / "binary"), "X_val")
+        assert has_processed_split(str(tmp_path / "csv"), "X_val")
+        assert not has_processed_split(str(tmp_path / "csv"), "y_val")
+
+    def test_object_split_rejected(self, tmp_path):
+        """Test splits with object dtype are rejected."""
+        with pytest.raises(ValueError):
+            save_processed_splits(str(tmp_path), {"X_train": pd.DataFrame({"a": ["x", "y"]})})
+
+    @pytest.mark.parametrize("binary", [True, False])
+    def test_iter_chunks(self, tmp_path, splits, binary):
+        """Test chunks of features and labels stay aligned and cover every row, binary or CSV."""
+        if binary:
+            save_processed_splits(str(tmp_path), splits)
+        else:
+            splits["X_train"].to_csv(tmp_path / "X_train.csv", index=False)
+            splits["y_train"].to_csv(tmp_path / "y_train.csv", index=False)
+
+        chunks = list(iter_processed_chunks(str(tmp_path), ("X_train", "y_train"), chunk_size=8))
+
+        assert [len(X) for X, _ in chunks] == [8, 8, 4]
+        assert all(isinstance(y, pd.Series) and len(y) == len(X) for X, y in chunks)
+        np.testing.assert_allclose(pd.concat([X for X, _ in chunks]).to_numpy(), splits["X_train"].to_numpy())
+        np.testing.assert_array_equal(np.concatenate([y for _, y in chunks]), splits["y_train"].to_numpy())
+
+    def test_iter_chunks_misaligned_raises(self, tmp_path, splits):
+        """Test splits with different row counts raise ValueError."""
+        save_processed_splits(str(tmp_path), splits)
+
+        with pytest.raises(ValueError):
+            list(iter_processed_chunks(str(tmp_path), ("X_train", "y_test"), chunk_size=8))
@@ -0,0 +1,151 @@
+"""
+Unit tests for training/src/data/raw_cache.py module.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from training.src.data.data_loader import DataLoader  # noqa: E402
+from training.src.data.raw_cache import CREDIT_SCHEMA, RawDataCache, apply_schema  # noqa: E402
+
+
+@pytest.fixture
+def credit_csv(tmp_path):
+    """Write a small credit_record.csv."""
+    path = tmp_path / "credit_record.csv"
+    pd.DataFrame(
+        {
+            "ID": [5008804, 5008804, 5008805],
+            "MONTHS_BALANCE": [0, -1, -2],
+            "STATUS": ["C", "X", "1"],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+class TestApplySchema:
+    """Tests for apply_schema function."""
+
+    def test_casts_to_schema_dtypes(self):
+        """Test columns are cast to compact dtypes."""
+        df = pd.DataFrame({"ID": [1, 2], "FLAG": [0, 1], "NAME": ["a", "b"], "CNT": [2.0, 3.0]})
+
+        result = apply_schema(df, {"ID": "int32", "FLAG": "int8", "NAME": "category", "CNT": "int8"})
+
+        assert result["ID"].dtype == np.int32
+        assert result["FLAG"].dtype == np.int8
+        assert isinstance(result["NAME"].dtype, pd.CategoricalDtype)
+        assert result["CNT"].tolist() == [2, 3]
+
+    @pytest.mark.parametrize("values", [[1.5, 2.0], [1.0, None], [0, 300]])
+    def test_skips_lossy_integer_casts(self, values):
+        """Test fractional, missing and out-of-range values keep their dtype."""
+        df = pd.DataFrame({"CNT": values})
+
+        result = apply_schema(df, {"CNT": "int8"})
+
+        assert result["CNT"].dtype == df["CNT"].dtype
+
+    def test_ignores_missing_columns(self):
+        """Test schema columns absent from the data are ignored."""
+        result = apply_schema(pd.DataFrame({"ID": [1]}), {"OTHER": "int8"})
+
+        assert list(result.columns) == ["ID"]
+
+
+class TestRawDataCache:
+    """Tests for RawDataCache class."""
+
+    def test_miss_writes_typed_cache(self, tmp_path, credit_csv):
+        """Test the first load parses the CSV and writes data and metadata."""
+        cache = RawDataCache(str(tmp_path / "cache"))
+
+        df = cache.load(credit_csv, CREDIT_SCHEMA)
+
+        assert df["MONTHS_BALANCE"].dtype == np.int8
+        assert isinstance(df["STATUS"].dtype, pd.CategoricalDtype)
+        assert (tmp_path / "cache" / "credit_record.feather").exists()
+        meta = json.loads((tmp_path / "cache" / "credit_record.meta.json").read_text())
+        assert meta["schema"] == CREDIT_SCHEMA
+        assert meta["size"] == credit_csv.stat().st_size
+
+    def test_hit_skips_csv_parse(self, tmp_path, credit_csv):
+        """Test a second load reads the cached copy without parsing the CSV."""
+        cache = RawDataCache(str(tmp_path / "cache"))
+        expected = cache.load(credit_csv, CREDIT_SCHEMA)
+
+        with patch("pandas.read_csv") as mock_read_csv:
+            result = cache.load(credit_csv, CREDIT_SCHEMA)
+
+        mock_read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_changed_source_invalidates(self, tmp_path, credit_csv):
+        """Test a modified source file is parsed again."""
+        cache = RawDataCache(str(tmp_path / "cache"))
+        cache.load(credit_csv, CREDIT_SCHEMA)
+
+        with open(credit_csv, "a") as f:
+            f.write("5008806,0,5\n")
+        result = cache.load(credit_csv, CREDIT_SCHEMA)
+
+        assert len(result) == 4
+
+    def test_touched_source_with_same_hash_is_reused(self, tmp_path, credit_csv):
+        """Test an unchanged file with a new mtime is still a hit."""
+        cache = RawDataCache(str(tmp_path / "cache"))
+        cache.load(credit_csv, CREDIT_SCHEMA)
+        stat = credit_csv.stat()
+        os.utime(credit_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch("pandas.read_csv") as mock_read_csv:
+            cache.load(credit_csv, CREDIT_SCHEMA)
+
+        mock_read_csv.assert_not_called()
+
+    def test_changed_schema_invalidates(self, tmp_path, credit_csv):
+        """Test a different schema is parsed again."""
+        cache = RawDataCache(str(tmp_path / "cache"))
+        cache.load(credit_csv, CREDIT_SCHEMA)
+
+        result = cache.load(credit_csv, {"ID": "int64"})
+
+        assert result["MONTHS_BALANCE"].dtype == np.int64
+        assert result["STATUS"].dtype == object
+
+
+class TestDataLoaderWithCache:
+    """Tests for DataLoader with the typed raw cache."""
+
+    def test_merge_data_fills_categorical_missing(self):
+        """Test categorical columns get 'Unknown' and drop categories of unmerged applicants."""
+        app_data = pd.DataFrame(
+            {
+                "ID": [1, 2, 3],
+                "OCCUPATION_TYPE": pd.Categorical(["Managers", None, "Drivers"]),
+            }
+        )
+        target_data = pd.DataFrame({"ID": [1, 2], "Label": [1, 0]})
+
+        result = DataLoader().merge_data(app_data, target_data)
+
+        assert result["OCCUPATION_TYPE"].tolist() == ["Managers", "Unknown"]
+        assert list(result["OCCUPATION_TYPE"].cat.categories) == ["Managers", "Unknown"]
+
+    def test_load_raw_data_uses_cache(self, tmp_path, credit_csv):
+        """Test load_raw_data reads both files through the cache."""
+        pd.DataFrame({"ID": [5008804, 5008805], "CODE_GENDER": ["M", "F"]}).to_csv(
+            tmp_path / "application_record.csv", index=False
+        )
+        loader = DataLoader(raw_data_dir=str(tmp_path), cache_dir=str(tmp_path / "cache"))
+
+        app_data, credit_data = loader.load_raw_data()
+
+        assert app_data["ID"].dtype == np.int32
+        assert isinstance(credit_data["STATUS"].dtype, pd.CategoricalDtype)
+        assert (tmp_path / "cache" / "application_record.feather").exists()
@@ -3,21 +3,39 @@ Unit tests for training/src/utils modules.
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import pytest
+from scipy import sparse
+from sklearn.metrics import precision_recall_curve, roc_auc_score, roc_curve
 from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
 
 # Add training/src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "training"))
 
-from src.utils.dimensionality import DimensionalityReducer  # noqa: E402
+from src.utils.dimensionality import DimensionalityReducer, fit_sparse_pca  # noqa: E402
 from src.utils.encoders import FeatureEncoder  # noqa: E402
-from src.utils.helpers import ensure_dir, load_config, save_config  # noqa: E402
-from src.utils.metrics import calculate_metrics, find_optimal_threshold, get_classification_report  # noqa: E402
-from src.utils.resampling import Resampler  # noqa: E402
+from src.utils.helpers import ensure_dir, iter_row_chunks, load_config, save_config  # noqa: E402
+from src.utils.metrics import (  # noqa: E402
+    StreamingMetrics,
+    bootstrap_metrics,
+    calculate_metrics,
+    confusion_counts,
+    find_optimal_threshold,
+    get_classification_report,
+    threshold_sweep,
+)
+from src.utils.plotting import (  # noqa: E402
+    evaluation_plot_data,
+    precision_recall_points,
+    render_evaluation_plots,
+    roc_points,
+)
+from src.utils.resampling import Resampler, find_tomek_links, make_neighbors  # noqa: E402
 from src.utils.scalers import FeatureScaler  # noqa: E402
 
 
@@ -94,6 +112,32 @@ class TestFeatureEncoder:
 
         assert list(result.columns) == reference
 
+    def test_sparse_one_hot_matches_dense(self, encoder):
+        """Test the CSR encoding has the same columns and values as get_dummies."""
+        df = pd.DataFrame(
+            {
+                "city": ["b", "a", "c", "a"],
+                "income": [1.5, 2.0, 3.0, 4.0],
+                "housing": pd.Categorical(["own", "rent", "own", "own"], categories=["rent", "own", "other"]),
+            }
+        )
+
+        dense = encoder.one_hot_encode(df)
+        result = encoder.sparse_one_hot_encode(df)
+
+        assert sparse.isspmatrix_csr(result)
+        assert encoder.feature_names == list(dense.columns)
+        np.testing.assert_array_equal(result.toarray(), dense.to_numpy(dtype=np.float64))
+
+    def test_sparse_one_hot_reuses_vocabulary(self, encoder):
+        """Test new data is encoded with the fitted columns; unseen levels become zeros."""
+        encoder.sparse_one_hot_encode(pd.DataFrame({"city": ["a", "b", "c"]}))
+
+        result = encoder.sparse_one_hot_encode(pd.DataFrame({"city": ["c", "z"]}), fit=False)
+
+        assert encoder.feature_names == ["city_b", "city_c"]
+        np.testing.assert_array_equal(result.toarray(), [[0, 1], [0, 0]])
+
 
 class TestFeatureScaler:
     """Tests for FeatureScaler class."""
@@ -160,6 +204,52 @@ class TestFeatureScaler:
         with pytest.raises(ValueError):
             scaler.transform(pd.DataFrame({"feat": [1]}))
 
+    @pytest.mark.parametrize("method", ["standard", "minmax"])
+    def test_chunked_matches_one_shot(self, method, tmp_path):
+        """Test chunked fitting accumulates the same statistics as a one-shot fit."""
+        rng = np.random.default_rng(0)
+        X = rng.normal(loc=5.0, scale=[1.0, 100.0, 0.01], size=(1003, 3))
+        path = tmp_path / "X.npy"
+        np.save(path, X)
+
+        expected = FeatureScaler(method=method).fit_transform(X)
+        chunked = FeatureScaler(method=method, chunk_size=100)
+        result = chunked.fit_transform(np.load(path, mmap_mode="r"))
+
+        np.testing.assert_allclose(result, expected, atol=1e-10)
+        assert type(chunked.scaler) is type(FeatureScaler(method=method).scaler)
+
+    def test_chunked_transform_writes_into_out(self):
+        """Test chunked transform fills a caller-provided array."""
+        X = pd.DataFrame({"a": np.arange(50.0), "b": np.arange(50.0) ** 2})
+        scaler = FeatureScaler(chunk_size=7)
+        scaler.fit_transform(X)
+        out = np.zeros(X.shape)
+
+        result = scaler.transform(X, out=out)
+
+        assert result is out
+        np.testing.assert_allclose(out, StandardScaler().fit_transform(X))
+
+    def test_sparse_input_stays_sparse(self):
+        """Test sparse input is scaled without centering and stays CSR."""
+        X = sparse.random(200, 6, density=0.2, format="csr", random_state=0)
+        scaler = FeatureScaler()
+
+        result = scaler.fit_transform(X)
+
+        assert sparse.isspmatrix_csr(result)
+        assert scaler.scaler.with_mean is False
+        np.testing.assert_allclose(result.toarray(), X.toarray() / X.toarray().std(axis=0))
+        assert sparse.issparse(scaler.transform(X[:5]))
+        with pytest.raises(ValueError):
+            FeatureScaler(method="minmax").fit_transform(X)
+
+    def test_chunked_robust_raises(self):
+        """Test robust scaling cannot be fitted incrementally."""
+        with pytest.raises(ValueError):
+            FeatureScaler(method="robust", chunk_size=100)
+
 
 class TestMetrics:
     """Tests for metrics module."""
@@ -234,6 +324,123 @@ class TestMetrics:
         with pytest.raises(ValueError):
             find_optimal_threshold(y_true, y_pred_proba, metric="invalid")
 
+    def test_threshold_sweep_matches_sklearn(self):
+        """Test the sweep equals sklearn metrics at every distinct threshold, ties included."""
+        from sklearn.metrics import f1_score, precision_score, recall_score
+
+        rng = np.random.default_rng(0)
+        y_true = pd.Series(rng.integers(0, 2, size=500))
+        y_pred_proba = np.round(rng.random(500), 2)
+
+        sweep = threshold_sweep(y_true, y_pred_proba)
+
+        np.testing.assert_array_equal(sweep["thresholds"], np.unique(y_pred_proba))
+        for i, threshold in enumerate(sweep["thresholds"]):
+            y_pred_thresh = (y_pred_proba >= threshold).astype(int)
+            assert sweep["precision"][i] == pytest.approx(precision_score(y_true, y_pred_thresh))
+            assert sweep["recall"][i] == pytest.approx(recall_score(y_true, y_pred_thresh))
+            assert sweep["f1"][i] == pytest.approx(f1_score(y_true, y_pred_thresh))
+
+    def test_find_optimal_threshold_is_exact(self):
+        """Test the optimum is at least as good as any grid threshold and is a score value."""
+        from sklearn.metrics import f1_score
+
+        rng = np.random.default_rng(1)
+        y_true = pd.Series(rng.integers(0, 2, size=300))
+        y_pred_proba = np.clip(y_true.to_numpy() * 0.3 + rng.random(300) * 0.7, 0, 1)
+
+        result = find_optimal_threshold(y_true, y_pred_proba, metric="f1")
+
+        best = f1_score(y_true, (y_pred_proba >= result).astype(int))
+        grid_best = max(f1_score(y_true, (y_pred_proba >= t).astype(int)) for t in np.arange(0.1, 1.0, 0.01))
+        assert result in y_pred_proba
+        assert best >= grid_best
+
+    def test_threshold_sweep_length_mismatch(self, y_true):
+        """Test mismatched inputs raise ValueError."""
+        with pytest.raises(ValueError):
+            threshold_sweep(y_true, np.array([0.5]))
+
+    def test_calculate_metrics_matches_sklearn(self):
+        """Test confusion-matrix metrics and rank AUC equal sklearn's, with ties and zero division."""
+        from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score, roc_auc_score
+
+        rng = np.random.default_rng(2)
+        y_true = pd.Series(rng.integers(0, 2, size=400))
+        y_pred_proba = np.round(rng.random(400) * 0.7 + y_true.to_numpy() * 0.3, 1)
+        for y_pred in ((y_pred_proba >= 0.5).astype(int), np.zeros(400, dtype=int)):
+            result = calculate_metrics(y_true, y_pred, y_pred_proba)
+
+            assert result["accuracy"] == pytest.approx(accuracy_score(y_true, y_pred))
+            assert result["precision"] == pytest.approx(precision_score(y_true, y_pred, zero_division=0))
+            assert result["recall"] == pytest.approx(recall_score(y_true, y_pred, zero_division=0))
+            assert result["f1_score"] == pytest.approx(f1_score(y_true, y_pred, zero_division=0))
+            assert result["roc_auc"] == pytest.approx(roc_auc_score(y_true, y_pred_proba))
+
+    def test_confusion_counts(self, y_true, y_pred):
+        """Test the confusion matrix cells; non-binary labels raise ValueError."""
+        assert confusion_counts(y_true, y_pred) == {"tn": 3, "fp": 1, "fn": 1, "tp": 3}
+        with pytest.raises(ValueError):
+            confusion_counts(y_true, np.full(8, 2))
+
+    def test_bootstrap_metrics(self):
+        """Test intervals bracket the estimate, are reproducible and do not depend on n_jobs."""
+        rng = np.random.default_rng(3)
+        y_true = pd.Series(rng.integers(0, 2, size=2000))
+        y_pred_proba = rng.random(2000) * 0.7 + y_true.to_numpy() * 0.3
+        y_pred = (y_pred_proba >= 0.5).astype(int)
+
+        result = bootstrap_metrics(y_true, y_pred, y_pred_proba, n_resamples=300)
+        threaded = bootstrap_metrics(y_true, y_pred, y_pred_proba, n_resamples=300, n_jobs=3)
+
+        assert set(result) == {"accuracy", "precision", "recall", "f1_score", "roc_auc"}
+        assert result == threaded
+        for interval in result.values():
+            assert interval["lower"] < interval["estimate"] < interval["upper"]
+        assert result["f1_score"]["estimate"] == calculate_metrics(y_true, y_pred)["f1_score"]
+        # Standard error of F1 at n=2000 is about 0.01
+        assert 0.01 < result["f1_score"]["upper"] - result["f1_score"]["lower"] < 0.08
+
+    def test_streaming_metrics_match_full_data(self):
+        """Test batched accumulation equals whole-data metrics when scores sit on bin edges."""
+        rng = np.random.default_rng(4)
+        y_true = rng.integers(0, 2, size=5000)
+        y_pred_proba = rng.integers(0, 100, size=5000) / 100
+        y_pred = (y_pred_proba >= 0.5).astype(int)
+
+        first, second = StreamingMetrics(n_bins=100), StreamingMetrics(n_bins=100)
+        for start in range(0, 3500, 700):
+            first.update(y_true[start : start + 700], y_pred[start : start + 700], y_pred_proba[start : start + 700])
+        second.update(y_true[3500:], y_pred[3500:], y_pred_proba[3500:])
+        streaming = first.merge(second)
+
+        expected = calculate_metrics(y_true, y_pred, y_pred_proba)
+        assert streaming.n_samples == 5000
+        assert streaming.compute() == pytest.approx(expected)
+        sweep, exact = streaming.threshold_sweep(), threshold_sweep(y_true, y_pred_proba)
+        np.testing.assert_allclose(sweep["thresholds"], exact["thresholds"])
+        np.testing.assert_allclose(sweep["f1"], exact["f1"])
+        assert streaming.optimal_threshold("f1") == pytest.approx(find_optimal_threshold(y_true, y_pred_proba))
+
+    def test_streaming_metrics_binned_auc(self):
+        """Test the histogram AUC is close to the exact AUC; label-only batches have no score metrics."""
+        rng = np.random.default_rng(5)
+        y_true = rng.integers(0, 2, size=20000)
+        y_pred_proba = np.clip(rng.random(20000) * 0.7 + y_true * 0.3, 0, 1)
+
+        streaming = StreamingMetrics(n_bins=1000)
+        streaming.update(y_true, (y_pred_proba >= 0.5).astype(int), y_pred_proba)
+
+        assert streaming.roc_auc() == pytest.approx(
+            calculate_metrics(y_true, y_true, y_pred_proba)["roc_auc"], abs=1e-3
+        )
+
+        labels_only = StreamingMetrics()
+        labels_only.update(y_true, y_true)
+        assert "roc_auc" not in labels_only.compute()
+        with pytest.raises(ValueError):
+            labels_only.threshold_sweep()
+
 
 class TestHelpers:
     """Tests for helpers module."""
@@ -280,6 +487,77 @@ class TestHelpers:
 
         assert existing_dir.exists()
 
+    def test_iter_row_chunks(self):
+        """Test row chunks cover the input and merge a short tail."""
+        X = np.arange(23).reshape(-1, 1)
+
+        sizes = [len(chunk) for chunk in iter_row_chunks(X, 10, min_rows=5)]
+        frames = list(iter_row_chunks(pd.DataFrame(X), 10))
+
+        assert sizes == [10, 13]
+        assert [len(chunk) for chunk in frames] == [10, 10, 3]
+        assert frames[-1].index[0] == 20
+        with pytest.raises(ValueError):
+            next(iter_row_chunks(X, 0))
+
+
+class TestPlotting:
+    """Tests for plotting module."""
+
+    @pytest.fixture
+    def scores(self):
+        """Labels and tied probability scores."""
+        rng = np.random.default_rng(0)
+        y = rng.integers(0, 2, 3000)
+        return y, np.round(rng.random(3000) * 0.6 + y * 0.3, 2)
+
+    def test_curve_points_match_sklearn(self, scores):
+        """Test curve points and AUC equal sklearn's, including ties."""
+        y, proba = scores
+
+        roc = roc_points(y, proba)
+        pr = precision_recall_points(y, proba)
+
+        fpr, tpr, _ = roc_curve(y, proba, drop_intermediate=False)
+        precision, recall, _ = precision_recall_curve(y, proba)
+        np.testing.assert_allclose(roc["fpr"], fpr)
+        np.testing.assert_allclose(roc["tpr"], tpr)
+        assert roc["auc"] == pytest.approx(roc_auc_score(y, proba))
+        np.testing.assert_allclose(pr["precision"], precision)
+        np.testing.assert_allclose(pr["recall"], recall)
+
+    def test_downsampling_keeps_ends_and_auc(self, scores):
+        """Test thinned curves keep their end points and the exact AUC."""
+        y, proba = scores
+
+        data = evaluation_plot_data(y, (proba > 0.5).astype(int), proba, max_points=10)
+
+        roc = data["roc_curve"]
+        assert len(roc["fpr"]) <= 10
+        assert (roc["fpr"][0], roc["tpr"][0], roc["fpr"][-1], roc["tpr"][-1]) == (0, 0, 1, 1)
+        assert roc["auc"] == pytest.approx(roc_auc_score(y, proba))
+        assert data["precision_recall_curve"]["recall"][-1] == 0
+        assert data["confusion_matrix"]["cm"].sum() == len(y)
+
+    def test_render_in_process_pool(self, scores, tmp_path):
+        """Test plots render to files in worker processes; no curves without probabilities."""
+        y, proba = scores
+        y_pred = (proba > 0.5).astype(int)
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            futures = render_evaluation_plots(y, y_pred, proba, str(tmp_path), dpi=50, executor=executor)
+            paths = {name: future.result() for name, future in futures.items()}
+        labels_only = render_evaluation_plots(y, y_pred, None, str(tmp_path / "inline"), dpi=50)
+
+        assert set(paths) == {"confusion_matrix", "roc_curve", "precision_recall_curve"}
+        assert all(Path(path).read_bytes().startswith(b"\x89PNG") for path in paths.values())
+        assert list(labels_only) == ["confusion_matrix"]
+
+    def test_single_class_roc_raises(self):
+        """Test the ROC curve is rejected when only one class is present."""
+        with pytest.raises(ValueError):
+            roc_points(np.ones(5), np.linspace(0, 1, 5))
+
 
 class TestDimensionalityReducer:
     """Tests for DimensionalityReducer class."""
@@ -336,6 +614,46 @@ class TestDimensionalityReducer:
         result2 = new_reducer.transform(X_test)
         np.testing.assert_array_almost_equal(result1.values, result2.values)
 
+    def test_chunked_matches_pca(self):
+        """Test incremental PCA recovers the PCA projection of low-rank data."""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(1000, 3)) * [5, 3, 1] @ rng.normal(size=(3, 10)) + rng.normal(scale=1e-3, size=(1000, 10))
+
+        expected = DimensionalityReducer(n_components=3).fit_transform(X)
+        reducer = DimensionalityReducer(n_components=3, chunk_size=101)
+        result = reducer.fit_transform(X)
+
+        assert list(result.columns) == ["PC1", "PC2", "PC3"]
+        np.testing.assert_allclose(np.abs(result.values), np.abs(expected.values), atol=1e-3)
+        np.testing.assert_allclose(reducer.transform(X[:10]).values, result.values[:10])
+
+    def test_sparse_matches_dense_pca(self, reducer):
+        """Test the sparse fit equals exact PCA on the densified matrix."""
+        from sklearn.decomposition import PCA
+
+        X = sparse.random(500, 12, density=0.3, format="csr", random_state=0)
+        expected = PCA(n_components=3, svd_solver="full").fit(X.toarray())
+
+        result = reducer.fit_transform(X)
+
+        assert isinstance(reducer.pca, PCA)
+        np.testing.assert_allclose(reducer.pca.explained_variance_ratio_, expected.explained_variance_ratio_)
+        np.testing.assert_allclose(np.abs(result.values), np.abs(expected.transform(X.toarray())), atol=1e-10)
+        np.testing.assert_allclose(reducer.pca.transform(X.toarray()), result.values, atol=1e-10)
+
+    def test_sparse_pca_is_deterministic(self):
+        """Test the ARPACK start vector is seeded."""
+        X = sparse.random(300, 10, density=0.3, format="csr", random_state=1)
+
+        first, second = fit_sparse_pca(X, 2, random_state=5), fit_sparse_pca(X, 2, random_state=5)
+
+        np.testing.assert_array_equal(first.components_, second.components_)
+
+    def test_partial_fit_requires_chunked_mode(self, reducer):
+        """Test partial_fit is only available with an incremental PCA."""
+        with pytest.raises(ValueError):
+            reducer.partial_fit(np.random.randn(10, 10))
+
 
 class TestResampler:
     """Tests for Resampler class."""
@@ -393,3 +711,61 @@ class TestResampler:
         # Classes should be balanced
         class_counts = pd.Series(y_resampled).value_counts()
         assert class_counts[0] == class_counts[1]
+
+    @pytest.mark.parametrize("algorithm", ["auto", "kd_tree", "ball_tree"])
+    def test_scalable_matches_exact(self, resampler, imbalanced_data, algorithm):
+        """Test scalable mode with an exact neighbour search reproduces SMOTETomek."""
+        X, y = imbalanced_data
+        scalable = Resampler(random_state=42, mode="scalable", neighbors_algorithm=algorithm, tomek_chunk_size=17)
+
+        X_expected, y_expected = resampler.apply_smote_tomek(X, y)
+        X_resampled, y_resampled = scalable.apply_smote_tomek(X, y)
+
+        np.testing.assert_allclose(X_resampled.to_numpy(), X_expected.to_numpy())
+        np.testing.assert_array_equal(np.asarray(y_resampled), np.asarray(y_expected))
+        assert list(X_resampled.columns) == list(X.columns)
+
+    def test_scalable_approximate_is_deterministic(self, imbalanced_data):
+        """Test approximate neighbour search gives the same output for the same seed."""
+        X, y = imbalanced_data
+        X = pd.concat([X] + [X.rename(columns=lambda c: f"{c}_{i}") for i in range(10)], axis=1)
+
+        def resample():
+            resampler = Resampler(random_state=7, mode="scalable", neighbors_algorithm="approximate", n_components=4)
+            return resampler.apply_smote_tomek(X, y)
+
+        (X_first, y_first), (X_second, y_second) = resample(), resample()
+
+        pd.testing.assert_frame_equal(X_first, X_second)
+        pd.testing.assert_series_equal(y_first, y_second)
+        assert pd.Series(y_first).value_counts().min() / len(y_first) > 0.4
+
+    def test_sparse_input(self, imbalanced_data):
+        """Test sparse input resamples to the same rows as dense input."""
+        X, y = imbalanced_data
+
+        for mode, algorithm in (("exact", "auto"), ("scalable", "approximate")):
+            X_dense, y_dense = Resampler(mode=mode, neighbors_algorithm=algorithm).apply_smote_tomek(X, y)
+            X_sparse, y_sparse = Resampler(mode=mode, neighbors_algorithm=algorithm).apply_smote_tomek(
+                sparse.csr_matrix(X.to_numpy()), y
+            )
+
+            assert sparse.issparse(X_sparse)
+            np.testing.assert_allclose(X_sparse.toarray(), X_dense.to_numpy())
+            np.testing.assert_array_equal(np.asarray(y_sparse), np.asarray(y_dense))
+
+    def test_find_tomek_links(self):
+        """Test only mutual nearest neighbours with different labels are flagged, duplicates included."""
+        X = np.array([[0.0], [0.1], [1.0], [1.05], [3.0], [3.0], [5.0]])
+        y = np.array([0, 1, 0, 0, 1, 1, 0])
+
+        links = find_tomek_links(X, y, make_neighbors(2), chunk_size=3)
+
+        np.testing.assert_array_equal(links, [True, True, False, False, False, False, False])
+
+    def test_invalid_settings_raise(self):
+        """Test unknown modes and neighbour algorithms raise ValueError."""
+        with pytest.raises(ValueError):
+            Resampler(mode="fast")
+        with pytest.raises(ValueError):
+            Resampler(mode="scalable", neighbors_algorithm="hnsw")
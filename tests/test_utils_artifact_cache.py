@@ -0,0 +1,141 @@
+"""
+Unit tests for app/utils/artifact_cache.py module.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.utils.artifact_cache import MANIFEST_NAME, ArtifactCache, get_artifact_cache
+
+
+def make_downloader(files, calls):
+    """Build a download_fn that writes the given files and records each call."""
+
+    def download(dst):
+        calls.append(dst)
+        root = Path(dst) / "model"
+        root.mkdir()
+        for name, content in files.items():
+            (root / name).write_bytes(content)
+        return str(root)
+
+    return download
+
+
+class TestArtifactCache:
+    """Tests for ArtifactCache class."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create ArtifactCache in a temporary directory."""
+        return ArtifactCache(str(tmp_path / "cache"))
+
+    def test_make_key(self):
+        """Test make_key combines version, run_id and artifact path."""
+        assert ArtifactCache.make_key("abc", "model", version="3") == "v3-abc-model"
+        assert ArtifactCache.make_key("abc", "preprocessors") == "abc-preprocessors"
+
+    def test_fetch_downloads_once(self, cache):
+        """Test a second fetch is served from disk without downloading."""
+        calls = []
+        download = make_downloader({"MLmodel": b"flavors: {}"}, calls)
+
+        first = cache.fetch("v1-run-model", download)
+        second = cache.fetch("v1-run-model", download)
+
+        assert len(calls) == 1
+        assert first == second
+        assert (first / "MLmodel").read_bytes() == b"flavors: {}"
+
+    def test_fetch_writes_manifest(self, cache):
+        """Test fetch records file sizes and checksums."""
+        cache.fetch("v1-run-model", make_downloader({"model.pkl": b"1234"}, []))
+
+        with open(cache.root / "v1-run-model" / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+
+        assert manifest["root"] == "model"
+        assert manifest["files"]["model/model.pkl"]["size"] == 4
+        assert manifest["total_bytes"] == 4
+
+    def test_corrupted_entry_is_redownloaded(self, cache):
+        """Test checksum mismatch invalidates the cache entry."""
+        calls = []
+        download = make_downloader({"model.pkl": b"1234"}, calls)
+        path = cache.fetch("v1-run-model", download)
+
+        (path / "model.pkl").write_bytes(b"abcd")
+        path = cache.fetch("v1-run-model", download)
+
+        assert len(calls) == 2
+        assert (path / "model.pkl").read_bytes() == b"1234"
+
+    def test_failed_download_leaves_no_entry(self, cache):
+        """Test a failing download does not publish a partial entry."""
+
+        def failing_download(dst):
+            (Path(dst) / "partial.bin").write_bytes(b"x")
+            raise IOError("network error")
+
+        with pytest.raises(IOError):
+            cache.fetch("v1-run-model", failing_download)
+
+        assert not (cache.root / "v1-run-model").exists()
+        assert not [p for p in cache.root.iterdir() if p.is_dir()]
+
+    def test_eviction_respects_max_bytes(self, tmp_path):
+        """Test least recently used entries are evicted beyond max_bytes."""
+        cache = ArtifactCache(str(tmp_path / "cache"), max_bytes=10)
+
+        cache.fetch("v1-run-model", make_downloader({"model.pkl": b"x" * 8}, []))
+        cache.fetch("v2-run-model", make_downloader({"model.pkl": b"y" * 8}, []))
+
+        assert not (cache.root / "v1-run-model").exists()
+        assert (cache.root / "v2-run-model").exists()
+
+    def test_leased_entry_is_not_evicted(self, tmp_path):
+        """Test eviction skips an entry another holder is loading and removes it once released."""
+        cache = ArtifactCache(str(tmp_path / "cache"), max_bytes=10)
+        # A second instance opens its own lock files, like another process sharing the volume
+        other = ArtifactCache(str(tmp_path / "cache"), max_bytes=10)
+
+        with cache.lease("v1-run-model", make_downloader({"model.pkl": b"x" * 8}, [])) as path:
+            other.fetch("v2-run-model", make_downloader({"model.pkl": b"y" * 8}, []))
+
+            assert (path / "model.pkl").read_bytes() == b"x" * 8
+
+        other.fetch("v3-run-model", make_downloader({"model.pkl": b"z" * 8}, []))
+
+        assert not (cache.root / "v1-run-model").exists()
+        assert (cache.root / "v3-run-model").exists()
+
+    def test_lease_redownloads_evicted_entry(self, tmp_path):
+        """Test leasing an entry evicted by another holder downloads it again."""
+        cache = ArtifactCache(str(tmp_path / "cache"), max_bytes=10)
+        calls = []
+
+        cache.fetch("v1-run-model", make_downloader({"model.pkl": b"x" * 8}, calls))
+        cache.fetch("v2-run-model", make_downloader({"model.pkl": b"y" * 8}, []))
+        with cache.lease("v1-run-model", make_downloader({"model.pkl": b"x" * 8}, calls)) as path:
+            assert (path / "model.pkl").read_bytes() == b"x" * 8
+
+        assert len(calls) == 2
+        assert not (cache.root / "v2-run-model").exists()
+
+
+class TestGetArtifactCache:
+    """Tests for get_artifact_cache function."""
+
+    def test_disabled_without_directory(self):
+        """Test empty cache directory disables caching."""
+        assert get_artifact_cache("") is None
+
+    def test_creates_cache(self, tmp_path):
+        """Test cache is created for a configured directory."""
+        cache = get_artifact_cache(str(tmp_path / "cache"), max_bytes=100)
+
+        assert isinstance(cache, ArtifactCache)
+        assert cache.max_bytes == 100
+        assert cache.root.exists()
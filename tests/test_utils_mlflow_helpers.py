@@ -11,6 +11,7 @@ from app.utils.mlflow_helpers import (
     get_latest_model_version,
     load_model_with_flavor,
     setup_mlflow_tracking,
+    wrap_native_model,
 )
 
 
@@ -49,7 +50,7 @@ class TestGetLatestModelVersion:
         mock_version.run_id = "test-run-id-123"
         mock_version.current_stage = "Production"
 
-        mock_client.search_model_versions.return_value = [mock_version]
+        mock_client.get_latest_versions.return_value = [mock_version]
 
         version, run_id = get_latest_model_version(
             client=mock_client,
@@ -60,53 +61,11 @@ class TestGetLatestModelVersion:
         assert version == "5"
         assert run_id == "test-run-id-123"
 
-    def test_filters_by_stage(self):
-        """Test filters versions by stage."""
+    def test_filters_by_stage_on_server(self):
+        """Test the stage is passed to the registry instead of listing every version."""
         mock_client = MagicMock()
-
-        # Multiple versions with different stages
-        prod_version = MagicMock()
-        prod_version.version = "3"
-        prod_version.run_id = "prod-run"
-        prod_version.current_stage = "Production"
-
-        staging_version = MagicMock()
-        staging_version.version = "4"
-        staging_version.run_id = "staging-run"
-        staging_version.current_stage = "Staging"
-
-        mock_client.search_model_versions.return_value = [prod_version, staging_version]
-
-        version, run_id = get_latest_model_version(
-            client=mock_client,
-            model_name="test_model",
-            stage="Production",
-        )
-
-        assert version == "3"
-        assert run_id == "prod-run"
-
-    def test_returns_latest_version(self):
-        """Test returns the latest (highest) version number."""
-        mock_client = MagicMock()
-
-        # Multiple Production versions
-        version1 = MagicMock()
-        version1.version = "1"
-        version1.run_id = "run-1"
-        version1.current_stage = "Production"
-
-        version3 = MagicMock()
-        version3.version = "3"
-        version3.run_id = "run-3"
-        version3.current_stage = "Production"
-
-        version2 = MagicMock()
-        version2.version = "2"
-        version2.run_id = "run-2"
-        version2.current_stage = "Production"
-
-        mock_client.search_model_versions.return_value = [version1, version3, version2]
+        prod_version = MagicMock(version="3", run_id="prod-run", current_stage="Production")
+        mock_client.get_latest_versions.return_value = [prod_version]
 
         version, run_id = get_latest_model_version(
             client=mock_client,
@@ -114,13 +73,14 @@ class TestGetLatestModelVersion:
             stage="Production",
         )
 
-        assert version == "3"
-        assert run_id == "run-3"
+        assert (version, run_id) == ("3", "prod-run")
+        mock_client.get_latest_versions.assert_called_once_with("test_model", stages=["Production"])
+        mock_client.search_model_versions.assert_not_called()
 
     def test_raises_when_no_versions_found(self):
         """Test raises ValueError when no versions found for stage."""
         mock_client = MagicMock()
-        mock_client.search_model_versions.return_value = []
+        mock_client.get_latest_versions.return_value = []
 
         with pytest.raises(ValueError) as exc_info:
             get_latest_model_version(
@@ -131,23 +91,6 @@ class TestGetLatestModelVersion:
 
         assert "No model version found" in str(exc_info.value)
 
-    def test_raises_when_no_matching_stage(self):
-        """Test raises ValueError when no versions match stage."""
-        mock_client = MagicMock()
-
-        staging_version = MagicMock()
-        staging_version.version = "1"
-        staging_version.current_stage = "Staging"
-
-        mock_client.search_model_versions.return_value = [staging_version]
-
-        with pytest.raises(ValueError):
-            get_latest_model_version(
-                client=mock_client,
-                model_name="test_model",
-                stage="Production",  # No Production versions
-            )
-
 
 class TestLoadModelWithFlavor:
     """Tests for load_model_with_flavor function."""
@@ -251,3 +194,22 @@ class TestCheckMlflowConnection:
         with patch("app.utils.mlflow_helpers.logger") as mock_logger:
             check_mlflow_connection("http://mlflow:5000")
             mock_logger.warning.assert_called()
+
+
+class TestWrapNativeModel:
+    """Tests for wrap_native_model function."""
+
+    @patch("app.utils.mlflow_helpers.Model")
+    def test_pyfunc_delegates_to_native_model(self, mock_model_cls):
+        """Test the pyfunc wrapper calls the already-loaded native model."""
+        mock_model_cls.load.return_value.get_input_schema.return_value = None
+        mock_model_cls.load.return_value.get_params_schema.return_value = None
+        native = MagicMock()
+        native.predict.return_value = [1]
+
+        pyfunc_model = wrap_native_model("/models/model", native)
+        result = pyfunc_model.predict([[0.5, 0.1]])
+
+        mock_model_cls.load.assert_called_once_with("/models/model")
+        native.predict.assert_called_once()
+        assert result == [1]
@@ -0,0 +1,122 @@
+"""
+Unit tests for app/utils/registry_resolver.py module.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND, RESOURCE_DOES_NOT_EXIST
+
+from app.utils.registry_resolver import RegistryResolver, get_registry_resolver, resolve_latest_version
+
+
+def make_version(version, stage="Production", updated=1):
+    """ModelVersion-like mock."""
+    return MagicMock(
+        version=str(version),
+        run_id=f"run-{version}",
+        current_stage=stage,
+        source=f"gs://bucket/{version}",
+        last_updated_timestamp=updated,
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResolveLatestVersion:
+    """Tests for resolve_latest_version function."""
+
+    def test_missing_model_raises_value_error(self):
+        """Test an unknown model raises ValueError, not the MLflow error."""
+        client = MagicMock()
+        client.get_latest_versions.side_effect = MlflowException("missing", error_code=RESOURCE_DOES_NOT_EXIST)
+
+        with pytest.raises(ValueError):
+            resolve_latest_version(client, "test_model", "Production")
+
+    def test_falls_back_to_paged_search(self):
+        """Test servers without the stage endpoint are searched newest first, stopping at the first match."""
+        client = MagicMock()
+        client.get_latest_versions.side_effect = MlflowException("no endpoint", error_code=ENDPOINT_NOT_FOUND)
+        first_page = MagicMock()
+        first_page.__iter__.return_value = iter([make_version(9, "Staging"), make_version(8, "None")])
+        first_page.token = "page-2"
+        second_page = MagicMock()
+        second_page.__iter__.return_value = iter([make_version(7), make_version(6)])
+        second_page.token = "page-3"
+        client.search_model_versions.side_effect = [first_page, second_page]
+
+        latest = resolve_latest_version(client, "test_model", "Production")
+
+        assert latest.version == "7"
+        assert client.search_model_versions.call_count == 2
+        assert client.search_model_versions.call_args.kwargs["order_by"] == ["version_number DESC"]
+        assert client.search_model_versions.call_args.kwargs["page_token"] == "page-2"
+
+
+class TestRegistryResolver:
+    """Tests for RegistryResolver class."""
+
+    @pytest.fixture
+    def client(self):
+        """Client whose Production stage holds version 3."""
+        client = MagicMock()
+        client.get_latest_versions.return_value = [make_version(3)]
+        return client
+
+    def test_cached_within_ttl(self, client):
+        """Test lookups within the TTL are served from cache and expire after it."""
+        clock = FakeClock()
+        resolver = RegistryResolver(client, ttl_seconds=30, clock=clock)
+
+        first = resolver.resolve("test_model", "Production")
+        clock.now = 29
+        resolver.resolve("test_model", "Production")
+        clock.now = 31
+        resolver.resolve("test_model", "Production")
+
+        assert first["version"] == "3"
+        assert first["run_id"] == "run-3"
+        assert first["source"] == "gs://bucket/3"
+        assert client.get_latest_versions.call_count == 2
+
+    def test_refresh_and_invalidate_bypass_cache(self, client):
+        """Test refresh=True and invalidate() force a registry lookup."""
+        resolver = RegistryResolver(client, ttl_seconds=30)
+
+        resolver.resolve("test_model", "Production")
+        resolver.resolve("test_model", "Production", refresh=True)
+        resolver.invalidate("test_model")
+        resolver.resolve("test_model", "Production")
+
+        assert client.get_latest_versions.call_count == 3
+
+    def test_etag_change_detection(self, client):
+        """Test resolve_if_changed returns None until the version or its update time changes."""
+        resolver = RegistryResolver(client, ttl_seconds=0)
+
+        etag = resolver.resolve("test_model", "Production")["etag"]
+        unchanged = resolver.resolve_if_changed("test_model", "Production", etag)
+        client.get_latest_versions.return_value = [make_version(3, updated=2)]
+        restaged = resolver.resolve_if_changed("test_model", "Production", etag)
+        client.get_latest_versions.return_value = [make_version(4)]
+        promoted = resolver.resolve_if_changed("test_model", "Production", etag)
+
+        assert unchanged is None
+        assert restaged["version"] == "3"
+        assert restaged["etag"] != etag
+        assert promoted["version"] == "4"
+
+    def test_shared_per_tracking_uri(self):
+        """Test one resolver (and client) is shared per tracking URI."""
+        assert get_registry_resolver("http://mlflow-a:5000") is get_registry_resolver("http://mlflow-a:5000")
+        assert get_registry_resolver("http://mlflow-a:5000") is not get_registry_resolver("http://mlflow-b:5000")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+SMOTE-Tomek Benchmark
+Times the scalable resampling modes against imblearn's SMOTETomek on a
+synthetic one-hot training matrix and compares the resulting class balance
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent  # noqa: E402
+sys.path.insert(0, str(project_root))  # noqa: E402
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from loguru import logger  # noqa: E402
+from src.utils.resampling import Resampler  # noqa: E402
+
+# One-hot groups of application_record.csv: levels per categorical column
+CATEGORY_LEVELS = {
+    "CODE_GENDER": 2,
+    "FLAG_OWN_CAR": 2,
+    "FLAG_OWN_REALTY": 2,
+    "NAME_INCOME_TYPE": 5,
+    "NAME_EDUCATION_TYPE": 5,
+    "NAME_FAMILY_STATUS": 5,
+    "NAME_HOUSING_TYPE": 6,
+    "OCCUPATION_TYPE": 19,
+}
+
+
+def make_training_matrix(n_rows: int, bad_rate: float, seed: int):
+    """
+    Build an imbalanced matrix shaped like the encoded (unscaled) application data
+
+    Args:
+        n_rows: Number of samples
+        bad_rate: Share of the minority class
+        seed: Random seed
+
+    Returns:
+        Tuple of (features DataFrame, labels Series) with the minority labelled 0
+    """
+    rng = np.random.default_rng(seed)
+    pensioner = rng.random(n_rows) < 0.17
+    columns = {
+        "CNT_CHILDREN": rng.choice([0, 1, 2, 3], size=n_rows, p=[0.69, 0.2, 0.09, 0.02]),
+        "AMT_INCOME_TOTAL": np.round(rng.lognormal(12.0, 0.5, size=n_rows) / 2250) * 2250,
+        "DAYS_BIRTH": -rng.integers(7500, 25000, size=n_rows),
+        "DAYS_EMPLOYED": np.where(pensioner, 365243, -rng.integers(0, 15000, size=n_rows)),
+        "FLAG_WORK_PHONE": (rng.random(n_rows) < 0.2).astype(int),
+        "FLAG_PHONE": (rng.random(n_rows) < 0.3).astype(int),
+        "FLAG_EMAIL": (rng.random(n_rows) < 0.1).astype(int),
+    }
+    columns["CNT_FAM_MEMBERS"] = columns["CNT_CHILDREN"] + rng.choice([1, 2], size=n_rows, p=[0.3, 0.7])
+    for name, levels in CATEGORY_LEVELS.items():
+        weights = rng.dirichlet(np.ones(levels))
+        codes = rng.choice(levels, size=n_rows, p=weights)
+        for level in range(1, levels):  # drop_first, as FeatureEncoder does
+            columns[f"{name}_{level}"] = (codes == level).astype(int)
+
+    X = pd.DataFrame(columns).astype(np.float64)
+    risk = -X["AMT_INCOME_TOTAL"].rank(pct=True) + X["CNT_CHILDREN"] * 0.1 + rng.normal(scale=0.3, size=n_rows)
+    y = (risk > np.quantile(risk, 1 - bad_rate)).astype(int)
+    return X, pd.Series(1 - y.to_numpy(), name="Label")
+
+
+def run(resampler: Resampler, X: pd.DataFrame, y: pd.Series):
+    """Return (seconds, resampled X, resampled y)"""
+    start = time.perf_counter()
+    X_res, y_res = resampler.apply_smote_tomek(X, y)
+    return time.perf_counter() - start, X_res, np.asarray(y_res)
+
+
+def main():
+    """Run SMOTE-Tomek benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark SMOTE-Tomek resampling modes")
+    parser.add_argument("--rows", type=int, default=100_000, help="Training rows (default: 100k)")
+    parser.add_argument("--bad-rate", type=float, default=0.01, help="Minority share (default: 0.01)")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Neighbour-search jobs (default: all cores)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--skip-exact", action="store_true", help="Skip the imblearn baseline on large inputs")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["name"] == "__main__")
+
+    logger.info("=" * 80)
+    logger.info("SMOTE-TOMEK BENCHMARK")
+    logger.info("=" * 80)
+
+    X, y = make_training_matrix(args.rows, args.bad_rate, args.seed)
+    logger.info(f"{len(X):,} rows x {X.shape[1]} columns, minority share {(y == 0).mean() * 100:.2f}%")
+
+    modes = [
+        ("scalable kd_tree", Resampler(args.seed, "scalable", args.n_jobs, "kd_tree")),
+        ("scalable ball_tree", Resampler(args.seed, "scalable", args.n_jobs, "ball_tree")),
+        ("scalable approximate", Resampler(args.seed, "scalable", args.n_jobs, "approximate")),
+    ]
+    if not args.skip_exact:
+        modes.insert(0, ("imblearn SMOTETomek", Resampler(args.seed)))
+
+    baseline = None
+    rows = []
+    for name, resampler in modes:
+        seconds, X_res, y_res = run(resampler, X, y)
+        counts = np.bincount(y_res, minlength=2)
+        row = {
+            "Mode": name,
+            "Seconds": round(seconds, 2),
+            "Rows": len(y_res),
+            "Bad (0)": counts[0],
+            "Good (1)": counts[1],
+            "Balance": round(counts[1] / max(counts[0], 1), 3),
+        }
+        if baseline is None:
+            baseline = (seconds, X_res, y_res)
+            row["Speedup"] = 1.0
+            row["Identical"] = "-"
+        else:
+            row["Speedup"] = round(baseline[0] / seconds, 1)
+            row["Identical"] = (
+                "n/a"
+                if args.skip_exact
+                else str(
+                    len(y_res) == len(baseline[2])
+                    and np.array_equal(y_res, baseline[2])
+                    and np.allclose(np.asarray(X_res, dtype=np.float64), np.asarray(baseline[1], dtype=np.float64))
+                )
+            )
+        rows.append(row)
+        logger.info(f"✓ {name}: {seconds:.2f}s, {len(y_res):,} rows")
+
+    # Determinism: the same seed must give the same output
+    _, X_again, y_again = run(modes[-1][1], X, y)
+    _, X_first, y_first = run(Resampler(args.seed, "scalable", args.n_jobs, "approximate"), X, y)
+    deterministic = np.array_equal(y_again, y_first) and np.array_equal(np.asarray(X_again), np.asarray(X_first))
+
+    print("\n" + pd.DataFrame(rows).to_string(index=False))
+    logger.info(f"Approximate mode deterministic across runs: {deterministic}")
+    logger.info("=" * 80)
+    if not deterministic:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Sparse Encoding Benchmark
+Compares wall time and peak memory of the dense and sparse (CSR) one-hot
+feature engineering paths on a synthetic application dataset
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent  # noqa: E402
+sys.path.insert(0, str(project_root))  # noqa: E402
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from loguru import logger  # noqa: E402
+from src.features.feature_engineering import FeatureEngineer  # noqa: E402
+from src.utils.resampling import Resampler  # noqa: E402
+
+# Categorical columns of application_record.csv and their number of levels
+CATEGORY_LEVELS = {
+    "CODE_GENDER": 2,
+    "FLAG_OWN_CAR": 2,
+    "FLAG_OWN_REALTY": 2,
+    "NAME_INCOME_TYPE": 5,
+    "NAME_EDUCATION_TYPE": 5,
+    "NAME_FAMILY_STATUS": 5,
+    "NAME_HOUSING_TYPE": 6,
+    "OCCUPATION_TYPE": 19,
+}
+
+
+def make_application_frame(n_rows: int, bad_rate: float, seed: int, extra_levels: int = 0):
+    """
+    Build a raw application frame with category dtypes, as DataLoader returns it
+
+    Args:
+        n_rows: Number of samples
+        bad_rate: Share of the minority class
+        seed: Random seed
+        extra_levels: Levels of an additional high-cardinality column (0 to skip)
+
+    Returns:
+        Tuple of (features DataFrame, labels Series) with the minority labelled 0
+    """
+    rng = np.random.default_rng(seed)
+    levels = dict(CATEGORY_LEVELS)
+    if extra_levels:
+        levels["EMPLOYER_ID"] = extra_levels
+
+    X = pd.DataFrame(
+        {
+            "CNT_CHILDREN": rng.choice([0, 1, 2, 3], size=n_rows, p=[0.69, 0.2, 0.09, 0.02]),
+            "AMT_INCOME_TOTAL": np.round(rng.lognormal(12.0, 0.5, size=n_rows) / 2250) * 2250,
+            "DAYS_BIRTH": -rng.integers(7500, 25000, size=n_rows),
+            "DAYS_EMPLOYED": -rng.integers(0, 15000, size=n_rows),
+            "FLAG_WORK_PHONE": (rng.random(n_rows) < 0.2).astype(int),
+            "FLAG_PHONE": (rng.random(n_rows) < 0.3).astype(int),
+            "FLAG_EMAIL": (rng.random(n_rows) < 0.1).astype(int),
+        }
+    )
+    for name, n_levels in levels.items():
+        weights = rng.dirichlet(np.ones(n_levels))
+        names = [f"{name.lower()}_{level:03d}" for level in range(n_levels)]
+        X[name] = pd.Categorical.from_codes(rng.choice(n_levels, size=n_rows, p=weights), categories=names)
+
+    risk = -X["AMT_INCOME_TOTAL"].rank(pct=True) + X["CNT_CHILDREN"] * 0.1 + rng.normal(scale=0.3, size=n_rows)
+    y = (risk > np.quantile(risk, 1 - bad_rate)).astype(int)
+    return X, pd.Series(1 - y.to_numpy(), name="Label")
+
+
+def run_pipeline(sparse: bool, X: pd.DataFrame, y: pd.Series, args) -> dict:
+    """Run the feature engineering pipeline once"""
+    engineer = FeatureEngineer(
+        random_state=args.seed,
+        resampler=Resampler(args.seed, mode="scalable", neighbors_algorithm="approximate"),
+        sparse=sparse,
+    )
+    return engineer.full_pipeline(
+        X, y, apply_smote=args.smote, n_components=args.pca_components, save_preprocessors=False
+    )
+
+
+def measure(sparse: bool, X: pd.DataFrame, y: pd.Series, args):
+    """Return (seconds, peak traced MiB, encoded MiB, pipeline result)"""
+    start = time.perf_counter()
+    result = run_pipeline(sparse, X, y, args)
+    seconds = time.perf_counter() - start
+
+    # Separate pass: tracing allocations slows the run down
+    tracemalloc.start()
+    run_pipeline(sparse, X, y, args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    encoder = FeatureEngineer(sparse=sparse).encoder
+    if sparse:
+        encoded = encoder.sparse_one_hot_encode(X)
+        encoded_bytes = encoded.data.nbytes + encoded.indices.nbytes + encoded.indptr.nbytes
+    else:
+        encoded_bytes = encoder.one_hot_encode(X).astype(np.float64).memory_usage(index=False).sum()
+    return seconds, peak / 2**20, encoded_bytes / 2**20, result
+
+
+def main():
+    """Run sparse encoding benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark dense vs sparse one-hot feature engineering")
+    parser.add_argument("--rows", type=int, default=500_000, help="Samples (default: 500k)")
+    parser.add_argument("--bad-rate", type=float, default=0.01, help="Minority share (default: 0.01)")
+    parser.add_argument(
+        "--extra-levels",
+        type=int,
+        default=0,
+        help="Add a categorical column with this many levels (default: 0)",
+    )
+    parser.add_argument("--pca-components", type=int, default=5, help="PCA components (default: 5)")
+    parser.add_argument("--smote", action="store_true", help="Include scalable SMOTE+Tomek resampling")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["name"] == "__main__")
+
+    logger.info("=" * 80)
+    logger.info("SPARSE ENCODING BENCHMARK")
+    logger.info("=" * 80)
+
+    X, y = make_application_frame(args.rows, args.bad_rate, args.seed, args.extra_levels)
+    logger.info(f"{len(X):,} rows x {X.shape[1]} raw columns, minority share {(y == 0).mean() * 100:.2f}%")
+
+    rows = []
+    for name, sparse in (("dense", False), ("sparse", True)):
+        seconds, peak, encoded, result = measure(sparse, X, y, args)
+        rows.append(
+            {
+                "Path": name,
+                "Seconds": round(seconds, 2),
+                "Peak MiB": round(peak, 1),
+                "Encoded MiB": round(encoded, 1),
+                "Features": len(result["feature_names"]),
+                "Variance explained": (
+                    round(float(result["pca"].pca.explained_variance_ratio_.sum()), 4) if result["pca"] else None
+                ),
+            }
+        )
+        logger.info(f"✓ {name}: {seconds:.2f}s, peak {peak:.1f} MiB")
+
+    # Dense PCA may pick the randomized solver; the sparse fit is an exact ARPACK SVD
+    print("\n" + pd.DataFrame(rows).to_string(index=False))
+    logger.info("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Target Label Benchmark
+Times DataLoader.create_target_variable on a synthetic credit history and
+checks it against the row-wise groupby/idxmax construction it replaced
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent  # noqa: E402
+sys.path.insert(0, str(project_root))  # noqa: E402
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from loguru import logger  # noqa: E402
+from src.data.data_loader import DataLoader  # noqa: E402
+
+STATUS_VALUES = ["0", "1", "2", "3", "4", "5", "C", "X"]
+# Roughly the STATUS frequencies of the Kaggle credit_record.csv
+STATUS_WEIGHTS = [0.365, 0.011, 0.001, 0.0003, 0.0002, 0.0015, 0.42, 0.201]
+
+
+def make_credit_history(n_rows: int, n_ids: int, seed: int, categorical: bool) -> pd.DataFrame:
+    """
+    Build a synthetic credit_record-like DataFrame
+
+    Args:
+        n_rows: Number of monthly records
+        n_ids: Number of distinct applicants
+        seed: Random seed
+        categorical: Store STATUS as categorical (True) or as CSV-style strings (False)
+
+    Returns:
+        DataFrame with ID, MONTHS_BALANCE and STATUS columns
+    """
+    rng = np.random.default_rng(seed)
+    weights = np.array(STATUS_WEIGHTS) / sum(STATUS_WEIGHTS)
+    codes = rng.choice(len(STATUS_VALUES), size=n_rows, p=weights).astype(np.int8)
+    status = pd.Categorical.from_codes(codes, categories=STATUS_VALUES)
+
+    return pd.DataFrame(
+        {
+            "ID": rng.integers(5000000, 5000000 + n_ids, size=n_rows),
+            "MONTHS_BALANCE": rng.integers(-60, 1, size=n_rows, dtype=np.int8),
+            "STATUS": status if categorical else np.asarray(status, dtype=object),
+        }
+    )
+
+
+def legacy_target_variable(credit_data: pd.DataFrame) -> pd.DataFrame:
+    """Row-wise apply + groupby/idxmax construction used before vectorization"""
+    credit_data = credit_data.copy()
+    credit_data["Good or Bad"] = credit_data["STATUS"].apply(lambda x: "Good" if x in ["0", "X", "C"] else "Bad")
+    credit_goods_bads = credit_data.groupby(["ID", "Good or Bad"]).size().to_frame("size")
+    credit_goods_bads.reset_index(inplace=True)
+    idx = credit_goods_bads.groupby("ID")["size"].idxmax()
+    max_goods_bads = credit_goods_bads.loc[idx]
+    max_goods_bads["Label"] = max_goods_bads["Good or Bad"].apply(lambda x: 1 if x == "Good" else 0)
+    return max_goods_bads[["ID", "Label"]].reset_index(drop=True)
+
+
+def timed(fn, *args):
+    """Return (seconds, result)"""
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    """Run target label benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark target label construction")
+    parser.add_argument("--rows", type=int, default=100_000_000, help="Credit records (default: 100M)")
+    parser.add_argument(
+        "--rows-per-id",
+        type=int,
+        default=25,
+        help="Average monthly records per applicant (default: 25)",
+    )
+    parser.add_argument(
+        "--legacy-rows",
+        type=int,
+        default=2_000_000,
+        help="Rows for the legacy comparison and parity check (default: 2M)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["name"] == "__main__")
+    loader = DataLoader()
+
+    logger.info("=" * 80)
+    logger.info("TARGET LABEL BENCHMARK")
+    logger.info("=" * 80)
+
+    # 1. Parity and speedup against the legacy implementation on CSV-style (object) STATUS
+    legacy_data = make_credit_history(
+        args.legacy_rows, max(1, args.legacy_rows // args.rows_per_id), args.seed, categorical=False
+    )
+    legacy_time, expected = timed(legacy_target_variable, legacy_data)
+    vector_time, result = timed(loader.create_target_variable, legacy_data)
+    del legacy_data
+
+    try:
+        pd.testing.assert_frame_equal(result, expected)
+    except AssertionError as e:
+        logger.error(f"Labels differ from the legacy implementation: {e}")
+        sys.exit(1)
+
+    logger.info(f"{args.legacy_rows:,} rows (object STATUS), {len(expected):,} IDs: labels identical")
+    logger.info(f"  Legacy:     {legacy_time:8.2f}s ({args.legacy_rows / legacy_time / 1e6:6.2f}M rows/s)")
+    logger.info(f"  Vectorized: {vector_time:8.2f}s ({args.legacy_rows / vector_time / 1e6:6.2f}M rows/s)")
+    logger.info(f"  Speedup:    {legacy_time / vector_time:8.1f}x")
+
+    # 2. Full-size run; STATUS is categorical to keep the synthetic frame within memory
+    n_ids = max(1, args.rows // args.rows_per_id)
+    logger.info(f"Generating {args.rows:,} rows for {n_ids:,} IDs...")
+    credit_data = make_credit_history(args.rows, n_ids, args.seed, categorical=True)
+    memory_mb = credit_data.memory_usage(deep=True).sum() / 1024**2
+    full_time, labels = timed(loader.create_target_variable, credit_data)
+
+    logger.info(f"{args.rows:,} rows (categorical STATUS, {memory_mb:,.0f} MB), {len(labels):,} IDs")
+    logger.info(f"  Vectorized: {full_time:8.2f}s ({args.rows / full_time / 1e6:6.2f}M rows/s)")
+    logger.info(f"  Good share: {labels['Label'].mean() * 100:.1f}%")
+    logger.info("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
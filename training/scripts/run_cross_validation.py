@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Cross-Validation Script
+Runs stratified k-fold cross-validation of all models on the training split
+"""
+
+import argparse
+import sys
+import warnings
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent  # noqa: E402
+sys.path.insert(0, str(project_root))  # noqa: E402
+
+from loguru import logger  # noqa: E402
+from src.data.data_loader import DataLoader  # noqa: E402
+from src.features.feature_engineering import FeatureEngineer  # noqa: E402
+from src.models.cross_validation import CrossValidator, load_cv_config  # noqa: E402
+
+warnings.filterwarnings("ignore")
+
+
+def main():
+    """Run cross-validation pipeline"""
+    parser = argparse.ArgumentParser(description="Run Cross-Validation")
+    parser.add_argument(
+        "--raw-data-dir",
+        default="data/raw",
+        help="Raw data directory (default: data/raw)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default="data/cache",
+        help="Typed raw-data cache directory (default: data/cache)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse the raw CSVs without the cache")
+    parser.add_argument(
+        "--output-dir",
+        default="models",
+        help="Output directory for CV results (default: models)",
+    )
+    parser.add_argument(
+        "--mlflow-uri",
+        default="http://127.0.0.1:5000",
+        help="MLflow tracking URI (default: http://127.0.0.1:5000)",
+    )
+    parser.add_argument("--config", default=None, help="Config file (default: src/config/config.yaml)")
+    parser.add_argument("--models", nargs="+", help="Specific models to evaluate (default: all)")
+    parser.add_argument("--n-folds", type=int, default=None, help="Number of folds (default: from config)")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Held-out test set size (default: 0.2)")
+    parser.add_argument(
+        "--pca-components",
+        type=int,
+        default=5,
+        help="Number of PCA components (default: 5)",
+    )
+    parser.add_argument("--no-smote", action="store_true", help="Disable SMOTE resampling")
+    parser.add_argument("--no-pca", action="store_true", help="Disable PCA")
+    parser.add_argument(
+        "--n-cores",
+        type=int,
+        default=None,
+        help="Cores to split between concurrent fold jobs (default: all available)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Fold jobs run at the same time; 1 runs sequentially in-process (default: one per core)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run even if training.cross_validation.enabled is false",
+    )
+    parser.add_argument("--random-state", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    logger.info("=" * 80)
+    logger.info("CROSS-VALIDATION PIPELINE")
+    logger.info("=" * 80)
+
+    if not load_cv_config(args.config)["enabled"] and not args.force:
+        logger.info("Cross-validation is disabled in the config (use --force to run anyway)")
+        return 0
+
+    try:
+        # 1. Load Data
+        logger.info("\n1. Loading data...")
+        loader = DataLoader(raw_data_dir=args.raw_data_dir, cache_dir=None if args.no_cache else args.cache_dir)
+        X, y = loader.load_and_prepare_data()
+        logger.info(f"✓ Features: {X.shape}")
+
+        # 2. Encode and hold out the test split, exactly as run_preprocessing does
+        logger.info("\n2. Encoding features and holding out the test split...")
+        engineer = FeatureEngineer(random_state=args.random_state)
+        X_encoded = engineer.encode_features(X)
+        X_train, _, y_train, _ = engineer.train_test_split_data(X_encoded, y, test_size=args.test_size)
+
+        # 3. Cross-validate on the training split
+        logger.info("\n3. Cross-validating models...")
+        validator = CrossValidator(
+            tracking_uri=args.mlflow_uri,
+            n_folds=args.n_folds,
+            apply_smote=not args.no_smote,
+            n_components=None if args.no_pca else args.pca_components,
+            random_state=args.random_state,
+            n_cores=args.n_cores,
+            max_workers=args.max_workers,
+            config_path=args.config,
+        )
+        summary = validator.run(X_train, y_train, models=args.models)
+
+        # 4. Display and Save Results
+        logger.info("\n4. Cross-validation results...")
+        columns = ["Model", "n_folds", "f1_score_mean", "f1_score_std", "roc_auc_mean", "roc_auc_std"]
+        print("\n" + summary[[column for column in columns if column in summary.columns]].to_string(index=False))
+
+        summary_path = validator.save_results(args.output_dir)
+        logger.info(f"✓ Summary saved to: {summary_path}")
+        logger.info(f"✓ Per-fold results saved to: {Path(args.output_dir) / 'cv_fold_results.csv'}")
+
+        logger.info("\n" + "=" * 80)
+        logger.info("  CROSS-VALIDATION COMPLETED SUCCESSFULLY")
+        logger.info("=" * 80)
+        return 0
+
+    except Exception as e:
+        logger.error(f" Cross-validation failed: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
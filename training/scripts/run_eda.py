@@ -27,6 +27,12 @@ def main():
         default="data/raw",
         help="Raw data directory (default: data/raw)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default="data/cache",
+        help="Typed raw-data cache directory (default: data/cache)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse the raw CSVs without the cache")
     parser.add_argument(
         "--output-dir",
         default="outputs/eda",
@@ -45,7 +51,7 @@ def main():
 
         # 1. Load Data
         logger.info("\n1. Loading data...")
-        loader = DataLoader(raw_data_dir=args.raw_data_dir)
+        loader = DataLoader(raw_data_dir=args.raw_data_dir, cache_dir=None if args.no_cache else args.cache_dir)
         app_data, credit_data = loader.load_raw_data()
 
         logger.info(f"✓ Application Records: {app_data.shape[0]:,} rows, {app_data.shape[1]} columns")
@@ -65,8 +71,8 @@ def main():
 
         # 3. Merge Data
         logger.info("\n3. Merging application and credit data...")
-        app_data_filled = app_data.fillna("Unknown")
-        data = app_data_filled.merge(target_data, how="inner", on="ID")
+        # merge_data fills missing values, including in categorical columns from the raw cache
+        data = loader.merge_data(app_data, target_data)
 
         logger.info(f"✓ Merged dataset: {len(data):,} rows, {data.shape[1]} columns")
         logger.info(f"  Good (1): {(data['Label'] == 1).sum():,} ({(data['Label'] == 1).sum() / len(data) * 100:.2f}%)")
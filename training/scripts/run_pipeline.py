@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Pipeline Runner Script
+Runs download → preprocess → train → evaluate as cached stages, skipping
+stages whose inputs, parameters and code are unchanged since their last run
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent  # noqa: E402
+sys.path.insert(0, str(project_root))  # noqa: E402
+
+import pandas as pd  # noqa: E402
+from loguru import logger  # noqa: E402
+from src.pipeline.runner import PipelineRunner  # noqa: E402
+from src.pipeline.stages import DEFAULT_STAGES, OPTIONAL_STAGES, build_stages  # noqa: E402
+
+
+def main():
+    """Run the training pipeline"""
+    parser = argparse.ArgumentParser(description="Run the training pipeline with stage caching")
+    parser.add_argument(
+        "--root",
+        default=str(project_root.parent),
+        help="Repository root the stage paths are relative to (default: parent of training/)",
+    )
+    parser.add_argument(
+        "--with",
+        dest="optional",
+        nargs="+",
+        choices=OPTIONAL_STAGES,
+        default=[],
+        help="Optional stages to add; they run in parallel with the stages they do not depend on",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        help="Run only these stages; outputs of the others are used as they are on disk",
+    )
+    parser.add_argument("--force", nargs="+", default=[], help="Rerun these stages even when unchanged")
+    parser.add_argument("--force-all", action="store_true", help="Rerun every stage")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Stages run at the same time (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--mlflow-uri",
+        default="http://127.0.0.1:5000",
+        help="MLflow tracking URI (default: http://127.0.0.1:5000)",
+    )
+    parser.add_argument(
+        "--model-name",
+        default="card_approval_model",
+        help="Model name for MLflow registry (default: card_approval_model)",
+    )
+    parser.add_argument("--models", nargs="+", help="Specific models to train (default: all)")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Test set size (default: 0.2)")
+    parser.add_argument("--pca-components", type=int, default=5, help="Number of PCA components (default: 5)")
+    parser.add_argument("--no-smote", action="store_true", help="Disable SMOTE resampling")
+    parser.add_argument("--f1-threshold", type=float, default=0.90, help="Evaluation F1 gate (default: 0.90)")
+    args = parser.parse_args()
+
+    logger.info("=" * 80)
+    logger.info("TRAINING PIPELINE")
+    logger.info("=" * 80)
+
+    try:
+        stages = build_stages(
+            mlflow_uri=args.mlflow_uri,
+            model_name=args.model_name,
+            test_size=args.test_size,
+            pca_components=args.pca_components,
+            smote=not args.no_smote,
+            models=args.models,
+            f1_threshold=args.f1_threshold,
+            include=list(DEFAULT_STAGES) + args.optional,
+        )
+        force = [stage.name for stage in stages] if args.force_all else args.force
+        runner = PipelineRunner(stages, root=args.root, max_workers=args.max_workers, force=force)
+        report = runner.run(args.only)
+
+        summary = pd.DataFrame(
+            [
+                {
+                    "Stage": entry["stage"],
+                    "Status": entry["status"],
+                    "Seconds": entry.get("seconds"),
+                    "Depends on": ", ".join(entry.get("depends_on", [])) or "-",
+                }
+                for entry in report["stages"]
+            ]
+        )
+        print("\n" + summary.to_string(index=False))
+        logger.info(f"Total: {report['seconds']:.1f}s")
+
+        if report["status"] != "success":
+            logger.error(" Pipeline failed; see the stage logs in the run report")
+            return 1
+
+        logger.info("=" * 80)
+        logger.info("  PIPELINE COMPLETED SUCCESSFULLY")
+        logger.info("=" * 80)
+        return 0
+
+    except Exception as e:
+        logger.error(f" Pipeline failed: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,14 @@ project_root = Path(__file__).parent.parent  # noqa: E402
 sys.path.insert(0, str(project_root))  # noqa: E402
 
 from src.data.data_loader import DataLoader  # noqa: E402
+from src.data.processed_store import (  # noqa: E402
+    MANIFEST_NAME,
+    SPLIT_NAMES,
+    VALIDATION_SPLIT_NAMES,
+    save_processed_splits,
+)
 from src.features.feature_engineering import FeatureEngineer  # noqa: E402
+from src.utils.resampling import NEIGHBOR_ALGORITHMS, RESAMPLING_MODES, Resampler  # noqa: E402
 
 warnings.filterwarnings("ignore")
 
@@ -29,12 +36,24 @@ def main():
         default="data/raw",
         help="Raw data directory (default: data/raw)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default="data/cache",
+        help="Typed raw-data cache directory (default: data/cache)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse the raw CSVs without the cache")
     parser.add_argument(
         "--output-dir",
         default="data/processed",
         help="Output directory for processed data (default: data/processed)",
     )
     parser.add_argument("--test-size", type=float, default=0.2, help="Test set size (default: 0.2)")
+    parser.add_argument(
+        "--validation-size",
+        type=float,
+        default=0.1,
+        help="Share of real training rows held out before SMOTE for early stopping, 0 disables (default: 0.1)",
+    )
     parser.add_argument(
         "--pca-components",
         type=int,
@@ -42,8 +61,54 @@ def main():
         help="Number of PCA components (default: 5)",
     )
     parser.add_argument("--no-smote", action="store_true", help="Disable SMOTE resampling")
+    parser.add_argument(
+        "--smote-mode",
+        choices=RESAMPLING_MODES,
+        default="exact",
+        help="SMOTE+Tomek implementation: imblearn 'exact' or 'scalable' (default: exact)",
+    )
+    parser.add_argument(
+        "--smote-n-jobs",
+        type=int,
+        default=None,
+        help="Parallel jobs for scalable-mode neighbour searches, -1 for all cores (default: 1)",
+    )
+    parser.add_argument(
+        "--smote-neighbors",
+        choices=NEIGHBOR_ALGORITHMS,
+        default="auto",
+        help="Scalable-mode neighbour search; 'approximate' searches a random projection (default: auto)",
+    )
+    parser.add_argument(
+        "--tomek-chunk-size",
+        type=int,
+        default=50_000,
+        help="Rows per scalable-mode Tomek-link query (default: 50000)",
+    )
     parser.add_argument("--no-pca", action="store_true", help="Disable PCA")
+    parser.add_argument(
+        "--export-csv",
+        action="store_true",
+        help="Also write the splits as CSV next to the binary files",
+    )
     parser.add_argument("--random-state", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0,
+        help="Stream credit_record.csv in chunks of this many rows (default: 0, load fully)",
+    )
+    parser.add_argument(
+        "--fit-chunk-size",
+        type=int,
+        default=0,
+        help="Fit the scaler and an incremental PCA in chunks of this many rows (default: 0, fit in one shot)",
+    )
+    parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="Keep the one-hot matrix sparse (CSR) through SMOTE, scaling and PCA",
+    )
     args = parser.parse_args()
 
     logger.info("=" * 80)
@@ -53,7 +118,11 @@ def main():
     try:
         # 1. Load Data
         logger.info("\n1. Loading data...")
-        loader = DataLoader(raw_data_dir=args.raw_data_dir)
+        loader = DataLoader(
+            raw_data_dir=args.raw_data_dir,
+            chunk_size=args.chunk_size or None,
+            cache_dir=None if args.no_cache else args.cache_dir,
+        )
         X, y = loader.load_and_prepare_data()
 
         logger.info(f"✓ Features: {X.shape}")
@@ -63,7 +132,19 @@ def main():
 
         # 2. Feature Engineering
         logger.info("\n2. Running feature engineering pipeline...")
-        engineer = FeatureEngineer(random_state=args.random_state)
+        resampler = Resampler(
+            random_state=args.random_state,
+            mode=args.smote_mode,
+            n_jobs=args.smote_n_jobs,
+            neighbors_algorithm=args.smote_neighbors,
+            tomek_chunk_size=args.tomek_chunk_size,
+        )
+        engineer = FeatureEngineer(
+            random_state=args.random_state,
+            resampler=resampler,
+            chunk_size=args.fit_chunk_size or None,
+            sparse=args.sparse,
+        )
 
         result = engineer.full_pipeline(
             X=X,
@@ -74,6 +155,7 @@ def main():
             test_size=args.test_size,
             save_preprocessors=True,
             output_dir=args.output_dir,
+            validation_size=args.validation_size,
         )
 
         # 3. Display Results
@@ -104,16 +186,19 @@ def main():
         output_path = Path(args.output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        result["X_train"].to_csv(output_path / "X_train.csv", index=False)
-        result["X_test"].to_csv(output_path / "X_test.csv", index=False)
-        result["y_train"].to_csv(output_path / "y_train.csv", index=False)
-        result["y_test"].to_csv(output_path / "y_test.csv", index=False)
+        splits = {name: result[name] for name in SPLIT_NAMES + VALIDATION_SPLIT_NAMES if name in result}
+        save_processed_splits(str(output_path), splits, export_csv=args.export_csv)
 
         logger.info(f"✓ Saved to {output_path}:")
-        logger.info(f"  - X_train.csv ({result['X_train'].shape[0]} x {result['X_train'].shape[1]})")
-        logger.info(f"  - X_test.csv ({result['X_test'].shape[0]} x {result['X_test'].shape[1]})")
-        logger.info(f"  - y_train.csv ({len(result['y_train'])} samples)")
-        logger.info(f"  - y_test.csv ({len(result['y_test'])} samples)")
+        logger.info(f"  - X_train.npy ({result['X_train'].shape[0]} x {result['X_train'].shape[1]})")
+        logger.info(f"  - X_test.npy ({result['X_test'].shape[0]} x {result['X_test'].shape[1]})")
+        logger.info(f"  - y_train.npy ({len(result['y_train'])} samples)")
+        logger.info(f"  - y_test.npy ({len(result['y_test'])} samples)")
+        if "X_val" in result:
+            logger.info(f"  - X_val.npy, y_val.npy ({len(result['y_val'])} samples, before SMOTE)")
+        logger.info(f"  - {MANIFEST_NAME}")
+        if args.export_csv:
+            logger.info(f"  - {', '.join(f'{name}.csv' for name in splits)}")
         logger.info("  - scaler.pkl")
         if not args.no_pca:
             logger.info("  - pca.pkl")
@@ -14,14 +14,17 @@ project_root = Path(__file__).parent.parent  # noqa: E402
 sys.path.insert(0, str(project_root))  # noqa: E402
 
 import joblib  # noqa: E402
-import pandas as pd  # noqa: E402
 from loguru import logger  # noqa: E402
+from src.data.processed_store import (  # noqa: E402
+    VALIDATION_SPLIT_NAMES,
+    has_processed_split,
+    load_processed_splits,
+)
 from src.models.train import ModelTrainer  # noqa: E402
 from src.utils.metrics import get_classification_report  # noqa: E402
 from src.utils.mlflow_artifacts import MLflowArtifactManager  # noqa: E402
-
-# Import plotting functions
-from src.utils.plotting import plot_confusion_matrix, plot_precision_recall_curve, plot_roc_curve  # noqa: E402
+from src.utils.plotting import TITLES, render_evaluation_plots  # noqa: E402
+from src.utils.shared_memory import spawn_pool  # noqa: E402
 
 warnings.filterwarnings("ignore")
 
@@ -45,6 +48,26 @@ def main():
         help="MLflow tracking URI (default: http://127.0.0.1:5000)",
     )
     parser.add_argument("--models", nargs="+", help="Specific models to train (default: all)")
+    parser.add_argument(
+        "--n-cores",
+        type=int,
+        default=None,
+        help="Cores to split between models trained in parallel (default: all available)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Models trained at the same time; 1 trains sequentially in-process (default: one per model)",
+    )
+    parser.add_argument(
+        "--no-early-stopping",
+        dest="early_stopping",
+        action="store_const",
+        const=False,
+        default=None,
+        help="Train boosting models for their full iteration count (default: training.early_stopping in config)",
+    )
     parser.add_argument(
         "--metric",
         default="F1-Score",
@@ -67,6 +90,24 @@ def main():
         default="card_approval_model",
         help="Model name for MLflow registry (default: card_approval_model)",
     )
+    parser.add_argument(
+        "--plot-dpi",
+        type=int,
+        default=300,
+        help="Resolution of the evaluation plots (default: 300)",
+    )
+    parser.add_argument(
+        "--plot-workers",
+        type=int,
+        default=3,
+        help="Processes rendering evaluation plots in the background; 0 renders them inline (default: 3)",
+    )
+    parser.add_argument(
+        "--plot-max-points",
+        type=int,
+        default=2000,
+        help="Points drawn per ROC/precision-recall curve (default: 2000)",
+    )
     args = parser.parse_args()
 
     logger.info("=" * 80)
@@ -78,10 +119,9 @@ def main():
         logger.info("\n1. Loading processed data...")
         data_path = Path(args.data_dir)
 
-        X_train = pd.read_csv(data_path / "X_train.csv")
-        X_test = pd.read_csv(data_path / "X_test.csv")
-        y_train = pd.read_csv(data_path / "y_train.csv").squeeze()
-        y_test = pd.read_csv(data_path / "y_test.csv").squeeze()
+        splits = load_processed_splits(str(data_path))
+        X_train, X_test = splits["X_train"], splits["X_test"]
+        y_train, y_test = splits["y_train"], splits["y_test"]
 
         logger.info(f"✓ X_train: {X_train.shape}")
         logger.info(f"✓ X_test: {X_test.shape}")
@@ -92,6 +132,12 @@ def main():
             f"✓ y_test: {y_test.shape} - Good: {(y_test == 1).sum():,}, Bad: {(y_test == 0).sum():,}"  # noqa: E501
         )
 
+        # Real rows held out before SMOTE, used to validate early stopping
+        validation = {}
+        if all(has_processed_split(str(data_path), name) for name in VALIDATION_SPLIT_NAMES):
+            validation = load_processed_splits(str(data_path), VALIDATION_SPLIT_NAMES)
+            logger.info(f"✓ X_val: {validation['X_val'].shape} (before SMOTE)")
+
         # 2. Load Preprocessing Artifacts
         logger.info("\n2. Loading preprocessing artifacts...")
         scaler = None
@@ -142,7 +188,12 @@ def main():
         # 3. Train Models
         logger.info("\n3. Training models...")
 
-        trainer = ModelTrainer(tracking_uri=args.mlflow_uri)
+        trainer = ModelTrainer(
+            tracking_uri=args.mlflow_uri,
+            n_cores=args.n_cores,
+            max_workers=args.max_workers,
+            early_stopping=args.early_stopping,
+        )
         models = args.models
 
         results_df = trainer.train_all_models(
@@ -151,6 +202,8 @@ def main():
             X_test=X_test,
             y_test=y_test,
             models=models,
+            X_val=validation.get("X_val"),
+            y_val=validation.get("y_val"),
         )
 
         # 4. Display Results
@@ -173,11 +226,14 @@ def main():
         # Log preprocessing artifacts to the best model's run in MLflow
         if hasattr(trainer, "best_model_run_id") and trainer.best_model_run_id:
             logger.info("\nLogging preprocessing artifacts to MLflow...")
-            import mlflow
-
-            with mlflow.start_run(run_id=trainer.best_model_run_id):
-                MLflowArtifactManager.log_preprocessing_artifacts(scaler=scaler, pca=pca, feature_names=feature_names)
-            logger.info("✓ Preprocessing artifacts logged to MLflow")
+            # Uploaded in the background while the results below are saved
+            MLflowArtifactManager.log_preprocessing_artifacts(
+                scaler=scaler,
+                pca=pca,
+                feature_names=feature_names,
+                run_id=trainer.best_model_run_id,
+                mlflow_logger=trainer.mlflow_logger,
+            )
         else:
             logger.warning("Could not log preprocessing artifacts - no run_id available")
 
@@ -203,20 +259,17 @@ def main():
         eval_dir = output_path / "evaluation"
         eval_dir.mkdir(exist_ok=True)
 
-        # Generate and save visualizations
-        plot_confusion_matrix(y_test, y_pred, save_path=str(eval_dir / "confusion_matrix.png"))
-        logger.info(f"✓ Confusion matrix saved to: {eval_dir / 'confusion_matrix.png'}")
-
-        if y_pred_proba is not None:
-            plot_roc_curve(y_test, y_pred_proba, save_path=str(eval_dir / "roc_curve.png"))
-            logger.info(f"✓ ROC curve saved to: {eval_dir / 'roc_curve.png'}")
-
-            plot_precision_recall_curve(
-                y_test,
-                y_pred_proba,
-                save_path=str(eval_dir / "precision_recall_curve.png"),
-            )
-            logger.info(f"✓ Precision-Recall curve saved to: {eval_dir / 'precision_recall_curve.png'}")
+        # Render visualizations in background processes; they are collected after registration
+        plot_executor = spawn_pool(args.plot_workers) if args.plot_workers > 0 else None
+        plot_futures = render_evaluation_plots(
+            y_test,
+            y_pred,
+            y_pred_proba,
+            str(eval_dir),
+            dpi=args.plot_dpi,
+            max_points=args.plot_max_points,
+            executor=plot_executor,
+        )
 
         # Save classification report
         report = get_classification_report(y_test, y_pred)
@@ -225,6 +278,11 @@ def main():
             f.write(report)
         logger.info(f"✓ Classification report saved to: {report_path}")
 
+        if trainer.mlflow_logger.flush():
+            logger.info("✓ Preprocessing artifacts logged to MLflow")
+        else:
+            logger.warning("Some preprocessing artifacts could not be logged to MLflow")
+
         # Display best model info
         logger.info("\n" + "=" * 80)
         logger.info(f"🏆 BEST MODEL: {trainer.best_model_name}")
@@ -279,6 +337,15 @@ def main():
                     f"  python scripts/register_model.py --run-id {trainer.best_model_run_id} --model-name {args.model_name} --stage Production"  # noqa: E501
                 )
 
+        # Collect evaluation plots
+        for name, future in plot_futures.items():
+            try:
+                logger.info(f"✓ {TITLES[name]} saved to: {future.result()}")
+            except Exception as e:
+                logger.warning(f"Could not render {name}: {e}")
+        if plot_executor is not None:
+            plot_executor.shutdown()
+
         return 0
 
     except Exception as e:
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Hyperparameter Search Script
+Tunes model hyperparameters on the processed training split with successive halving
+"""
+
+import argparse
+import sys
+import warnings
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent  # noqa: E402
+sys.path.insert(0, str(project_root))  # noqa: E402
+
+from loguru import logger  # noqa: E402
+from src.data.processed_store import load_processed_split  # noqa: E402
+from src.models.tuning import HyperparameterSearch  # noqa: E402
+
+warnings.filterwarnings("ignore")
+
+
+def main():
+    """Run hyperparameter search"""
+    parser = argparse.ArgumentParser(description="Run Hyperparameter Search")
+    parser.add_argument(
+        "--data-dir",
+        default="data/processed",
+        help="Processed data directory (default: data/processed)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="models",
+        help="Output directory for the best parameters (default: models)",
+    )
+    parser.add_argument(
+        "--trial-log",
+        default=None,
+        help="Trial log to append to and resume from (default: <output-dir>/tuning_trials.jsonl)",
+    )
+    parser.add_argument(
+        "--mlflow-uri",
+        default="http://127.0.0.1:5000",
+        help="MLflow tracking URI (default: http://127.0.0.1:5000)",
+    )
+    parser.add_argument("--config", default=None, help="Config file (default: src/config/config.yaml)")
+    parser.add_argument("--models", nargs="+", help="Specific models to tune (default: all with a search space)")
+    parser.add_argument("--n-trials", type=int, default=None, help="Configurations per model (default: from config)")
+    parser.add_argument("--eta", type=int, default=None, help="Halving factor (default: from config)")
+    parser.add_argument(
+        "--min-budget",
+        type=float,
+        default=None,
+        help="Fraction of training rows in the first rung (default: from config)",
+    )
+    parser.add_argument("--metric", default=None, help="Validation metric to maximize (default: from config)")
+    parser.add_argument(
+        "--n-cores",
+        type=int,
+        default=None,
+        help="Cores to split between concurrent trials (default: all available)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Trials run at the same time; 1 runs sequentially in-process (default: one per core)",
+    )
+    parser.add_argument("--random-state", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    logger.info("=" * 80)
+    logger.info("HYPERPARAMETER SEARCH")
+    logger.info("=" * 80)
+
+    try:
+        # 1. Load Processed Data
+        logger.info("\n1. Loading processed training data...")
+        X_train = load_processed_split(args.data_dir, "X_train")
+        y_train = load_processed_split(args.data_dir, "y_train")
+        logger.info(f"✓ X_train: {X_train.shape}")
+
+        # 2. Search
+        logger.info("\n2. Searching hyperparameters...")
+        output_path = Path(args.output_dir)
+        search = HyperparameterSearch(
+            tracking_uri=args.mlflow_uri,
+            trial_log=args.trial_log or str(output_path / "tuning_trials.jsonl"),
+            n_trials=args.n_trials,
+            eta=args.eta,
+            min_budget=args.min_budget,
+            metric=args.metric,
+            random_state=args.random_state,
+            n_cores=args.n_cores,
+            max_workers=args.max_workers,
+            config_path=args.config,
+        )
+        results = search.run(X_train, y_train, models=args.models)
+
+        # 3. Display and Save Results
+        logger.info("\n3. Search results...")
+        print("\n" + results.to_string(index=False))
+
+        params_path = search.save_best_params(str(output_path / "best_hyperparameters.yaml"))
+        logger.info(f"✓ Best parameters saved to: {params_path}")
+        logger.info(f"✓ Trial log: {search.trial_log}")
+
+        logger.info("\n" + "=" * 80)
+        logger.info("  HYPERPARAMETER SEARCH COMPLETED SUCCESSFULLY")
+        logger.info("=" * 80)
+        logger.info("Copy the parameters into model.hyperparameters in config.yaml to train with them")
+        return 0
+
+    except Exception as e:
+        logger.error(f" Hyperparameter search failed: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
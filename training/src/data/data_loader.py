@@ -3,23 +3,80 @@ Data loading and target creation module
 """
 
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from loguru import logger
+from src.data.raw_cache import APPLICATION_SCHEMA, CREDIT_SCHEMA, RawDataCache
+
+# STATUS values counted as Good; everything else (overdue, missing) is Bad
+GOOD_STATUSES = ["0", "X", "C"]
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+class LabelCountAccumulator:
+    """Running per-ID record and Good counts, backed by sorted arrays"""
+
+    def __init__(self):
+        """Initialize an empty accumulator"""
+        self.ids = pd.Index([], dtype=np.int64)
+        self.total_counts = np.zeros(0, dtype=np.int32)
+        self.good_counts = np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the accumulator arrays"""
+        return int(self.ids.nbytes + self.total_counts.nbytes + self.good_counts.nbytes)
+
+    def update(self, ids: pd.Index, total_counts: np.ndarray, good_counts: np.ndarray) -> None:
+        """
+        Add the counts of one chunk
+
+        Args:
+            ids: Sorted unique IDs in the chunk
+            total_counts: Records per ID in the chunk
+            good_counts: Good records per ID in the chunk
+        """
+        merged = self.ids.union(ids) if len(self.ids) else pd.Index(ids)
+        if len(merged) != len(self.ids):
+            # New IDs appeared: scatter existing counts into the merged ID order
+            old_positions = merged.get_indexer(self.ids)
+            total = np.zeros(len(merged), dtype=np.int32)
+            good = np.zeros(len(merged), dtype=np.int32)
+            total[old_positions] = self.total_counts
+            good[old_positions] = self.good_counts
+            self.ids, self.total_counts, self.good_counts = merged, total, good
+
+        positions = self.ids.get_indexer(ids)
+        self.total_counts[positions] += total_counts.astype(np.int32)
+        self.good_counts[positions] += good_counts.astype(np.int32)
 
 
 class DataLoader:
     """Handle data loading and initial processing"""
 
-    def __init__(self, raw_data_dir: str = "data/raw"):
+    def __init__(
+        self,
+        raw_data_dir: str = "data/raw",
+        chunk_size: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ):
         """
         Initialize DataLoader
 
         Args:
             raw_data_dir: Directory containing raw data files
+            chunk_size: Credit records per chunk for streaming target creation
+                (None loads credit_record.csv fully into memory)
+            cache_dir: Directory for the typed raw-data cache (None parses the CSVs every time)
         """
         self.raw_data_dir = Path(raw_data_dir)
+        self.chunk_size = chunk_size
+        self.cache = RawDataCache(cache_dir) if cache_dir else None
 
     def load_raw_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
@@ -30,17 +87,33 @@ class DataLoader:
         """
         logger.info("Loading raw data...")
 
-        app_path = self.raw_data_dir / "application_record.csv"
-        credit_path = self.raw_data_dir / "credit_record.csv"
+        app_data = self.load_application_data()
+
+        credit_data = self._read_raw_csv("credit_record.csv", CREDIT_SCHEMA)
+        logger.info(f"Credit Records: {credit_data.shape[0]:,} rows, {credit_data.shape[1]} columns")
+
+        return app_data, credit_data
+
+    def load_application_data(self) -> pd.DataFrame:
+        """
+        Load application record data
 
-        app_data = pd.read_csv(app_path)
-        credit_data = pd.read_csv(credit_path)
+        Returns:
+            Application DataFrame
+        """
+        app_data = self._read_raw_csv("application_record.csv", APPLICATION_SCHEMA)
 
         logger.info(f"Application Records: {app_data.shape[0]:,} rows, {app_data.shape[1]} columns")
-        logger.info(f"Credit Records: {credit_data.shape[0]:,} rows, {credit_data.shape[1]} columns")
         logger.info(f"Unique Applicants: {app_data['ID'].nunique():,}")
 
-        return app_data, credit_data
+        return app_data
+
+    def _read_raw_csv(self, file_name: str, schema: Dict[str, str]) -> pd.DataFrame:
+        """Read a raw CSV, through the typed cache when one is configured"""
+        path = self.raw_data_dir / file_name
+        if self.cache is None:
+            return pd.read_csv(path)
+        return self.cache.load(path, schema)
 
     def create_target_variable(self, credit_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -58,31 +131,123 @@ class DataLoader:
         """
         logger.info("Creating target variable...")
 
-        # Create Good/Bad labels from STATUS
-        credit_data = credit_data.copy()
-        credit_data["Good or Bad"] = credit_data["STATUS"].apply(lambda x: "Good" if x in ["0", "X", "C"] else "Bad")
+        is_good = self._good_status_mask(credit_data["STATUS"])
+        ids, total_counts, good_counts = self._count_by_id(credit_data["ID"], is_good)
 
-        # Group by ID and get dominant label
-        credit_goods_bads = credit_data.groupby(["ID", "Good or Bad"]).size().to_frame("size")
-        credit_goods_bads.reset_index(inplace=True)
+        return self._build_label_table(ids, total_counts, good_counts)
 
-        idx = credit_goods_bads.groupby("ID")["size"].idxmax()
-        max_goods_bads = credit_goods_bads.loc[idx]
+    def stream_target_variable(self, chunk_size: Optional[int] = None) -> pd.DataFrame:
+        """
+        Create target variable by streaming credit_record.csv in chunks
 
-        # Convert to binary (1=Good, 0=Bad)
-        max_goods_bads["Label"] = max_goods_bads["Good or Bad"].apply(lambda x: 1 if x == "Good" else 0)
-        max_goods_bads = max_goods_bads[["ID", "Label"]].reset_index(drop=True)
+        Only ID and STATUS are read, and per-ID counts are kept in a
+        LabelCountAccumulator, so peak memory scales with the number of
+        applicants rather than the number of credit records. Labels are
+        identical to create_target_variable.
+
+        Args:
+            chunk_size: Credit records per chunk (defaults to self.chunk_size)
+
+        Returns:
+            DataFrame with ID and Label columns
+        """
+        chunk_size = chunk_size or self.chunk_size or DEFAULT_CHUNK_SIZE
+        credit_path = self.raw_data_dir / "credit_record.csv"
+        logger.info(f"Streaming target variable from {credit_path} ({chunk_size:,} rows per chunk)...")
+
+        accumulator = LabelCountAccumulator()
+        n_rows = 0
+        # STATUS is read as strings so a chunk without 'X'/'C' is not parsed as integers
+        reader = pd.read_csv(credit_path, usecols=["ID", "STATUS"], dtype={"STATUS": "category"}, chunksize=chunk_size)
+        for chunk in reader:
+            is_good = self._good_status_mask(chunk["STATUS"])
+            accumulator.update(*self._count_by_id(chunk["ID"], is_good))
+            n_rows += len(chunk)
 
-        logger.info(f"Created target labels for {len(max_goods_bads):,} customers")
-        logger.info(
-            f"Good (1): {(max_goods_bads['Label'] == 1).sum():,} ({(max_goods_bads['Label'] == 1).sum() / len(max_goods_bads) * 100:.1f}%)"  # noqa: E501
-        )
         logger.info(
-            f"Bad (0): {(max_goods_bads['Label'] == 0).sum():,} ({(max_goods_bads['Label'] == 0).sum() / len(max_goods_bads) * 100:.1f}%)"  # noqa: E501
+            f"Credit Records: {n_rows:,} rows streamed, "
+            f"{accumulator.nbytes / 1024**2:.1f} MB of per-ID counts for {len(accumulator):,} IDs"
         )
+        return self._build_label_table(accumulator.ids, accumulator.total_counts, accumulator.good_counts)
+
+    @staticmethod
+    def _good_status_mask(status: pd.Series) -> np.ndarray:
+        """
+        Flag Good credit records via a lookup on the STATUS categorical codes
+
+        Args:
+            status: STATUS column (object or categorical)
+
+        Returns:
+            Boolean array, True for Good records; missing STATUS is Bad
+        """
+        if not isinstance(status.dtype, pd.CategoricalDtype):
+            status = status.astype("category")
+        # Code -1 (missing) indexes the trailing False
+        good_categories = np.append(status.cat.categories.isin(GOOD_STATUSES), False)
+        return good_categories[status.cat.codes.to_numpy()]
+
+    @staticmethod
+    def _build_label_table(ids: pd.Index, total_counts: np.ndarray, good_counts: np.ndarray) -> pd.DataFrame:
+        """
+        Build the ID/Label table from per-ID counts and log its distribution
+
+        Args:
+            ids: Sorted unique IDs
+            total_counts: Records per ID
+            good_counts: Good records per ID
+
+        Returns:
+            DataFrame with ID and Label columns
+        """
+        # Dominant label per ID (1=Good, 0=Bad); ties resolve to Bad, which sorts first
+        labels = (good_counts > total_counts - good_counts).astype(np.int64)
+        max_goods_bads = pd.DataFrame({"ID": ids, "Label": labels})
+
+        n_customers = len(max_goods_bads)
+        n_good = int(labels.sum())
+        n_bad = n_customers - n_good
+        logger.info(f"Created target labels for {n_customers:,} customers")
+        if n_customers:
+            logger.info(f"Good (1): {n_good:,} ({n_good / n_customers * 100:.1f}%)")
+            logger.info(f"Bad (0): {n_bad:,} ({n_bad / n_customers * 100:.1f}%)")
 
         return max_goods_bads
 
+    @staticmethod
+    def _count_by_id(id_column: pd.Series, is_good: np.ndarray) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+        """
+        Count records and good records per ID
+
+        Dense integer IDs are bincounted on their offset from the minimum ID;
+        anything else goes through factorize. Either way IDs come back sorted
+        and missing IDs are dropped, matching groupby.
+
+        Args:
+            id_column: ID column of the credit records
+            is_good: Boolean mask of good records
+
+        Returns:
+            Tuple of (sorted unique IDs, record counts, good record counts)
+        """
+        values = id_column.to_numpy()
+        if len(values) and values.dtype.kind in "iu":
+            min_id = values.min()
+            span = int(values.max()) - int(min_id) + 1
+            if span <= 2 * len(values):
+                offsets = values - min_id
+                total_counts = np.bincount(offsets, minlength=span)
+                good_counts = np.bincount(offsets[is_good], minlength=span)
+                present = np.flatnonzero(total_counts)
+                ids = pd.Index((present + min_id).astype(values.dtype), name=id_column.name)
+                return ids, total_counts[present], good_counts[present]
+
+        id_codes, ids = pd.factorize(id_column, sort=True)
+        has_id = id_codes >= 0
+        total_counts = np.bincount(id_codes[has_id], minlength=len(ids))
+        good_counts = np.bincount(id_codes[has_id & is_good], minlength=len(ids))
+        return ids, total_counts, good_counts
+
     def merge_data(
         self,
         app_data: pd.DataFrame,
@@ -105,12 +270,20 @@ class DataLoader:
         # Fill missing values if requested
         if fill_missing:
             app_data = app_data.copy()
+            for column in app_data.select_dtypes("category"):
+                # fillna needs the category to exist; keep them sorted so dummies match the string order
+                categories = sorted(set(app_data[column].cat.categories) | {"Unknown"}, key=str)
+                app_data[column] = app_data[column].cat.set_categories(categories)
             app_data.fillna("Unknown", inplace=True)
             logger.info("Filled missing values with 'Unknown'")
 
         # Merge data
         merged_data = pd.merge(app_data, target_data, how="inner", on="ID")
 
+        # Drop categories of applicants without credit records so they do not become all-zero dummies
+        for column in merged_data.select_dtypes("category"):
+            merged_data[column] = merged_data[column].cat.remove_unused_categories()
+
         logger.info(f"Merged dataset: {len(merged_data):,} rows, {merged_data.shape[1]} columns")
         logger.info("Target Distribution After Merge:")
         logger.info(
@@ -132,11 +305,16 @@ class DataLoader:
         Returns:
             Tuple of (features_df, target_series)
         """
-        # Load raw data
-        app_data, credit_data = self.load_raw_data()
-
-        # Create target
-        target_data = self.create_target_variable(credit_data)
+        if self.chunk_size:
+            # Stream credit records; only the label table is materialized
+            app_data = self.load_application_data()
+            target_data = self.stream_target_variable()
+        else:
+            # Load raw data
+            app_data, credit_data = self.load_raw_data()
+
+            # Create target
+            target_data = self.create_target_variable(credit_data)
 
         # Merge data
         merged_data = self.merge_data(app_data, target_data)
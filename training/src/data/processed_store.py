@@ -0,0 +1,202 @@
+"""
+Binary storage for processed train/test splits
+
+Each split is saved as a ``.npy`` array next to a small JSON manifest
+recording its shape, dtype and column names, so readers can memory-map the
+arrays instead of parsing CSV text.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+MANIFEST_NAME = "processed_manifest.json"
+FORMAT_VERSION = 1
+SPLIT_NAMES = ("X_train", "X_test", "y_train", "y_test")
+# Optional real (pre-SMOTE) training rows held out for early stopping
+VALIDATION_SPLIT_NAMES = ("X_val", "y_val")
+
+Split = Union[pd.DataFrame, pd.Series]
+
+
+def save_processed_splits(output_dir: str, splits: Dict[str, Split], export_csv: bool = False) -> Path:
+    """
+    Save processed splits as .npy arrays plus a manifest
+
+    Args:
+        output_dir: Output directory
+        splits: Mapping of split name (e.g. 'X_train') to DataFrame or Series
+        export_csv: Also write each split as CSV (for inspection or older consumers)
+
+    Returns:
+        Path to the manifest
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    manifest = {"format_version": FORMAT_VERSION, "splits": {}}
+    for name, data in splits.items():
+        array = np.ascontiguousarray(data.to_numpy())
+        if array.dtype == object:
+            raise ValueError(f"Split {name} has mixed or object dtypes and cannot be stored as an array")
+
+        file_name = f"{name}.npy"
+        np.save(output_path / file_name, array, allow_pickle=False)
+
+        entry = {"file": file_name, "shape": list(array.shape), "dtype": array.dtype.str}
+        if isinstance(data, pd.DataFrame):
+            entry["columns"] = [str(column) for column in data.columns]
+        else:
+            entry["name"] = None if data.name is None else str(data.name)
+        manifest["splits"][name] = entry
+
+        if export_csv:
+            data.to_csv(output_path / f"{name}.csv", index=False)
+
+    manifest_path = output_path / MANIFEST_NAME
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    logger.info(f"Saved {len(splits)} processed splits to {output_path} ({MANIFEST_NAME})")
+    return manifest_path
+
+
+def has_processed_manifest(data_dir: str) -> bool:
+    """Check whether a directory holds binary processed splits"""
+    return (Path(data_dir) / MANIFEST_NAME).exists()
+
+
+def has_processed_split(data_dir: str, name: str) -> bool:
+    """Check whether a processed data directory holds the named split"""
+    data_path = Path(data_dir)
+    manifest_path = data_path / MANIFEST_NAME
+    if not manifest_path.exists():
+        return (data_path / f"{name}.csv").exists()
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return name in json.load(f).get("splits", {})
+
+
+def load_processed_split(data_dir: str, name: str, mmap: bool = True) -> Split:
+    """
+    Load one processed split
+
+    Reads the binary split when a manifest is present, memory-mapped
+    copy-on-write so the data is not copied until written to. Falls back to
+    ``<name>.csv`` for directories written before the binary format.
+
+    Args:
+        data_dir: Processed data directory
+        name: Split name (e.g. 'X_test')
+        mmap: Memory-map the array instead of reading it into memory
+
+    Returns:
+        DataFrame for 2-D splits, Series for 1-D splits
+    """
+    data_path = Path(data_dir)
+    manifest_path = data_path / MANIFEST_NAME
+
+    if not manifest_path.exists():
+        csv_path = data_path / f"{name}.csv"
+        if not csv_path.exists():
+            raise FileNotFoundError(f"Processed split not found: {csv_path}")
+        data = pd.read_csv(csv_path)
+        return data.squeeze(axis=1) if name.startswith("y") else data
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported processed data format: {manifest.get('format_version')}")
+    if name not in manifest["splits"]:
+        raise FileNotFoundError(f"Processed split '{name}' not in {manifest_path}")
+
+    entry = manifest["splits"][name]
+    array = np.load(data_path / entry["file"], mmap_mode="c" if mmap else None, allow_pickle=False)
+    if list(array.shape) != entry["shape"] or array.dtype.str != entry["dtype"]:
+        raise ValueError(
+            f"Processed split '{name}' does not match manifest: "
+            f"{array.shape} {array.dtype.str} vs {tuple(entry['shape'])} {entry['dtype']}"
+        )
+
+    if "columns" in entry:
+        return pd.DataFrame(array, columns=entry["columns"], copy=False)
+    return pd.Series(array, name=entry.get("name"), copy=False)
+
+
+def load_processed_splits(data_dir: str, names: Iterable[str] = SPLIT_NAMES, mmap: bool = True) -> Dict[str, Split]:
+    """
+    Load several processed splits
+
+    Args:
+        data_dir: Processed data directory
+        names: Split names to load
+        mmap: Memory-map the arrays instead of reading them into memory
+
+    Returns:
+        Mapping of split name to DataFrame or Series
+    """
+    source = "binary" if has_processed_manifest(data_dir) else "CSV"
+    logger.info(f"Loading processed splits from {data_dir} ({source})")
+    return {name: load_processed_split(data_dir, name, mmap=mmap) for name in names}
+
+
+def iter_processed_chunks(
+    data_dir: str, names: Iterable[str] = ("X_test", "y_test"), chunk_size: int = 100_000
+) -> Iterator[Tuple[Split, ...]]:
+    """
+    Stream row-aligned chunks of several processed splits
+
+    Binary splits are memory-mapped and sliced; CSV splits are parsed
+    chunk_size rows at a time, so memory stays bounded by one chunk.
+
+    Args:
+        data_dir: Processed data directory
+        names: Split names sharing the same rows (e.g. features and labels)
+        chunk_size: Rows per chunk
+
+    Yields:
+        One chunk per split, in the order of names
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    names = list(names)
+
+    if has_processed_manifest(data_dir):
+        splits = [load_processed_split(data_dir, name, mmap=True) for name in names]
+        n_rows = {len(split) for split in splits}
+        if len(n_rows) != 1:
+            raise ValueError(f"Splits {names} have different row counts: {sorted(n_rows)}")
+        for start in range(0, n_rows.pop(), chunk_size):
+            yield tuple(split.iloc[start : start + chunk_size] for split in splits)
+        return
+
+    readers = []
+    for name in names:
+        csv_path = Path(data_dir) / f"{name}.csv"
+        if not csv_path.exists():
+            raise FileNotFoundError(f"Processed split not found: {csv_path}")
+        readers.append(pd.read_csv(csv_path, chunksize=chunk_size))
+    sentinel = object()
+    while True:
+        chunks = [next(reader, sentinel) for reader in readers]
+        if all(chunk is sentinel for chunk in chunks):
+            return
+        if any(chunk is sentinel for chunk in chunks) or len({len(chunk) for chunk in chunks}) != 1:
+            raise ValueError(f"Splits {names} have different row counts")
+        yield tuple(chunk.squeeze(axis=1) if name.startswith("y") else chunk for name, chunk in zip(names, chunks))
+
+
+__all__ = [
+    "save_processed_splits",
+    "load_processed_split",
+    "load_processed_splits",
+    "iter_processed_chunks",
+    "has_processed_manifest",
+    "has_processed_split",
+    "MANIFEST_NAME",
+    "SPLIT_NAMES",
+    "VALIDATION_SPLIT_NAMES",
+]
@@ -0,0 +1,217 @@
+"""
+Typed columnar cache for raw CSV inputs
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+CACHE_FORMAT_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Target dtypes for application_record.csv; columns not listed keep their parsed dtype
+APPLICATION_SCHEMA: Dict[str, str] = {
+    "ID": "int32",
+    "CODE_GENDER": "category",
+    "FLAG_OWN_CAR": "category",
+    "FLAG_OWN_REALTY": "category",
+    "CNT_CHILDREN": "int8",
+    "AMT_INCOME_TOTAL": "float64",
+    "NAME_INCOME_TYPE": "category",
+    "NAME_EDUCATION_TYPE": "category",
+    "NAME_FAMILY_STATUS": "category",
+    "NAME_HOUSING_TYPE": "category",
+    "DAYS_BIRTH": "int32",
+    "DAYS_EMPLOYED": "int32",
+    "FLAG_MOBIL": "int8",
+    "FLAG_WORK_PHONE": "int8",
+    "FLAG_PHONE": "int8",
+    "FLAG_EMAIL": "int8",
+    "OCCUPATION_TYPE": "category",
+    "CNT_FAM_MEMBERS": "int8",
+}
+
+# Target dtypes for credit_record.csv
+CREDIT_SCHEMA: Dict[str, str] = {
+    "ID": "int32",
+    "MONTHS_BALANCE": "int8",
+    "STATUS": "category",
+}
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Cast columns to the schema dtypes where the cast is lossless
+
+    Integer casts are skipped (with a warning) for columns holding missing,
+    fractional or out-of-range values, so the cached data always equals the
+    CSV contents.
+
+    Args:
+        df: DataFrame parsed with default dtypes
+        schema: Mapping of column name to target dtype
+
+    Returns:
+        DataFrame with typed columns
+    """
+    df = df.copy()
+    for column, dtype in schema.items():
+        if column not in df.columns or str(df[column].dtype) == dtype:
+            continue
+
+        values = df[column]
+        if dtype == "category":
+            df[column] = values.astype("category")
+            continue
+
+        target = np.dtype(dtype)
+        if target.kind in "iu":
+            info = np.iinfo(target)
+            numeric = pd.to_numeric(values, errors="coerce")
+            lossless = (
+                numeric.notna().all()
+                and (numeric % 1 == 0).all()
+                and (len(numeric) == 0 or (numeric.min() >= info.min and numeric.max() <= info.max))
+            )
+            if not lossless:
+                logger.warning(f"Keeping {column} as {values.dtype}: values do not fit {dtype}")
+                continue
+
+        df[column] = values.astype(target)
+    return df
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 checksum of a file
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RawDataCache:
+    """Cache raw CSVs as typed Feather (Arrow IPC) files keyed by source hash"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize RawDataCache
+
+        Args:
+            cache_dir: Directory holding cached files (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(self, csv_path: Path, schema: Dict[str, str]) -> pd.DataFrame:
+        """
+        Load a raw CSV through the cache
+
+        The cached copy is reused while the source SHA-256 and the schema are
+        unchanged. The hash is only recomputed when the file size or mtime
+        differs from the recorded ones.
+
+        Args:
+            csv_path: Source CSV file
+            schema: Mapping of column name to target dtype
+
+        Returns:
+            Typed DataFrame
+        """
+        csv_path = Path(csv_path)
+        data_path = self.cache_dir / f"{csv_path.stem}.feather"
+        meta_path = self.cache_dir / f"{csv_path.stem}.meta.json"
+
+        meta = self._load_meta(meta_path)
+        if meta is not None and data_path.exists() and self._is_fresh(csv_path, schema, meta, meta_path):
+            start = time.perf_counter()
+            df = pd.read_feather(data_path)
+            elapsed = time.perf_counter() - start
+            memory_mb = df.memory_usage(deep=True).sum() / 1024**2
+            logger.info(
+                f"Raw cache hit for {csv_path.name}: loaded in {elapsed:.2f}s, {memory_mb:.1f} MB "
+                f"(CSV parse: {meta['csv_seconds']:.2f}s, {meta['csv_memory_mb']:.1f} MB)"
+            )
+            return df
+
+        logger.info(f"Raw cache miss for {csv_path.name}, parsing CSV...")
+        start = time.perf_counter()
+        raw = pd.read_csv(csv_path)
+        csv_seconds = time.perf_counter() - start
+        csv_memory_mb = raw.memory_usage(deep=True).sum() / 1024**2
+
+        df = apply_schema(raw, schema)
+        del raw
+        memory_mb = df.memory_usage(deep=True).sum() / 1024**2
+
+        tmp_path = data_path.with_suffix(".feather.tmp")
+        df.to_feather(tmp_path)
+        tmp_path.replace(data_path)
+
+        stat = csv_path.stat()
+        meta = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "source": csv_path.name,
+            "sha256": file_sha256(csv_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "schema": schema,
+            "csv_seconds": csv_seconds,
+            "csv_memory_mb": csv_memory_mb,
+        }
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+        logger.info(
+            f"Cached {csv_path.name}: CSV parse {csv_seconds:.2f}s, {csv_memory_mb:.1f} MB -> "
+            f"typed {memory_mb:.1f} MB ({memory_mb / max(csv_memory_mb, 1e-9) * 100:.0f}%)"
+        )
+        return df
+
+    @staticmethod
+    def _load_meta(meta_path: Path) -> Optional[dict]:
+        """Read the cache metadata, or None if missing or unreadable"""
+        if not meta_path.exists():
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache metadata {meta_path}: {e}")
+            return None
+
+    @staticmethod
+    def _is_fresh(csv_path: Path, schema: Dict[str, str], meta: dict, meta_path: Path) -> bool:
+        """Check the cached copy still matches the source file and schema"""
+        if meta.get("format_version") != CACHE_FORMAT_VERSION or meta.get("schema") != schema:
+            return False
+
+        stat = csv_path.stat()
+        if stat.st_size == meta.get("size") and stat.st_mtime_ns == meta.get("mtime_ns"):
+            return True
+
+        if file_sha256(csv_path) != meta.get("sha256"):
+            return False
+
+        # Content unchanged (e.g. file re-copied): record the new mtime to skip hashing next time
+        meta.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        return True
+
+
+__all__ = ["RawDataCache", "APPLICATION_SCHEMA", "CREDIT_SCHEMA", "apply_schema", "file_sha256"]
@@ -19,17 +19,35 @@ from src.utils.scalers import FeatureScaler
 class FeatureEngineer:
     """Handle feature engineering using utility modules"""
 
-    def __init__(self, random_state: int = 42):
-        """Initialize FeatureEngineer"""
+    def __init__(
+        self,
+        random_state: int = 42,
+        resampler: Optional[Resampler] = None,
+        chunk_size: Optional[int] = None,
+        sparse: bool = False,
+    ):
+        """
+        Initialize FeatureEngineer
+
+        Args:
+            random_state: Random seed
+            resampler: Resampler for SMOTE+Tomek (default: exact imblearn SMOTETomek)
+            chunk_size: Fit the scaler and an incremental PCA in chunks of this many rows (default: one shot)
+            sparse: Encode to a CSR matrix and keep it sparse through SMOTE, scaling and PCA
+        """
         self.random_state = random_state
+        self.chunk_size = chunk_size
+        self.sparse = sparse
         self.encoder = FeatureEncoder()
-        self.resampler = Resampler(random_state)
-        self.scaler = FeatureScaler(method="standard")
+        self.resampler = resampler or Resampler(random_state)
+        self.scaler = FeatureScaler(method="standard", chunk_size=chunk_size)
         self.pca = None
         self.feature_names = None
 
-    def encode_features(self, X: pd.DataFrame) -> pd.DataFrame:
-        """Encode categorical features"""
+    def encode_features(self, X: pd.DataFrame):
+        """Encode categorical features (CSR matrix in sparse mode)"""
+        if self.sparse:
+            return self.encoder.sparse_one_hot_encode(X)
         return self.encoder.one_hot_encode(X)
 
     def apply_smote_tomek(self, X: pd.DataFrame, y: pd.Series) -> Tuple[pd.DataFrame, pd.Series]:
@@ -45,7 +63,7 @@ class FeatureEngineer:
     def apply_pca(self, X, n_components: int = 5, fit: bool = True) -> pd.DataFrame:
         """Apply PCA for dimensionality reduction"""
         if fit:
-            self.pca = DimensionalityReducer(n_components, self.random_state)
+            self.pca = DimensionalityReducer(n_components, self.random_state, chunk_size=self.chunk_size)
             return self.pca.fit_transform(X)
         return self.pca.transform(X)
 
@@ -95,6 +113,7 @@ class FeatureEngineer:
         test_size: float = 0.2,
         save_preprocessors: bool = True,
         output_dir: Optional[str] = None,
+        validation_size: float = 0.0,
     ) -> dict:
         """
         Complete feature engineering pipeline
@@ -108,6 +127,8 @@ class FeatureEngineer:
             test_size: Proportion of test set
             save_preprocessors: Whether to save scaler and PCA
             output_dir: Directory to save preprocessors
+            validation_size: Proportion of real training rows held out before SMOTE
+                for early stopping (0 disables; adds X_val and y_val to the result)
 
         Returns:
             Dictionary containing processed data and metadata
@@ -118,7 +139,7 @@ class FeatureEngineer:
 
         # 1. Encode features
         X_encoded = self.encode_features(X)
-        self.feature_names = X_encoded.columns.tolist()
+        self.feature_names = list(self.encoder.feature_names)
 
         # 2. Train-test split FIRST (on real data only!)
         logger.info("Splitting data BEFORE SMOTE to prevent data leakage...")
@@ -128,6 +149,14 @@ class FeatureEngineer:
         logger.info(f"  Train - Good: {sum(y_train==1)}, Bad: {sum(y_train==0)}")
         logger.info(f"  Test - Good: {sum(y_test==1)}, Bad: {sum(y_test==0)}")
 
+        # Early stopping must be validated on real rows too, so hold them out before SMOTE
+        X_val_encoded = y_val = None
+        if validation_size > 0:
+            X_train_encoded, X_val_encoded, y_train, y_val = train_test_split(
+                X_train_encoded, y_train, test_size=validation_size, stratify=y_train, random_state=self.random_state
+            )
+            logger.info(f"Validation (early stopping, before SMOTE): {len(y_val)}, Train: {len(y_train)}")
+
         # 3. Apply SMOTE+Tomek ONLY to training set
         if apply_smote:
             X_train_resampled, y_train_resampled = self.apply_smote_tomek(X_train_encoded, y_train)
@@ -135,20 +164,21 @@ class FeatureEngineer:
             X_train_resampled, y_train_resampled = X_train_encoded, y_train
             logger.info("Skipping SMOTE+Tomek resampling")
 
-        # 4. Scale features (fit on train, transform both)
-        logger.info("Scaling: Fitting on training set, transforming both...")
+        # 4. Scale features (fit on train, transform held-out sets)
+        logger.info("Scaling: Fitting on training set, transforming held-out sets...")
         X_train_scaled = self.scale_features(X_train_resampled, fit=True)
-        X_test_scaled = self.scale_features(X_test_encoded, fit=False)
 
-        # 5. Apply PCA (fit on train, transform both)
+        # 5. Apply PCA (fit on train, transform held-out sets)
         if apply_pca_transform:
-            logger.info("PCA: Fitting on training set, transforming both...")
+            logger.info("PCA: Fitting on training set, transforming held-out sets...")
             X_train = self.apply_pca(X_train_scaled, n_components=n_components, fit=True)
-            X_test = self.apply_pca(X_test_scaled, n_components=n_components, fit=False)
+        elif self.sparse:
+            X_train = pd.DataFrame.sparse.from_spmatrix(X_train_scaled, columns=self.feature_names)
+            logger.info("Skipping PCA transformation")
         else:
             X_train = pd.DataFrame(X_train_scaled, columns=X_train_resampled.columns)
-            X_test = pd.DataFrame(X_test_scaled, columns=X_test_encoded.columns)
             logger.info("Skipping PCA transformation")
+        X_test = self._transform_held_out(X_test_encoded, apply_pca_transform)
 
         # Update to match new variable names
         y_train = y_train_resampled
@@ -181,7 +211,7 @@ class FeatureEngineer:
         logger.info("PIPELINE COMPLETED")
         logger.info("=" * 80)
 
-        return {
+        result = {
             "X_train": X_train,
             "X_test": X_test,
             "y_train": y_train,
@@ -191,6 +221,19 @@ class FeatureEngineer:
             "feature_names": self.feature_names,
             "n_features": X_train.shape[1],
         }
+        if X_val_encoded is not None:
+            result["X_val"] = self._transform_held_out(X_val_encoded, apply_pca_transform)
+            result["y_val"] = y_val
+        return result
+
+    def _transform_held_out(self, X_encoded, apply_pca_transform: bool) -> pd.DataFrame:
+        """Scale (and project) encoded held-out rows with the preprocessors fitted on the training set"""
+        X_scaled = self.scale_features(X_encoded, fit=False)
+        if apply_pca_transform:
+            return self.apply_pca(X_scaled, fit=False)
+        if self.sparse:
+            return pd.DataFrame.sparse.from_spmatrix(X_scaled, columns=self.feature_names)
+        return pd.DataFrame(X_scaled, columns=X_encoded.columns)
 
     def save_preprocessors(self, output_dir: str):
         """Save fitted scaler and PCA"""
@@ -211,6 +254,14 @@ class FeatureEngineer:
 
     def transform_new_data(self, X: pd.DataFrame) -> pd.DataFrame:
         """Transform new data using fitted preprocessors"""
+        if self.sparse:
+            # The fitted vocabulary already yields the training columns
+            X_encoded = self.encoder.sparse_one_hot_encode(X, fit=False)
+            X_scaled = self.scale_features(X_encoded, fit=False)
+            if self.pca:
+                return self.apply_pca(X_scaled, fit=False)
+            return pd.DataFrame.sparse.from_spmatrix(X_scaled, columns=self.encoder.feature_names)
+
         X_encoded = self.encoder.one_hot_encode(X)
 
         # Align features
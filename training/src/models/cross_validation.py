@@ -0,0 +1,430 @@
+"""
+Stratified k-fold cross-validation over the folds x models grid
+"""
+
+import os
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import mlflow
+import numpy as np
+import pandas as pd
+from loguru import logger
+from mlflow.entities import Metric, Param
+from sklearn.model_selection import KFold, StratifiedKFold
+from src.models.train import THREAD_PARAMS, _fit_and_evaluate, _train_model_job, available_cores
+from src.utils.dimensionality import DimensionalityReducer
+from src.utils.helpers import load_config
+from src.utils.mlflow_batch import log_batch
+from src.utils.model_configs import get_model_configs
+from src.utils.resampling import Resampler
+from src.utils.scalers import FeatureScaler
+from src.utils.shared_memory import SharedDataset, attach_shared, detach_shared, spawn_pool
+
+DEFAULT_CV_CONFIG = {"enabled": True, "n_folds": 5, "stratified": True}
+
+CV_METRICS = ["accuracy", "precision", "recall", "f1_score", "roc_auc", "training_time"]
+
+
+def load_cv_config(config_path: Optional[str] = None) -> dict:
+    """
+    Read ``training.cross_validation`` from the config file
+
+    Args:
+        config_path: Path to config file (optional, defaults to src/config/config.yaml)
+
+    Returns:
+        Dictionary with enabled, n_folds and stratified
+    """
+    if config_path is None:
+        config_path = Path(__file__).parent.parent / "config" / "config.yaml"
+
+    config = load_config(str(config_path)) or {}
+    cv_config = (config.get("training") or {}).get("cross_validation") or {}
+    return {**DEFAULT_CV_CONFIG, **cv_config}
+
+
+def make_fold_assignment(y: pd.Series, n_folds: int, stratified: bool = True, random_state: int = 42) -> np.ndarray:
+    """
+    Assign every row to one validation fold
+
+    Args:
+        y: Target Series
+        n_folds: Number of folds
+        stratified: Preserve the class ratio in every fold
+        random_state: Random seed for shuffling
+
+    Returns:
+        int8 array with the validation fold of each row
+    """
+    splitter_class = StratifiedKFold if stratified else KFold
+    splitter = splitter_class(n_splits=n_folds, shuffle=True, random_state=random_state)
+
+    folds = np.empty(len(y), dtype=np.int8)
+    for fold, (_, val_idx) in enumerate(splitter.split(np.zeros(len(y)), y)):
+        folds[val_idx] = fold
+    return folds
+
+
+def prepare_fold(
+    X: pd.DataFrame,
+    y: pd.Series,
+    folds: np.ndarray,
+    fold: int,
+    apply_smote: bool = True,
+    n_components: Optional[int] = 5,
+    random_state: int = 42,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Resample, scale and project one fold, fitting only on its training rows
+
+    Args:
+        X: Encoded features DataFrame
+        y: Target Series
+        folds: Fold assignment from make_fold_assignment
+        fold: Fold held out for validation
+        apply_smote: Whether to apply SMOTE+Tomek to the training rows
+        n_components: Number of PCA components (None skips PCA)
+        random_state: Random seed for SMOTE and PCA
+
+    Returns:
+        Dictionary with X_train, y_train, X_test and y_test (the validation rows)
+    """
+    is_val = np.asarray(folds) == fold
+    X_train, y_train = X[~is_val], y[~is_val]
+    X_val, y_val = X[is_val], y[is_val]
+
+    if apply_smote:
+        X_train, y_train = Resampler(random_state).apply_smote_tomek(X_train, y_train)
+
+    scaler = FeatureScaler(method="standard")
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_val_scaled = scaler.transform(X_val)
+
+    if n_components:
+        pca = DimensionalityReducer(n_components, random_state)
+        X_train_out = pca.fit_transform(X_train_scaled)
+        X_val_out = pca.transform(X_val_scaled)
+    else:
+        X_train_out = pd.DataFrame(X_train_scaled, columns=X.columns)
+        X_val_out = pd.DataFrame(X_val_scaled, columns=X.columns)
+
+    return {
+        "X_train": X_train_out,
+        "y_train": pd.Series(np.asarray(y_train), name=y.name),
+        "X_test": X_val_out,
+        "y_test": pd.Series(np.asarray(y_val), name=y.name),
+    }
+
+
+def _prepare_fold_job(job: dict) -> dict:
+    """Process-pool entry point: map the shared encoded data and prepare one fold"""
+    handles, data = attach_shared(job["specs"])
+    try:
+        prepared = prepare_fold(
+            data["X"],
+            data["y"],
+            data["folds"].to_numpy(),
+            job["fold"],
+            apply_smote=job["apply_smote"],
+            n_components=job["n_components"],
+            random_state=job["random_state"],
+        )
+        # Copy out of the shared blocks before they are closed
+        prepared = {key: value.copy() for key, value in prepared.items()}
+    finally:
+        del data
+        detach_shared(handles)
+    return {"fold": job["fold"], "data": prepared}
+
+
+def _cv_model_job(job: dict) -> dict:
+    """Process-pool entry point: fit one model on one prepared fold"""
+    result = _train_model_job(job)
+    # The fitted model is not needed by the parent; skip pickling it back
+    result.pop("model")
+    result["fold"] = job["fold"]
+    return result
+
+
+def aggregate_fold_metrics(fold_results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate per-fold metrics into mean and standard deviation per model
+
+    Args:
+        fold_results: One row per (Model, Fold) with CV_METRICS columns
+
+    Returns:
+        DataFrame with ``<metric>_mean`` and ``<metric>_std`` columns, sorted by mean F1
+    """
+    metrics = [metric for metric in CV_METRICS if metric in fold_results.columns]
+    summary = fold_results.groupby("Model", sort=False)[metrics].agg(["mean", "std"])
+    summary.columns = [f"{metric}_{stat}" for metric, stat in summary.columns]
+    summary.insert(0, "n_folds", fold_results.groupby("Model", sort=False)["Fold"].nunique())
+    summary = summary.reset_index().sort_values("f1_score_mean", ascending=False)
+    return summary.reset_index(drop=True)
+
+
+class CrossValidator:
+    """Cross-validate candidate models in parallel, refitting preprocessing per fold"""
+
+    def __init__(
+        self,
+        tracking_uri: Optional[str] = None,
+        experiment_name: str = "credit_card_approval_model_training",
+        n_folds: Optional[int] = None,
+        stratified: Optional[bool] = None,
+        apply_smote: bool = True,
+        n_components: Optional[int] = 5,
+        random_state: int = 42,
+        n_cores: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        config_path: Optional[str] = None,
+    ):
+        """
+        Initialize CrossValidator
+
+        Args:
+            tracking_uri: MLflow tracking URI (None keeps the current one)
+            experiment_name: MLflow experiment name
+            n_folds: Number of folds (default: training.cross_validation.n_folds)
+            stratified: Stratify folds by label (default: training.cross_validation.stratified)
+            apply_smote: Whether to apply SMOTE+Tomek inside each fold
+            n_components: Number of PCA components (None skips PCA)
+            random_state: Random seed for folds, SMOTE and PCA
+            n_cores: Cores shared by the grid (default: all available)
+            max_workers: Jobs run at once (default: n_cores; 1 runs in-process)
+            config_path: Path to config file with CV settings and model hyperparameters
+        """
+        cv_config = load_cv_config(config_path)
+        self.n_folds = int(n_folds or cv_config["n_folds"])
+        self.stratified = cv_config["stratified"] if stratified is None else stratified
+        if self.n_folds < 2:
+            raise ValueError(f"n_folds must be at least 2, got {self.n_folds}")
+
+        self.apply_smote = apply_smote
+        self.n_components = n_components
+        self.random_state = random_state
+        self.n_cores = n_cores or available_cores()
+        self.max_workers = max_workers
+        self.config_path = config_path
+
+        if tracking_uri:
+            mlflow.set_tracking_uri(tracking_uri)
+        mlflow.set_experiment(experiment_name)
+
+        self.folds: Optional[np.ndarray] = None
+        self.fold_results: Optional[pd.DataFrame] = None
+        self.summary_df: Optional[pd.DataFrame] = None
+        self.run_ids: Dict[str, str] = {}
+
+    def run(self, X: pd.DataFrame, y: pd.Series, models: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Cross-validate all configured models
+
+        Args:
+            X: Encoded (not resampled, scaled or projected) features
+            y: Target Series
+            models: Model names to evaluate (default: all in config)
+
+        Returns:
+            Summary DataFrame with mean and std of every metric, sorted by mean F1
+        """
+        model_configs = get_model_configs(models, config_path=self.config_path)
+        if not model_configs:
+            raise ValueError(f"No model configurations found for: {models}")
+
+        X = X.reset_index(drop=True).astype(np.float64)
+        y = y.reset_index(drop=True)
+        self.folds = make_fold_assignment(y, self.n_folds, self.stratified, self.random_state)
+
+        n_jobs = self.n_folds * len(model_configs)
+        n_workers = min(self.max_workers or self.n_cores, n_jobs, self.n_cores)
+        n_threads = max(1, self.n_cores // n_workers)
+        jobs = []
+        for fold in range(self.n_folds):
+            for model_name, config in model_configs.items():
+                params = dict(config["params"])
+                job_threads = n_threads if model_name in THREAD_PARAMS else 1
+                if model_name in THREAD_PARAMS:
+                    params[THREAD_PARAMS[model_name]] = job_threads
+                jobs.append(
+                    {
+                        "model_name": model_name,
+                        "model_class": config["class"],
+                        "params": params,
+                        "n_threads": job_threads,
+                        "fold": fold,
+                    }
+                )
+
+        logger.info(
+            f"Cross-validating {len(model_configs)} models x {self.n_folds} "
+            f"{'stratified ' if self.stratified else ''}folds on {self.n_cores} cores ({n_workers} jobs at a time)"
+        )
+
+        start = time.perf_counter()
+        if n_workers == 1:
+            results = self._run_in_process(jobs, X, y)
+        else:
+            results = self._run_in_pool(jobs, X, y, n_workers)
+        elapsed = time.perf_counter() - start
+
+        rows = []
+        for result in results:
+            rows.append(
+                {
+                    "Model": result["model_name"],
+                    "Fold": result["fold"],
+                    **result["metrics"],
+                    "training_time": result["training_time"],
+                }
+            )
+        self.fold_results = pd.DataFrame(rows).sort_values(["Model", "Fold"]).reset_index(drop=True)
+        self.summary_df = aggregate_fold_metrics(self.fold_results)
+
+        for model_name in self.summary_df["Model"]:
+            self.run_ids[model_name] = self._log_model_runs(model_name, model_configs[model_name]["params"])
+
+        serial_time = sum(result["wall_time"] for result in results)
+        logger.info(f"Cross-validation finished in {elapsed:.2f}s wall time ({serial_time:.2f}s summed per job)")
+        for _, row in self.summary_df.iterrows():
+            logger.info(f"  {row['Model']}: F1={row['f1_score_mean']:.4f} ± {row['f1_score_std']:.4f}")
+
+        return self.summary_df
+
+    def _run_in_process(self, jobs: List[dict], X: pd.DataFrame, y: pd.Series) -> List[dict]:
+        """Prepare each fold once, then fit its models one after another"""
+        results = []
+        prepared = None
+        for job in jobs:
+            if prepared is None or prepared["fold"] != job["fold"]:
+                prepared = {
+                    "fold": job["fold"],
+                    "data": prepare_fold(
+                        X, y, self.folds, job["fold"], self.apply_smote, self.n_components, self.random_state
+                    ),
+                }
+            start = time.perf_counter()
+            result = _fit_and_evaluate(job, prepared["data"])
+            result.pop("model")
+            result.update(
+                model_name=job["model_name"],
+                n_threads=job["n_threads"],
+                fold=job["fold"],
+                wall_time=time.perf_counter() - start,
+                pid=os.getpid(),
+            )
+            self._log_result(result)
+            results.append(result)
+        return results
+
+    def _run_in_pool(self, jobs: List[dict], X: pd.DataFrame, y: pd.Series, n_workers: int) -> List[dict]:
+        """Prepare the folds in parallel, then run the folds x models grid from shared memory"""
+        results = []
+        with spawn_pool(n_workers) as executor:
+            folds = pd.Series(self.folds, name="fold")
+            with SharedDataset(X=X, y=y, folds=folds) as shared:
+                fold_jobs = [
+                    {
+                        "fold": fold,
+                        "specs": shared.specs,
+                        "apply_smote": self.apply_smote,
+                        "n_components": self.n_components,
+                        "random_state": self.random_state,
+                    }
+                    for fold in range(self.n_folds)
+                ]
+                prepared = {result["fold"]: result["data"] for result in executor.map(_prepare_fold_job, fold_jobs)}
+            logger.info(f"Prepared {len(prepared)} folds")
+
+            frames = {
+                f"{key}_{fold}": frame for fold, fold_data in prepared.items() for key, frame in fold_data.items()
+            }
+            del prepared
+            with SharedDataset(**frames) as shared:
+                futures = []
+                for job in jobs:
+                    specs = {
+                        key: shared.specs[f"{key}_{job['fold']}"] for key in ("X_train", "y_train", "X_test", "y_test")
+                    }
+                    futures.append(executor.submit(_cv_model_job, {**job, "specs": specs}))
+                for future in as_completed(futures):
+                    result = future.result()
+                    self._log_result(result)
+                    results.append(result)
+        return results
+
+    @staticmethod
+    def _log_result(result: dict) -> None:
+        """Log a finished (model, fold) job to the console"""
+        metrics = result["metrics"]
+        logger.info(
+            f"✓ {result['model_name']} fold {result['fold']}: F1={metrics['f1_score']:.4f} | "
+            f"fit {result['training_time']:.2f}s, {result['n_threads']} thread(s)"
+        )
+
+    def _log_model_runs(self, model_name: str, params: dict) -> Optional[str]:
+        """Log one model's per-fold and aggregated metrics to its own MLflow run in batched requests"""
+        fold_rows = self.fold_results[self.fold_results["Model"] == model_name]
+        summary = self.summary_df.set_index("Model").loc[model_name]
+        timestamp = int(time.time() * 1000)
+
+        metrics = []
+        for _, row in fold_rows.iterrows():
+            for metric in CV_METRICS:
+                value = row.get(metric)
+                if value is not None and pd.notna(value):
+                    metrics.append(Metric(f"cv_{metric}", float(value), timestamp, int(row["Fold"])))
+        for key, value in summary.items():
+            if key != "n_folds" and pd.notna(value):
+                metrics.append(Metric(f"cv_{key}", float(value), timestamp, 0))
+
+        cv_params = {
+            "model_type": model_name,
+            "cv_n_folds": self.n_folds,
+            "cv_stratified": self.stratified,
+            "cv_smote": self.apply_smote,
+            "cv_pca_components": self.n_components,
+            **params,
+        }
+        params_list = [Param(key, str(value)) for key, value in cv_params.items()]
+
+        try:
+            client = mlflow.MlflowClient()
+            with mlflow.start_run(run_name=f"{model_name}_cv") as run:
+                run_id = run.info.run_id
+                log_batch(client, run_id, metrics=metrics, params=params_list)
+                return run_id
+        except Exception as e:
+            logger.warning(f"Could not log {model_name} cross-validation to MLflow: {e}")
+            return None
+
+    def save_results(self, output_dir: str) -> Path:
+        """
+        Save per-fold results and the aggregated summary as CSV
+
+        Args:
+            output_dir: Output directory
+
+        Returns:
+            Path to cv_summary.csv
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        self.fold_results.to_csv(output_path / "cv_fold_results.csv", index=False)
+        summary_path = output_path / "cv_summary.csv"
+        self.summary_df.to_csv(summary_path, index=False)
+        return summary_path
+
+
+__all__ = [
+    "CrossValidator",
+    "aggregate_fold_metrics",
+    "load_cv_config",
+    "make_fold_assignment",
+    "prepare_fold",
+    "CV_METRICS",
+]
@@ -0,0 +1,143 @@
+"""
+Early stopping for the gradient-boosting models
+"""
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+import lightgbm as lgb
+import pandas as pd
+from loguru import logger
+from sklearn.model_selection import train_test_split
+from src.utils.helpers import load_config
+from xgboost import XGBClassifier
+
+EARLY_STOPPING_MODELS = ("XGBoost", "LightGBM", "CatBoost")
+
+DEFAULT_EARLY_STOPPING_CONFIG = {"enabled": False, "patience": 10, "metric": "auc", "validation_size": 0.1}
+
+# Config metric name -> name used by XGBoost, LightGBM and CatBoost
+METRIC_NAMES = {
+    "auc": {"XGBoost": "auc", "LightGBM": "auc", "CatBoost": "AUC"},
+    "logloss": {"XGBoost": "logloss", "LightGBM": "binary_logloss", "CatBoost": "Logloss"},
+}
+
+
+def load_early_stopping_config(config_path: Optional[str] = None) -> dict:
+    """
+    Read ``training.early_stopping`` and ``data.validation_size`` from the config file
+
+    Args:
+        config_path: Path to config file (optional, defaults to src/config/config.yaml)
+
+    Returns:
+        Dictionary with enabled, patience, metric and validation_size
+    """
+    if config_path is None:
+        config_path = Path(__file__).parent.parent / "config" / "config.yaml"
+
+    config = load_config(str(config_path)) or {}
+    early_stopping = dict((config.get("training") or {}).get("early_stopping") or {})
+    validation_size = (config.get("data") or {}).get("validation_size")
+    if validation_size:
+        early_stopping.setdefault("validation_size", validation_size)
+
+    early_stopping = {**DEFAULT_EARLY_STOPPING_CONFIG, **early_stopping}
+    if early_stopping["metric"] not in METRIC_NAMES:
+        raise ValueError(
+            f"Unknown early stopping metric '{early_stopping['metric']}', expected one of {list(METRIC_NAMES)}"
+        )
+    return early_stopping
+
+
+def split_validation(
+    X: pd.DataFrame, y: pd.Series, validation_size: float, random_state: int = 42
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    """
+    Carve a stratified validation split out of the training data
+
+    Args:
+        X: Training features
+        y: Training labels
+        validation_size: Proportion of rows held out for validation
+        random_state: Random seed for the split
+
+    Returns:
+        Tuple of (X_fit, X_val, y_fit, y_val)
+    """
+    return train_test_split(X, y, test_size=validation_size, stratify=y, random_state=random_state)
+
+
+def _truncate_xgboost(model: XGBClassifier, n_iterations: int) -> XGBClassifier:
+    """Rebuild an XGBoost classifier holding only its first n_iterations boosting rounds"""
+    booster = model.get_booster()[:n_iterations]
+    truncated = XGBClassifier(**{**model.get_params(), "early_stopping_rounds": None, "n_estimators": n_iterations})
+    truncated.load_model(booster.save_raw("ubj"))
+    return truncated
+
+
+def fit_with_early_stopping(
+    model_name: str,
+    model,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_val: pd.DataFrame,
+    y_val: pd.Series,
+    patience: int = 10,
+    metric: str = "auc",
+) -> Tuple[object, int]:
+    """
+    Fit a boosting model with early stopping on a validation split
+
+    The returned model keeps only the trees up to the best iteration, so
+    it predicts exactly like the best iteration and serializes smaller.
+
+    Args:
+        model_name: One of EARLY_STOPPING_MODELS
+        model: Unfitted XGBoost, LightGBM or CatBoost classifier
+        X_train: Training features
+        y_train: Training labels
+        X_val: Validation features monitored for early stopping
+        y_val: Validation labels
+        patience: Rounds without improvement before stopping
+        metric: Monitored metric (key of METRIC_NAMES)
+
+    Returns:
+        Tuple of (fitted and truncated model, number of boosting iterations kept)
+    """
+    if model_name not in EARLY_STOPPING_MODELS:
+        raise ValueError(f"Early stopping is not supported for {model_name}")
+    metric_name = METRIC_NAMES[metric][model_name]
+
+    if model_name == "XGBoost":
+        model.set_params(early_stopping_rounds=patience, eval_metric=metric_name)
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False)
+        n_iterations = model.best_iteration + 1
+        if n_iterations < model.get_booster().num_boosted_rounds():
+            model = _truncate_xgboost(model, n_iterations)
+    elif model_name == "LightGBM":
+        # lgb.train re-serializes the booster at its best iteration, dropping the later trees
+        model.fit(
+            X_train,
+            y_train,
+            eval_set=[(X_val, y_val)],
+            eval_metric=metric_name,
+            callbacks=[lgb.early_stopping(patience, first_metric_only=True, verbose=False)],
+        )
+        n_iterations = model.booster_.num_trees()
+    else:
+        # use_best_model shrinks the model to the best iteration
+        model.set_params(eval_metric=metric_name)
+        model.fit(X_train, y_train, eval_set=(X_val, y_val), early_stopping_rounds=patience, use_best_model=True)
+        n_iterations = model.tree_count_
+
+    logger.info(f"{model_name} early stopping: kept {n_iterations} iteration(s) (metric={metric}, patience={patience})")
+    return model, n_iterations
+
+
+__all__ = [
+    "EARLY_STOPPING_MODELS",
+    "fit_with_early_stopping",
+    "load_early_stopping_config",
+    "split_validation",
+]
@@ -0,0 +1,468 @@
+"""
+Multi-model training with a process pool and per-model core budgets
+"""
+
+import json
+import os
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import joblib
+import mlflow
+import pandas as pd
+from loguru import logger
+from src.models.early_stopping import (
+    EARLY_STOPPING_MODELS,
+    fit_with_early_stopping,
+    load_early_stopping_config,
+    split_validation,
+)
+from src.utils.metrics import calculate_metrics
+from src.utils.mlflow_async import AsyncMLflowLogger
+from src.utils.model_configs import get_model_configs
+from src.utils.shared_memory import SharedDataset, attach_shared, detach_shared, spawn_pool
+from threadpoolctl import threadpool_limits
+
+# Constructor argument controlling each library's thread count; other models are single-threaded
+THREAD_PARAMS = {
+    "XGBoost": "n_jobs",
+    "LightGBM": "n_jobs",
+    "CatBoost": "thread_count",
+}
+
+# MLflow flavor saving each model; others are logged with mlflow.sklearn
+MODEL_FLAVORS = {
+    "XGBoost": "xgboost",
+    "LightGBM": "lightgbm",
+    "CatBoost": "catboost",
+}
+
+RESULT_COLUMNS = ["Model", "Accuracy", "Precision", "Recall", "F1-Score", "ROC-AUC", "Training Time (s)"]
+
+
+def available_cores() -> int:
+    """Number of CPU cores this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def allocate_threads(model_names: List[str], total_cores: int, max_concurrent: Optional[int] = None) -> Dict[str, int]:
+    """
+    Split cores between trained models
+
+    When all models run at once, every model gets one core and cores left
+    over go to the multi-threaded libraries (see THREAD_PARAMS) as evenly as
+    possible. When fewer run at once, any model may share the machine with
+    any other, so each multi-threaded library gets one concurrent slot's
+    share of the cores.
+
+    Args:
+        model_names: Models to train
+        total_cores: Cores available to the whole pool
+        max_concurrent: Models trained at the same time (default: all of them)
+
+    Returns:
+        Mapping of model name to thread count
+    """
+    budget = {name: 1 for name in model_names}
+    threaded = [name for name in model_names if name in THREAD_PARAMS]
+    if max_concurrent is not None and max_concurrent < len(model_names):
+        slot_cores = max(1, total_cores // max(1, max_concurrent))
+        budget.update({name: slot_cores for name in threaded})
+        return budget
+    spare = total_cores - len(model_names)
+    if spare > 0 and threaded:
+        share, extra = divmod(spare, len(threaded))
+        for i, name in enumerate(threaded):
+            budget[name] += share + (1 if i < extra else 0)
+    return budget
+
+
+def _fit_and_evaluate(job: dict, data: Dict[str, pd.DataFrame]) -> dict:
+    """Fit one model and score it on the test split within its thread budget"""
+    with threadpool_limits(limits=job["n_threads"]):
+        model = job["model_class"](**job["params"])
+
+        early_stopping = job.get("early_stopping")
+        best_iteration = None
+        start = time.perf_counter()
+        if early_stopping:
+            if "X_val" in data:
+                X_fit, X_val, y_fit, y_val = data["X_train"], data["X_val"], data["y_train"], data["y_val"]
+            else:
+                X_fit, X_val, y_fit, y_val = split_validation(
+                    data["X_train"], data["y_train"], early_stopping["validation_size"], job.get("random_state", 42)
+                )
+            model, best_iteration = fit_with_early_stopping(
+                job["model_name"],
+                model,
+                X_fit,
+                y_fit,
+                X_val,
+                y_val,
+                patience=early_stopping["patience"],
+                metric=early_stopping["metric"],
+            )
+        else:
+            model.fit(data["X_train"], data["y_train"])
+        training_time = time.perf_counter() - start
+
+        y_pred = model.predict(data["X_test"])
+        y_pred_proba = model.predict_proba(data["X_test"])[:, 1] if hasattr(model, "predict_proba") else None
+        metrics = calculate_metrics(data["y_test"], y_pred, y_pred_proba)
+
+    return {
+        "model": model,
+        "metrics": metrics,
+        "training_time": training_time,
+        "best_iteration": best_iteration,
+        "early_stopping": early_stopping,
+    }
+
+
+def _train_model_job(job: dict) -> dict:
+    """Process-pool entry point: map the shared splits, then fit and evaluate"""
+    start = time.perf_counter()
+    handles, data = attach_shared(job["specs"])
+    try:
+        result = _fit_and_evaluate(job, data)
+    finally:
+        del data
+        detach_shared(handles)
+
+    result.update(
+        model_name=job["model_name"],
+        n_threads=job["n_threads"],
+        wall_time=time.perf_counter() - start,
+        pid=os.getpid(),
+    )
+    return result
+
+
+class ModelTrainer:
+    """Train candidate models concurrently, log them to MLflow and pick the best"""
+
+    def __init__(
+        self,
+        tracking_uri: Optional[str] = None,
+        experiment_name: str = "credit_card_approval_model_training",
+        n_cores: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        config_path: Optional[str] = None,
+        early_stopping: Optional[bool] = None,
+        mlflow_logger: Optional[AsyncMLflowLogger] = None,
+    ):
+        """
+        Initialize ModelTrainer
+
+        Args:
+            tracking_uri: MLflow tracking URI (None keeps the current one)
+            experiment_name: MLflow experiment name
+            n_cores: Cores to split between models (default: all available)
+            max_workers: Models trained at once (default: one per model, capped at n_cores; 1 trains in-process)
+            config_path: Path to config file with model hyperparameters
+            early_stopping: Early-stop the boosting models (default: training.early_stopping.enabled)
+            mlflow_logger: Background MLflow logger (default: a new one for the tracking URI)
+        """
+        self.n_cores = n_cores or available_cores()
+        self.max_workers = max_workers
+        self.config_path = config_path
+        self.early_stopping = load_early_stopping_config(config_path)
+        if early_stopping is not None:
+            self.early_stopping["enabled"] = early_stopping
+
+        if tracking_uri:
+            mlflow.set_tracking_uri(tracking_uri)
+        self.experiment_id = mlflow.set_experiment(experiment_name).experiment_id
+        self.mlflow_logger = mlflow_logger or AsyncMLflowLogger(mlflow.MlflowClient())
+
+        self.trained_models: Dict[str, object] = {}
+        self.run_ids: Dict[str, str] = {}
+        self.results_df: Optional[pd.DataFrame] = None
+        self.best_model_name: Optional[str] = None
+        self.best_score: Optional[float] = None
+        self.best_model_run_id: Optional[str] = None
+
+    def train_all_models(
+        self,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        X_test: pd.DataFrame,
+        y_test: pd.Series,
+        models: Optional[List[str]] = None,
+        X_val: Optional[pd.DataFrame] = None,
+        y_val: Optional[pd.Series] = None,
+    ) -> pd.DataFrame:
+        """
+        Train and evaluate all configured models
+
+        Each model is logged to MLflow as soon as it finishes; uploads run in the
+        background while the remaining models train and are flushed before returning
+
+        Args:
+            X_train: Training features
+            y_train: Training labels
+            X_test: Test features
+            y_test: Test labels
+            models: Model names to train (default: all in config)
+            X_val: Real (pre-SMOTE) validation features for early stopping
+            y_val: Validation labels for early stopping
+
+        Returns:
+            Comparison DataFrame sorted by F1-Score
+        """
+        model_configs = get_model_configs(models, config_path=self.config_path)
+        if not model_configs:
+            raise ValueError(f"No model configurations found for: {models}")
+
+        n_workers = min(self.max_workers or len(model_configs), len(model_configs), self.n_cores)
+        # Threads are budgeted per concurrent slot, so every model gets a share whenever it runs
+        budget = allocate_threads(list(model_configs), self.n_cores, max_concurrent=n_workers)
+
+        jobs = []
+        for model_name, config in model_configs.items():
+            n_threads = budget[model_name]
+            params = dict(config["params"])
+            if model_name in THREAD_PARAMS:
+                params[THREAD_PARAMS[model_name]] = n_threads
+            use_early_stopping = self.early_stopping["enabled"] and model_name in EARLY_STOPPING_MODELS
+            jobs.append(
+                {
+                    "model_name": model_name,
+                    "model_class": config["class"],
+                    "params": params,
+                    "n_threads": n_threads,
+                    "early_stopping": self.early_stopping if use_early_stopping else None,
+                }
+            )
+
+        logger.info(f"Training {len(jobs)} models on {self.n_cores} cores ({n_workers} at a time)")
+        for job in jobs:
+            logger.info(f"  {job['model_name']}: {job['n_threads']} thread(s)")
+
+        start = time.perf_counter()
+        data = {"X_train": X_train, "y_train": y_train, "X_test": X_test, "y_test": y_test}
+        if X_val is not None and y_val is not None:
+            data.update(X_val=X_val, y_val=y_val)
+        elif any(job["early_stopping"] for job in jobs):
+            logger.warning(
+                "No pre-SMOTE validation split given; early stopping validates on resampled training rows "
+                "(re-run preprocessing with --validation-size to hold out real rows)"
+            )
+        if n_workers == 1:
+            results = self._train_in_process(jobs, data)
+        else:
+            results = self._train_in_pool(jobs, data, n_workers)
+        elapsed = time.perf_counter() - start
+
+        flush_start = time.perf_counter()
+        if not self.mlflow_logger.flush():
+            logger.warning("Some MLflow logging requests failed; see the warnings above")
+        logger.info(f"MLflow logging finished {time.perf_counter() - flush_start:.2f}s after training")
+
+        rows = []
+        for result in results:
+            self.trained_models[result["model_name"]] = result["model"]
+            metrics = result["metrics"]
+            rows.append(
+                {
+                    "Model": result["model_name"],
+                    "Accuracy": metrics["accuracy"],
+                    "Precision": metrics["precision"],
+                    "Recall": metrics["recall"],
+                    "F1-Score": metrics["f1_score"],
+                    "ROC-AUC": metrics.get("roc_auc"),
+                    "Training Time (s)": result["training_time"],
+                }
+            )
+
+        serial_time = sum(result["wall_time"] for result in results)
+        logger.info(f"All models trained in {elapsed:.2f}s wall time ({serial_time:.2f}s summed per model)")
+
+        results_df = pd.DataFrame(rows, columns=RESULT_COLUMNS).sort_values("F1-Score", ascending=False)
+        self.results_df = results_df.reset_index(drop=True)
+        return self.results_df
+
+    def _train_in_process(self, jobs: List[dict], data: Dict[str, pd.DataFrame]) -> List[dict]:
+        """Train models one after another in this process"""
+        results = []
+        for job in jobs:
+            start = time.perf_counter()
+            result = _fit_and_evaluate(job, data)
+            result.update(
+                model_name=job["model_name"],
+                n_threads=job["n_threads"],
+                wall_time=time.perf_counter() - start,
+                pid=os.getpid(),
+            )
+            self._log_result(result)
+            self.run_ids[result["model_name"]] = self._log_run(result)
+            results.append(result)
+        return results
+
+    def _train_in_pool(self, jobs: List[dict], data: Dict[str, pd.DataFrame], n_workers: int) -> List[dict]:
+        """Train models in worker processes reading the splits from shared memory"""
+        results = []
+        with SharedDataset(**data) as shared, spawn_pool(n_workers) as executor:
+            futures = {executor.submit(_train_model_job, {**job, "specs": shared.specs}): job for job in jobs}
+            for future in as_completed(futures):
+                result = future.result()
+                self._log_result(result)
+                self.run_ids[result["model_name"]] = self._log_run(result)
+                results.append(result)
+
+        order = {job["model_name"]: i for i, job in enumerate(jobs)}
+        return sorted(results, key=lambda result: order[result["model_name"]])
+
+    @staticmethod
+    def _log_result(result: dict) -> None:
+        """Log a finished model to the console"""
+        metrics = result["metrics"]
+        roc_auc = metrics.get("roc_auc")
+        best_iteration = result.get("best_iteration")
+        logger.info(
+            f"✓ {result['model_name']}: F1={metrics['f1_score']:.4f}"
+            f"{f', ROC-AUC={roc_auc:.4f}' if roc_auc is not None else ''} | "
+            f"fit {result['training_time']:.2f}s, wall {result['wall_time']:.2f}s, {result['n_threads']} thread(s)"
+            f"{f', best iteration {best_iteration}' if best_iteration is not None else ''}"
+        )
+
+    def _log_run(self, result: dict) -> Optional[str]:
+        """Queue one model's parameters, metrics, timings and artifact for its own MLflow run"""
+        model_name = result["model_name"]
+        model = result["model"]
+        try:
+            run_id = mlflow.MlflowClient().create_run(self.experiment_id, run_name=model_name).info.run_id
+        except Exception as e:
+            logger.warning(f"Could not log {model_name} to MLflow: {e}")
+            return None
+
+        params = {"model_type": model_name, **model.get_params(), "n_threads": result["n_threads"]}
+        metrics = {
+            **{key: value for key, value in result["metrics"].items() if value is not None},
+            "training_time": result["training_time"],
+            "wall_time": result["wall_time"],
+        }
+        if result.get("best_iteration") is not None:
+            early_stopping = result["early_stopping"]
+            params.update(
+                early_stopping_patience=early_stopping["patience"],
+                early_stopping_metric=early_stopping["metric"],
+                early_stopping_validation_size=early_stopping["validation_size"],
+            )
+            metrics["best_iteration"] = result["best_iteration"]
+
+        status = "FINISHED"
+        try:
+            self.mlflow_logger.log_params(run_id, params)
+            self.mlflow_logger.log_metrics(run_id, metrics)
+            flavor = getattr(mlflow, MODEL_FLAVORS.get(model_name, "sklearn"))
+            self.mlflow_logger.log_model(run_id, flavor, model, artifact_path="model")
+        except Exception as e:
+            logger.warning(f"Could not log {model_name} to MLflow: {e}")
+            status = "FAILED"
+        self.mlflow_logger.end_run(run_id, status)
+        return run_id
+
+    def save_best_model(self, output_dir: str, metric: str = "F1-Score") -> Tuple[Path, Path]:
+        """
+        Save the best model by a comparison metric
+
+        Args:
+            output_dir: Output directory
+            metric: Column of the comparison table to maximize
+
+        Returns:
+            Tuple of (model_path, metadata_path)
+        """
+        if self.results_df is None or self.results_df.empty:
+            raise ValueError("No trained models; call train_all_models first")
+        if metric not in self.results_df.columns:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {RESULT_COLUMNS[1:]}")
+
+        best = self.results_df.sort_values(metric, ascending=False).iloc[0]
+        self.best_model_name = best["Model"]
+        self.best_score = float(best[metric])
+        self.best_model_run_id = self.run_ids.get(self.best_model_name)
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        model_path = output_path / f"best_model_{self.best_model_name.replace(' ', '_').lower()}.pkl"
+        joblib.dump(self.trained_models[self.best_model_name], model_path)
+
+        metadata = {
+            "model_name": self.best_model_name,
+            "metric": metric,
+            "metrics": {key: (None if pd.isna(value) else value) for key, value in best.to_dict().items()},
+            "run_id": self.best_model_run_id,
+            "trained_on": pd.Timestamp.now().isoformat(),
+        }
+        metadata_path = output_path / "best_model_metadata.json"
+        with open(metadata_path, "w") as f:
+            json.dump(metadata, f, indent=2, default=str)
+
+        return model_path, metadata_path
+
+    def save_comparison_results(self, output_dir: str) -> Path:
+        """
+        Save the model comparison table as CSV
+
+        Args:
+            output_dir: Output directory
+
+        Returns:
+            Path to model_comparison.csv
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        results_path = output_path / "model_comparison.csv"
+        self.results_df.to_csv(results_path, index=False)
+        return results_path
+
+    def create_training_summary(self, X_train: pd.DataFrame, X_test: pd.DataFrame, output_dir: str) -> Path:
+        """
+        Write a plain-text training summary
+
+        Args:
+            X_train: Training features
+            X_test: Test features
+            output_dir: Output directory
+
+        Returns:
+            Path to training_summary.txt
+        """
+        best = self.results_df.set_index("Model").loc[self.best_model_name]
+        roc_auc = best["ROC-AUC"]
+        roc_auc_str = f"{roc_auc:.4f}" if pd.notna(roc_auc) else "N/A"
+
+        summary_text = f"""MODEL TRAINING COMPLETED
+
+Models Trained: {len(self.results_df)}
+  {', '.join(self.results_df['Model'])}
+
+Best Model: {self.best_model_name}
+  - Accuracy:  {best['Accuracy']:.4f}
+  - Precision: {best['Precision']:.4f}
+  - Recall:    {best['Recall']:.4f}
+  - F1-Score:  {best['F1-Score']:.4f}
+  - ROC-AUC:   {roc_auc_str}
+  - MLflow run: {self.best_model_run_id}
+
+Training Data:
+  - Training samples: {len(X_train):,}
+  - Test samples: {len(X_test):,}
+  - Features: {X_train.shape[1]}
+"""
+        summary_path = Path(output_dir) / "training_summary.txt"
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_path, "w") as f:
+            f.write(summary_text)
+        return summary_path
+
+
+__all__ = ["ModelTrainer", "allocate_threads", "available_cores", "THREAD_PARAMS"]
@@ -0,0 +1,450 @@
+"""
+Parallel hyperparameter search with successive halving
+"""
+
+import json
+import math
+import os
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import mlflow
+import numpy as np
+import pandas as pd
+import yaml
+from loguru import logger
+from mlflow.entities import Metric, Param
+from src.models.early_stopping import split_validation
+from src.models.train import THREAD_PARAMS, _fit_and_evaluate, available_cores
+from src.utils.helpers import load_config
+from src.utils.mlflow_batch import log_batch
+from src.utils.model_configs import get_model_configs
+from src.utils.shared_memory import SharedDataset, attach_shared, detach_shared, spawn_pool
+
+DEFAULT_TUNING_CONFIG = {
+    "metric": "roc_auc",
+    "n_trials": 27,
+    "eta": 3,
+    "min_budget": 0.1,
+    "validation_size": 0.2,
+    "search_spaces": {},
+}
+
+PARAM_TYPES = ("int", "float", "choice")
+
+
+def load_tuning_config(config_path: Optional[str] = None) -> dict:
+    """
+    Read the ``tuning`` section from the config file
+
+    Args:
+        config_path: Path to config file (optional, defaults to src/config/config.yaml)
+
+    Returns:
+        Dictionary with metric, n_trials, eta, min_budget, validation_size and search_spaces
+    """
+    if config_path is None:
+        config_path = Path(__file__).parent.parent / "config" / "config.yaml"
+
+    config = load_config(str(config_path)) or {}
+    return {**DEFAULT_TUNING_CONFIG, **(config.get("tuning") or {})}
+
+
+def _to_builtin(value):
+    """Convert numpy scalars so sampled values round-trip through JSON and YAML"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def sample_params(space: Dict[str, dict], rng: np.random.Generator) -> dict:
+    """
+    Draw one configuration from a declarative search space
+
+    Each entry is ``{type: int|float, low, high, log?, step?}`` or
+    ``{type: choice, values: [...]}``.
+
+    Args:
+        space: Mapping of parameter name to its distribution
+        rng: Random generator
+
+    Returns:
+        Dictionary of sampled parameter values
+    """
+    params = {}
+    for name, spec in space.items():
+        kind = spec.get("type")
+        if kind == "choice":
+            value = spec["values"][rng.integers(len(spec["values"]))]
+        elif kind in ("int", "float"):
+            low, high = float(spec["low"]), float(spec["high"])
+            if spec.get("log"):
+                value = math.exp(rng.uniform(math.log(low), math.log(high)))
+            else:
+                value = rng.uniform(low, high)
+            if spec.get("step"):
+                value = low + round((value - low) / spec["step"]) * spec["step"]
+            value = int(round(value)) if kind == "int" else float(value)
+        else:
+            raise ValueError(f"Unknown type '{kind}' for parameter {name}, expected one of {PARAM_TYPES}")
+        params[name] = _to_builtin(value)
+    return params
+
+
+def halving_budgets(min_budget: float, eta: int) -> List[float]:
+    """
+    Data fractions of the successive-halving rungs, ending at the full data
+
+    Args:
+        min_budget: Fraction of the training rows used by the first rung
+        eta: Factor by which the budget grows and the survivors shrink per rung
+
+    Returns:
+        List of budgets in (0, 1], smallest first
+    """
+    if not 0 < min_budget <= 1:
+        raise ValueError(f"min_budget must be in (0, 1], got {min_budget}")
+    if eta < 2:
+        raise ValueError(f"eta must be at least 2, got {eta}")
+    n_rungs = int(math.floor(math.log(1 / min_budget, eta) + 1e-9)) + 1
+    return [min(1.0, min_budget * eta**rung) for rung in range(n_rungs - 1)] + [1.0]
+
+
+def _stratified_order(y: pd.Series, random_state: int) -> np.ndarray:
+    """Row order whose every prefix keeps the class ratio, so small budgets see both classes"""
+    rng = np.random.default_rng(random_state)
+    keys = np.empty(len(y))
+    for label in np.unique(y):
+        idx = np.flatnonzero(np.asarray(y) == label)
+        keys[rng.permutation(idx)] = (np.arange(len(idx)) + rng.random()) / len(idx)
+    return np.argsort(keys, kind="stable")
+
+
+def _evaluate_trial(job: dict, data: Dict[str, pd.DataFrame]) -> dict:
+    """Fit one configuration on the first n_rows training rows and score it on validation"""
+    budget_data = {
+        "X_train": data["X_train"].iloc[: job["n_rows"]],
+        "y_train": data["y_train"].iloc[: job["n_rows"]],
+        "X_test": data["X_test"],
+        "y_test": data["y_test"],
+    }
+    start = time.perf_counter()
+    result = _fit_and_evaluate(job, budget_data)
+    result.pop("model")
+    result["wall_time"] = time.perf_counter() - start
+    result["pid"] = os.getpid()
+    return result
+
+
+def _trial_job(job: dict) -> dict:
+    """Process-pool entry point: map the shared splits and evaluate one trial"""
+    handles, data = attach_shared(job["specs"])
+    try:
+        result = _evaluate_trial(job, data)
+    finally:
+        del data
+        detach_shared(handles)
+    return result
+
+
+class HyperparameterSearch:
+    """Search model hyperparameters with successive halving over data budgets"""
+
+    def __init__(
+        self,
+        tracking_uri: Optional[str] = None,
+        experiment_name: str = "credit_card_approval_hyperparameter_search",
+        trial_log: str = "models/tuning_trials.jsonl",
+        n_trials: Optional[int] = None,
+        eta: Optional[int] = None,
+        min_budget: Optional[float] = None,
+        metric: Optional[str] = None,
+        random_state: int = 42,
+        n_cores: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        config_path: Optional[str] = None,
+    ):
+        """
+        Initialize HyperparameterSearch
+
+        Args:
+            tracking_uri: MLflow tracking URI (None keeps the current one)
+            experiment_name: MLflow experiment name
+            trial_log: JSONL file recording every finished trial; existing entries are reused
+            n_trials: Configurations sampled per model (default: tuning.n_trials)
+            eta: Halving factor (default: tuning.eta)
+            min_budget: Data fraction of the first rung (default: tuning.min_budget)
+            metric: Validation metric to maximize (default: tuning.metric)
+            random_state: Seed for sampling, data order and the validation split
+            n_cores: Cores shared by concurrent trials (default: all available)
+            max_workers: Trials run at once (default: n_cores; 1 runs in-process)
+            config_path: Path to config file with search spaces and base hyperparameters
+        """
+        tuning_config = load_tuning_config(config_path)
+        self.n_trials = int(n_trials or tuning_config["n_trials"])
+        self.eta = int(eta or tuning_config["eta"])
+        self.min_budget = float(min_budget or tuning_config["min_budget"])
+        self.metric = metric or tuning_config["metric"]
+        self.validation_size = float(tuning_config["validation_size"])
+        self.search_spaces = tuning_config["search_spaces"] or {}
+        self.budgets = halving_budgets(self.min_budget, self.eta)
+
+        self.trial_log = Path(trial_log)
+        self.random_state = random_state
+        self.n_cores = n_cores or available_cores()
+        self.max_workers = max_workers
+        self.config_path = config_path
+
+        if tracking_uri:
+            mlflow.set_tracking_uri(tracking_uri)
+        mlflow.set_experiment(experiment_name)
+
+        self.trials: Optional[pd.DataFrame] = None
+        self.best_params: Dict[str, dict] = {}
+        self.best_scores: Dict[str, float] = {}
+        self.run_ids: Dict[str, str] = {}
+
+    def _load_trial_log(self) -> Dict[tuple, dict]:
+        """Read finished trials keyed by (model, trial, rung)"""
+        finished = {}
+        if self.trial_log.exists():
+            with open(self.trial_log, "r") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        finished[(record["model"], record["trial"], record["rung"])] = record
+            logger.info(f"Resuming from {self.trial_log} ({len(finished)} finished trials)")
+        return finished
+
+    def _append_trial_log(self, record: dict) -> None:
+        """Append one finished trial to the log, flushed so an interrupted search can resume"""
+        self.trial_log.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.trial_log, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _sample_candidates(self, model_name: str, base_params: dict) -> List[dict]:
+        """Sample the model's configurations; the seed makes them identical across resumes"""
+        space = self.search_spaces.get(model_name) or {}
+        seed = [self.random_state, *model_name.encode()]
+        rng = np.random.default_rng(seed)
+        n_trials = self.n_trials if space else 1
+        return [{**base_params, **sample_params(space, rng)} for _ in range(n_trials)]
+
+    def run(self, X: pd.DataFrame, y: pd.Series, models: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Search hyperparameters of all configured models
+
+        Args:
+            X: Training features (a validation split is carved from them)
+            y: Training labels
+            models: Model names to tune (default: all with a search space)
+
+        Returns:
+            DataFrame with the best validation score and parameters per model
+        """
+        if models is None:
+            models = list(self.search_spaces)
+        model_configs = get_model_configs(models, config_path=self.config_path)
+        if not model_configs:
+            raise ValueError(f"No model configurations found for: {models}")
+
+        X_fit, X_val, y_fit, y_val = split_validation(X, y, self.validation_size, self.random_state)
+        order = _stratified_order(y_fit, self.random_state)
+        data = {
+            "X_train": X_fit.iloc[order].reset_index(drop=True),
+            "y_train": y_fit.iloc[order].reset_index(drop=True),
+            "X_test": X_val.reset_index(drop=True),
+            "y_test": y_val.reset_index(drop=True),
+        }
+        n_rows = len(data["y_train"])
+
+        candidates = {
+            name: self._sample_candidates(name, dict(config["params"])) for name, config in model_configs.items()
+        }
+        survivors = {name: list(range(len(configs))) for name, configs in candidates.items()}
+        finished = self._load_trial_log()
+        records = []
+
+        logger.info(
+            f"Successive halving over {len(model_configs)} models: {self.n_trials} trials, eta={self.eta}, "
+            f"budgets={[round(budget, 3) for budget in self.budgets]}, metric={self.metric}"
+        )
+
+        start = time.perf_counter()
+        executor = None
+        shared = None
+        try:
+            for rung, budget in enumerate(self.budgets):
+                rung_rows = max(self.eta * 2, int(round(budget * n_rows)))
+                jobs, rung_records = [], []
+                for model_name, trial_ids in survivors.items():
+                    for trial in trial_ids:
+                        params = candidates[model_name][trial]
+                        record = finished.get((model_name, trial, rung))
+                        if record is not None:
+                            if record["params"] != params:
+                                raise ValueError(
+                                    f"{self.trial_log} was written by a different search "
+                                    f"({model_name} trial {trial} has other params); use a new trial log"
+                                )
+                            rung_records.append(record)
+                            continue
+                        jobs.append(
+                            {
+                                "model_name": model_name,
+                                "model_class": model_configs[model_name]["class"],
+                                "params": params,
+                                "trial": trial,
+                                "rung": rung,
+                                "budget": budget,
+                                "n_rows": min(rung_rows, n_rows),
+                            }
+                        )
+
+                n_workers = min(self.max_workers or self.n_cores, max(len(jobs), 1), self.n_cores)
+                n_threads = max(1, self.n_cores // n_workers)
+                for job in jobs:
+                    job["n_threads"] = n_threads if job["model_name"] in THREAD_PARAMS else 1
+                    if job["model_name"] in THREAD_PARAMS:
+                        job["params"] = {**job["params"], THREAD_PARAMS[job["model_name"]]: job["n_threads"]}
+
+                logger.info(
+                    f"Rung {rung}: {len(jobs) + len(rung_records)} trials on {min(rung_rows, n_rows):,} rows "
+                    f"({len(rung_records)} from the trial log)"
+                )
+
+                if jobs and n_workers > 1 and executor is None:
+                    executor = spawn_pool(n_workers)
+                    shared = SharedDataset(**data)
+
+                if executor is None:
+                    results = (dict(_evaluate_trial(job, data), job=job) for job in jobs)
+                else:
+                    futures = {executor.submit(_trial_job, {**job, "specs": shared.specs}): job for job in jobs}
+                    results = (dict(future.result(), job=futures[future]) for future in as_completed(futures))
+
+                for result in results:
+                    record = self._make_record(result)
+                    self._append_trial_log(record)
+                    rung_records.append(record)
+                    logger.info(
+                        f"✓ {record['model']} trial {record['trial']} rung {rung}: "
+                        f"{self.metric}={record['score']:.4f} ({record['training_time']:.2f}s)"
+                    )
+
+                records.extend(rung_records)
+                if rung < len(self.budgets) - 1:
+                    survivors = self._promote(rung_records)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if shared is not None:
+                shared.close()
+
+        logger.info(f"Search finished in {time.perf_counter() - start:.2f}s")
+
+        self.trials = pd.DataFrame(records)
+        final = self.trials[self.trials["rung"] == len(self.budgets) - 1]
+        rows = []
+        for model_name in model_configs:
+            best = final[final["model"] == model_name].sort_values("score", ascending=False).iloc[0]
+            self.best_params[model_name] = best["params"]
+            self.best_scores[model_name] = float(best["score"])
+            self.run_ids[model_name] = self._log_search(model_name)
+            rows.append(
+                {
+                    "Model": model_name,
+                    "Best Trial": int(best["trial"]),
+                    f"Best {self.metric}": float(best["score"]),
+                    "Trials": int((self.trials["model"] == model_name).sum()),
+                    "Params": json.dumps(best["params"], default=str),
+                }
+            )
+        return pd.DataFrame(rows).sort_values(f"Best {self.metric}", ascending=False).reset_index(drop=True)
+
+    def _make_record(self, result: dict) -> dict:
+        """Turn a trial result into a JSON-serializable trial log record"""
+        job = result["job"]
+        metrics = {key: value for key, value in result["metrics"].items() if value is not None}
+        if self.metric not in metrics:
+            raise ValueError(f"Metric '{self.metric}' not available for {job['model_name']}")
+        params = {key: value for key, value in job["params"].items() if key != THREAD_PARAMS.get(job["model_name"])}
+        return {
+            "model": job["model_name"],
+            "trial": job["trial"],
+            "rung": job["rung"],
+            "budget": job["budget"],
+            "n_rows": job["n_rows"],
+            "params": params,
+            "score": float(metrics[self.metric]),
+            "metrics": {key: float(value) for key, value in metrics.items()},
+            "training_time": result["training_time"],
+        }
+
+    def _promote(self, rung_records: List[dict]) -> Dict[str, List[int]]:
+        """Keep the top 1/eta trials of each model for the next rung"""
+        survivors = {}
+        for model_name in dict.fromkeys(record["model"] for record in rung_records):
+            ranked = sorted(
+                (record for record in rung_records if record["model"] == model_name),
+                key=lambda record: (-record["score"], record["trial"]),
+            )
+            survivors[model_name] = [record["trial"] for record in ranked[: max(1, len(ranked) // self.eta)]]
+        return survivors
+
+    def _log_search(self, model_name: str) -> Optional[str]:
+        """Log one model's trials and best configuration to its own MLflow run in batched requests"""
+        trials = self.trials[self.trials["model"] == model_name]
+        timestamp = int(time.time() * 1000)
+        metrics = [
+            Metric(f"rung{int(row['rung'])}_{self.metric}", float(row["score"]), timestamp, int(row["trial"]))
+            for _, row in trials.iterrows()
+        ]
+        metrics.append(Metric(f"best_{self.metric}", self.best_scores[model_name], timestamp, 0))
+
+        search_params = {
+            "model_type": model_name,
+            "n_trials": self.n_trials,
+            "eta": self.eta,
+            "min_budget": self.min_budget,
+            "metric": self.metric,
+            **self.best_params[model_name],
+        }
+        params = [Param(key, str(value)) for key, value in search_params.items()]
+
+        try:
+            client = mlflow.MlflowClient()
+            with mlflow.start_run(run_name=f"{model_name}_search") as run:
+                log_batch(client, run.info.run_id, metrics=metrics, params=params)
+                return run.info.run_id
+        except Exception as e:
+            logger.warning(f"Could not log {model_name} search to MLflow: {e}")
+            return None
+
+    def save_best_params(self, output_path: str) -> Path:
+        """
+        Write the best configurations in the config.yaml ``model.hyperparameters`` layout
+
+        Args:
+            output_path: YAML file to write
+
+        Returns:
+            Path to the written file
+        """
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(
+                {"model": {"hyperparameters": self.best_params}}, f, default_flow_style=False, sort_keys=False
+            )
+        return path
+
+
+__all__ = [
+    "HyperparameterSearch",
+    "halving_budgets",
+    "load_tuning_config",
+    "sample_params",
+]
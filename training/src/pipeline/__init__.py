@@ -0,0 +1 @@
+"""Pipeline orchestration module"""
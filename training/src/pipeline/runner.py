@@ -0,0 +1,390 @@
+"""
+Stage-level pipeline runner with content-hash caching
+
+Each stage is a command with declared inputs, parameters and outputs. Its
+fingerprint hashes the command, the parameters and the contents of every
+input, so a stage is skipped when neither its inputs nor its configuration
+changed since its last successful run and its outputs are still in place.
+A stage that reads another stage's output waits for it; independent stages
+run in parallel.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+from src.data.raw_cache import file_sha256
+
+STATE_DIR = ".pipeline"
+STATE_FILE = "state.json"
+HASH_CACHE_FILE = "hash_cache.json"
+REPORT_FILE = "run_report.json"
+IGNORED_NAMES = ("__pycache__", ".ipynb_checkpoints", ".DS_Store")
+IGNORED_SUFFIXES = (".pyc", ".tmp")
+
+# Terminal stage states; only 'ran' and 'skipped' unblock downstream stages
+SUCCEEDED = ("ran", "skipped")
+
+
+class Stage:
+    """A pipeline step: a command with declared inputs, parameters and outputs"""
+
+    def __init__(
+        self,
+        name: str,
+        command: List[str],
+        inputs: Optional[List[str]] = None,
+        outputs: Optional[List[str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cwd: str = ".",
+        env: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize Stage
+
+        Args:
+            name: Unique stage name
+            command: Argument list to execute
+            inputs: Files or directories read by the stage, relative to the pipeline root
+            outputs: Files or directories written by the stage, relative to the pipeline root
+            params: Settings that change the result (part of the fingerprint and report)
+            cwd: Working directory, relative to the pipeline root
+            env: Extra environment variables
+        """
+        self.name = name
+        self.command = [str(arg) for arg in command]
+        self.inputs = list(inputs or [])
+        self.outputs = list(outputs or [])
+        self.params = dict(params or {})
+        self.cwd = cwd
+        self.env = dict(env or {})
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r})"
+
+
+def _contains(parent: str, child: str) -> bool:
+    """Whether relative path child equals parent or lies below it"""
+    parent_parts, child_parts = Path(parent).parts, Path(child).parts
+    return child_parts[: len(parent_parts)] == parent_parts
+
+
+class FileHasher:
+    """Content hashes of files and directories, cached by (size, mtime) per file"""
+
+    def __init__(self, root: Path, cache: Optional[Dict[str, list]] = None):
+        """
+        Initialize FileHasher
+
+        Args:
+            root: Pipeline root the hashed paths are relative to
+            cache: Previous cache mapping relative path to [size, mtime_ns, sha256]
+        """
+        self.root = root
+        self.cache = dict(cache or {})
+        self._lock = threading.Lock()
+
+    def hash_file(self, path: Path) -> str:
+        """Return the SHA-256 of a file, re-reading it only when its size or mtime changed"""
+        stat = path.stat()
+        key = path.relative_to(self.root).as_posix()
+        with self._lock:
+            cached = self.cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        digest = file_sha256(path)
+        with self._lock:
+            self.cache[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def hash_path(self, relative_path: str) -> Optional[str]:
+        """
+        Hash a file or a directory tree
+
+        Args:
+            relative_path: Path relative to the root
+
+        Returns:
+            Hex digest, or None when the path does not exist
+        """
+        path = self.root / relative_path
+        if path.is_file():
+            return self.hash_file(path)
+        if not path.is_dir():
+            return None
+
+        digest = hashlib.sha256()
+        for file_path in sorted(path.rglob("*")):
+            relative_parts = file_path.relative_to(path).parts
+            if not file_path.is_file() or any(part in IGNORED_NAMES for part in relative_parts):
+                continue
+            if file_path.suffix in IGNORED_SUFFIXES:
+                continue
+            digest.update(f"{file_path.relative_to(path).as_posix()}\0{self.hash_file(file_path)}\n".encode())
+        return digest.hexdigest()
+
+
+def stage_fingerprint(stage: Stage, hasher: FileHasher) -> str:
+    """
+    Fingerprint a stage from its command, parameters and input contents
+
+    Args:
+        stage: Stage to fingerprint
+        hasher: FileHasher for the input contents
+
+    Returns:
+        Hex digest
+    """
+    payload = {
+        "name": stage.name,
+        "command": stage.command,
+        "cwd": stage.cwd,
+        "env": stage.env,
+        "params": stage.params,
+        "inputs": {path: hasher.hash_path(path) for path in stage.inputs},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class PipelineRunner:
+    """Run stages in dependency order, skipping those whose fingerprint is unchanged"""
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        root: str = ".",
+        max_workers: Optional[int] = None,
+        force: Iterable[str] = (),
+        state_dir: Optional[str] = None,
+    ):
+        """
+        Initialize PipelineRunner
+
+        Args:
+            stages: Stages in declaration order
+            root: Directory all stage paths are relative to
+            max_workers: Stages run at the same time (default: one per CPU, at most one per stage)
+            force: Names of stages to run even when their fingerprint is unchanged
+            state_dir: Directory for fingerprints, hash cache, logs and report (default: <root>/.pipeline)
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        unknown = set(force) - set(self.stages)
+        if unknown:
+            raise ValueError(f"Unknown stages to force: {sorted(unknown)}")
+
+        self.root = Path(root).resolve()
+        self.state_dir = Path(state_dir) if state_dir else self.root / STATE_DIR
+        self.max_workers = max_workers or max(1, min(len(stages), os.cpu_count() or 1))
+        self.force = set(force)
+        self.dependencies = self._resolve_dependencies()
+        self.state: Dict[str, dict] = {}
+        self.hasher: Optional[FileHasher] = None
+
+    def _resolve_dependencies(self) -> Dict[str, List[str]]:
+        """Link each stage to the stages producing its inputs and reject overlaps and cycles"""
+        producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                for existing, producer in producers.items():
+                    if _contains(existing, output) or _contains(output, existing):
+                        raise ValueError(f"Outputs overlap: '{output}' ({stage.name}) and '{existing}' ({producer})")
+                producers[output] = stage.name
+
+        dependencies = {}
+        for stage in self.stages.values():
+            upstream = {
+                producer
+                for output, producer in producers.items()
+                for path in stage.inputs
+                if producer != stage.name and (_contains(output, path) or _contains(path, output))
+            }
+            dependencies[stage.name] = sorted(upstream, key=list(self.stages).index)
+
+        visiting, done = set(), set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage '{name}'")
+            visiting.add(name)
+            for upstream_name in dependencies[name]:
+                visit(upstream_name)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+        return dependencies
+
+    def _load_json(self, name: str) -> dict:
+        """Read a JSON file from the state directory ({} when missing or corrupt)"""
+        try:
+            with open(self.state_dir / name, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_json(self, name: str, data: dict):
+        """Atomically write a JSON file to the state directory"""
+        path = self.state_dir / name
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        tmp_path.replace(path)
+
+    def _outputs_digest(self, stage: Stage) -> Optional[Dict[str, str]]:
+        """Hash every declared output (None when any is missing)"""
+        digests = {path: self.hasher.hash_path(path) for path in stage.outputs}
+        return None if any(digest is None for digest in digests.values()) else digests
+
+    def _execute(self, stage: Stage) -> dict:
+        """Run or skip one stage and describe the outcome"""
+        started = time.perf_counter()
+        result = {
+            "stage": stage.name,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "params": stage.params,
+            "depends_on": self.dependencies[stage.name],
+        }
+        fingerprint = stage_fingerprint(stage, self.hasher)
+        result["fingerprint"] = fingerprint
+
+        previous = self.state.get(stage.name, {})
+        if (
+            stage.name not in self.force
+            and previous.get("fingerprint") == fingerprint
+            and previous.get("outputs") == self._outputs_digest(stage)
+        ):
+            result.update(status="skipped", seconds=round(time.perf_counter() - started, 3))
+            return result
+
+        log_path = self.state_dir / "logs" / f"{stage.name}.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "w", encoding="utf-8") as log_file:
+            completed = subprocess.run(
+                stage.command,
+                cwd=self.root / stage.cwd,
+                env={**os.environ, **stage.env},
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                check=False,
+            )
+
+        outputs = self._outputs_digest(stage) if completed.returncode == 0 else None
+        if completed.returncode != 0:
+            status, error = "failed", f"exit code {completed.returncode}"
+        elif outputs is None:
+            status, error = "failed", "declared outputs missing after run"
+        else:
+            status, error = "ran", None
+        result.update(
+            status=status,
+            returncode=completed.returncode,
+            log=str(log_path),
+            seconds=round(time.perf_counter() - started, 3),
+            outputs=outputs,
+        )
+        if error:
+            result["error"] = error
+        return result
+
+    def run(self, stages: Optional[Iterable[str]] = None) -> dict:
+        """
+        Run the pipeline and write the run report
+
+        Args:
+            stages: Subset of stage names to run (default: all); other stages are not
+                run and their outputs count as plain inputs
+
+        Returns:
+            Run report with one entry per stage in declaration order
+        """
+        selected = list(self.stages) if stages is None else list(stages)
+        unknown = set(selected) - set(self.stages)
+        if unknown:
+            raise ValueError(f"Unknown stages: {sorted(unknown)}")
+
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.state = self._load_json(STATE_FILE)
+        self.hasher = FileHasher(self.root, self._load_json(HASH_CACHE_FILE))
+
+        started_at = datetime.now(timezone.utc).isoformat()
+        started = time.perf_counter()
+        results: Dict[str, dict] = {}
+        pending = [name for name in self.stages if name in selected]
+
+        logger.info(f"Running {len(pending)} stages with up to {self.max_workers} in parallel")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while pending or running:
+                for name in list(pending):
+                    upstream = [dep for dep in self.dependencies[name] if dep in selected]
+                    if any(results.get(dep, {}).get("status") in ("failed", "blocked") for dep in upstream):
+                        pending.remove(name)
+                        results[name] = {"stage": name, "status": "blocked", "depends_on": upstream}
+                        logger.warning(f"✗ {name}: blocked by a failed upstream stage")
+                    elif all(results.get(dep, {}).get("status") in SUCCEEDED for dep in upstream):
+                        pending.remove(name)
+                        running[executor.submit(self._execute, self.stages[name])] = name
+                        logger.info(f"→ {name}: started")
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {"stage": name, "status": "failed", "error": str(e)}
+                    results[name] = result
+                    if result["status"] == "ran":
+                        self.state[name] = {"fingerprint": result["fingerprint"], "outputs": result["outputs"]}
+                        self._save_json(STATE_FILE, self.state)
+                    self._log_result(result)
+
+        self._save_json(HASH_CACHE_FILE, self.hasher.cache)
+        failed = any(result["status"] in ("failed", "blocked") for result in results.values())
+        report = {
+            "started_at": started_at,
+            "seconds": round(time.perf_counter() - started, 3),
+            "status": "failed" if failed else "success",
+            "max_workers": self.max_workers,
+            "stages": [results[name] for name in self.stages if name in results],
+        }
+        self._save_json(REPORT_FILE, report)
+        logger.info(f"Run report: {self.state_dir / REPORT_FILE}")
+        return report
+
+    @staticmethod
+    def _log_result(result: dict):
+        """Log the outcome of one stage"""
+        name, status = result["stage"], result["status"]
+        if status == "ran":
+            logger.info(f"✓ {name}: ran in {result['seconds']:.1f}s")
+        elif status == "skipped":
+            logger.info(f"✓ {name}: unchanged, skipped")
+        else:
+            logger.error(f"✗ {name}: {result.get('error', status)} (log: {result.get('log', '-')})")
+
+
+__all__ = [
+    "Stage",
+    "FileHasher",
+    "PipelineRunner",
+    "stage_fingerprint",
+    "STATE_DIR",
+    "REPORT_FILE",
+]
@@ -0,0 +1,218 @@
+"""
+Default stages of the training pipeline
+
+Paths are relative to the repository root. Scripts under training/ run from
+training/ (as documented), evaluate_model.py runs from the repository root
+(as in CI). Code inputs list the script and the src packages it imports, so
+editing code reruns only the stages that use it.
+"""
+
+import sys
+from typing import List, Optional
+
+from src.pipeline.runner import Stage
+
+DEFAULT_STAGES = ("download", "preprocess", "train", "evaluate")
+OPTIONAL_STAGES = ("eda", "cross_validation", "tuning")
+
+CONFIG = "training/src/config/config.yaml"
+RAW_DIR = "training/data/raw"
+PROCESSED_DIR = "training/data/processed"
+MODELS_DIR = "training/models"
+
+
+def build_stages(
+    mlflow_uri: str = "http://127.0.0.1:5000",
+    model_name: str = "card_approval_model",
+    test_size: float = 0.2,
+    pca_components: int = 5,
+    smote: bool = True,
+    models: Optional[List[str]] = None,
+    f1_threshold: float = 0.90,
+    include: Optional[List[str]] = None,
+    python: str = sys.executable,
+) -> List[Stage]:
+    """
+    Build the training pipeline stages
+
+    Args:
+        mlflow_uri: MLflow tracking URI
+        model_name: Registered model name
+        test_size: Held-out test set size
+        pca_components: Number of PCA components
+        smote: Whether to apply SMOTE+Tomek resampling
+        models: Models to train, tune and cross-validate (default: all)
+        f1_threshold: F1 quality gate of the evaluation stage
+        include: Stage names to build (default: DEFAULT_STAGES)
+        python: Interpreter running the scripts
+
+    Returns:
+        Stages in execution order
+    """
+    include = list(DEFAULT_STAGES if include is None else include)
+    unknown = set(include) - set(DEFAULT_STAGES) - set(OPTIONAL_STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {sorted(unknown)}")
+
+    model_args = ["--models", *models] if models else []
+    smote_args = [] if smote else ["--no-smote"]
+    split_params = {"test_size": test_size, "pca_components": pca_components, "smote": smote}
+
+    stages = [
+        Stage(
+            "download",
+            [python, "scripts/download_data.py", "--output-dir", "data/raw"],
+            inputs=["training/scripts/download_data.py"],
+            outputs=[RAW_DIR],
+            cwd="training",
+        ),
+        Stage(
+            "eda",
+            [python, "scripts/run_eda.py", "--raw-data-dir", "data/raw", "--output-dir", "outputs/eda"],
+            inputs=[RAW_DIR, "training/scripts/run_eda.py", "training/src/data"],
+            outputs=["training/outputs/eda"],
+            cwd="training",
+        ),
+        Stage(
+            "preprocess",
+            [
+                python,
+                "scripts/run_preprocessing.py",
+                "--raw-data-dir",
+                "data/raw",
+                "--output-dir",
+                "data/processed",
+                "--test-size",
+                test_size,
+                "--pca-components",
+                pca_components,
+                *smote_args,
+            ],
+            inputs=[
+                RAW_DIR,
+                "training/scripts/run_preprocessing.py",
+                "training/src/data",
+                "training/src/features",
+                "training/src/utils",
+            ],
+            outputs=[PROCESSED_DIR],
+            params=split_params,
+            cwd="training",
+        ),
+        Stage(
+            "cross_validation",
+            [
+                python,
+                "scripts/run_cross_validation.py",
+                "--raw-data-dir",
+                "data/raw",
+                "--output-dir",
+                "outputs/cross_validation",
+                "--mlflow-uri",
+                mlflow_uri,
+                "--test-size",
+                test_size,
+                "--pca-components",
+                pca_components,
+                *smote_args,
+                *model_args,
+            ],
+            inputs=[
+                RAW_DIR,
+                CONFIG,
+                "training/scripts/run_cross_validation.py",
+                "training/src/data",
+                "training/src/features",
+                "training/src/models",
+                "training/src/utils",
+            ],
+            outputs=["training/outputs/cross_validation"],
+            params={**split_params, "models": models},
+            cwd="training",
+        ),
+        Stage(
+            "train",
+            [
+                python,
+                "scripts/run_training.py",
+                "--data-dir",
+                "data/processed",
+                "--output-dir",
+                "models",
+                "--mlflow-uri",
+                mlflow_uri,
+                "--model-name",
+                model_name,
+                *model_args,
+            ],
+            inputs=[
+                PROCESSED_DIR,
+                CONFIG,
+                "training/scripts/run_training.py",
+                "training/src/data",
+                "training/src/models",
+                "training/src/utils",
+            ],
+            outputs=[MODELS_DIR],
+            params={"models": models, "model_name": model_name},
+            cwd="training",
+        ),
+        Stage(
+            "tuning",
+            [
+                python,
+                "scripts/run_tuning.py",
+                "--data-dir",
+                "data/processed",
+                "--output-dir",
+                "outputs/tuning",
+                "--mlflow-uri",
+                mlflow_uri,
+                *model_args,
+            ],
+            inputs=[
+                PROCESSED_DIR,
+                CONFIG,
+                "training/scripts/run_tuning.py",
+                "training/src/data",
+                "training/src/models",
+                "training/src/utils",
+            ],
+            outputs=["training/outputs/tuning"],
+            params={"models": models},
+            cwd="training",
+        ),
+        Stage(
+            "evaluate",
+            [
+                python,
+                "scripts/evaluate_model.py",
+                "--data-dir",
+                PROCESSED_DIR,
+                "--tracking-uri",
+                mlflow_uri,
+                "--model-name",
+                model_name,
+                "--threshold",
+                f1_threshold,
+                "--output-file",
+                "training/outputs/evaluation/model-info.env",
+            ],
+            # The trained models tie evaluation to the registry version the train stage produced
+            inputs=[
+                MODELS_DIR,
+                PROCESSED_DIR,
+                "scripts/evaluate_model.py",
+                "training/src/data",
+                "training/src/utils",
+                "app/utils",
+            ],
+            outputs=["training/outputs/evaluation/model-info.env"],
+            params={"f1_threshold": f1_threshold, "model_name": model_name},
+            env={"PYTHONPATH": ".:training"},
+        ),
+    ]
+    return [stage for stage in stages if stage.name in include]
+
+
+__all__ = ["build_stages", "DEFAULT_STAGES", "OPTIONAL_STAGES"]
@@ -2,27 +2,94 @@
 Dimensionality reduction utilities
 """
 
+from typing import Optional
+
 import joblib
 import numpy as np
 import pandas as pd
 from loguru import logger
-from sklearn.decomposition import PCA
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator, svds
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.utils.extmath import svd_flip
+from src.utils.helpers import iter_row_chunks
+
+
+def fit_sparse_pca(X: sparse.spmatrix, n_components: int, random_state: int = 42) -> PCA:
+    """
+    Fit PCA on a sparse matrix without densifying it
+
+    The column means are subtracted implicitly inside ARPACK's matrix products,
+    so the result equals PCA on the centered dense matrix. It is returned as a
+    regular fitted PCA so the saved artifact works wherever a PCA is expected.
+
+    Args:
+        X: Sparse features matrix (n_samples x n_features)
+        n_components: Number of principal components (< min(n_samples, n_features))
+        random_state: Seed of the ARPACK start vector
+
+    Returns:
+        Fitted PCA
+    """
+    X = sparse.csr_matrix(X, dtype=np.float64)
+    n_samples, n_features = X.shape
+    mean = np.asarray(X.mean(axis=0)).ravel()
+
+    def matmat(V):
+        return X @ V - np.outer(np.ones(n_samples), mean @ V)
+
+    def rmatmat(U):
+        return X.T @ U - np.outer(mean, U.sum(axis=0))
+
+    centered = LinearOperator(
+        (n_samples, n_features),
+        matvec=lambda v: matmat(v.reshape(-1, 1)).ravel(),
+        rmatvec=lambda u: rmatmat(u.reshape(-1, 1)).ravel(),
+        matmat=matmat,
+        rmatmat=rmatmat,
+        dtype=np.float64,
+    )
+    v0 = np.random.RandomState(random_state).uniform(-1, 1, min(n_samples, n_features))
+    U, S, Vt = svds(centered, k=n_components, v0=v0)
+    order = np.argsort(S)[::-1]
+    U, Vt = svd_flip(U[:, order], Vt[order])
+    S = S[order]
+
+    total_var = (np.asarray(X.multiply(X).sum(axis=0)).ravel() - n_samples * mean**2).sum() / (n_samples - 1)
+    explained_variance = S**2 / (n_samples - 1)
+
+    pca = PCA(n_components=n_components, random_state=random_state)
+    pca.n_features_in_ = n_features
+    pca.n_samples_ = n_samples
+    pca.n_components_ = n_components
+    pca.mean_ = mean
+    pca.components_ = Vt
+    pca.singular_values_ = S
+    pca.explained_variance_ = explained_variance
+    pca.explained_variance_ratio_ = explained_variance / total_var
+    pca.noise_variance_ = max(total_var - explained_variance.sum(), 0.0) / max(n_features - n_components, 1)
+    return pca
 
 
 class DimensionalityReducer:
     """Handle dimensionality reduction operations"""
 
-    def __init__(self, n_components: int = 5, random_state: int = 42):
+    def __init__(self, n_components: int = 5, random_state: int = 42, chunk_size: Optional[int] = None):
         """
         Initialize DimensionalityReducer
 
         Args:
             n_components: Number of principal components
             random_state: Random seed for reproducibility
+            chunk_size: Fit an IncrementalPCA in chunks of this many rows (default: None, exact PCA)
         """
         self.n_components = n_components
         self.random_state = random_state
-        self.pca = PCA(n_components=n_components, random_state=random_state)
+        self.chunk_size = chunk_size
+        if chunk_size is None:
+            self.pca = PCA(n_components=n_components, random_state=random_state)
+        else:
+            self.pca = IncrementalPCA(n_components=n_components, batch_size=chunk_size)
 
     def fit_transform(self, X: np.ndarray) -> pd.DataFrame:
         """
@@ -34,8 +101,19 @@ class DimensionalityReducer:
         Returns:
             PCA-transformed DataFrame
         """
-        logger.info("Applying PCA for dimensionality reduction...")
-        X_pca = self.pca.fit_transform(X)
+        if sparse.issparse(X):
+            logger.info("Applying sparse PCA (implicitly centered ARPACK SVD)...")
+            self.pca = fit_sparse_pca(X, self.n_components, self.random_state)
+            X_pca = self._transform_sparse(X)
+        elif self.chunk_size is None:
+            logger.info("Applying PCA for dimensionality reduction...")
+            X_pca = self.pca.fit_transform(X)
+        else:
+            logger.info(f"Fitting incremental PCA in chunks of {self.chunk_size:,} rows...")
+            self.pca = IncrementalPCA(n_components=self.n_components, batch_size=self.chunk_size)
+            for chunk in iter_row_chunks(X, self.chunk_size, min_rows=self.n_components):
+                self.partial_fit(chunk)
+            X_pca = self._transform_chunks(X)
 
         logger.info(f"PCA components: {X_pca.shape[1]}")
         logger.info("Explained variance ratio:")
@@ -60,13 +138,49 @@ class DimensionalityReducer:
             PCA-transformed DataFrame
         """
         logger.info("Transforming features with existing PCA...")
-        X_pca = self.pca.transform(X)
+        if sparse.issparse(X):
+            X_pca = self._transform_sparse(X)
+        elif self.chunk_size is None:
+            X_pca = self.pca.transform(X)
+        else:
+            X_pca = self._transform_chunks(X)
 
         # Convert to DataFrame
         X_pca_df = pd.DataFrame(X_pca, columns=[f"PC{i+1}" for i in range(self.n_components)])
 
         return X_pca_df
 
+    def partial_fit(self, X_chunk: np.ndarray):
+        """
+        Update the incremental PCA with one chunk of rows
+
+        Args:
+            X_chunk: Scaled features chunk with at least n_components rows
+
+        Returns:
+            self
+        """
+        if not isinstance(self.pca, IncrementalPCA):
+            raise ValueError("partial_fit requires chunked mode (chunk_size)")
+        self.pca.partial_fit(X_chunk)
+        return self
+
+    def _transform_sparse(self, X: sparse.spmatrix) -> np.ndarray:
+        """Project sparse rows, subtracting the mean after the sparse product"""
+        if getattr(self.pca, "whiten", False):
+            raise ValueError("Whitened PCA does not support sparse input")
+        components = self.pca.components_
+        return np.asarray(X @ components.T) - self.pca.mean_ @ components.T
+
+    def _transform_chunks(self, X: np.ndarray) -> np.ndarray:
+        """Project X chunk by chunk into a preallocated array"""
+        X_pca = np.empty((len(X), self.n_components), dtype=np.float64)
+        start = 0
+        for chunk in iter_row_chunks(X, self.chunk_size):
+            X_pca[start : start + len(chunk)] = self.pca.transform(chunk)
+            start += len(chunk)
+        return X_pca
+
     def save(self, filepath: str):
         """Save PCA model to disk"""
         joblib.dump(self.pca, filepath)
@@ -78,4 +192,4 @@ class DimensionalityReducer:
         logger.info(f"Loaded PCA from {filepath}")
 
 
-__all__ = ["DimensionalityReducer"]
+__all__ = ["DimensionalityReducer", "fit_sparse_pca"]
@@ -2,10 +2,12 @@
 Feature encoding utilities
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from loguru import logger
+from scipy import sparse
 
 
 class FeatureEncoder:
@@ -14,6 +16,7 @@ class FeatureEncoder:
     def __init__(self):
         """Initialize FeatureEncoder"""
         self.feature_names: Optional[List[str]] = None
+        self.categories: Optional[Dict[str, list]] = None
 
     def one_hot_encode(self, X: pd.DataFrame, drop_first: bool = True) -> pd.DataFrame:
         """
@@ -39,6 +42,59 @@ class FeatureEncoder:
 
         return X_encoded
 
+    def sparse_one_hot_encode(self, X: pd.DataFrame, drop_first: bool = True, fit: bool = True) -> sparse.csr_matrix:
+        """
+        One-hot encode categorical features into a CSR matrix
+
+        Columns follow pd.get_dummies (numeric columns first, then one indicator
+        per category level), so feature_names match the dense encoding. With
+        fit=False the stored vocabulary is reused and unseen levels encode as zeros.
+
+        Args:
+            X: Input features DataFrame
+            drop_first: Whether to drop first category (default: True)
+            fit: Learn the category vocabulary from X (default: True)
+
+        Returns:
+            Encoded CSR matrix (float64)
+        """
+        logger.info("Encoding categorical features (sparse)...")
+        logger.info(f"Original features: {X.shape[1]}")
+
+        if fit:
+            self.categories = {}
+            for col in X.select_dtypes(include=["object", "string", "category"]).columns:
+                if isinstance(X[col].dtype, pd.CategoricalDtype):
+                    self.categories[col] = list(X[col].cat.categories)
+                else:
+                    self.categories[col] = sorted(X[col].dropna().unique())
+        elif self.categories is None:
+            raise ValueError("Vocabulary not fitted. Call sparse_one_hot_encode with fit=True first.")
+
+        numeric_columns = [col for col in X.columns if col not in self.categories]
+        feature_names = list(numeric_columns)
+        blocks = [sparse.csr_matrix(X[numeric_columns].to_numpy(dtype=np.float64))]
+        rows = np.arange(len(X))
+        for col, levels in self.categories.items():
+            kept_levels = levels[1:] if drop_first else levels
+            codes = pd.Categorical(X[col], categories=levels).codes.astype(np.int64) - int(drop_first)
+            present = codes >= 0
+            blocks.append(
+                sparse.csr_matrix(
+                    (np.ones(present.sum()), (rows[present], codes[present])),
+                    shape=(len(X), len(kept_levels)),
+                )
+            )
+            feature_names.extend(f"{col}_{level}" for level in kept_levels)
+
+        X_encoded = sparse.hstack(blocks, format="csr")
+        density = X_encoded.nnz / max(X_encoded.shape[0] * X_encoded.shape[1], 1)
+        logger.info(f"Encoded features: {X_encoded.shape[1]} (density {density:.1%})")
+
+        self.feature_names = feature_names
+
+        return X_encoded
+
     def align_features(self, X: pd.DataFrame, reference_columns: List[str]) -> pd.DataFrame:
         """
         Align DataFrame features with reference columns
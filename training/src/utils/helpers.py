@@ -2,6 +2,7 @@
 Utility functions for card approval prediction
 """
 from pathlib import Path
+from typing import Iterator
 
 import yaml
 
@@ -26,3 +27,32 @@ def ensure_dir(directory: str):
 def get_project_root() -> Path:
     """Get project root directory"""
     return Path(__file__).parent.parent.parent
+
+
+def iter_row_chunks(X, chunk_size: int, min_rows: int = 1) -> Iterator:
+    """
+    Yield consecutive row slices of a DataFrame or array
+
+    Slicing a memory-mapped array reads only the rows of the current chunk.
+    A trailing chunk shorter than min_rows is merged into the one before it.
+
+    Args:
+        X: DataFrame, numpy array or memory-mapped array
+        chunk_size: Rows per chunk
+        min_rows: Minimum rows of any chunk (e.g. n_components for IncrementalPCA)
+
+    Returns:
+        Iterator over row slices
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    rows = X.iloc if hasattr(X, "iloc") else X
+    n_rows = len(X)
+    chunk_size = max(chunk_size, min_rows)
+    start = 0
+    while start < n_rows:
+        stop = start + chunk_size
+        if n_rows - stop < min_rows:
+            stop = n_rows
+        yield rows[start:stop]
+        start = stop
@@ -2,25 +2,129 @@
 Metrics calculation utilities
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
 from loguru import logger
-from sklearn.metrics import (
-    accuracy_score,
-    classification_report,
-    f1_score,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-)
+from sklearn.metrics import classification_report
+
+# Budget for one bootstrap batch's resample-count matrix (float64 cells)
+BOOTSTRAP_BATCH_CELLS = 4_000_000
+
+
+def _binary_labels(y: np.ndarray, name: str) -> np.ndarray:
+    """Boolean positives of 0/1 (or boolean) labels"""
+    y = np.asarray(y).ravel()
+    if y.dtype == bool:
+        return y
+    positives = y == 1
+    if not np.all(positives | (y == 0)):
+        raise ValueError(f"{name} must contain only 0/1 labels")
+    return positives
+
+
+def confusion_counts(y_true: pd.Series, y_pred: np.ndarray) -> Dict[str, int]:
+    """
+    Binary confusion matrix in one pass over the labels
+
+    Args:
+        y_true: True 0/1 labels
+        y_pred: Predicted 0/1 labels
+
+    Returns:
+        Dictionary with tn, fp, fn and tp
+    """
+    truth = _binary_labels(y_true, "y_true")
+    pred = _binary_labels(y_pred, "y_pred")
+    if len(truth) != len(pred):
+        raise ValueError(f"y_true has {len(truth)} labels but y_pred has {len(pred)}")
+
+    tn, fp, fn, tp = np.bincount(2 * truth + pred, minlength=4)
+    return {"tn": int(tn), "fp": int(fp), "fn": int(fn), "tp": int(tp)}
+
+
+def metrics_from_counts(tn, fp, fn, tp) -> Dict:
+    """
+    Accuracy, precision, recall and F1 from confusion counts
+
+    Counts may be scalars or arrays (e.g. one entry per bootstrap resample);
+    undefined ratios are 0 like sklearn's zero_division=0.
+
+    Args:
+        tn: True negatives
+        fp: False positives
+        fn: False negatives
+        tp: True positives
+
+    Returns:
+        Dictionary of metrics with the shape of the counts
+    """
+    tn, fp, fn, tp = (np.asarray(count, dtype=np.float64) for count in (tn, fp, fn, tp))
+    total = tn + fp + fn + tp
+
+    def ratio(numerator, denominator):
+        return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+    metrics = {
+        "accuracy": ratio(tp + tn, total),
+        "precision": ratio(tp, tp + fp),
+        "recall": ratio(tp, tp + fn),
+        "f1_score": ratio(2 * tp, 2 * tp + fp + fn),
+    }
+    return {key: float(value) if value.ndim == 0 else value for key, value in metrics.items()}
+
+
+def _rank_groups(y_true: np.ndarray, y_pred_proba: np.ndarray):
+    """Score-sorted order and the start of each run of tied scores"""
+    scores = np.asarray(y_pred_proba, dtype=np.float64).ravel()
+    if len(scores) != len(y_true):
+        raise ValueError(f"y_true has {len(y_true)} labels but y_pred_proba has {len(scores)} scores")
+    order = np.argsort(scores, kind="mergesort")
+    starts = np.r_[0, np.flatnonzero(np.diff(scores[order])) + 1]
+    return order, starts
+
+
+def _weighted_auc(weights: np.ndarray, positives: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    ROC AUC (Mann-Whitney U) of sample-weighted, score-sorted data, one row of weights per resample
+
+    Ties count half, as in sklearn's roc_auc_score; rows without both classes give NaN.
+    """
+    weights = np.atleast_2d(weights)
+    pos = np.add.reduceat(weights * positives, starts, axis=1)
+    neg = np.add.reduceat(weights * ~positives, starts, axis=1)
+    neg_below = np.cumsum(neg, axis=1) - neg
+    n_pos, n_neg = pos.sum(axis=1), neg.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (pos * (neg_below + 0.5 * neg)).sum(axis=1) / (n_pos * n_neg)
+
+
+def roc_auc(y_true: pd.Series, y_pred_proba: np.ndarray) -> float:
+    """
+    ROC AUC from one sort of the scores
+
+    Args:
+        y_true: True 0/1 labels
+        y_pred_proba: Predicted probabilities
+
+    Returns:
+        Area under the ROC curve
+    """
+    positives = _binary_labels(y_true, "y_true")
+    if positives.all() or not positives.any():
+        raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+    order, starts = _rank_groups(positives, y_pred_proba)
+    return float(_weighted_auc(np.ones(len(positives)), positives[order], starts)[0])
 
 
 def calculate_metrics(y_true: pd.Series, y_pred: np.ndarray, y_pred_proba: Optional[np.ndarray] = None) -> Dict:
     """
     Calculate classification metrics
 
+    Every label metric is derived from one confusion matrix.
+
     Args:
         y_true: True labels
         y_pred: Predicted labels
@@ -29,19 +133,204 @@ def calculate_metrics(y_true: pd.Series, y_pred: np.ndarray, y_pred_proba: Optio
     Returns:
         Dictionary of metrics
     """
-    metrics = {
-        "accuracy": accuracy_score(y_true, y_pred),
-        "precision": precision_score(y_true, y_pred, zero_division=0),
-        "recall": recall_score(y_true, y_pred, zero_division=0),
-        "f1_score": f1_score(y_true, y_pred, zero_division=0),
-    }
+    metrics = metrics_from_counts(**confusion_counts(y_true, y_pred))
 
     if y_pred_proba is not None:
-        metrics["roc_auc"] = roc_auc_score(y_true, y_pred_proba)
+        metrics["roc_auc"] = roc_auc(y_true, y_pred_proba)
 
     return metrics
 
 
+def bootstrap_metrics(
+    y_true: pd.Series,
+    y_pred: np.ndarray,
+    y_pred_proba: Optional[np.ndarray] = None,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    random_state: int = 42,
+    n_jobs: int = 1,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Bootstrap confidence intervals for every metric of calculate_metrics
+
+    Each batch draws a matrix of resampled row indices and turns it into
+    per-row counts; confusion matrices are then one matrix product per cell
+    and the AUC one weighted rank sum, for all resamples of the batch at
+    once. Batches run on n_jobs threads with independent seeds, so results
+    do not depend on n_jobs.
+
+    Args:
+        y_true: True 0/1 labels
+        y_pred: Predicted 0/1 labels
+        y_pred_proba: Predicted probabilities (optional, adds roc_auc)
+        n_resamples: Bootstrap resamples
+        confidence: Two-sided percentile interval coverage
+        random_state: Random seed
+        n_jobs: Threads computing batches
+
+    Returns:
+        Metric name to estimate (on the full data), lower and upper bound
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    if n_resamples < 1:
+        raise ValueError(f"n_resamples must be >= 1, got {n_resamples}")
+
+    truth = _binary_labels(y_true, "y_true")
+    pred = _binary_labels(y_pred, "y_pred")
+    n = len(truth)
+    if len(pred) != n:
+        raise ValueError(f"y_true has {n} labels but y_pred has {len(pred)}")
+    starts = None
+    if y_pred_proba is not None:
+        # Resampling is order-free, so rows are put in score order once for the AUC
+        order, starts = _rank_groups(truth, y_pred_proba)
+        truth, pred = truth[order], pred[order]
+    cells = np.stack([~truth & ~pred, ~truth & pred, truth & ~pred, truth & pred], axis=1).astype(np.float64)
+
+    batch_size = max(1, min(n_resamples, BOOTSTRAP_BATCH_CELLS // max(n, 1)))
+    sizes = [min(batch_size, n_resamples - start) for start in range(0, n_resamples, batch_size)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+
+    def run_batch(size: int, seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+        indices = np.random.default_rng(seed).integers(0, n, size=(size, n))
+        offsets = (np.arange(size) * n)[:, None]
+        counts = np.bincount((indices + offsets).ravel(), minlength=size * n).reshape(size, n).astype(np.float64)
+        batch = metrics_from_counts(*(counts @ cells).T)
+        if starts is not None:
+            batch["roc_auc"] = _weighted_auc(counts, truth, starts)
+        return batch
+
+    with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+        batches = list(executor.map(run_batch, sizes, seeds))
+
+    estimates = calculate_metrics(y_true, y_pred, y_pred_proba)
+    alpha = (1 - confidence) / 2
+    intervals = {}
+    for name, estimate in estimates.items():
+        samples = np.concatenate([batch[name] for batch in batches])
+        lower, upper = np.nanquantile(samples, [alpha, 1 - alpha])
+        intervals[name] = {"estimate": estimate, "lower": float(lower), "upper": float(upper)}
+    return intervals
+
+
+class StreamingMetrics:
+    """
+    Constant-memory metric accumulators for scoring data in batches
+
+    Confusion counts at the decision threshold are exact. Scores are
+    counted in n_bins equal-width bins over [0, 1] per class, so threshold
+    metrics are exact at bin edges and the AUC treats scores sharing a bin
+    as tied (its error is at most half the share of positive/negative pairs
+    that fall in the same bin).
+    """
+
+    def __init__(self, n_bins: int = 1000):
+        """
+        Initialize StreamingMetrics
+
+        Args:
+            n_bins: Equal-width score bins over [0, 1]
+        """
+        if n_bins < 1:
+            raise ValueError(f"n_bins must be >= 1, got {n_bins}")
+        self.n_bins = n_bins
+        self.edges = np.arange(n_bins) / n_bins
+        self.counts = {"tn": 0, "fp": 0, "fn": 0, "tp": 0}
+        self.positive_hist = np.zeros(n_bins, dtype=np.int64)
+        self.negative_hist = np.zeros(n_bins, dtype=np.int64)
+        self.n_scored = 0
+
+    @property
+    def n_samples(self) -> int:
+        """Rows accumulated so far"""
+        return sum(self.counts.values())
+
+    def update(self, y_true: pd.Series, y_pred: np.ndarray, y_pred_proba: Optional[np.ndarray] = None):
+        """
+        Add one batch
+
+        Args:
+            y_true: True 0/1 labels
+            y_pred: Predicted 0/1 labels
+            y_pred_proba: Predicted probabilities (optional)
+        """
+        for key, value in confusion_counts(y_true, y_pred).items():
+            self.counts[key] += value
+
+        if y_pred_proba is not None:
+            positives = _binary_labels(y_true, "y_true")
+            scores = np.asarray(y_pred_proba, dtype=np.float64).ravel()
+            if len(scores) != len(positives):
+                raise ValueError(f"y_true has {len(positives)} labels but y_pred_proba has {len(scores)} scores")
+            # Compare against the edges themselves so a bin holds exactly the scores >= its edge
+            bins = np.clip(np.searchsorted(self.edges, scores, side="right") - 1, 0, self.n_bins - 1)
+            self.positive_hist += np.bincount(bins[positives], minlength=self.n_bins)
+            self.negative_hist += np.bincount(bins[~positives], minlength=self.n_bins)
+            self.n_scored += len(scores)
+
+    def merge(self, other: "StreamingMetrics") -> "StreamingMetrics":
+        """Add another accumulator's counts, e.g. from a parallel worker"""
+        if other.n_bins != self.n_bins:
+            raise ValueError(f"Cannot merge {other.n_bins} bins into {self.n_bins}")
+        for key, value in other.counts.items():
+            self.counts[key] += value
+        self.positive_hist += other.positive_hist
+        self.negative_hist += other.negative_hist
+        self.n_scored += other.n_scored
+        return self
+
+    def threshold_sweep(self) -> Dict[str, np.ndarray]:
+        """
+        Precision, recall and F1 of ``y_pred_proba >= edge`` at every bin's lower edge
+
+        Returns:
+            Dictionary of arrays by ascending threshold, as threshold_sweep
+        """
+        if not self.n_scored:
+            raise ValueError("No scores accumulated")
+        # Bins with scores in them, from the highest: predicting >= a bin's edge flags it and all above
+        occupied = np.flatnonzero(self.positive_hist + self.negative_hist)
+        tp = np.cumsum(self.positive_hist[::-1])[::-1][occupied]
+        fp = np.cumsum(self.negative_hist[::-1])[::-1][occupied]
+        n_positive = self.positive_hist.sum()
+        return {
+            "thresholds": self.edges[occupied],
+            "tp": tp,
+            "fp": fp,
+            "precision": tp / (tp + fp),
+            "recall": tp / n_positive if n_positive else np.zeros(len(tp)),
+            "f1": 2 * tp / (tp + fp + n_positive),
+        }
+
+    def roc_auc(self) -> float:
+        """ROC AUC from the score histograms, scores within a bin counting as tied"""
+        n_positive, n_negative = self.positive_hist.sum(), self.negative_hist.sum()
+        if not n_positive or not n_negative:
+            raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+        neg_below = np.cumsum(self.negative_hist) - self.negative_hist
+        return float((self.positive_hist * (neg_below + 0.5 * self.negative_hist)).sum() / (n_positive * n_negative))
+
+    def optimal_threshold(self, metric: str = "f1") -> float:
+        """Bin edge maximizing a metric ('f1', 'precision', 'recall'), ties to the lowest"""
+        if metric not in ("f1", "precision", "recall"):
+            raise ValueError(f"Unknown metric: {metric}")
+        sweep = self.threshold_sweep()
+        return float(sweep["thresholds"][int(np.argmax(sweep[metric]))])
+
+    def compute(self) -> Dict:
+        """
+        Metrics in the format of calculate_metrics
+
+        Returns:
+            Dictionary of metrics; roc_auc when scores were accumulated
+        """
+        metrics = metrics_from_counts(**self.counts)
+        if self.n_scored:
+            metrics["roc_auc"] = self.roc_auc()
+        return metrics
+
+
 def get_classification_report(y_true: pd.Series, y_pred: np.ndarray, target_names: Optional[list] = None) -> str:
     """
     Generate classification report
@@ -61,10 +350,59 @@ def get_classification_report(y_true: pd.Series, y_pred: np.ndarray, target_name
     return report
 
 
+def threshold_sweep(y_true: pd.Series, y_pred_proba: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Exact precision, recall and F1 at every distinct score threshold
+
+    Scores are sorted once; cumulative true/false positive counts then give
+    the confusion counts of the rule ``y_pred_proba >= threshold`` for every
+    distinct score in one vectorized pass (O(n log n) overall).
+
+    Args:
+        y_true: True labels
+        y_pred_proba: Predicted probabilities
+
+    Returns:
+        Dictionary of arrays sorted by ascending threshold: thresholds, tp, fp, precision, recall, f1
+    """
+    y_true = np.asarray(y_true) == 1
+    scores = np.asarray(y_pred_proba, dtype=np.float64).ravel()
+    if len(scores) != len(y_true):
+        raise ValueError(f"y_true has {len(y_true)} labels but y_pred_proba has {len(scores)} scores")
+    if len(scores) == 0:
+        raise ValueError("Cannot sweep thresholds over empty inputs")
+
+    order = np.argsort(-scores, kind="mergesort")
+    scores = scores[order]
+    positives = y_true[order]
+
+    # Last position of each run of equal scores: predicting >= that score flags the whole prefix
+    run_ends = np.r_[np.flatnonzero(np.diff(scores)), len(scores) - 1]
+    tp = np.cumsum(positives)[run_ends]
+    fp = run_ends + 1 - tp
+    n_positive = positives.sum()
+
+    precision = tp / (tp + fp)
+    recall = tp / n_positive if n_positive else np.zeros(len(tp))
+    f1 = 2 * tp / (tp + fp + n_positive)
+
+    return {
+        "thresholds": scores[run_ends][::-1],
+        "tp": tp[::-1],
+        "fp": fp[::-1],
+        "precision": precision[::-1],
+        "recall": recall[::-1],
+        "f1": f1[::-1],
+    }
+
+
 def find_optimal_threshold(y_true: pd.Series, y_pred_proba: np.ndarray, metric: str = "f1") -> float:
     """
     Find optimal classification threshold
 
+    Every distinct score is evaluated exactly (see threshold_sweep); ties go
+    to the lowest threshold.
+
     Args:
         y_true: True labels
         y_pred_proba: Predicted probabilities
@@ -73,27 +411,15 @@ def find_optimal_threshold(y_true: pd.Series, y_pred_proba: np.ndarray, metric:
     Returns:
         Optimal threshold value
     """
-    logger.info(f"Finding optimal threshold for {metric}...")
-
-    thresholds = np.arange(0.1, 1.0, 0.01)
-    best_threshold = 0.5
-    best_score = 0.0
+    if metric not in ("f1", "precision", "recall"):
+        raise ValueError(f"Unknown metric: {metric}")
 
-    for threshold in thresholds:
-        y_pred_thresh = (y_pred_proba >= threshold).astype(int)
-
-        if metric == "f1":
-            score = f1_score(y_true, y_pred_thresh, zero_division=0)
-        elif metric == "precision":
-            score = precision_score(y_true, y_pred_thresh, zero_division=0)
-        elif metric == "recall":
-            score = recall_score(y_true, y_pred_thresh, zero_division=0)
-        else:
-            raise ValueError(f"Unknown metric: {metric}")
+    logger.info(f"Finding optimal threshold for {metric}...")
 
-        if score > best_score:
-            best_score = score
-            best_threshold = threshold
+    sweep = threshold_sweep(y_true, y_pred_proba)
+    best_idx = int(np.argmax(sweep[metric]))
+    best_threshold = float(sweep["thresholds"][best_idx])
+    best_score = float(sweep[metric][best_idx])
 
     logger.info(f"Optimal threshold: {best_threshold:.4f} (best {metric}: {best_score:.4f})")
 
@@ -102,6 +428,12 @@ def find_optimal_threshold(y_true: pd.Series, y_pred_proba: np.ndarray, metric:
 
 __all__ = [
     "calculate_metrics",
+    "confusion_counts",
+    "metrics_from_counts",
+    "roc_auc",
+    "bootstrap_metrics",
+    "StreamingMetrics",
     "get_classification_report",
     "find_optimal_threshold",
+    "threshold_sweep",
 ]
@@ -20,6 +20,8 @@ class MLflowArtifactManager:
         pca=None,
         feature_names: Optional[list] = None,
         artifact_path: str = "preprocessors",
+        run_id: Optional[str] = None,
+        mlflow_logger=None,
     ):
         """
         Log preprocessing artifacts to MLflow
@@ -29,7 +31,16 @@ class MLflowArtifactManager:
             pca: Fitted PCA object
             feature_names: List of feature names after encoding
             artifact_path: Path within MLflow run to store artifacts
+            run_id: Run to log to (required with mlflow_logger; default: the active run)
+            mlflow_logger: AsyncMLflowLogger uploading the files concurrently in the background
         """
+
+        def upload(path: Path):
+            if mlflow_logger is not None:
+                mlflow_logger.log_artifact(run_id, str(path), artifact_path)
+            else:
+                mlflow.log_artifact(str(path), artifact_path)
+
         try:
             artifact_dir = Path("preprocessors")
             artifact_dir.mkdir(exist_ok=True)
@@ -39,7 +50,7 @@ class MLflowArtifactManager:
                 scaler_path = artifact_dir / "scaler.pkl"
                 scaler_to_save = scaler.scaler if hasattr(scaler, "scaler") else scaler
                 joblib.dump(scaler_to_save, scaler_path)
-                mlflow.log_artifact(str(scaler_path), artifact_path)
+                upload(scaler_path)
                 logger.info(f"✓ Logged scaler to MLflow")
 
             # Save PCA
@@ -47,7 +58,7 @@ class MLflowArtifactManager:
                 pca_path = artifact_dir / "pca.pkl"
                 pca_to_save = pca.pca if hasattr(pca, "pca") else pca
                 joblib.dump(pca_to_save, pca_path)
-                mlflow.log_artifact(str(pca_path), artifact_path)
+                upload(pca_path)
                 logger.info(f"✓ Logged PCA to MLflow")
 
             # Save feature names
@@ -55,7 +66,7 @@ class MLflowArtifactManager:
                 features_path = artifact_dir / "feature_names.json"
                 with open(features_path, "w") as f:
                     json.dump({"feature_names": feature_names}, f, indent=2)
-                mlflow.log_artifact(str(features_path), artifact_path)
+                upload(features_path)
                 logger.info(f"✓ Logged feature names to MLflow ({len(feature_names)} features)")
 
         except Exception as e:
@@ -0,0 +1,223 @@
+"""
+Asynchronous batched MLflow logging
+
+Params, metrics and tags are queued per run and sent by a background thread
+with batched requests; artifacts and models are uploaded concurrently by a
+small thread pool. Callers only pay for serializing a model locally, not for
+tracking-server round trips. Everything queued is flushed by flush(), close()
+or at interpreter exit.
+"""
+
+import atexit
+import json
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from mlflow import MlflowClient
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.models import Model
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
+from src.utils.mlflow_batch import MAX_BATCH_METRICS, log_batch
+
+
+class AsyncMLflowLogger:
+    """Queue MLflow logging calls and send them from background threads"""
+
+    def __init__(self, client: Optional[MlflowClient] = None, max_workers: int = 4, flush_interval: float = 1.0):
+        """
+        Initialize AsyncMLflowLogger
+
+        Args:
+            client: MLflow client (default: MlflowClient() for the current tracking URI)
+            max_workers: Concurrent artifact uploads
+            flush_interval: Seconds between background batch flushes
+        """
+        self.client = client or MlflowClient()
+        self.flush_interval = flush_interval
+        self.errors: List[str] = []
+
+        self._pending: Dict[str, Dict[str, list]] = {}
+        self._n_pending_metrics = 0
+        self._futures: List[Future] = []
+        self._ending: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._closed = False
+
+        self._uploads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mlflow-upload")
+        self._thread = threading.Thread(target=self._flush_loop, name="mlflow-batch", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _enqueue(self, run_id: str, kind: str, entities: list):
+        """Queue entities for the next batch of a run"""
+        if self._closed:
+            raise RuntimeError("AsyncMLflowLogger is closed")
+        with self._lock:
+            self._pending.setdefault(run_id, {"metrics": [], "params": [], "tags": []})[kind].extend(entities)
+            if kind == "metrics":
+                self._n_pending_metrics += len(entities)
+                if self._n_pending_metrics >= MAX_BATCH_METRICS:
+                    self._wake.set()
+
+    def log_params(self, run_id: str, params: Dict[str, Any]):
+        """Queue run parameters"""
+        self._enqueue(run_id, "params", [Param(key, str(value)) for key, value in params.items()])
+
+    def log_metrics(self, run_id: str, metrics: Dict[str, float], step: int = 0):
+        """Queue metric values at one step"""
+        timestamp = int(time.time() * 1000)
+        entities = [Metric(key, float(value), timestamp, step) for key, value in metrics.items()]
+        self._enqueue(run_id, "metrics", entities)
+
+    def set_tags(self, run_id: str, tags: Dict[str, Any]):
+        """Queue run tags"""
+        self._enqueue(run_id, "tags", [RunTag(key, str(value)) for key, value in tags.items()])
+
+    def _submit(self, fn, *args) -> Future:
+        """Run an upload on the pool and remember it for flush()"""
+        if self._closed:
+            raise RuntimeError("AsyncMLflowLogger is closed")
+        future = self._uploads.submit(fn, *args)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def log_artifact(self, run_id: str, local_path: str, artifact_path: Optional[str] = None) -> Future:
+        """
+        Upload a file in the background
+
+        Args:
+            run_id: Run to log to
+            local_path: File to upload (must not change until the upload finished)
+            artifact_path: Directory within the run's artifacts
+
+        Returns:
+            Future of the upload
+        """
+        return self._submit(self.client.log_artifact, run_id, str(local_path), artifact_path)
+
+    def log_model(self, run_id: str, flavor, model, artifact_path: str = "model") -> Future:
+        """
+        Save a model locally with an MLflow flavor and upload it in the background
+
+        Args:
+            run_id: Run to log to
+            flavor: MLflow flavor module, e.g. mlflow.sklearn
+            model: Fitted model
+            artifact_path: Directory within the run's artifacts
+
+        Returns:
+            Future of the upload
+        """
+        staging_dir = Path(tempfile.mkdtemp(prefix="mlflow-model-"))
+        local_dir = staging_dir / artifact_path
+        try:
+            flavor.save_model(model, path=str(local_dir))
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        return self._submit(self._upload_model, run_id, local_dir, artifact_path, staging_dir)
+
+    def _upload_model(self, run_id: str, local_dir: Path, artifact_path: str, staging_dir: Path):
+        """Upload a saved model and record it in the run's logged-model history"""
+        try:
+            self.client.log_artifacts(run_id, str(local_dir), artifact_path)
+            if (local_dir / "MLmodel").exists():
+                mlflow_model = Model.load(str(local_dir))
+                mlflow_model.run_id = run_id
+                mlflow_model.artifact_path = artifact_path
+                self.client.set_tag(run_id, MLFLOW_LOGGED_MODELS, json.dumps([mlflow_model.to_dict()]))
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def end_run(self, run_id: str, status: str = "FINISHED"):
+        """Mark a run as terminated once its queued data and uploads are flushed"""
+        with self._lock:
+            self._ending[run_id] = status
+
+    def _flush_loop(self):
+        """Send queued batches every flush_interval or when enough metrics are queued"""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._send_batches()
+
+    def _send_batches(self):
+        """Send everything queued so far, one batch request (or chunk) per run"""
+        with self._send_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._n_pending_metrics = 0
+            for run_id, entities in pending.items():
+                try:
+                    log_batch(self.client, run_id, **entities)
+                except Exception as e:
+                    self._record_error(f"Could not log batch to run {run_id}: {e}")
+
+    def _record_error(self, message: str):
+        """Keep and report a failed background request"""
+        self.errors.append(message)
+        logger.warning(message)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued uploads, send queued batches and terminate ended runs
+
+        Args:
+            timeout: Seconds to wait for uploads (default: no limit)
+
+        Returns:
+            True when everything queued so far was delivered
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        done, not_done = wait(futures, timeout=timeout)
+        for future in done:
+            if future.exception() is not None:
+                self._record_error(f"Artifact upload failed: {future.exception()}")
+        if not_done:
+            self._record_error(f"{len(not_done)} artifact uploads still running after {timeout}s")
+            with self._lock:
+                self._futures.extend(not_done)
+
+        n_errors = len(self.errors)
+        self._send_batches()
+
+        with self._lock:
+            ending, self._ending = self._ending, {}
+        for run_id, status in ending.items():
+            try:
+                self.client.set_terminated(run_id, status=status)
+            except Exception as e:
+                self._record_error(f"Could not end run {run_id}: {e}")
+        return not not_done and len(self.errors) == n_errors and all(f.exception() is None for f in done)
+
+    def close(self):
+        """Flush everything and stop the background threads"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._uploads.shutdown(wait=True)
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+__all__ = ["AsyncMLflowLogger"]
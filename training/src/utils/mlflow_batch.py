@@ -0,0 +1,51 @@
+"""
+Batched MLflow logging
+"""
+
+from typing import Sequence
+
+from mlflow.entities import Metric, Param, RunTag
+
+# Per-request limits enforced by the MLflow tracking server
+MAX_BATCH_METRICS = 1000
+MAX_BATCH_PARAMS = 100
+MAX_BATCH_TAGS = 100
+
+
+def log_batch(
+    client,
+    run_id: str,
+    metrics: Sequence[Metric] = (),
+    params: Sequence[Param] = (),
+    tags: Sequence[RunTag] = (),
+) -> int:
+    """
+    Log metrics, params and tags in as few requests as the server allows
+
+    Args:
+        client: MlflowClient
+        run_id: Run to log to
+        metrics: Metric entities (may span several steps)
+        params: Param entities
+        tags: RunTag entities
+
+    Returns:
+        Number of log_batch requests sent
+    """
+    metrics, params, tags = list(metrics), list(params), list(tags)
+    requests = 0
+    while metrics or params or tags or requests == 0:
+        client.log_batch(
+            run_id,
+            metrics=metrics[:MAX_BATCH_METRICS],
+            params=params[:MAX_BATCH_PARAMS],
+            tags=tags[:MAX_BATCH_TAGS],
+        )
+        metrics = metrics[MAX_BATCH_METRICS:]
+        params = params[MAX_BATCH_PARAMS:]
+        tags = tags[MAX_BATCH_TAGS:]
+        requests += 1
+    return requests
+
+
+__all__ = ["log_batch", "MAX_BATCH_METRICS", "MAX_BATCH_PARAMS"]
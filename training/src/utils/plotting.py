@@ -2,39 +2,120 @@
 Visualization utilities
 """
 
-from typing import Optional
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Dict, Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
 from loguru import logger
-from sklearn.metrics import (
-    confusion_matrix,
-    f1_score,
-    precision_recall_curve,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-    roc_curve,
-)
+from matplotlib.figure import Figure
+from sklearn.metrics import confusion_matrix
+from src.utils.metrics import threshold_sweep
+
+# Figure size and log title per evaluation plot
+FIGSIZES = {
+    "confusion_matrix": (8, 6),
+    "roc_curve": (8, 6),
+    "precision_recall_curve": (8, 6),
+}
+TITLES = {
+    "confusion_matrix": "Confusion matrix",
+    "roc_curve": "ROC curve",
+    "precision_recall_curve": "Precision-Recall curve",
+}
+
+
+def _downsample(n: int, max_points: Optional[int]) -> np.ndarray:
+    """Evenly spaced indices into n curve points, always keeping both ends"""
+    if max_points is None or n <= max_points:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max(max_points, 2)).astype(int))
+
+
+def roc_points(y_true: pd.Series, y_pred_proba: np.ndarray, max_points: Optional[int] = None) -> Dict:
+    """
+    ROC curve points from one exact threshold sweep
 
+    Args:
+        y_true: True labels
+        y_pred_proba: Predicted probabilities
+        max_points: Points kept for drawing (default: all); the AUC is computed before thinning
 
-def plot_confusion_matrix(y_true: pd.Series, y_pred: np.ndarray, save_path: Optional[str] = None) -> plt.Figure:
+    Returns:
+        Dictionary with fpr, tpr and auc
     """
-    Plot confusion matrix
+    sweep = threshold_sweep(y_true, y_pred_proba)
+    return _roc_from_sweep(sweep, max_points)
+
+
+def _roc_from_sweep(sweep: Dict[str, np.ndarray], max_points: Optional[int]) -> Dict:
+    """ROC points of a threshold sweep, from (0, 0) to (1, 1)"""
+    n_positive = sweep["tp"][0]
+    n_negative = sweep["fp"][0]
+    if n_positive == 0 or n_negative == 0:
+        raise ValueError("Only one class present in y_true; the ROC curve is not defined")
+    # Sweep is by ascending threshold; the curve runs from the strictest threshold
+    fpr = np.r_[0.0, sweep["fp"][::-1] / n_negative]
+    tpr = np.r_[0.0, sweep["tp"][::-1] / n_positive]
+    auc = float(np.trapz(tpr, fpr))
+    keep = _downsample(len(fpr), max_points)
+    return {"fpr": fpr[keep], "tpr": tpr[keep], "auc": auc}
+
+
+def precision_recall_points(y_true: pd.Series, y_pred_proba: np.ndarray, max_points: Optional[int] = None) -> Dict:
+    """
+    Precision-recall curve points from one exact threshold sweep
+
+    Args:
+        y_true: True labels
+        y_pred_proba: Predicted probabilities
+        max_points: Points kept for drawing (default: all)
+
+    Returns:
+        Dictionary with precision and recall
+    """
+    return _precision_recall_from_sweep(threshold_sweep(y_true, y_pred_proba), max_points)
+
+
+def _precision_recall_from_sweep(sweep: Dict[str, np.ndarray], max_points: Optional[int]) -> Dict:
+    """Precision-recall points of a threshold sweep, ending at recall 0 like sklearn"""
+    precision = np.r_[sweep["precision"], 1.0]
+    recall = np.r_[sweep["recall"], 0.0]
+    keep = _downsample(len(recall), max_points)
+    return {"precision": precision[keep], "recall": recall[keep]}
+
+
+def evaluation_plot_data(
+    y_true: pd.Series, y_pred: np.ndarray, y_pred_proba: Optional[np.ndarray] = None, max_points: int = 2000
+) -> Dict[str, Dict]:
+    """
+    Precompute everything the evaluation plots draw
+
+    The test set is sorted once for both curves and the curves are thinned to
+    max_points, so rendering cost does not grow with the test set.
 
     Args:
         y_true: True labels
         y_pred: Predicted labels
-        save_path: Path to save figure (optional)
+        y_pred_proba: Predicted probabilities (curves are skipped without them)
+        max_points: Points kept per curve
 
     Returns:
-        Matplotlib figure
+        Plot name to plot data
     """
-    cm = confusion_matrix(y_true, y_pred)
+    data = {"confusion_matrix": {"cm": confusion_matrix(y_true, y_pred)}}
+    if y_pred_proba is not None:
+        sweep = threshold_sweep(y_true, y_pred_proba)
+        data["roc_curve"] = _roc_from_sweep(sweep, max_points)
+        data["precision_recall_curve"] = _precision_recall_from_sweep(sweep, max_points)
+    return data
+
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+def _draw_confusion_matrix(ax, cm: np.ndarray):
+    """Draw a confusion matrix heatmap"""
     sns.heatmap(
         cm,
         annot=True,
@@ -48,52 +129,99 @@ def plot_confusion_matrix(y_true: pd.Series, y_pred: np.ndarray, save_path: Opti
     ax.set_ylabel("Actual", fontsize=12, fontweight="bold")
     ax.set_title("Confusion Matrix", fontsize=14, fontweight="bold", pad=15)
 
+
+def _draw_roc_curve(ax, fpr: np.ndarray, tpr: np.ndarray, auc: float):
+    """Draw a ROC curve against the random classifier"""
+    ax.plot(fpr, tpr, color="#667eea", lw=3, label=f"ROC Curve (AUC = {auc:.4f})")
+    ax.plot([0, 1], [0, 1], color="#cccccc", lw=2, linestyle="--", label="Random Classifier")
+    ax.set_xlim([0.0, 1.0])
+    ax.set_ylim([0.0, 1.05])
+    ax.set_xlabel("False Positive Rate", fontsize=12, fontweight="bold")
+    ax.set_ylabel("True Positive Rate", fontsize=12, fontweight="bold")
+    ax.set_title("ROC Curve", fontsize=14, fontweight="bold", pad=15)
+    ax.legend(loc="lower right", fontsize=11)
+    ax.grid(alpha=0.3)
+
+
+def _draw_precision_recall_curve(ax, precision: np.ndarray, recall: np.ndarray):
+    """Draw a precision-recall curve"""
+    ax.plot(recall, precision, color="#764ba2", lw=3, label="Precision-Recall Curve")
+    ax.set_xlim([0.0, 1.0])
+    ax.set_ylim([0.0, 1.05])
+    ax.set_xlabel("Recall", fontsize=12, fontweight="bold")
+    ax.set_ylabel("Precision", fontsize=12, fontweight="bold")
+    ax.set_title("Precision-Recall Curve", fontsize=14, fontweight="bold", pad=15)
+    ax.legend(loc="lower left", fontsize=11)
+    ax.grid(alpha=0.3)
+
+
+DRAWERS = {
+    "confusion_matrix": _draw_confusion_matrix,
+    "roc_curve": _draw_roc_curve,
+    "precision_recall_curve": _draw_precision_recall_curve,
+}
+
+
+def _plot(name: str, data: Dict, save_path: Optional[str], dpi: int) -> plt.Figure:
+    """Draw one evaluation plot on a pyplot figure and optionally save it"""
+    fig, ax = plt.subplots(figsize=FIGSIZES[name])
+    DRAWERS[name](ax, **data)
     plt.tight_layout()
 
     if save_path:
-        fig.savefig(save_path, dpi=300, bbox_inches="tight")
-        logger.info(f"✓ Confusion matrix saved to {save_path}")
+        fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
+        logger.info(f"✓ {TITLES[name]} saved to {save_path}")
 
     return fig
 
 
-def plot_roc_curve(y_true: pd.Series, y_pred_proba: np.ndarray, save_path: Optional[str] = None) -> plt.Figure:
+def plot_confusion_matrix(
+    y_true: pd.Series, y_pred: np.ndarray, save_path: Optional[str] = None, dpi: int = 300
+) -> plt.Figure:
     """
-    Plot ROC curve
+    Plot confusion matrix
 
     Args:
         y_true: True labels
-        y_pred_proba: Predicted probabilities
+        y_pred: Predicted labels
         save_path: Path to save figure (optional)
+        dpi: Resolution of the saved figure
 
     Returns:
         Matplotlib figure
     """
-    fpr, tpr, _ = roc_curve(y_true, y_pred_proba)
-    roc_auc = roc_auc_score(y_true, y_pred_proba)
+    return _plot("confusion_matrix", {"cm": confusion_matrix(y_true, y_pred)}, save_path, dpi)
 
-    fig, ax = plt.subplots(figsize=(8, 6))
-    ax.plot(fpr, tpr, color="#667eea", lw=3, label=f"ROC Curve (AUC = {roc_auc:.4f})")
-    ax.plot([0, 1], [0, 1], color="#cccccc", lw=2, linestyle="--", label="Random Classifier")
-    ax.set_xlim([0.0, 1.0])
-    ax.set_ylim([0.0, 1.05])
-    ax.set_xlabel("False Positive Rate", fontsize=12, fontweight="bold")
-    ax.set_ylabel("True Positive Rate", fontsize=12, fontweight="bold")
-    ax.set_title("ROC Curve", fontsize=14, fontweight="bold", pad=15)
-    ax.legend(loc="lower right", fontsize=11)
-    ax.grid(alpha=0.3)
 
-    plt.tight_layout()
+def plot_roc_curve(
+    y_true: pd.Series,
+    y_pred_proba: np.ndarray,
+    save_path: Optional[str] = None,
+    dpi: int = 300,
+    max_points: Optional[int] = None,
+) -> plt.Figure:
+    """
+    Plot ROC curve
 
-    if save_path:
-        fig.savefig(save_path, dpi=300, bbox_inches="tight")
-        logger.info(f"✓ ROC curve saved to {save_path}")
+    Args:
+        y_true: True labels
+        y_pred_proba: Predicted probabilities
+        save_path: Path to save figure (optional)
+        dpi: Resolution of the saved figure
+        max_points: Curve points drawn (default: all)
 
-    return fig
+    Returns:
+        Matplotlib figure
+    """
+    return _plot("roc_curve", roc_points(y_true, y_pred_proba, max_points), save_path, dpi)
 
 
 def plot_precision_recall_curve(
-    y_true: pd.Series, y_pred_proba: np.ndarray, save_path: Optional[str] = None
+    y_true: pd.Series,
+    y_pred_proba: np.ndarray,
+    save_path: Optional[str] = None,
+    dpi: int = 300,
+    max_points: Optional[int] = None,
 ) -> plt.Figure:
     """
     Plot Precision-Recall curve
@@ -102,32 +230,22 @@ def plot_precision_recall_curve(
         y_true: True labels
         y_pred_proba: Predicted probabilities
         save_path: Path to save figure (optional)
+        dpi: Resolution of the saved figure
+        max_points: Curve points drawn (default: all)
 
     Returns:
         Matplotlib figure
     """
-    precision, recall, _ = precision_recall_curve(y_true, y_pred_proba)
+    return _plot("precision_recall_curve", precision_recall_points(y_true, y_pred_proba, max_points), save_path, dpi)
 
-    fig, ax = plt.subplots(figsize=(8, 6))
-    ax.plot(recall, precision, color="#764ba2", lw=3, label="Precision-Recall Curve")
-    ax.set_xlim([0.0, 1.0])
-    ax.set_ylim([0.0, 1.05])
-    ax.set_xlabel("Recall", fontsize=12, fontweight="bold")
-    ax.set_ylabel("Precision", fontsize=12, fontweight="bold")
-    ax.set_title("Precision-Recall Curve", fontsize=14, fontweight="bold", pad=15)
-    ax.legend(loc="lower left", fontsize=11)
-    ax.grid(alpha=0.3)
-
-    plt.tight_layout()
-
-    if save_path:
-        fig.savefig(save_path, dpi=300, bbox_inches="tight")
-        logger.info(f"✓ Precision-Recall curve saved to {save_path}")
-
-    return fig
 
-
-def plot_threshold_analysis(y_true: pd.Series, y_pred_proba: np.ndarray, save_path: Optional[str] = None) -> plt.Figure:
+def plot_threshold_analysis(
+    y_true: pd.Series,
+    y_pred_proba: np.ndarray,
+    save_path: Optional[str] = None,
+    max_points: int = 2000,
+    dpi: int = 300,
+) -> plt.Figure:
     """
     Plot metrics vs threshold
 
@@ -135,20 +253,22 @@ def plot_threshold_analysis(y_true: pd.Series, y_pred_proba: np.ndarray, save_pa
         y_true: True labels
         y_pred_proba: Predicted probabilities
         save_path: Path to save figure (optional)
+        max_points: Thresholds drawn per curve (the optimum is exact regardless)
+        dpi: Resolution of the saved figure
 
     Returns:
         Matplotlib figure
     """
-    thresholds = np.arange(0.1, 1.0, 0.01)
-    precisions = []
-    recalls = []
-    f1_scores = []
+    sweep = threshold_sweep(y_true, y_pred_proba)
+    optimal_idx = int(np.argmax(sweep["f1"]))
+    optimal_threshold = float(sweep["thresholds"][optimal_idx])
 
-    for threshold in thresholds:
-        y_pred_thresh = (y_pred_proba >= threshold).astype(int)
-        precisions.append(precision_score(y_true, y_pred_thresh, zero_division=0))
-        recalls.append(recall_score(y_true, y_pred_thresh, zero_division=0))
-        f1_scores.append(f1_score(y_true, y_pred_thresh, zero_division=0))
+    # The sweep has one point per distinct score; thin it for drawing, keeping the optimum
+    points = np.unique(np.r_[np.linspace(0, len(sweep["thresholds"]) - 1, max_points).astype(int), optimal_idx])
+    thresholds = sweep["thresholds"][points]
+    precisions = sweep["precision"][points]
+    recalls = sweep["recall"][points]
+    f1_scores = sweep["f1"][points]
 
     fig, ax = plt.subplots(figsize=(10, 6))
     ax.plot(thresholds, precisions, label="Precision", color="#667eea", lw=2)
@@ -160,9 +280,6 @@ def plot_threshold_analysis(y_true: pd.Series, y_pred_proba: np.ndarray, save_pa
     ax.legend(fontsize=11)
     ax.grid(alpha=0.3)
 
-    # Find optimal threshold
-    optimal_idx = np.argmax(f1_scores)
-    optimal_threshold = thresholds[optimal_idx]
     ax.axvline(
         x=optimal_threshold,
         color="red",
@@ -175,7 +292,7 @@ def plot_threshold_analysis(y_true: pd.Series, y_pred_proba: np.ndarray, save_pa
     plt.tight_layout()
 
     if save_path:
-        fig.savefig(save_path, dpi=300, bbox_inches="tight")
+        fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
         logger.info(f"✓ Threshold analysis saved to {save_path}")
 
     logger.info(f"Optimal threshold (max F1): {optimal_threshold:.4f}")
@@ -183,7 +300,76 @@ def plot_threshold_analysis(y_true: pd.Series, y_pred_proba: np.ndarray, save_pa
     return fig
 
 
+def render_plot(name: str, data: Dict, save_path: str, dpi: int = 150) -> str:
+    """
+    Render one evaluation plot to a file without pyplot
+
+    Uses a standalone Agg-backed Figure, so it is headless, leaves no open
+    pyplot figures behind and is safe to run in worker processes.
+
+    Args:
+        name: Plot name (a key of DRAWERS)
+        data: Plot data from evaluation_plot_data
+        save_path: Output image path
+        dpi: Resolution of the saved figure
+
+    Returns:
+        save_path
+    """
+    fig = Figure(figsize=FIGSIZES[name])
+    DRAWERS[name](fig.subplots(), **data)
+    fig.tight_layout()
+    fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
+    return save_path
+
+
+def render_evaluation_plots(
+    y_true: pd.Series,
+    y_pred: np.ndarray,
+    y_pred_proba: Optional[np.ndarray],
+    output_dir: str,
+    dpi: int = 150,
+    max_points: int = 2000,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Future]:
+    """
+    Render the confusion matrix, ROC and precision-recall plots
+
+    Curve points are computed once here; only the small plot data is sent
+    to the executor, which renders the figures in parallel.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+        y_pred_proba: Predicted probabilities (curves are skipped without them)
+        output_dir: Directory the PNG files are written to (created if missing)
+        dpi: Resolution of the saved figures
+        max_points: Points kept per curve
+        executor: Executor rendering the figures, e.g. a spawn ProcessPoolExecutor (default: render now in this process)
+
+    Returns:
+        Plot name to future of its saved path
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    futures = {}
+    for name, data in evaluation_plot_data(y_true, y_pred, y_pred_proba, max_points).items():
+        save_path = str(Path(output_dir) / f"{name}.png")
+        if executor is not None:
+            futures[name] = executor.submit(render_plot, name, data, save_path, dpi)
+        else:
+            future = Future()
+            future.set_result(render_plot(name, data, save_path, dpi))
+            futures[name] = future
+    return futures
+
+
 __all__ = [
+    "TITLES",
+    "evaluation_plot_data",
+    "render_plot",
+    "render_evaluation_plots",
+    "roc_points",
+    "precision_recall_points",
     "plot_confusion_matrix",
     "plot_roc_curve",
     "plot_precision_recall_curve",
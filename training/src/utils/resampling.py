@@ -2,20 +2,200 @@
 Class balancing and resampling utilities
 """
 
-from typing import Tuple
+from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from imblearn.combine import SMOTETomek
 from imblearn.over_sampling import SMOTE
 from loguru import logger
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.neighbors import NearestNeighbors
+from sklearn.random_projection import GaussianRandomProjection
+
+RESAMPLING_MODES = ("exact", "scalable")
+
+NEIGHBOR_ALGORITHMS = ("auto", "brute", "kd_tree", "ball_tree", "approximate")
+
+
+def _as_float_matrix(X):
+    """Return X as a float64 array, or as a float64 CSR matrix when it is sparse"""
+    if sparse.issparse(X):
+        return sparse.csr_matrix(X, dtype=np.float64)
+    return np.asarray(X, dtype=np.float64)
+
+
+class ProjectedNearestNeighbors(NearestNeighbors):
+    """
+    Approximate nearest neighbours via a seeded Gaussian random projection
+
+    Candidates are retrieved with a KD-tree in a low-dimensional projection
+    (distances are roughly preserved, Johnson-Lindenstrauss) and re-ranked by
+    their exact distance in the original space. Inputs with at most
+    n_components features are searched exactly.
+    """
+
+    def __init__(
+        self,
+        n_neighbors: int = 5,
+        n_components: int = 8,
+        n_candidates: int = 10,
+        algorithm: str = "kd_tree",
+        n_jobs: Optional[int] = None,
+        random_state: Optional[int] = None,
+    ):
+        super().__init__(n_neighbors=n_neighbors, algorithm=algorithm, n_jobs=n_jobs)
+        self.n_components = n_components
+        self.n_candidates = n_candidates
+        self.random_state = random_state
+
+    def fit(self, X, y=None):
+        X = _as_float_matrix(X)
+        self.projection_ = None
+        self.original_X_ = X
+        if X.shape[1] > self.n_components:
+            self.projection_ = GaussianRandomProjection(
+                n_components=self.n_components, random_state=self.random_state
+            ).fit(X)
+            X = self.projection_.transform(X)
+        return super().fit(X)
+
+    def kneighbors(self, X=None, n_neighbors=None, return_distance=True):
+        if X is None:
+            raise ValueError("ProjectedNearestNeighbors needs explicit query points")
+        n_neighbors = n_neighbors or self.n_neighbors
+        X = _as_float_matrix(X)
+        if self.projection_ is None:
+            return super().kneighbors(X, n_neighbors=n_neighbors, return_distance=return_distance)
+
+        n_candidates = min(max(self.n_candidates, n_neighbors), self.original_X_.shape[0])
+        candidates = super().kneighbors(self.projection_.transform(X), n_neighbors=n_candidates, return_distance=False)
+        if sparse.issparse(X):
+            diff = self.original_X_[candidates.ravel()] - X[np.repeat(np.arange(X.shape[0]), n_candidates)]
+            distances = np.sqrt(np.asarray(diff.multiply(diff).sum(axis=1))).reshape(candidates.shape)
+        else:
+            distances = np.sqrt(((self.original_X_[candidates] - X[:, None, :]) ** 2).sum(axis=2))
+        order = np.argsort(distances, axis=1, kind="stable")[:, :n_neighbors]
+        indices = np.take_along_axis(candidates, order, axis=1)
+        if return_distance:
+            return np.take_along_axis(distances, order, axis=1), indices
+        return indices
+
+
+def make_neighbors(
+    n_neighbors: int,
+    algorithm: str = "auto",
+    n_jobs: Optional[int] = None,
+    n_components: int = 8,
+    random_state: Optional[int] = None,
+) -> NearestNeighbors:
+    """
+    Build the neighbour search used by the scalable resampler
+
+    Args:
+        n_neighbors: Neighbours returned per query (including the query point itself)
+        algorithm: One of NEIGHBOR_ALGORITHMS ('approximate' searches a random projection)
+        n_jobs: Parallel jobs for neighbour queries (-1 uses all cores)
+        n_components: Projection dimension for 'approximate'
+        random_state: Random seed for the projection
+
+    Returns:
+        Unfitted NearestNeighbors estimator
+    """
+    if algorithm not in NEIGHBOR_ALGORITHMS:
+        raise ValueError(f"Unknown neighbour algorithm '{algorithm}', expected one of {NEIGHBOR_ALGORITHMS}")
+    if algorithm == "approximate":
+        return ProjectedNearestNeighbors(
+            n_neighbors=n_neighbors, n_components=n_components, n_jobs=n_jobs, random_state=random_state
+        )
+    return NearestNeighbors(n_neighbors=n_neighbors, algorithm=algorithm, n_jobs=n_jobs)
+
+
+def find_tomek_links(X: np.ndarray, y: np.ndarray, neighbors: NearestNeighbors, chunk_size: int = 50_000) -> np.ndarray:
+    """
+    Flag both samples of every Tomek link, querying nearest neighbours in chunks
+
+    A Tomek link is a pair of mutual nearest neighbours with different
+    labels. Querying chunk by chunk bounds the memory of the search on
+    large matrices.
+
+    Args:
+        X: Feature matrix
+        y: Labels
+        neighbors: Unfitted neighbour search (see make_neighbors)
+        chunk_size: Rows queried at a time
+
+    Returns:
+        Boolean mask of samples that belong to a Tomek link
+    """
+    X = _as_float_matrix(X)
+    y = np.asarray(y)
+    n_samples = len(y)
+    rows = np.arange(n_samples)
+
+    nn = clone(neighbors).set_params(n_neighbors=2).fit(X)
+    nearest = np.empty(n_samples, dtype=np.intp)
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        indices = nn.kneighbors(X[start:stop], return_distance=False)
+        # The query point is usually its own first neighbour; with duplicates it may come second
+        nearest[start:stop] = np.where(indices[:, 0] != rows[start:stop], indices[:, 0], indices[:, 1])
+
+    return (nearest[nearest] == rows) & (y[nearest] != y)
 
 
 class Resampler:
     """Handle class balancing operations"""
 
-    def __init__(self, random_state: int = 42):
-        """Initialize Resampler"""
+    def __init__(
+        self,
+        random_state: int = 42,
+        mode: str = "exact",
+        n_jobs: Optional[int] = None,
+        neighbors_algorithm: str = "auto",
+        tomek_chunk_size: int = 50_000,
+        n_components: int = 8,
+    ):
+        """
+        Initialize Resampler
+
+        Args:
+            random_state: Random seed
+            mode: 'exact' runs imblearn's SMOTETomek; 'scalable' uses the settings below
+            n_jobs: Parallel jobs for neighbour searches in scalable mode (-1 uses all cores)
+            neighbors_algorithm: Neighbour search in scalable mode, one of NEIGHBOR_ALGORITHMS
+            tomek_chunk_size: Rows per Tomek-link query in scalable mode
+            n_components: Projection dimension when neighbors_algorithm is 'approximate'
+        """
+        if mode not in RESAMPLING_MODES:
+            raise ValueError(f"Unknown resampling mode '{mode}', expected one of {RESAMPLING_MODES}")
+        if neighbors_algorithm not in NEIGHBOR_ALGORITHMS:
+            raise ValueError(
+                f"Unknown neighbour algorithm '{neighbors_algorithm}', expected one of {NEIGHBOR_ALGORITHMS}"
+            )
         self.random_state = random_state
+        self.mode = mode
+        self.n_jobs = n_jobs
+        self.neighbors_algorithm = neighbors_algorithm
+        self.tomek_chunk_size = tomek_chunk_size
+        self.n_components = n_components
+
+    def _scalable_smote_tomek(self, X: pd.DataFrame, y: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """SMOTE with a configurable neighbour search, then chunked removal of Tomek links"""
+        neighbors = make_neighbors(
+            n_neighbors=6,
+            algorithm=self.neighbors_algorithm,
+            n_jobs=self.n_jobs,
+            n_components=self.n_components,
+            random_state=self.random_state,
+        )
+        smote = SMOTE(random_state=self.random_state, k_neighbors=neighbors)
+        X_smote, y_smote = smote.fit_resample(_as_float_matrix(X), np.asarray(y))
+
+        links = find_tomek_links(X_smote, y_smote, neighbors, chunk_size=self.tomek_chunk_size)
+        logger.info(f"Removing {links.sum():,} samples in Tomek links")
+        return X_smote[~links], y_smote[~links]
 
     def apply_smote_tomek(self, X: pd.DataFrame, y: pd.Series) -> Tuple[pd.DataFrame, pd.Series]:
         """
@@ -30,16 +210,21 @@ class Resampler:
         """
         logger.info("Applying SMOTE + Tomek Links for class balancing...")
         logger.info("Before resampling:")
-        logger.info(f"  Total: {len(X):,}")
+        logger.info(f"  Total: {X.shape[0]:,}")
         logger.info(f"  Good (1): {(y == 1).sum():,} ({(y == 1).sum() / len(y) * 100:.2f}%)")
         logger.info(f"  Bad (0): {(y == 0).sum():,} ({(y == 0).sum() / len(y) * 100:.2f}%)")
 
         # Apply SMOTE + Tomek
-        smote_tomek = SMOTETomek(random_state=self.random_state)
-        X_resampled, y_resampled = smote_tomek.fit_resample(X, y)
+        if self.mode == "scalable":
+            X_resampled, y_resampled = self._scalable_smote_tomek(X, y)
+            if isinstance(y, pd.Series):
+                y_resampled = pd.Series(y_resampled, name=y.name)
+        else:
+            smote_tomek = SMOTETomek(random_state=self.random_state)
+            X_resampled, y_resampled = smote_tomek.fit_resample(X, y)
 
         logger.info("After SMOTE + Tomek:")
-        logger.info(f"  Total: {len(X_resampled):,}")
+        logger.info(f"  Total: {X_resampled.shape[0]:,}")
         logger.info(
             f"  Good (1): {(y_resampled == 1).sum():,} ({(y_resampled == 1).sum() / len(y_resampled) * 100:.2f}%)"
         )
@@ -67,7 +252,7 @@ class Resampler:
         """
         logger.info("Applying SMOTE for class balancing...")
         logger.info("Before resampling:")
-        logger.info(f"  Total: {len(X):,}")
+        logger.info(f"  Total: {X.shape[0]:,}")
         logger.info(f"  Good (1): {(y == 1).sum():,} ({(y == 1).sum() / len(y) * 100:.2f}%)")
         logger.info(f"  Bad (0): {(y == 0).sum():,} ({(y == 0).sum() / len(y) * 100:.2f}%)")
 
@@ -76,7 +261,7 @@ class Resampler:
         X_resampled, y_resampled = smote.fit_resample(X, y)
 
         logger.info("After SMOTE:")
-        logger.info(f"  Total: {len(X_resampled):,}")
+        logger.info(f"  Total: {X_resampled.shape[0]:,}")
         logger.info(
             f"  Good (1): {(y_resampled == 1).sum():,} ({(y_resampled == 1).sum() / len(y_resampled) * 100:.2f}%)"
         )
@@ -91,4 +276,11 @@ class Resampler:
         return X_resampled, y_resampled
 
 
-__all__ = ["Resampler"]
+__all__ = [
+    "Resampler",
+    "ProjectedNearestNeighbors",
+    "find_tomek_links",
+    "make_neighbors",
+    "NEIGHBOR_ALGORITHMS",
+    "RESAMPLING_MODES",
+]
@@ -2,26 +2,37 @@
 Feature scaling utilities
 """
 
+from typing import Optional
+
 import joblib
 import numpy as np
 import pandas as pd
 from loguru import logger
+from scipy import sparse
 from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
+from src.utils.helpers import iter_row_chunks
+
+# Scalers whose statistics can be accumulated with partial_fit
+INCREMENTAL_METHODS = ("standard", "minmax")
 
 
 class FeatureScaler:
     """Handle feature scaling operations"""
 
-    def __init__(self, method: str = "standard"):
+    def __init__(self, method: str = "standard", chunk_size: Optional[int] = None):
         """
         Initialize FeatureScaler
 
         Args:
             method: Scaling method ('standard', 'minmax', 'robust')
+            chunk_size: Fit and transform in chunks of this many rows (default: None, one shot)
         """
         self.method = method
+        self.chunk_size = chunk_size
         self.scaler = None
         self._initialize_scaler()
+        if chunk_size is not None and method not in INCREMENTAL_METHODS:
+            raise ValueError(f"Scaling method '{method}' cannot be fitted incrementally")
 
     def _initialize_scaler(self):
         """Initialize the appropriate scaler"""
@@ -38,32 +49,74 @@ class FeatureScaler:
         """
         Fit scaler and transform features
 
+        Sparse input is scaled without centering, which keeps it sparse; the
+        centering is left to the decomposition that follows.
+
         Args:
-            X: Features DataFrame
+            X: Features DataFrame or CSR matrix
 
         Returns:
-            Scaled features as numpy array
+            Scaled features as numpy array (CSR matrix for sparse input)
         """
-        logger.info(f"Fitting and transforming features with {self.method} scaler...")
-        X_scaled = self.scaler.fit_transform(X)
-        logger.info(f"Scaled shape: {X_scaled.shape}")
-        return X_scaled
+        if sparse.issparse(X):
+            if self.method != "standard":
+                raise ValueError(f"Scaling method '{self.method}' does not support sparse input")
+            logger.info("Fitting and transforming sparse features with standard scaler (no centering)...")
+            self.scaler = StandardScaler(with_mean=False)
+            X_scaled = self.scaler.fit_transform(X)
+            logger.info(f"Scaled shape: {X_scaled.shape}")
+            return X_scaled
+
+        if self.chunk_size is None:
+            logger.info(f"Fitting and transforming features with {self.method} scaler...")
+            X_scaled = self.scaler.fit_transform(X)
+            logger.info(f"Scaled shape: {X_scaled.shape}")
+            return X_scaled
+
+        logger.info(f"Fitting {self.method} scaler in chunks of {self.chunk_size:,} rows...")
+        self._initialize_scaler()
+        for chunk in iter_row_chunks(X, self.chunk_size):
+            self.partial_fit(chunk)
+        return self.transform(X)
+
+    def partial_fit(self, X_chunk: pd.DataFrame):
+        """
+        Accumulate scaler statistics from one chunk of rows
+
+        Args:
+            X_chunk: Features chunk
 
-    def transform(self, X: pd.DataFrame) -> np.ndarray:
+        Returns:
+            self
+        """
+        if self.method not in INCREMENTAL_METHODS:
+            raise ValueError(f"Scaling method '{self.method}' cannot be fitted incrementally")
+        self.scaler.partial_fit(X_chunk)
+        return self
+
+    def transform(self, X: pd.DataFrame, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Transform features using fitted scaler
 
         Args:
-            X: Features DataFrame
+            X: Features DataFrame or CSR matrix
+            out: Array to write the scaled rows into in chunked mode, e.g. a np.memmap
 
         Returns:
-            Scaled features as numpy array
+            Scaled features as numpy array (CSR matrix for sparse input)
         """
         if self.scaler is None:
             raise ValueError("Scaler not fitted. Call fit_transform first.")
 
         logger.info(f"Transforming features with existing {self.method} scaler...")
-        X_scaled = self.scaler.transform(X)
+        if self.chunk_size is None or sparse.issparse(X):
+            X_scaled = self.scaler.transform(X)
+        else:
+            X_scaled = np.empty(X.shape, dtype=np.float64) if out is None else out
+            start = 0
+            for chunk in iter_row_chunks(X, self.chunk_size):
+                X_scaled[start : start + len(chunk)] = self.scaler.transform(chunk)
+                start += len(chunk)
         logger.info(f"Scaled shape: {X_scaled.shape}")
         return X_scaled
 
@@ -78,4 +131,4 @@ class FeatureScaler:
         logger.info(f"Loaded scaler from {filepath}")
 
 
-__all__ = ["FeatureScaler"]
+__all__ = ["FeatureScaler", "INCREMENTAL_METHODS"]
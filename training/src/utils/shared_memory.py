@@ -0,0 +1,133 @@
+"""
+Shared-memory transport for DataFrames used by worker processes
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+Frame = Union[pd.DataFrame, pd.Series]
+
+
+class SharedDataset:
+    """
+    Copy named DataFrames/Series into shared memory once
+
+    Workers receive the small, picklable ``specs`` and map the blocks with
+    ``attach_shared`` instead of unpickling a copy of every matrix. The
+    owner must call ``close`` (or use the context manager) to free them.
+    """
+
+    def __init__(self, **frames: Frame):
+        """
+        Initialize SharedDataset
+
+        Args:
+            **frames: Named DataFrames or Series with a single numeric dtype
+        """
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.specs: Dict[str, dict] = {}
+
+        try:
+            for key, data in frames.items():
+                array = np.ascontiguousarray(data.to_numpy())
+                if array.dtype == object:
+                    raise ValueError(f"{key} has object dtype and cannot be shared")
+
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+
+                spec = {"shm_name": block.name, "shape": array.shape, "dtype": array.dtype.str}
+                if isinstance(data, pd.DataFrame):
+                    spec["columns"] = list(data.columns)
+                else:
+                    spec["name"] = data.name
+                self.specs[key] = spec
+        except Exception:
+            self.close()
+            raise
+
+        total_mb = sum(block.size for block in self._blocks) / 1024**2
+        logger.info(f"Shared {len(self.specs)} arrays with worker processes ({total_mb:.1f} MB)")
+
+    def close(self) -> None:
+        """Release and unlink all shared blocks"""
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def attach_shared(specs: Dict[str, dict]) -> Tuple[List[shared_memory.SharedMemory], Dict[str, Frame]]:
+    """
+    Map shared blocks as zero-copy DataFrames/Series
+
+    The returned frames are views on the blocks: drop every reference to them
+    before closing the handles with ``detach_shared``.
+
+    Args:
+        specs: ``SharedDataset.specs`` from the owning process
+
+    Returns:
+        Tuple of (block handles, mapping of name to DataFrame or Series)
+    """
+    handles = []
+    frames = {}
+    for key, spec in specs.items():
+        block = shared_memory.SharedMemory(name=spec["shm_name"])
+        handles.append(block)
+        array = np.ndarray(tuple(spec["shape"]), dtype=np.dtype(spec["dtype"]), buffer=block.buf)
+        if "columns" in spec:
+            frames[key] = pd.DataFrame(array, columns=spec["columns"], copy=False)
+        else:
+            frames[key] = pd.Series(array, name=spec.get("name"), copy=False)
+    return handles, frames
+
+
+def detach_shared(handles: List[shared_memory.SharedMemory]) -> None:
+    """
+    Close block handles obtained from ``attach_shared``
+
+    Args:
+        handles: Block handles to close
+    """
+    for block in handles:
+        try:
+            block.close()
+        except BufferError:
+            # A view is still referenced (e.g. held by a fitted model); the OS reclaims it at exit
+            logger.debug(f"Shared block {block.name} still referenced, leaving it mapped")
+
+
+def spawn_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool for training workers
+
+    Workers are spawned, not forked: forking after the OpenMP runtimes of the
+    boosting libraries are initialized can deadlock them. Spawned workers do
+    not inherit the parent's data, so pass it through ``SharedDataset``.
+
+    Args:
+        max_workers: Worker processes
+
+    Returns:
+        ProcessPoolExecutor with the spawn start method
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+
+
+__all__ = ["SharedDataset", "attach_shared", "detach_shared", "spawn_pool"]